@@ -21,10 +21,14 @@
 ## -- 2023-02-09  1.3.2     MRD      Beautify
 ## -- 2023-03-02  1.3.3     SY       Update load_data in DataStoring
 ## -- 2024-04-28  1.4.0     DA       Refactoring
+## -- 2026-10-16  1.5.0     DA       Class Buffer: preallocated columnar ring storage with batch
+## --                                insertion and fancy-indexed sampling
+## -- 2026-10-17  1.5.1     DA       Class Buffer: get_all() and get_sample() return lists by default;
+## --                                numpy arrays on request via new parameter p_as_array
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.4.0 (2024-04-28)
+Ver. 1.5.1 (2026-10-17)
 
 This module provides various elementary buffer management classes.
 
@@ -32,6 +36,8 @@ This module provides various elementary buffer management classes.
 
 
 import random
+from numbers import Number
+import numpy as np
 
 
 
@@ -86,9 +92,20 @@ class BufferElement:
 ## -------------------------------------------------------------------------------------------------
 class Buffer:
     """
-    Base class implementation for buffer management.
+    Base class implementation for buffer management. The data are stored column by column in
+    numpy arrays of fixed capacity that are allocated on the first occurrence of a field. Numerical
+    fields get an array of the shape and data type of their first value, all other fields an
+    object array. New elements are written at a circular write position, so that the oldest element
+    is overwritten in O(1) once the buffer is full.
+
+    Internally, elements are addressed by their storage slot. As long as the buffer is not full,
+    the slots 0, ..., len-1 are used. All fields are returned as lists. On request, numerical fields
+    are returned as numpy arrays instead.
     """
 
+    C_SCALAR_TYPES  = { float : np.empty((), dtype=float),
+                        int : np.empty((), dtype=int),
+                        bool : np.empty((), dtype=bool) }
 
 ## -------------------------------------------------------------------------------------------------
     def __init__(self, p_size=1):
@@ -99,6 +116,65 @@ class Buffer:
         
         self._size = p_size
         self._data_buffer = {}
+        self._num_elements = 0
+        self._write_pos = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _create_column(self, p_value):
+        """
+        Allocates the storage of a new field based on its first value.
+
+        Parameters:
+            p_value: First value of the field
+
+        Returns:
+            Numpy array of capacity p_size
+        """
+
+        if isinstance(p_value, (Number, np.generic, np.ndarray, list, tuple)):
+            value = np.asarray(p_value)
+            if value.dtype.kind in 'biufc':
+                return np.zeros((self._size,) + value.shape, dtype=value.dtype)
+
+        return np.empty(self._size, dtype=object)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _fit_column(self, p_key, p_values, p_batch:bool = False):
+        """
+        Widens the data type of a numerical field if the new values can not be stored loss-free.
+        If the shape of the new values differs, the field is converted to an object array.
+
+        Parameters:
+            p_key: Name of the field
+            p_values: New value or batch of new values
+            p_batch (bool): True, if p_values is a batch of values
+
+        Returns:
+            Storage of the field
+        """
+
+        column = self._data_buffer[p_key]
+        if column.dtype == object: return column
+
+        if ( not p_batch ) and ( type(p_values) in self.C_SCALAR_TYPES ):
+            values = self.C_SCALAR_TYPES[type(p_values)]
+        else:
+            values = np.asarray(p_values)
+        shape = values.shape[1:] if p_batch else values.shape
+        if ( values.dtype == column.dtype ) and ( shape == column.shape[1:] ): return column
+
+        if ( values.dtype.kind not in 'biufc' ) or ( shape != column.shape[1:] ):
+            column_new = np.empty(self._size, dtype=object)
+            for i in range(self._size): column_new[i] = column[i]
+        elif not np.can_cast(values.dtype, column.dtype, casting='safe'):
+            column_new = column.astype(np.result_type(column.dtype, values.dtype))
+        else:
+            return column
+
+        self._data_buffer[p_key] = column_new
+        return column_new
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -109,26 +185,81 @@ class Buffer:
         Parameters:
             p_elem (BufferElement): Element of Buffer
         """
-        
-        self._data_buffer = {**p_elem.get_data(), **self._data_buffer}
-        for key, value in self._data_buffer.items():
-            if key in p_elem.get_data() and key in self._data_buffer:
-                if not isinstance(self._data_buffer[key], list):
-                    self._data_buffer[key] = [p_elem.get_data()[key]]
-                else:
-                    self._data_buffer[key].append(p_elem.get_data()[key])
 
-                if len(self._data_buffer[key]) > self._size:
-                    self._data_buffer[key].pop(-len(self._data_buffer[key]))
+        pos = self._write_pos
+
+        for key, value in p_elem.get_data().items():
+            try:
+                column = self._fit_column(key, value)
+            except KeyError:
+                column = self._data_buffer[key] = self._create_column(value)
 
+            column[pos] = value
 
- ## -------------------------------------------------------------------------------------------------
+        self._write_pos = ( pos + 1 ) % self._size
+        self._num_elements = min(self._num_elements + 1, self._size)
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_batch(self, p_data: dict):
+        """
+        Adds a batch of elements to the buffer at once. If the batch is larger than the buffer,
+        only the latest elements are kept.
+
+        Parameters:
+            p_data (dict): Values of all fields of the elements. Each value is an array-like object
+            with one element per row.
+        """
+
+        num_batch = len(next(iter(p_data.values())))
+        if num_batch == 0: return
+        skip = max(0, num_batch - self._size)
+        slots = ( self._write_pos + skip + np.arange(num_batch - skip) ) % self._size
+
+        for key, values in p_data.items():
+            if key not in self._data_buffer:
+                self._data_buffer[key] = self._create_column(values[0])
+            column = self._fit_column(key, values, p_batch=True)
+
+            if column.dtype == object:
+                for slot, value in zip(slots, values[skip:]): column[slot] = value
+            else:
+                column[slots] = np.asarray(values)[skip:]
+
+        self._write_pos = int(( self._write_pos + num_batch ) % self._size)
+        self._num_elements = min(self._num_elements + num_batch, self._size)
+
+
+## -------------------------------------------------------------------------------------------------
     def clear(self):
         """
         Resets buffer.
         """
 
         self._data_buffer.clear()
+        self._num_elements = 0
+        self._write_pos = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_ordered_ind(self) -> np.ndarray:
+        """
+        Returns the slots of all buffered elements from the oldest to the latest one.
+        """
+
+        if self._num_elements < self._size:
+            return np.arange(self._num_elements)
+
+        return ( self._write_pos + np.arange(self._size) ) % self._size
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_latest_ind(self) -> int:
+        """
+        Returns the slot of the latest buffered element.
+        """
+
+        return ( self._write_pos - 1 ) % self._size
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -137,34 +268,40 @@ class Buffer:
         Returns latest buffered element. 
         """
 
-        try:
-            return {key: self._data_buffer[key][-1] for key in self._data_buffer}
-        except:
-            return None
+        if self._num_elements == 0: return None
+        pos = self._get_latest_ind()
+        return {key: self._data_buffer[key][pos] for key in self._data_buffer}
 
 
 ## -------------------------------------------------------------------------------------------------
-    def get_all(self):
+    def get_all(self, p_as_array: bool = False):
         """
-        Return all buffered elements.
+        Return all buffered elements from the oldest to the latest one.
+
+        Parameters:
+            p_as_array (bool): If True, numerical fields are returned as numpy arrays. Default = False.
+
+        Returns:
+            Buffered elements in dictionary
         """
         
-        return self._data_buffer
+        return self._extract_rows(self._get_ordered_ind(), p_as_array=p_as_array)
 
 
 ## -------------------------------------------------------------------------------------------------
-    def get_sample(self, p_num: int):
+    def get_sample(self, p_num: int, p_as_array: bool = False):
         """
         Sample some element from the buffer.
 
         Parameters:
             p_num (int): Number of sample
+            p_as_array (bool): If True, numerical fields are returned as numpy arrays. Default = False.
 
         Returns:
             Samples in dictionary
         """
         
-        return self._extract_rows(self._gen_sample_ind(p_num))
+        return self._extract_rows(self._gen_sample_ind(p_num), p_as_array=p_as_array)
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -183,21 +320,30 @@ class Buffer:
 
 
 ## -------------------------------------------------------------------------------------------------
-    def _extract_rows(self, p_list_idx: list):
+    def _extract_rows(self, p_list_idx: list, p_as_array: bool = False):
         """
         Extract the element in the buffer based on a
         list of indices.
 
         Parameters:
             p_list_idx (list): List of indices
+            p_as_array (bool): If True, numerical fields are returned as numpy arrays. Default = False.
 
         Returns:
             Samples in dictionary
         """
         
+        idx = np.asarray(p_list_idx, dtype=np.int64)
         rows = {}
-        for key in self._data_buffer:
-            rows[key] = [self._data_buffer[key][i] for i in p_list_idx]
+        for key, column in self._data_buffer.items():
+            if column.dtype == object:
+                rows[key] = column[idx].tolist()
+            elif p_as_array:
+                rows[key] = column[idx]
+            elif column.ndim == 1:
+                rows[key] = column[idx].tolist()
+            else:
+                rows[key] = list(column[idx])
         return rows
 
 
@@ -210,14 +356,12 @@ class Buffer:
             True, if the buffer is full
         """
         
-        keys = list(self._data_buffer.keys())
-        return len(self._data_buffer[keys[0]]) >= self._size
+        return self._num_elements >= self._size
 
 
 ## -------------------------------------------------------------------------------------------------
     def __len__(self):
-        keys = list(self._data_buffer.keys())
-        return len(self._data_buffer[keys[0]])
+        return self._num_elements
 
 
 
@@ -243,5 +387,4 @@ class BufferRnd(Buffer):
             List of indicies
         """
         
-        keys = list(self._data_buffer.keys())
-        return random.sample(list(range(0, len(self._data_buffer[keys[0]]))), p_num)
+        return random.sample(range(self._num_elements), p_num)
@@ -12,10 +12,11 @@
 ## -- 2023-11-17  1.2.0     DA       Class Event: new time stamp functionality
 ## -- 2023-11-18  1.2.1     DA       Class Event: time stamp is set to now() if not provided
 ## -- 2024-05-23  1.3.0     DA       Method EventManger._raise_event(): reduction to TypeError   
+## -- 2026-10-16  1.3.1     DA       Method EventManger._raise_event(): lazy logging
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.3.0 (2024-05-23)
+Ver. 1.3.1 (2026-10-16)
 
 This module provides classes for event handling. To this regard, the property class Eventmanager is
 provided to add event functionality to child classes by inheritence.
@@ -142,7 +143,7 @@ class EventManager (Log):
         """
 
         # 0 Intro
-        self.log(Log.C_LOG_TYPE_S, 'Event "' + p_event_id + '" fired')
+        self.log_lazy(Log.C_LOG_TYPE_S, 'Event "%s" fired', p_event_id)
 
 
         # 1 Get list of registered handlers for given event id
@@ -152,14 +153,16 @@ class EventManager (Log):
             handlers = []
 
         if len(handlers) == 0:
-            self.log(Log.C_LOG_TYPE_I, 'No handlers registered for event "' + p_event_id + '"')
+            self.log_lazy(Log.C_LOG_TYPE_I, 'No handlers registered for event "%s"', p_event_id)
             return
 
 
         # 2 Call all registered handlers
+        log_i = self.is_enabled(Log.C_LOG_TYPE_I)
+
         for i, handler in enumerate(handlers):
             try:
-                self.log(Log.C_LOG_TYPE_I, 'Calling handler', i)
+                if log_i: self.log(Log.C_LOG_TYPE_I, 'Calling handler', i)
                 handler( p_event_id=p_event_id, p_event_object=p_event_object )
             except TypeError:
                 self.log(Log.C_LOG_TYPE_E, 'Handler not compatible! Check your code!')
@@ -24,10 +24,14 @@
 ## -- 2024-04-30  1.1.0     DA       Refactoring and new class Renormalizable
 ## -- 2024-05-23  1.2.0     DA       Method Normalizer._set_parameters(): little optimization
 ## -- 2024-07-12  1.2.1     LSB       Renormalization error
+## -- 2026-10-16  1.3.0     DA       Class Normalizer: new methods normalize_batch(), 
+## --                                denormalize_batch(), renormalize_batch()
+## -- 2026-10-16  1.4.0     DA       - New method Normalizer.get_renormalization()
+## --                                - New class LazyRenormalizer
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.2.1 (2024-07-12)
+Ver. 1.4.0 (2026-10-16)
 
 This module provides base class for Normalizers and normalizer objects including MinMax normalization and
 normalization by Z transformation.
@@ -161,6 +165,105 @@ class Normalizer:
         return renormalized_element
 
 
+## -------------------------------------------------------------------------------------------------
+    def normalize_batch(self, p_data: np.ndarray) -> np.ndarray:
+        """
+        Normalizes a 2-D array with one row per data element in place. The results are identical to
+        those of method normalize() per row. The feature data of an InstanceBatch or of an instance 
+        dictionary converted by InstanceBatch.from_inst_dict() can be normalized this way.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            2-D array of data elements.
+
+        Returns
+        -------
+        p_data : np.ndarray
+            Normalized data (same array object).
+        """
+
+        if self._param is None:
+            raise ImplementationError('Normalization parameters not set')
+
+        np.multiply(p_data, self._param[0], out=p_data)
+        np.subtract(p_data, self._param[1], out=p_data)
+        return p_data
+
+
+## -------------------------------------------------------------------------------------------------
+    def denormalize_batch(self, p_data: np.ndarray) -> np.ndarray:
+        """
+        Denormalizes a 2-D array with one row per data element in place. The results are identical
+        to those of method denormalize() per row.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            2-D array of normalized data elements.
+
+        Returns
+        -------
+        p_data : np.ndarray
+            Denormalized data (same array object).
+        """
+
+        if self._param is None:
+            raise ImplementationError('Normalization parameters not set')
+
+        np.multiply(p_data, 1 / self._param[0], out=p_data)
+        np.add(p_data, self._param[1] / self._param[0], out=p_data)
+        return np.nan_to_num(p_data, copy=False)
+
+
+## -------------------------------------------------------------------------------------------------
+    def renormalize_batch(self, p_data: np.ndarray) -> np.ndarray:
+        """
+        Renormalizes a 2-D array with one row per data element in place from the previous to the 
+        current normalization parameters. The results are identical to those of method renormalize()
+        per row.
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            2-D array of data elements normalized with the previous parameters.
+
+        Returns
+        -------
+        p_data : np.ndarray
+            Renormalized data (same array object).
+        """
+
+        self._set_parameters(self._param_old)
+        self.denormalize_batch(p_data)
+        self._set_parameters(self._param_new)
+        return self.normalize_batch(p_data)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_renormalization(self):
+        """
+        Returns the renormalization from the previous to the current normalization parameters as
+        affine transformation per dimension, i.e. renormalize(x) = x * scale + offset. Dimensions
+        without valid previous parameters are mapped to the normalized value of 0.
+
+        Returns
+        -------
+        scale : np.ndarray
+            Factor per dimension.
+        offset : np.ndarray
+            Offset per dimension.
+        """
+
+        a_old, b_old = self._param_old[0], self._param_old[1]
+        a_new, b_new = self._param_new[0], self._param_new[1]
+        valid        = a_old != 0
+
+        scale  = np.divide(a_new, a_old, out=np.zeros_like(a_new, dtype=np.float64), where=valid)
+        offset = np.divide(a_new * b_old, a_old, out=np.zeros_like(a_new, dtype=np.float64), where=valid) - b_new
+        return scale, offset
+
+
 ## -------------------------------------------------------------------------------------------------
     def update_parameters(self, p_data: Union[Set, Element, np.ndarray]):
         """
@@ -197,4 +300,104 @@ class Renormalizable:
             Suitable normalizer object to be used for renormalization.
         """
 
-        pass
\ No newline at end of file
+        pass
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class LazyRenormalizer (Normalizer):
+    """
+    Accumulates the renormalizations of one or more parameter updates of a normalizer as a single
+    affine transformation per dimension. This way, the renormalization of stored data costs O(1) per
+    parameter update and the data themselves are renormalized only once when they are needed, by
+    handing over this object to the renormalization of the data (methods renormalize(), 
+    renormalize_batch()).
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self):
+        super().__init__()
+        self._scale : np.ndarray  = None
+        self._offset : np.ndarray = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def add(self, p_normalizer : Normalizer):
+        """
+        Adds the latest renormalization of the given normalizer.
+
+        Parameters
+        ----------
+        p_normalizer : Normalizer
+            Normalizer whose parameters have been updated.
+        """
+
+        scale, offset = p_normalizer.get_renormalization()
+
+        if self._scale is None:
+            self._scale  = scale.copy()
+            self._offset = offset.copy()
+        else:
+            self._scale  *= scale
+            self._offset *= scale
+            self._offset += offset
+
+
+## -------------------------------------------------------------------------------------------------
+    def is_pending(self) -> bool:
+        """
+        Returns True, if renormalizations have been accumulated since the last reset.
+        """
+
+        return self._scale is not None
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self):
+        self._scale  = None
+        self._offset = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_renormalization(self):
+        return self._scale, self._offset
+
+
+## -------------------------------------------------------------------------------------------------
+    def renormalize(self, p_data: Union[Element, np.ndarray]):
+        """
+        Applies the accumulated renormalization to a data element or an array of data elements.
+
+        Parameters
+        ----------
+        p_data : Element or numpy array
+            Data to be renormalized.
+
+        Returns
+        -------
+        renormalized_element : Element or numpy array
+            Renormalized data.
+        """
+
+        if self._scale is None: return p_data
+
+        if isinstance(p_data, Element):
+            p_data.set_values(np.multiply(p_data.get_values(), self._scale) + self._offset)
+            return p_data
+        elif isinstance(p_data, np.ndarray):
+            return np.multiply(p_data, self._scale) + self._offset
+        else:
+            raise ParamError('Wrong data type provided for renormalization')
+
+
+## -------------------------------------------------------------------------------------------------
+    def renormalize_batch(self, p_data: np.ndarray) -> np.ndarray:
+
+        if self._scale is None: return p_data
+
+        np.multiply(p_data, self._scale, out=p_data)
+        np.add(p_data, self._offset, out=p_data)
+        return p_data
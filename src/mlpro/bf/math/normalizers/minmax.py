@@ -23,10 +23,11 @@
 ## -- 2023-02-13  1.0.14    LSB      BugFix: Changed the direct reference to p_param to a copy object
 ## -- 2024-04-30  1.1.0     DA       Refactoring/separation
 ## -- 2024-07-12  1.1.1     LSB      Renormalization error
+## -- 2026-10-16  1.2.0     DA       Method NormalizerMinMax.update_parameters(): vectorization
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.1.1 (2024-07-12)
+Ver. 1.2.0 (2026-10-16)
 
 This module provides a class for MinMax normalization.
 """
@@ -66,22 +67,20 @@ class NormalizerMinMax(Normalizer):
 
         except:
             try:
-                if self._param_new is None: self._param_new = np.zeros([(len(p_boundaries)), (len(p_boundaries))])
-                boundaries = p_boundaries.reshape(-1, 2)
+                boundaries = np.asarray(p_boundaries).reshape(-1, 2)
+                if self._param_new is None: self._param_new = np.zeros([2, boundaries.shape[0]], dtype=np.float64)
 
             except:
                 raise ParamError("Wrong parameters provided for update. Please provide a set as p_set or boundaries as "
                                  "p_boundaries")
 
-        for i, boundary in enumerate(boundaries):
-            if (boundary[1] - boundary[0]) == 0:
-                self._param_new[0][i] = 0
-            else:
-                self._param_new[0][i] = (2 / (boundary[1] - boundary[0]))
-            if (boundary[1] - boundary[0]) == 0:
-                self._param_new[0][i] = 0
-            else:
-                self._param_new[1][i] = (2 * boundary[0] / (boundary[1] - boundary[0]) + 1)
+        # Dimensions without range keep their previous offset
+        boundaries = np.asarray(boundaries, dtype=np.float64)
+        ranges     = boundaries[:, 1] - boundaries[:, 0]
+        valid      = ranges != 0
+        self._param_new[0] = np.divide(2, ranges, out=np.zeros_like(ranges), where=valid)
+        np.divide(2 * boundaries[:, 0], ranges, out=self._param_new[1], where=valid)
+        np.add(self._param_new[1], 1, out=self._param_new[1], where=valid)
 
         if self._param is not None:
             self._param_old = self._param.copy()
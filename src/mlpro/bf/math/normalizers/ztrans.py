@@ -25,10 +25,14 @@
 ## -- 2024-05-23  1.2.0     DA       Refactoring (not yet finished)
 ## -- 2024-05-24  1.2.1     LSB      Bug fix for Parameter update using only p_data_del in Z-transform
 ## -- 2024-05-27  1.2.2     LSB      Scientific Reference added
+## -- 2026-10-16  1.3.0     DA       - Method NormalizerZTrans.update_parameters(): update on blocks
+## --                                  of new/obsolete data by parallel merge
+## --                                - New method NormalizerZTrans.denormalize_batch()
+## -- 2026-10-16  1.4.0     DA       New method NormalizerZTrans.get_renormalization()
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.2.2 (2024-05-27)
+Ver. 1.4.0 (2026-10-16)
 
 This module provides a class for Z transformation.
 """
@@ -45,7 +49,11 @@ from mlpro.bf.various import ScientificObject
 ## -------------------------------------------------------------------------------------------------
 class NormalizerZTrans (Normalizer, ScientificObject):
     """
-    Class for Normalization based on Z transformation.
+    Class for Normalization based on Z transformation. 
+    
+    Mean and standard deviation can be updated incrementally per data element or per block of data
+    elements. Blocks are merged into/removed from the statistics in one step by the numerically
+    stable parallel algorithm of Chan et al. (see `Wikipedia <https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm>`_).
     """
     C_SCIREF_TYPE = ScientificObject.C_SCIREF_TYPE_ONLINE
     C_SCIREF_URL = 'http://datagenetics.com/blog/november22017/index.html'
@@ -72,9 +80,11 @@ class NormalizerZTrans (Normalizer, ScientificObject):
             parameters based on the dataset provided.
         p_data_new:Element or numpy array
             New element to update the normalization parameters. Using this parameter will set/update the
-            normalization parameters based on the data provided.
+            normalization parameters based on the data provided. A 2-D numpy array is treated as a
+            block of new elements (one per row).
         p_data_del:Element or Numpy array
-            Old element that is replaced with the new element.
+            Old element that is replaced with the new element. A 2-D numpy array is treated as a block
+            of obsolete elements (one per row).
 
         """
 
@@ -93,46 +103,35 @@ class NormalizerZTrans (Normalizer, ScientificObject):
                 self._param_new = np.zeros([2, self._std.shape[-1]])
                 
         else:
+            data_new = self._get_data( p_data = p_data_new )
+            data_del = self._get_data( p_data = p_data_del )
 
-            # 2 Update on new data
-            if p_data_new is not None:
-                try:
-                    data_new = np.array(p_data_new.get_values())
-                except:
-                    data_new = p_data_new
-                
-                if self._n == 0:
-                    self._n = 1
-                    self._mean = data_new.copy()
-                    self._std = np.zeros(shape=data_new.shape)
-                else:
-                    old_mean   = self._mean.copy()
-                    self._mean = (old_mean * self._n + data_new) / (self._n + 1)
+            # 2 Blocks of obsolete data are removed first, as long as data remain. This corresponds
+            #   to the order of an update per element along the instance ids
+            del_first = ( data_del is not None ) and ( data_del.ndim == 2 ) and ( self._n > data_del.shape[0] )
+            if del_first: self._remove_block( p_data = data_del )
 
-                    self._std = np.sqrt((np.square(self._std) * self._n
-                                        + (data_new - self._mean) * (data_new - old_mean)) / (self._n+1))
-                    self._n += 1
+
+            # 3 Update on new data
+            if data_new is not None:
+                if data_new.ndim == 2:
+                    self._merge_block( p_data = data_new )
+                else:
+                    self._add_element( p_data = data_new )
                     
                 if self._param_new is None: 
                     self._param_new = np.zeros([2, data_new.shape[-1]])
 
 
-            # 3 Update on obsolete data
-            if ( p_data_del is not None ) and ( self._n > 0 ):
-                try:
-                    data_del = np.array(p_data_del.get_values())
-                except:
-                    data_del = p_data_del
-            
-                old_mean = self._mean.copy()
-                self._mean = (old_mean * self._n - data_del) / (self._n-1)
-
-                self._std = np.sqrt((np.square(self._std)*self._n - (data_del - old_mean)*(data_del - self._mean)) / (self._n-1))
-                
-                self._n -= 1
+            # 4 Update on obsolete data
+            if ( data_del is not None ) and ( not del_first ) and ( self._n > 0 ):
+                if data_del.ndim == 2:
+                    self._remove_block( p_data = data_del )
+                else:
+                    self._remove_element( p_data = data_del )
 
 
-        # 4 Update of parameters
+        # 5 Update of parameters
         self._param_new[0] = np.divide(1, self._std, out = np.zeros_like(self._std), where = self._std!=0)
         self._param_new[1] = np.divide(self._mean, self._std, out = np.zeros_like(self._std), where = self._std!=0)
 
@@ -142,6 +141,107 @@ class NormalizerZTrans (Normalizer, ScientificObject):
         self._set_parameters( p_param = self._param_new )
 
 
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_data(p_data: Union[Element, np.ndarray]) -> np.ndarray:
+        if p_data is None: return None
+
+        try:
+            return np.array(p_data.get_values())
+        except:
+            return p_data
+
+
+## -------------------------------------------------------------------------------------------------
+    def _add_element(self, p_data: np.ndarray):
+        """
+        Adds a new data element to mean and standard deviation.
+        """
+
+        if self._n == 0:
+            self._n = 1
+            self._mean = p_data.copy()
+            self._std = np.zeros(shape=p_data.shape)
+        else:
+            old_mean   = self._mean.copy()
+            self._mean = (old_mean * self._n + p_data) / (self._n + 1)
+
+            self._std = np.sqrt((np.square(self._std) * self._n
+                                + (p_data - self._mean) * (p_data - old_mean)) / (self._n+1))
+            self._n += 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _remove_element(self, p_data: np.ndarray):
+        """
+        Removes an obsolete data element from mean and standard deviation.
+        """
+
+        old_mean = self._mean.copy()
+        self._mean = (old_mean * self._n - p_data) / (self._n-1)
+
+        self._std = np.sqrt((np.square(self._std)*self._n - (p_data - old_mean)*(p_data - self._mean)) / (self._n-1))
+        
+        self._n -= 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _merge_block(self, p_data: np.ndarray):
+        """
+        Merges a block of new data elements into mean and standard deviation.
+        """
+
+        n_b = p_data.shape[0]
+        if n_b == 0: return
+        if n_b == 1: return self._add_element( p_data = p_data[0] )
+
+        mean_b = np.mean(p_data, axis=0, dtype=np.float64)
+        m2_b   = np.square(p_data - mean_b).sum(axis=0)
+
+        if self._n == 0:
+            self._n    = n_b
+            self._mean = mean_b
+            self._std  = np.sqrt(m2_b / n_b)
+            return
+
+        n_a        = self._n
+        n          = n_a + n_b
+        delta      = mean_b - self._mean
+        m2         = np.square(self._std) * n_a + m2_b + np.square(delta) * ( n_a * n_b / n )
+        self._mean = self._mean + delta * ( n_b / n )
+        self._std  = np.sqrt(m2 / n)
+        self._n    = n
+
+
+## -------------------------------------------------------------------------------------------------
+    def _remove_block(self, p_data: np.ndarray):
+        """
+        Removes a block of obsolete data elements from mean and standard deviation.
+        """
+
+        n_b = p_data.shape[0]
+        if n_b == 0: return
+        if ( n_b == 1 ) and ( self._n > 1 ): return self._remove_element( p_data = p_data[0] )
+
+        n   = self._n
+        n_a = n - n_b
+
+        if n_a <= 0:
+            self._n    = 0
+            self._mean = np.zeros_like(self._mean)
+            self._std  = np.zeros_like(self._std)
+            return
+
+        mean_b     = np.mean(p_data, axis=0, dtype=np.float64)
+        m2_b       = np.square(p_data - mean_b).sum(axis=0)
+        mean_a     = ( self._mean * n - mean_b * n_b ) / n_a
+        delta      = mean_b - mean_a
+        m2_a       = np.square(self._std) * n - m2_b - np.square(delta) * ( n_a * n_b / n )
+        self._mean = mean_a
+        self._std  = np.sqrt(np.maximum(m2_a, 0) / n_a)
+        self._n    = n_a
+
+
 ## -------------------------------------------------------------------------------------------------
     def denormalize(self, p_data: Union[Element, np.ndarray]):
         """
@@ -177,3 +277,23 @@ class NormalizerZTrans (Normalizer, ScientificObject):
             raise ParamError('Wrong datatype provided for denormalization')
 
         return p_data
+
+
+## -------------------------------------------------------------------------------------------------
+    def denormalize_batch(self, p_data: np.ndarray) -> np.ndarray:
+
+        if ( self._param is not None ) and not all(self._std):
+            p_data[:] = self._mean
+            return p_data
+
+        return super().denormalize_batch(p_data)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_renormalization(self):
+
+        if all(self._std): return super().get_renormalization()
+
+        # Denormalization yields the mean as long as a standard deviation is zero (see denormalize())
+        a_new, b_new = self._param_new[0], self._param_new[1]
+        return np.zeros_like(a_new, dtype=np.float64), self._mean * a_new - b_new
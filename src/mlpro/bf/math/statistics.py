@@ -0,0 +1,357 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.math
+## -- Module  : statistics.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  0.0.0     DA       Creation
+## -- 2026-10-16  1.0.0     DA       First release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module provides incremental statistics for data streams. All estimators process one data
+element per update in O(1) with a memory footprint that is independent of the length of the stream.
+They work on all dimensions of the data elements at once.
+
+Learn more:
+
+Welford, B. P. (1962). Note on a Method for Calculating Corrected Sums of Squares and Products.
+Technometrics, 4(3), 419–420.
+
+Finch, T. (2009). Incremental calculation of weighted mean and variance. University of Cambridge.
+
+Jain, R., Chlamtac, I. (1985). The P² Algorithm for Dynamic Calculation of Quantiles and Histograms
+Without Storing Observations. Communications of the ACM, 28(10), 1076–1085.
+"""
+
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class RunningMoments:
+    """
+    Running mean and variance of all data elements seen so far, based on Welford's algorithm.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self):
+        self.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self):
+        """
+        Resets the estimator.
+        """
+
+        self._num  = 0
+        self._mean = None
+        self._m2   = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num(self) -> int:
+        return self._num
+
+
+## -------------------------------------------------------------------------------------------------
+    def update(self, p_values : np.ndarray):
+        """
+        Updates the estimator on a new data element.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Values of the new data element.
+        """
+
+        if self._num == 0:
+            self._mean = np.zeros_like(p_values, dtype=np.float64)
+            self._m2   = np.zeros_like(p_values, dtype=np.float64)
+
+        self._num  += 1
+        delta       = p_values - self._mean
+        self._mean += delta / self._num
+        self._m2   += delta * ( p_values - self._mean )
+
+
+## -------------------------------------------------------------------------------------------------
+    def update_batch(self, p_values : np.ndarray):
+        """
+        Updates the estimator on a batch of data elements in one step by merging the moments of the
+        batch into the current ones.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Matrix with one data element per row.
+        """
+
+        num_batch = p_values.shape[0]
+        if num_batch == 0: return
+
+        mean_batch = np.mean(p_values, axis=0)
+        m2_batch   = np.sum( ( p_values - mean_batch ) ** 2, axis=0 )
+
+        if self._num == 0:
+            self._num  = num_batch
+            self._mean = mean_batch
+            self._m2   = m2_batch
+            return
+
+        num        = self._num + num_batch
+        delta      = mean_batch - self._mean
+        self._mean = self._mean + delta * num_batch / num
+        self._m2   = self._m2 + m2_batch + delta ** 2 * self._num * num_batch / num
+        self._num  = num
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_mean(self) -> np.ndarray:
+        return self._mean
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_variance(self) -> np.ndarray:
+        """
+        Returns the population variance of all data elements seen so far.
+        """
+
+        if self._num == 0: return None
+        return self._m2 / self._num
+
+
+## -------------------------------------------------------------------------------------------------
+    def renormalize(self, p_scale : np.ndarray, p_offset : np.ndarray):
+        """
+        Applies the affine transformation x * p_scale + p_offset to the estimates.
+        """
+
+        if self._num == 0: return
+        self._mean = self._mean * p_scale + p_offset
+        self._m2   = self._m2 * p_scale ** 2
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class EWMoments:
+    """
+    Exponentially weighted moving average (EWMA) and variance (EWMV). Older data elements are
+    forgotten exponentially, so that the estimates follow slow changes of the data distribution.
+
+    Parameters
+    ----------
+    p_alpha : float
+        Smoothing factor in (0, 1]. The higher, the faster older data elements are forgotten.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_alpha : float):
+
+        if not ( 0 < p_alpha <= 1 ):
+            raise ParamError('Parameter p_alpha needs to be in (0, 1]')
+
+        self._alpha = p_alpha
+        self.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self):
+        """
+        Resets the estimator.
+        """
+
+        self._num  = 0
+        self._mean = None
+        self._var  = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num(self) -> int:
+        return self._num
+
+
+## -------------------------------------------------------------------------------------------------
+    def update(self, p_values : np.ndarray):
+        """
+        Updates the estimator on a new data element.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Values of the new data element.
+        """
+
+        self._num += 1
+
+        if self._num == 1:
+            self._mean = np.array(p_values, dtype=np.float64)
+            self._var  = np.zeros_like(self._mean)
+            return
+
+        delta      = p_values - self._mean
+        increment  = self._alpha * delta
+        self._mean = self._mean + increment
+        self._var  = ( 1 - self._alpha ) * ( self._var + delta * increment )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_mean(self) -> np.ndarray:
+        return self._mean
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_variance(self) -> np.ndarray:
+        return self._var
+
+
+## -------------------------------------------------------------------------------------------------
+    def renormalize(self, p_scale : np.ndarray, p_offset : np.ndarray):
+        """
+        Applies the affine transformation x * p_scale + p_offset to the estimates.
+        """
+
+        if self._num == 0: return
+        self._mean = self._mean * p_scale + p_offset
+        self._var  = self._var * p_scale ** 2
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class P2Quantile:
+    """
+    Approximation of a quantile with the P² algorithm of Jain and Chlamtac. Per dimension, five
+    markers are kept whose heights are adjusted by piecewise-parabolic interpolation on each new
+    data element. The first five data elements are stored as they are.
+
+    Parameters
+    ----------
+    p_quantile : float
+        Quantile to be approximated in (0, 1).
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_quantile : float):
+
+        if not ( 0 < p_quantile < 1 ):
+            raise ParamError('Parameter p_quantile needs to be in (0, 1)')
+
+        self._quantile  = p_quantile
+        self._increment = np.array([0, p_quantile / 2, p_quantile, ( 1 + p_quantile ) / 2, 1])
+        self.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self):
+        """
+        Resets the estimator.
+        """
+
+        self._num       = 0
+        self._heights   = None
+        self._positions = None
+        self._desired   = np.array([1, 1 + 2 * self._quantile, 1 + 4 * self._quantile, 3 + 2 * self._quantile, 5])
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num(self) -> int:
+        return self._num
+
+
+## -------------------------------------------------------------------------------------------------
+    def update(self, p_values : np.ndarray):
+        """
+        Updates the estimator on a new data element.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Values of the new data element.
+        """
+
+        values = np.asarray(p_values, dtype=np.float64).ravel()
+
+        # 1 Initial phase: the first five data elements are stored
+        if self._num < 5:
+            if self._num == 0:
+                self._heights = np.empty((5, values.size))
+            self._heights[self._num] = values
+            self._num += 1
+
+            if self._num == 5:
+                self._heights.sort(axis=0)
+                self._positions = np.tile(np.arange(1.0, 6.0)[:, np.newaxis], (1, values.size))
+            return
+
+        self._num += 1
+        heights    = self._heights
+        positions  = self._positions
+
+        # 2 Determination of the cells of the new values and adjustment of the extreme markers
+        cells      = np.sum(values >= heights[1:4], axis=0)
+        heights[0] = np.minimum(heights[0], values)
+        heights[4] = np.maximum(heights[4], values)
+        positions += np.arange(5)[:, np.newaxis] > cells
+        self._desired += self._increment
+
+        # 3 Adjustment of the heights of the middle markers
+        for i in range(1, 4):
+            delta  = self._desired[i] - positions[i]
+            gap_up = positions[i+1] - positions[i]
+            gap_dn = positions[i-1] - positions[i]
+            adjust = ( ( delta >= 1 ) & ( gap_up > 1 ) ) | ( ( delta <= -1 ) & ( gap_dn < -1 ) )
+            if not np.any(adjust): continue
+
+            sign = np.where(delta >= 0, 1.0, -1.0)
+
+            # 3.1 Piecewise-parabolic prediction
+            parabolic = heights[i] + sign / ( positions[i+1] - positions[i-1] ) * (
+                        ( positions[i] - positions[i-1] + sign ) * ( heights[i+1] - heights[i] ) / gap_up +
+                        ( gap_up - sign ) * ( heights[i] - heights[i-1] ) / -gap_dn )
+
+            # 3.2 Linear prediction, if the parabolic one violates the order of the markers
+            neighbour = np.where(sign > 0, heights[i+1], heights[i-1])
+            pos_neigh = np.where(sign > 0, positions[i+1], positions[i-1])
+            linear    = heights[i] + sign * ( neighbour - heights[i] ) / ( pos_neigh - positions[i] )
+            valid     = ( heights[i-1] < parabolic ) & ( parabolic < heights[i+1] )
+
+            heights[i]    = np.where(adjust, np.where(valid, parabolic, linear), heights[i])
+            positions[i] += np.where(adjust, sign, 0)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_quantile(self) -> np.ndarray:
+        """
+        Returns the current approximation of the quantile. During the initial phase, the exact
+        quantile of the stored data elements is returned.
+        """
+
+        if self._num == 0: return None
+        if self._num < 5: return np.quantile(self._heights[:self._num], self._quantile, axis=0)
+        return self._heights[2].copy()
+
+
+## -------------------------------------------------------------------------------------------------
+    def renormalize(self, p_scale : np.ndarray, p_offset : np.ndarray):
+        """
+        Applies the affine transformation x * p_scale + p_offset to the markers. The scale factors
+        are expected to be non-negative.
+        """
+
+        if self._num == 0: return
+        self._heights = self._heights * p_scale + p_offset
@@ -40,10 +40,23 @@
 ## -- 2024-11-11  2.3.0     DA       Class Task:
 ## --                                - new method _on_finished()
 ## --                                - redefinition of method _raise_event()
+## -- 2026-10-16  2.4.0     DA       - New class WorkerPool
+## --                                - Class Async: new method assign_worker_pool()
+## --                                - Class Workflow: new parameters p_worker_pool, p_num_workers
+## --                                  and new method shutdown_worker_pool()
+## -- 2026-10-16  2.5.0     DA       - Class Workflow: compiled execution plan for synchronous runs
+## --                                - Class Task: event C_EVENT_FINISHED is only created if handlers
+## --                                  are registered
+## -- 2026-10-17  2.5.1     DA       Class WorkerPool: failed jobs are logged and collected in the 
+## --                                pool process (new method get_failures())
+## -- 2026-10-17  2.5.2     DA       Method Workflow.add_task(): all plausibility checks precede the
+## --                                changes of the task structure
+## -- 2026-10-17  2.5.3     DA       Class WorkerPool: documentation of p_num_workers in multiprocessing
+## --                                mode and warning if the number of worker processes exceeds it
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 2.3.0 (2024-11-11)
+Ver. 2.5.3 (2026-10-17)
 
 This module provides classes for multitasking with optional interprocess communication (IPC) based
 on shared objects. Multitasking in MLPro combines multrithreading and multiprocessing and simplifies
@@ -57,6 +70,8 @@ See also: https://stackoverflow.com/questions/40234771/replace-pickle-in-python-
 """
 
 
+import os
+import queue
 import threading as mt
 import multiprocess as mp
 import matplotlib
@@ -290,6 +305,339 @@ class Shared (Range):
 
 
 
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WorkerPool (Range, Log):
+    """
+    Pool of long-lived worker threads or processes. Instead of creating a new thread or process for
+    each asynchronous execution, jobs are handed over to the queue of a persistent worker. 
+    
+    Jobs are assigned to workers by an affinity key (usually the object that owns the target method). 
+    All jobs with the same affinity key are executed by the same worker in order of submission. In 
+    multithreading mode, affinity keys are distributed round robin over at most p_num_workers
+    threads. In multiprocessing mode, each affinity key gets its own worker process. It is created 
+    on the first submission and keeps a copy of the related object, so that the object state 
+    persists within this process across all subsequent jobs. Only the method name and the parameters
+    cross the process boundary.
+
+    Please note: in multiprocessing mode, the number of worker processes equals the number of 
+    affinity keys and is not limited by p_num_workers. The object of an affinity key is handed over 
+    at process start and can not be moved to an already running process, since objects like tasks
+    of a workflow can not be pickled in general (e.g. due to shared objects or event handlers). If 
+    the number of worker processes exceeds p_num_workers, a warning is logged.
+
+    Exceptions raised by jobs do not terminate the workers. They are logged as errors and collected
+    by the pool. See method get_failures(). Failures of jobs in worker processes are collected on the
+    next call of method wait().
+
+    Parameters
+    ----------
+    p_range : int
+        Range of asynchronicity of the workers. Valid values are Range.C_RANGE_THREAD and 
+        Range.C_RANGE_PROCESS. Default = Range.C_RANGE_THREAD.
+    p_num_workers : int
+        Maximum number of worker threads. In multiprocessing mode, it is the number of worker 
+        processes beyond which a warning is logged. If None, the number of CPUs is taken. 
+        Default = None.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    """
+
+    C_TYPE          = 'Worker Pool'
+    C_NAME          = ''
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self, 
+                  p_range : int = Range.C_RANGE_THREAD, 
+                  p_num_workers : int = None,
+                  p_logging = Log.C_LOG_ALL ):
+
+        if p_range not in [ self.C_RANGE_THREAD, self.C_RANGE_PROCESS ]:
+            raise ParamError('Worker pools support multithreading and multiprocessing only')
+        
+        if ( p_num_workers is not None ) and ( p_num_workers < 1 ):
+            raise ParamError('Please specify at least one worker')
+
+        Range.__init__(self, p_range=p_range)
+        Log.__init__(self, p_logging=p_logging)
+
+        if p_num_workers is None:
+            self._num_workers = os.cpu_count() or 1
+        else:
+            self._num_workers = p_num_workers
+
+        self._workers       = []
+        self._queues        = []
+        self._affinity      = {}
+        self._objects       = {}
+        self._pending       = {}
+        self._cond_pending  = mt.Condition()
+        self._shut_down     = False
+        self._failures      = []
+        self._failure_queue = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_workers(self) -> int:
+        """
+        Returns the number of workers currently running.
+        """
+
+        return len(self._workers)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_worker(self, p_affinity, p_target) -> int:
+        """
+        Internal use. Determines the worker for the given affinity key and starts it if necessary.
+        """
+
+        try:
+            return self._affinity[p_affinity]
+        except KeyError:
+            pass
+
+        if self._range == self.C_RANGE_THREAD:
+            if len(self._workers) < self._num_workers:
+                worker_id = len(self._workers)
+                job_queue = queue.Queue()
+                worker    = mt.Thread( target=self._run_worker_thread, 
+                                       kwargs={ 'p_queue' : job_queue }, 
+                                       daemon=True )
+                self._queues.append(job_queue)
+                self._workers.append(worker)
+                worker.start()
+            else:
+                worker_id = len(self._affinity) % self._num_workers
+
+        else:
+            # The affinity object is handed over once at process start
+            worker_id = len(self._workers)
+            job_queue = mp.JoinableQueue()
+            obj       = getattr(p_target, '__self__', None)
+            if self._failure_queue is None: self._failure_queue = mp.SimpleQueue()
+            worker    = mp.Process( target=WorkerPool._run_worker_process,
+                                    kwargs={ 'p_queue' : job_queue, 
+                                             'p_object' : obj,
+                                             'p_failure_queue' : self._failure_queue },
+                                    daemon=True )
+            self._queues.append(job_queue)
+            self._workers.append(worker)
+            self._objects[worker_id] = obj
+            worker.start()
+
+            if len(self._workers) == self._num_workers + 1:
+                self.log(Log.C_LOG_TYPE_W, 'Number of worker processes exceeds', self._num_workers, 
+                         '(one process per affinity key)')
+
+        self._affinity[p_affinity] = worker_id
+        self.log(Log.C_LOG_TYPE_I, 'Affinity key assigned to worker', worker_id)
+        return worker_id
+
+
+## -------------------------------------------------------------------------------------------------
+    def submit(self, p_target, p_affinity = None, **p_kwargs):
+        """
+        Hands over a job to the worker related to the given affinity key.
+
+        Parameters
+        ----------
+        p_target
+            Method or function to be executed by a worker.
+        p_affinity
+            Optional affinity key. If None, the object of a given method or the function itself is
+            taken.
+        p_kwargs : dict
+            Parameters to be handed over to the target.
+        """
+
+        if self._shut_down:
+            raise Error('Worker pool has already been shut down')
+
+        if p_affinity is None:
+            p_affinity = getattr(p_target, '__self__', p_target)
+
+        with self._cond_pending:
+            worker_id = self._get_worker(p_affinity=p_affinity, p_target=p_target)
+
+            if self._range == self.C_RANGE_THREAD:
+                self._pending[p_affinity] = self._pending.get(p_affinity, 0) + 1
+
+        if self._range == self.C_RANGE_THREAD:
+            self._queues[worker_id].put( (p_affinity, p_target, p_kwargs) )
+
+        else:
+            # Completion of jobs in worker processes is tracked by their joinable queues
+            if getattr(p_target, '__self__', None) is self._objects[worker_id]:
+                # Only the method name crosses the process boundary
+                target = p_target.__name__
+            else:
+                target = p_target
+
+            self._queues[worker_id].put( (target, p_kwargs) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run_worker_thread(self, p_queue : queue.Queue):
+        """
+        Internal use. Main loop of a worker thread.
+        """
+
+        while True:
+            job = p_queue.get()
+            if job is None: break
+
+            affinity, target, kwargs = job
+
+            try:
+                target(**kwargs)
+            except Exception as e:
+                self._add_failure( p_target = getattr(target, '__name__', repr(target)), p_error = repr(e) )
+            finally:
+                with self._cond_pending:
+                    self._pending[affinity] -= 1
+                    self._cond_pending.notify_all()
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _run_worker_process(p_queue, p_object, p_failure_queue):
+        """
+        Internal use. Main loop of a worker process. Failed jobs are reported to the pool process via
+        the failure queue.
+        """
+
+        while True:
+            job = p_queue.get()
+
+            if job is None: 
+                p_queue.task_done()
+                break
+
+            target, kwargs = job
+
+            try:
+                if isinstance(target, str):
+                    getattr(p_object, target)(**kwargs)
+                else:
+                    target(**kwargs)
+            except Exception as e:
+                # The failure is reported before the job is marked as done, so that wait() finds it
+                if not isinstance(target, str): target = getattr(target, '__name__', repr(target))
+                p_failure_queue.put( ( target, repr(e) ) )
+            finally:
+                p_queue.task_done()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _add_failure(self, p_target : str, p_error : str):
+        """
+        Internal use. Logs and collects a failed job.
+        """
+
+        self.log(Log.C_LOG_TYPE_E, 'Job', p_target, 'failed:', p_error)
+        with self._cond_pending:
+            self._failures.append( ( p_target, p_error ) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _collect_process_failures(self):
+        """
+        Internal use. Takes over the failures reported by worker processes.
+        """
+
+        if self._failure_queue is None: return
+
+        while not self._failure_queue.empty():
+            target, error = self._failure_queue.get()
+            self._add_failure( p_target = target, p_error = error )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_failures(self, p_clear : bool = True) -> list:
+        """
+        Returns the jobs that failed since the last call.
+
+        Parameters
+        ----------
+        p_clear : bool
+            If True, the list of failures is cleared afterwards. Default = True.
+
+        Returns
+        -------
+        list
+            List of tuples (target name, error representation).
+        """
+
+        self._collect_process_failures()
+
+        with self._cond_pending:
+            failures = list(self._failures)
+            if p_clear: self._failures.clear()
+
+        return failures
+
+
+## -------------------------------------------------------------------------------------------------
+    def wait(self, p_affinity = None):
+        """
+        Waits until all jobs of the given affinity key (or all jobs) have been executed.
+
+        Parameters
+        ----------
+        p_affinity
+            Optional affinity key. If None, all jobs are waited for.
+        """
+
+        if self._range == self.C_RANGE_THREAD:
+            with self._cond_pending:
+                if p_affinity is None:
+                    self._cond_pending.wait_for( lambda: not any(self._pending.values()) )
+                else:
+                    self._cond_pending.wait_for( lambda: self._pending.get(p_affinity, 0) == 0 )
+
+        else:
+            if p_affinity is None:
+                for job_queue in self._queues: job_queue.join()
+            else:
+                try:
+                    self._queues[self._affinity[p_affinity]].join()
+                except KeyError:
+                    pass
+
+            self._collect_process_failures()
+
+
+## -------------------------------------------------------------------------------------------------
+    def shutdown(self, p_wait : bool = True):
+        """
+        Shuts down all workers. Further submissions are refused.
+
+        Parameters
+        ----------
+        p_wait : bool
+            If True, pending jobs are executed before the workers terminate. Default = True.
+        """
+
+        if self._shut_down: return
+
+        if p_wait: self.wait()
+        self._shut_down = True
+
+        for job_queue in self._queues: job_queue.put(None)
+        for worker in self._workers: worker.join()
+
+        self._workers.clear()
+        self._queues.clear()
+        self._affinity.clear()
+        self._objects.clear()
+        self._pending.clear()
+        self.log(Log.C_LOG_TYPE_I, 'Shut down')
+
+
+
+
+
 ## -------------------------------------------------------------------------------------------------
 ## -------------------------------------------------------------------------------------------------
 class Async (Range, Log):
@@ -320,6 +668,7 @@ class Async (Range, Log):
         self._async_tasks   = []
         self._mpmanager     = None
         self._class_shared  = p_class_shared
+        self._worker_pool   = None
 
         self._so : Shared   = self._create_so(p_range=p_range_max, p_class_shared=p_class_shared)
 
@@ -396,6 +745,21 @@ class Async (Range, Log):
         self._range = min( self._range, self._so.get_range() )
 
 
+## -------------------------------------------------------------------------------------------------
+    def assign_worker_pool(self, p_worker_pool : WorkerPool):
+        """
+        Assigns a persistent worker pool. Asynchronous executions in the range of the pool are then
+        handed over to the pool instead of starting a new thread/process each time.
+
+        Parameters
+        ----------
+        p_worker_pool : WorkerPool
+            Worker pool object or None to switch back to individual threads/processes.
+        """
+
+        self._worker_pool = p_worker_pool
+
+
 ## -------------------------------------------------------------------------------------------------
     def _start_async( self, 
                       p_target,
@@ -433,17 +797,21 @@ class Async (Range, Log):
             # 2.1 Synchronous execution
             p_target(**p_kwargs)
 
+        elif ( self._worker_pool is not None ) and ( range_run == self._worker_pool.get_range() ):
+            # 2.2 Asynchronous execution by a persistent worker of the assigned pool
+            self._worker_pool.submit( p_target, p_affinity=self, **p_kwargs )
+
         elif range_run in [ self.C_RANGE_THREAD, self.C_RANGE_PROCESS ]:
-            # 2.2 Asynchronous execution as separate thread or process
+            # 2.3 Asynchronous execution as separate thread or process
             if range_run == self.C_RANGE_THREAD:
-                # 2.2.1 Preparation of a new thread
+                # 2.3.1 Preparation of a new thread
                 task = mt.Thread(target=p_target, kwargs=p_kwargs, group=None)
 
             else:
-                # 2.2.2 Preparation of a new process
+                # 2.3.2 Preparation of a new process
                 task = mp.Process(target=p_target, kwargs=p_kwargs, group=None)
 
-            # 2.2.3 Registration and start of new thread/process
+            # 2.3.3 Registration and start of new thread/process
             self._async_tasks.append(task)
             task.start()
 
@@ -464,6 +832,8 @@ class Async (Range, Log):
         for task in self._async_tasks: task.join()
         self._async_tasks.clear()
 
+        if self._worker_pool is not None: self._worker_pool.wait(p_affinity=self)
+
 
 ## -------------------------------------------------------------------------------------------------
     def __del__(self):
@@ -644,7 +1014,10 @@ class Task (Async, EventManager, Plottable, Persistent, KWArgs):
 
         self.log(Log.C_LOG_TYPE_S, 'Stopped')
 
-        self._raise_event( self.C_EVENT_FINISHED, Event(p_raising_object=self, p_range=self._range_run, p_wait=False) )
+        if self._registered_handlers.get(self.C_EVENT_FINISHED):
+            self._raise_event( self.C_EVENT_FINISHED, Event(p_raising_object=self, p_range=self._range_run, p_wait=False) )
+        else:
+            self._on_finished()
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -804,6 +1177,12 @@ class Workflow (Task):
     Ready-to-use container class for task groups. Objects of type Task (or inherited) can be added and
     chained to sequences or hierarchies of tasks. 
 
+    On the first run, the task graph is compiled into an execution plan in topological order. 
+    Synchronous runs process this plan in a simple loop. Asynchronous runs start the entry tasks and
+    trigger the successors of a task as soon as all of its predecessors have finished, so that
+    independent branches run in parallel. In both cases, each task raises event C_EVENT_FINISHED
+    for external listeners as usual.
+
     Parameters
     ----------
     p_name : str
@@ -816,6 +1195,12 @@ class Workflow (Task):
         Boolean switch for env/agent visualisation. Default = False.
     p_logging
         Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    p_worker_pool : bool
+        If True, the workflow creates a persistent worker pool (see class WorkerPool) on its first 
+        asynchronous run and hands it over to all tasks within. Default = False.
+    p_num_workers : int
+        Optional maximum number of worker threads of the pool. See class WorkerPool for the meaning
+        in multiprocessing mode. Default = None (number of CPUs).
     p_kwargs : dict
         Further optional named parameters handed over to every task within.
     """
@@ -830,12 +1215,20 @@ class Workflow (Task):
                   p_class_shared=None, 
                   p_visualize:bool=False,
                   p_logging=Log.C_LOG_ALL, 
+                  p_worker_pool:bool=False,
+                  p_num_workers:int=None,
                   **p_kwargs ):
 
         self._tasks             = []
         self._entry_tasks       = []
         self._final_tasks       = []
+        self._successors        = {}
+        self._exec_plan         = None
+        self._plan_sync_run     = False
         self._first_run         = True
+        self._pool_enabled      = p_worker_pool
+        self._pool_num_workers  = p_num_workers
+        self._pool_owned        = False
 
         self._finished          = mt.Event()
         self._finished.clear()
@@ -895,14 +1288,24 @@ class Workflow (Task):
             raise ParamError
 
 
+        # 2.3 Check: are all predecessor tasks part of the workflow?
+        if p_pred_tasks is not None:
+            for t_pred in p_pred_tasks:
+                if t_pred not in self._tasks:
+                    self.log(Log.C_LOG_TYPE_E, 'Predecessor task "' + t_pred.get_name() + '" needs to be added at first')
+                    raise ParamError
+
+
         # 3 New task is prepared for workflow operation
         p_task.switch_logging(self._level)
         p_task.assign_so(self._so)
+        if self._worker_pool is not None: p_task.assign_worker_pool(self._worker_pool)
 
 
-        # 4 Register task and its event handler to all predecessor tasks
+        # 4 Register task and its predecessor relations
         self._tasks.append(p_task)
         self._final_tasks.append(p_task)
+        self._successors[p_task.get_tid()] = []
 
         if ( p_pred_tasks is None ) or ( len(p_pred_tasks) == 0 ):
             self._entry_tasks.append(p_task)
@@ -915,15 +1318,108 @@ class Workflow (Task):
                 self._range = self.C_RANGE_THREAD
                 
             for t_pred in p_pred_tasks: 
-                t_pred.register_event_handler(p_event_id=self.C_EVENT_FINISHED, p_event_handler=p_task.run_on_event)
+                self._successors[t_pred.get_tid()].append(p_task)
                 if t_pred in self._final_tasks: self._final_tasks.remove(t_pred)
 
 
+        # 5 The execution plan needs to be compiled again for the changed task structure
+        self._exec_plan = None
+
+
 ## -------------------------------------------------------------------------------------------------
     def get_tasks(self) -> list:
         return self._tasks
 
 
+## -------------------------------------------------------------------------------------------------
+    def get_exec_plan(self) -> list:
+        """
+        Returns the execution plan of the workflow, i.e. the list of all tasks in topological order.
+        The plan is compiled on demand.
+        """
+
+        if self._exec_plan is None: self._compile_exec_plan()
+        return self._exec_plan
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compile_exec_plan(self):
+        """
+        Internal use. Compiles the task graph into a list of tasks in topological order. Tasks without
+        mutual dependencies keep the order in which they were added.
+        """
+
+        self.log(Log.C_LOG_TYPE_I, 'Compiling execution plan')
+
+        ctr_pred  = { task.get_tid() : len(task.get_predecessors()) for task in self._tasks }
+        plan      = [ task for task in self._tasks if ctr_pred[task.get_tid()] == 0 ]
+        i         = 0
+
+        while i < len(plan):
+            for t_succ in self._successors[plan[i].get_tid()]:
+                tid = t_succ.get_tid()
+                ctr_pred[tid] -= 1
+                if ctr_pred[tid] == 0: plan.append(t_succ)
+
+            i += 1
+
+        self._exec_plan = plan
+
+
+## -------------------------------------------------------------------------------------------------
+    def _on_task_finished(self, p_event_id, p_event_object:Event):
+        """
+        Internally used in asynchronous runs to trigger the successors of a finished task. Synchronous
+        runs are driven by the execution plan instead.
+
+        Parameters
+        ----------
+        p_event_id 
+            Event id.
+        p_event_object : Event
+            Event object with further context informations.
+        """
+
+        if self._plan_sync_run: return
+
+        for t_succ in self._successors[p_event_object.get_raising_object().get_tid()]:
+            t_succ.run_on_event(p_event_id=p_event_id, p_event_object=p_event_object)
+
+
+## -------------------------------------------------------------------------------------------------
+    def assign_worker_pool(self, p_worker_pool : WorkerPool):
+        """
+        Assigns a worker pool to the workflow and all tasks within.
+
+        Parameters
+        ----------
+        p_worker_pool : WorkerPool
+            Worker pool object or None.
+        """
+
+        Task.assign_worker_pool(self, p_worker_pool=p_worker_pool)
+        for task in self._tasks: task.assign_worker_pool(p_worker_pool=p_worker_pool)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_worker_pool(self) -> WorkerPool:
+        return self._worker_pool
+
+
+## -------------------------------------------------------------------------------------------------
+    def shutdown_worker_pool(self):
+        """
+        Shuts down the worker pool owned by the workflow. A new pool is created on the next
+        asynchronous run.
+        """
+
+        if not self._pool_owned: return
+
+        self._worker_pool.shutdown()
+        self.assign_worker_pool(p_worker_pool=None)
+        self._pool_owned = False
+
+
 ## -------------------------------------------------------------------------------------------------
     def _get_plot_host_task(self, p_task : Task) -> Task:
         plot_host = None
@@ -1052,6 +1548,12 @@ class Workflow (Task):
 
         # 3 Prepare inner task structure for first run
         if self._first_run:
+            self.get_exec_plan()
+
+            for task in self._tasks:
+                if len(self._successors[task.get_tid()]) > 0:
+                    task.register_event_handler(p_event_id=self.C_EVENT_FINISHED, p_event_handler=self._on_task_finished)
+
             for t_final in self._final_tasks:
                 t_final.register_event_handler(p_event_id=self.C_EVENT_FINISHED, p_event_handler=self.event_forwarder)
 
@@ -1059,14 +1561,36 @@ class Workflow (Task):
 
         self._ctr_final_tasks = len(self._final_tasks)
 
+        if self._pool_enabled and ( self._worker_pool is None ) and ( range_run > self.C_RANGE_NONE ):
+            self.log(Log.C_LOG_TYPE_I, 'Creating worker pool')
+            self.assign_worker_pool( p_worker_pool = WorkerPool( p_range = self._range,
+                                                                 p_num_workers = self._pool_num_workers,
+                                                                 p_logging = self._level ) )
+            self._pool_owned = True
+
 
         # 4 Update plot of workflow
         self.update_plot(**p_kwargs)
 
 
         # 5 Execution of all tasks within the workflow
-        for task in self._entry_tasks: 
-            task.run( p_range=range_run, **p_kwargs )
+        if range_run == self.C_RANGE_NONE:
+            # 5.1 Synchronous execution along the compiled plan
+            self._plan_sync_run = True
+
+            try:
+                for task in self._exec_plan:
+                    if task.get_predecessors():
+                        task.run( p_range=range_run, p_wait=False )
+                    else:
+                        task.run( p_range=range_run, **p_kwargs )
+            finally:
+                self._plan_sync_run = False
+
+        else:
+            # 5.2 Asynchronous execution: successors are triggered by their predecessors
+            for task in self._entry_tasks: 
+                task.run( p_range=range_run, **p_kwargs )
 
         if p_wait: self.wait_async_tasks()
 
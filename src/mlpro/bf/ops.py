@@ -15,10 +15,11 @@
 ## -- 2022-11-21  1.2.2     DA       Eliminated all uses of super()
 ## -- 2023-03-25  1.2.3     DA       Class ScenarioBase: new parent class Persistent
 ## -- 2024-11-09  1.3.0     DA       Class ScenarioBase: new parent class KWArgs
+## -- 2026-10-16  1.3.1     DA       Method ScenarioBase.run_cycle(): lazy logging
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.3.0 (2024-11-09)
+Ver. 1.3.1 (2026-10-16)
 
 This module provides classes for operation.
 """
@@ -302,14 +303,15 @@ class ScenarioBase (Mode, Persistent, Plottable, KWArgs):
 
 
         # 1 Run a single custom cycle
-        self.log(self.C_LOG_TYPE_S, 'Process time', self._timer.get_time(), ': Start of cycle', str(self._cycle_id))
+        log_s = self.is_enabled(self.C_LOG_TYPE_S)
+        if log_s: self.log(self.C_LOG_TYPE_S, 'Process time', self._timer.get_time(), ': Start of cycle', self._cycle_id)
         success, error, adapted, end_of_data = self._run_cycle()
-        self.log(self.C_LOG_TYPE_S, 'Process time', self._timer.get_time(), ': End of cycle', str(self._cycle_id))
+        if log_s: self.log(self.C_LOG_TYPE_S, 'Process time', self._timer.get_time(), ': End of cycle', self._cycle_id)
 
 
         # 2 End of data source reached?
         if end_of_data:
-            self.log(self.C_LOG_TYPE_S, 'Process time', self._timer.get_time(), ': End of data source reached')
+            if log_s: self.log(self.C_LOG_TYPE_S, 'Process time', self._timer.get_time(), ': End of data source reached')
             return success, error, timeout, limit, adapted, end_of_data
 
 
@@ -327,7 +329,7 @@ class ScenarioBase (Mode, Persistent, Plottable, KWArgs):
 
         # 5 Wait for next cycle (real mode only)
         if ( self._timer.finish_lap() == False ) and ( self._cycle_len is not None ):
-            self.log(self.C_LOG_TYPE_W, 'Process time', self._timer.get_time(), ': Process timed out !!!')
+            self.log_lazy(self.C_LOG_TYPE_W, lambda: ('Process time', self._timer.get_time(), ': Process timed out !!!'))
             timeout = True
 
 
@@ -72,18 +72,55 @@
 ## -- 2024-10-29  2.2.0     DA       Changed definiton of InstType, InstTypeNew, InstTypeDel
 ## -- 2024-10-30  2.3.0     DA       Refactoring of StreamTask.update_plot()
 ## -- 2024-11-10  2.4.0     DA       Refactoring of StreamWorkflow.init_plot()
+## -- 2026-10-16  2.5.0     DA       Class StreamScenario: new micro-batch mode (parameters 
+## --                                p_batch_size, p_batch_duration)
+## -- 2026-10-16  2.6.0     DA       New classes StreamSharedMemory, StreamSharedMemoryClient for 
+## --                                the exchange of numeric instances via shared memory
+## -- 2026-10-16  2.7.0     DA       - New class InstanceBatch for a columnar representation of 
+## --                                  instances
+## --                                - Class StreamTask: new custom method _run_batch()
+## -- 2026-10-16  2.8.0     DA       - Class Stream: new method get_next_batch() and custom method
+## --                                  _get_next_batch()
+## --                                - Class StreamScenario: micro-batches are taken from the stream 
+## --                                  via get_next_batch()
+## -- 2026-10-16  2.9.0     DA       Opt-in instrumentation of stream tasks:
+## --                                - Class StreamTask: run statistics in method _run_wrapper()
+## --                                - Class StreamWorkflow: new methods set_instrumentation(),
+## --                                  get_instrumentation(), add_task()
+## --                                - Class StreamScenario: new parameters p_instrumentation,
+## --                                  p_instrumentation_path and new method run()
+## -- 2026-10-17  2.9.1     DA       Classes StreamSharedMemory, StreamSharedMemoryClient, StreamTask:
+## --                                - instances are exchanged as block references (first row and 
+## --                                  number of rows) and decoded inside the executing process
+## --                                - overflow detection of the shared memory ring
+## -- 2026-10-17  2.9.2     DA       Class InstanceBatch: 
+## --                                - new methods set_feature_data(), set_label_data()
+## --                                - method set_ids() accepts None
+## -- 2026-10-17  2.9.3     DA       - Classes StreamTask, StreamWorkflow: new method finish() and
+## --                                  custom method _finish()
+## --                                - Method StreamScenario.run() finishes the stream workflow
+## -- 2026-10-17  2.9.4     DA       Class StreamWorkflow: run statistics are completed when all
+## --                                final tasks have finished and count the outgoing instances
+## -- 2026-10-17  2.9.5     DA       Class StreamScenario: parameters p_batch_size, p_batch_duration
+## --                                moved behind p_logging
+## -- 2026-10-17  2.9.6     DA       Class StreamScenario: parameters p_instrumentation,
+## --                                p_instrumentation_path moved to the end
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 2.4.0 (2024-11-10)
+Ver. 2.9.6 (2026-10-17)
 
 This module provides classes for standardized data stream processing. 
 
 """
 import datetime
+import os
+from threading import Lock
 
 from matplotlib.figure import Figure
+from multiprocess import shared_memory, resource_tracker
 import random
+from time import perf_counter
 from typing import Dict, Tuple
 
 from mlpro.bf.math.basics import *
@@ -92,6 +129,7 @@ from mlpro.bf.ops import Mode, ScenarioBase
 from mlpro.bf.plot import PlotSettings
 from mlpro.bf.math import Dimension, Element
 from mlpro.bf.mt import *
+from mlpro.bf.streams.instrumentation import StreamInstrumentation, TaskStats
 
 
 
@@ -204,6 +242,314 @@ InstDict    = Dict[InstId, Tuple[InstType, Instance]]
 
 
 
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class InstanceBatch:
+    """
+    Columnar representation of a batch of stream instances. The feature and label values of all 
+    instances are stored in contiguous 2-D arrays (one row per instance), accompanied by vectors of
+    instance ids, time stamps and instance types. Objects of type Instance are only created on 
+    demand (see methods get_instance(), get_inst_dict()) and share their values with the rows of the
+    batch.
+
+    Parameters
+    ----------
+    p_feature_set : Set
+        Feature space of all instances.
+    p_feature_data : np.ndarray
+        2-D array of feature values with shape (number of instances, number of features).
+    p_label_set : Set
+        Optional label space of all instances. Default = None.
+    p_label_data : np.ndarray
+        Optional 2-D array of label values with shape (number of instances, number of labels).
+    p_ids : np.ndarray
+        Optional vector of instance ids. Default = None (ids are set later by the stream).
+    p_tstamps : np.ndarray
+        Optional vector of time stamps. Default = None.
+    p_new : np.ndarray
+        Optional boolean vector that is True for new instances and False for obsolete instances.
+        Default = None (all instances are new).
+    """
+
+    C_TYPE          = 'Instance Batch'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_feature_set : Set,
+                  p_feature_data : np.ndarray,
+                  p_label_set : Set = None,
+                  p_label_data : np.ndarray = None,
+                  p_ids : np.ndarray = None,
+                  p_tstamps : np.ndarray = None,
+                  p_new : np.ndarray = None ):
+
+        self._feature_set  = p_feature_set
+        self._feature_data = p_feature_data
+        self._label_set    = p_label_set
+        self._label_data   = p_label_data
+        self._len          = p_feature_data.shape[0]
+
+        if p_new is None:
+            self._new = np.ones(self._len, dtype=bool)
+        else:
+            self._new = p_new
+
+        self._tstamps      = p_tstamps
+        self._instances    = {}
+        self.set_ids(p_ids)
+
+
+## -------------------------------------------------------------------------------------------------
+    def __len__(self):
+        return self._len
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_feature_set(self) -> Set:
+        return self._feature_set
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_feature_data(self) -> np.ndarray:
+        return self._feature_data
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_feature_data(self, p_feature_set : Set, p_feature_data : np.ndarray):
+        """
+        Replaces the feature space and values of all instances of the batch, e.g. after a 
+        rearrangement. Instances already created get new feature data that share their values with 
+        the new rows.
+
+        Parameters
+        ----------
+        p_feature_set : Set
+            New feature space.
+        p_feature_data : np.ndarray
+            2-D array of new feature values with one row per instance.
+        """
+
+        self._feature_set  = p_feature_set
+        self._feature_data = p_feature_data
+
+        for i, inst in self._instances.items():
+            feature_data = Element(p_feature_set)
+            feature_data.set_values(p_feature_data[i])
+            inst.set_feature_data(p_feature_data=feature_data)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_label_set(self) -> Set:
+        return self._label_set
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_label_data(self) -> np.ndarray:
+        return self._label_data
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_label_data(self, p_label_set : Set, p_label_data : np.ndarray):
+        """
+        Replaces the label space and values of all instances of the batch. See method 
+        set_feature_data() for further details.
+
+        Parameters
+        ----------
+        p_label_set : Set
+            New label space.
+        p_label_data : np.ndarray
+            2-D array of new label values with one row per instance.
+        """
+
+        self._label_set  = p_label_set
+        self._label_data = p_label_data
+
+        for i, inst in self._instances.items():
+            label_data = Element(p_label_set)
+            label_data.set_values(p_label_data[i])
+            inst.set_label_data(p_label_data=label_data)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_ids(self) -> np.ndarray:
+        return self._ids
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_ids(self, p_ids : np.ndarray):
+        """
+        Sets the instance ids. Time stamps that have not been provided are set to the ids (see also
+        method Instance.set_id()).
+
+        Parameters
+        ----------
+        p_ids : np.ndarray
+            Vector of instance ids or None. If None, the ids of instances already created remain
+            unchanged.
+        """
+
+        self._ids = p_ids
+        if p_ids is None: return
+
+        if self._tstamps is None: self._tstamps = p_ids
+
+        for i, inst in self._instances.items():
+            inst.id = int(p_ids[i])
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_tstamps(self) -> np.ndarray:
+        return self._tstamps
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_new_mask(self) -> np.ndarray:
+        """
+        Returns a boolean vector that is True for new instances and False for obsolete instances.
+        """
+
+        return self._new
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_instance(self, p_index : int) -> Instance:
+        """
+        Returns the instance at the given position. The instance is created on the first call. Its
+        feature and label values are views on the rows of the batch.
+
+        Parameters
+        ----------
+        p_index : int
+            Position of the instance in the batch.
+
+        Returns
+        -------
+        inst : Instance
+            Instance object.
+        """
+
+        try:
+            return self._instances[p_index]
+        except KeyError:
+            pass
+
+        feature_data = Element(self._feature_set)
+        feature_data.set_values(self._feature_data[p_index])
+
+        if self._label_data is not None:
+            label_data = Element(self._label_set)
+            label_data.set_values(self._label_data[p_index])
+        else:
+            label_data = None
+
+        if self._tstamps is not None:
+            tstamp = self._tstamps[p_index]
+        else:
+            tstamp = None
+
+        inst = Instance( p_feature_data=feature_data, p_label_data=label_data, p_tstamp=tstamp )
+        if self._ids is not None: inst.id = int(self._ids[p_index])
+
+        self._instances[p_index] = inst
+        return inst
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_inst_dict(self) -> InstDict:
+        """
+        Returns the instances of the batch as instance dictionary. 
+        """
+
+        inst_dict = {}
+        new       = self._new
+
+        for i in range(self._len):
+            inst = self.get_instance(i)
+            inst_dict[inst.id] = ( InstTypeNew if new[i] else InstTypeDel, inst )
+
+        return inst_dict
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def from_inst_dict(p_inst : InstDict):
+        """
+        Creates a batch from an instance dictionary. The values of the instances are copied into
+        the batch at first. Afterwards, the given instances share their values with the rows of the
+        batch, so that manipulations of the batch arrays are visible in the instances and vice versa.
+
+        Parameters
+        ----------
+        p_inst : InstDict
+            Instances to be batched.
+
+        Returns
+        -------
+        batch : InstanceBatch
+            Batch of instances sorted by id or None, if the instances are not numeric or do not share
+            the same feature/label spaces.
+        """
+
+        if len(p_inst) == 0: return None
+
+        ids       = sorted(p_inst.keys())
+        inst_0    = p_inst[ids[0]][1]
+        fset      = inst_0.get_feature_data().get_related_set()
+        ldata_0   = inst_0.get_label_data()
+        lset      = ldata_0.get_related_set() if ldata_0 is not None else None
+        fdim_ids  = fset.get_dim_ids()
+        ldim_ids  = lset.get_dim_ids() if lset is not None else None
+
+        if not fset.is_numeric(): return None
+        if ( lset is not None ) and ( not lset.is_numeric() ): return None
+
+        # 1 Check the instances and collect the values
+        f_rows  = []
+        l_rows  = []
+        tstamps = []
+        new     = np.empty(len(ids), dtype=bool)
+
+        for i, inst_id in enumerate(ids):
+            inst_type, inst = p_inst[inst_id]
+            fdata = inst.get_feature_data()
+            ldata = inst.get_label_data()
+
+            if ( fdata.get_related_set() is not fset ) and ( fdata.get_dim_ids() != fdim_ids ): return None
+
+            if lset is None:
+                if ldata is not None: return None
+            else:
+                if ldata is None: return None
+                if ( ldata.get_related_set() is not lset ) and ( ldata.get_dim_ids() != ldim_ids ): return None
+                l_rows.append(ldata.get_values())
+
+            f_rows.append(fdata.get_values())
+            tstamps.append(inst.tstamp)
+            new[i] = ( inst_type == InstTypeNew )
+
+        # 2 Set up the batch
+        batch = InstanceBatch( p_feature_set = fset,
+                               p_feature_data = np.array(f_rows, dtype=np.float64),
+                               p_label_set = lset,
+                               p_label_data = np.array(l_rows, dtype=np.float64) if lset is not None else None,
+                               p_ids = np.array(ids),
+                               p_tstamps = np.array(tstamps),
+                               p_new = new )
+
+        # 3 Let the given instances share their values with the batch
+        for i, inst_id in enumerate(ids):
+            inst = p_inst[inst_id][1]
+            inst.get_feature_data().set_values(batch._feature_data[i])
+            if lset is not None: inst.get_label_data().set_values(batch._label_data[i])
+            batch._instances[i] = inst
+
+        return batch
+
+
+
+
+
 ## -------------------------------------------------------------------------------------------------
 ## -------------------------------------------------------------------------------------------------
 class StreamShared (Shared):
@@ -251,54 +597,435 @@ class StreamShared (Shared):
         Returns
         -------
         inst : InstDict
-            Instances of all given task ids.
+            Instances of all given task ids.
+        """
+
+        len_task_ids = len(p_task_ids)
+
+        if len_task_ids == 1:
+            # Most likely case: result instances of one predecessor are requested
+            try:
+                instances = self._instances[p_task_ids[0]]
+            except KeyError:
+                # Predecessor is the workflow
+                instances = self._instances['wf']
+
+            inst = instances.copy()
+
+        elif len_task_ids > 1:
+            # Result instances of more than one predecessors are requested
+            inst : InstDict = {}
+
+            for task_id in p_task_ids:
+                try:
+                    inst_task = self._instances[task_id]
+                except KeyError:
+                    inst_task = self._instances['wf']
+
+                inst.update(inst_task)
+
+        else:
+            # No predecessor task id -> origin incoming instances on workflow level are forwarded
+            inst = self._instances['wf'].copy()
+
+        return inst
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_instances(self, p_task_id, p_inst:InstDict):
+        """
+        Stores result instances of a task in the shared object.
+
+        Parameters
+        ----------
+        p_task_id
+            Id of related task.
+        p_inst : InstDict
+            Instances of related task.
+        """
+
+        self._instances[p_task_id] = p_inst
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamSharedMemory (StreamShared):
+    """
+    Shared object for multiprocessing stream workflows (range Range.C_RANGE_PROCESS) with numeric
+    streams. The feature and label values of the instances are stored in a ring of float rows in
+    a shared memory segment. The shared object itself only stores a lightweight block reference per
+    task, that consists of the first row of the block in the ring, the number of rows and some meta
+    data per instance (id, instance type, time stamp, keyword arguments). So, no Instance, Element 
+    or Set objects need to be serialized on the way between the tasks. Encoding and decoding of
+    instances is done by class StreamSharedMemoryClient inside the task processes.
+
+    The ring is set up on the first stream instance and is designed for the feature/label spaces of 
+    the stream. Instances of other spaces (e.g. after a rearrangement of features) are still 
+    exchanged as objects within the block reference. All rows allocated within one process cycle of
+    the workflow remain valid until the next cycle starts. If the rows of a cycle exceed the capacity
+    of the ring (constant C_CAPACITY), an exception is raised instead of overwriting rows that have
+    not yet been consumed.
+
+    Parameters
+    ----------
+    p_range : int
+        Range of asynchonicity. Default = Range.C_RANGE_PROCESS.
+    """
+
+    C_CAPACITY      = 65536
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_range: int = Range.C_RANGE_PROCESS):
+        StreamShared.__init__(self, p_range=p_range)
+        self._shm        = None
+        self._shm_layout = None
+        self._shm_pos    = 0
+        self._shm_used   = 0
+        self._shm_lock   = Lock()
+
+
+## -------------------------------------------------------------------------------------------------
+    def init_shm(self, p_num_features : int, p_num_labels : int, p_feature_set : Set, p_label_set : Set):
+        """
+        Creates the shared memory segment on the first call and returns its layout.
+
+        Parameters
+        ----------
+        p_num_features : int
+            Number of feature dimensions.
+        p_num_labels : int
+            Number of label dimensions.
+        p_feature_set : Set
+            Feature space of the stream.
+        p_label_set : Set
+            Label space of the stream or None.
+
+        Returns
+        -------
+        layout : tuple
+            Name of the segment, capacity, number of features, number of labels, feature space, 
+            label space
+        """
+
+        with self._shm_lock:
+            if self._shm is None:
+                width = max(1, p_num_features + p_num_labels)
+                self._shm = shared_memory.SharedMemory( create=True, 
+                                                        size=self.C_CAPACITY * width * np.dtype(np.float64).itemsize )
+                self._shm_layout = ( self._shm.name, 
+                                     self.C_CAPACITY, 
+                                     p_num_features, 
+                                     p_num_labels, 
+                                     p_feature_set, 
+                                     p_label_set )
+                
+            return self._shm_layout
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_shm_layout(self):
+        """
+        Returns the layout of the shared memory segment or None if not yet created. See method 
+        init_shm() for further details.
+        """
+
+        return self._shm_layout
+
+
+## -------------------------------------------------------------------------------------------------
+    def alloc_rows(self, p_num_rows : int, p_new_cycle : bool = False) -> int:
+        """
+        Allocates consecutive rows of the ring.
+
+        Parameters
+        ----------
+        p_num_rows : int
+            Number of rows.
+        p_new_cycle : bool
+            If True, the rows of the previous process cycle are released before. Default = False.
+
+        Returns
+        -------
+        row : int
+            First allocated row. The following rows are to be determined modulo the capacity.
+        """
+
+        with self._shm_lock:
+            if p_new_cycle: self._shm_used = 0
+
+            if self._shm_used + p_num_rows > self.C_CAPACITY:
+                raise Error('Overflow of the shared memory ring: ' + str(self._shm_used + p_num_rows) + 
+                            ' rows requested within one cycle, capacity is ' + str(self.C_CAPACITY) + 
+                            '. Please increase constant C_CAPACITY.')
+
+            row = self._shm_pos
+            self._shm_pos   = ( self._shm_pos + p_num_rows ) % self.C_CAPACITY
+            self._shm_used += p_num_rows
+            return row
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_instances(self, p_task_ids:list) -> list:
+        """
+        Provides the block references of all given task ids. See class StreamSharedMemoryClient for
+        decoding.
+
+        Parameters
+        ----------
+        p_task_ids : list
+            List of task ids.
+
+        Returns
+        -------
+        blocks : list
+            Block references of all given task ids.
+        """
+
+        if len(p_task_ids) == 0: return [ self._instances['wf'] ]
+
+        blocks = []
+        for task_id in p_task_ids:
+            try:
+                blocks.append( self._instances[task_id] )
+            except KeyError:
+                # Predecessor is the workflow
+                blocks.append( self._instances['wf'] )
+
+        return blocks
+
+
+## -------------------------------------------------------------------------------------------------
+    def __del__(self):
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except:
+            pass
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamSharedMemoryClient:
+    """
+    Process-local access to a shared object of type StreamSharedMemory. Encodes instance dictionaries
+    into block references plus rows in shared memory and decodes them again. 
+    
+    A block reference is a tuple (row, number of rows, entries). It contains one entry per instance
+    in the order of the instance dictionary. Entries of encoded instances are tuples (instance id, 
+    instance type, row offset, (time stamp, keyword arguments)). Entries of instances that are 
+    exchanged as objects are tuples (instance id, instance type, None, instance).
+
+    Parameters
+    ----------
+    p_so : StreamSharedMemory
+        Shared object (usually a proxy of it).
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_so : StreamSharedMemory):
+        self._so          = p_so
+        self._shm         = None
+        self._buffer      = None
+        self._capacity    = 0
+        self._num_feat    = 0
+        self._num_labels  = 0
+        self._fset        = None
+        self._lset        = None
+        self._fset_ids    = None
+        self._lset_ids    = None
+        self._numeric     = True
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def create(p_so):
+        """
+        Creates a client for the given shared object if it supports the exchange via shared memory
+        in multiprocessing mode. Returns None otherwise.
+        """
+
+        if p_so is None: return None
+
+        try:
+            if p_so.get_range() != Range.C_RANGE_PROCESS: return None
+            p_so.get_shm_layout()
+        except AttributeError:
+            return None
+
+        return StreamSharedMemoryClient(p_so=p_so)
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def get_num_inst(p_blocks : list) -> int:
+        """
+        Returns the number of instance entries of the given block references.
+        """
+
+        return sum( len(block[2]) for block in p_blocks )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _attach(self, p_inst_ref : Instance = None) -> bool:
+        """
+        Internal use. Attaches to the shared memory segment and creates it if necessary.
+        """
+
+        layout = self._so.get_shm_layout()
+
+        if layout is None:
+            if p_inst_ref is None: return False
+
+            feature_data = p_inst_ref.get_feature_data()
+            label_data   = p_inst_ref.get_label_data()
+            fset         = feature_data.get_related_set()
+            lset         = label_data.get_related_set() if label_data is not None else None
+
+            if ( not fset.is_numeric() ) or ( ( lset is not None ) and ( not lset.is_numeric() ) ):
+                self._numeric = False
+                return False
+
+            layout = self._so.init_shm( p_num_features = fset.get_num_dim(),
+                                        p_num_labels = lset.get_num_dim() if lset is not None else 0,
+                                        p_feature_set = fset,
+                                        p_label_set = lset )
+
+        name, self._capacity, self._num_feat, self._num_labels, self._fset, self._lset = layout
+        self._shm      = shared_memory.SharedMemory(name=name)
+        self._buffer   = np.ndarray( shape=(self._capacity, max(1, self._num_feat + self._num_labels)), 
+                                     dtype=np.float64, 
+                                     buffer=self._shm.buf )
+        self._fset_ids = self._fset.get_dim_ids()
+        self._lset_ids = self._lset.get_dim_ids() if self._lset is not None else None
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _is_encodable(self, p_inst : Instance) -> bool:
+        """
+        Internal use. Checks whether the instance fits the layout of the ring.
+        """
+
+        if p_inst.get_feature_data().get_related_set().get_dim_ids() != self._fset_ids: return False
+
+        label_data = p_inst.get_label_data()
+        if label_data is None: return self._lset_ids is None
+        return label_data.get_related_set().get_dim_ids() == self._lset_ids
+
+
+## -------------------------------------------------------------------------------------------------
+    def encode(self, p_inst : InstDict, p_new_cycle : bool = False) -> tuple:
+        """
+        Encodes the given instances into a block reference. Feature and label values are written to
+        consecutive rows of the shared memory ring.
+
+        Parameters
+        ----------
+        p_inst : InstDict
+            Instances to be encoded.
+        p_new_cycle : bool
+            Must be True for the incoming instances of a new process cycle. Default = False.
+
+        Returns
+        -------
+        block : tuple
+            Block reference (row, number of rows, entries).
+        """
+
+        if ( self._shm is None ) and self._numeric and ( len(p_inst) > 0 ):
+            self._attach( p_inst_ref = next(iter(p_inst.values()))[1] )
+
+        entries = []
+        values  = []
+
+        for inst_id, (inst_type, inst) in p_inst.items():
+
+            if ( self._shm is None ) or ( not self._is_encodable(inst) ):
+                entries.append( ( inst_id, inst_type, None, inst ) )
+                continue
+
+            row_values = inst.get_feature_data().get_values()
+            if self._num_labels > 0:
+                row_values = np.concatenate( ( row_values, inst.get_label_data().get_values() ) )
+
+            entries.append( ( inst_id, inst_type, len(values), ( inst.tstamp, inst.get_kwargs() or None ) ) )
+            values.append( row_values )
+
+        num_rows = len(values)
+        if ( num_rows == 0 ) and not p_new_cycle: return ( None, 0, entries )
+
+        row = self._so.alloc_rows( num_rows, p_new_cycle )
+
+        if num_rows > 0:
+            self._buffer[ ( row + np.arange(num_rows) ) % self._capacity, :self._num_feat + self._num_labels ] = values
+
+        return ( row, num_rows, entries )
+
+
+## -------------------------------------------------------------------------------------------------
+    def decode(self, p_blocks : list, p_copy_objects : bool = False) -> InstDict:
+        """
+        Decodes the given block references into new instance objects. Instances of several blocks
+        with the same id are taken from the last block.
+
+        Parameters
+        ----------
+        p_blocks : list
+            Block references.
+        p_copy_objects : bool
+            If True, instances that are exchanged as objects are duplicated. Default = False.
+
+        Returns
+        -------
+        inst : InstDict
+            Decoded instances.
         """
 
-        len_task_ids = len(p_task_ids)
+        inst_dict : InstDict = {}
 
-        if len_task_ids == 1:
-            # Most likely case: result instances of one predecessor are requested
-            try:
-                instances = self._instances[p_task_ids[0]]
-            except KeyError:
-                # Predecessor is the workflow
-                instances = self._instances['wf']
+        for row, num_rows, entries in p_blocks:
 
-            inst = instances.copy()
+            if num_rows > 0:
+                if self._shm is None: self._attach()
+                values = self._buffer[ ( row + np.arange(num_rows) ) % self._capacity ]
 
-        elif len_task_ids > 1:
-            # Result instances of more than one predecessors are requested
-            inst : InstDict = {}
+            for inst_id, inst_type, offset, payload in entries:
 
-            for task_id in p_task_ids:
-                try:
-                    inst_task = self._instances[task_id]
-                except KeyError:
-                    inst_task = self._instances['wf']
+                if offset is None:
+                    inst_dict[inst_id] = ( inst_type, payload.copy() if p_copy_objects else payload )
+                    continue
 
-                inst.update(inst_task)
+                feature_data = Element(self._fset)
+                feature_data.set_values( values[offset, :self._num_feat] )
 
-        else:
-            # No predecessor task id -> origin incoming instances on workflow level are forwarded
-            inst = self._instances['wf'].copy()
+                if self._num_labels > 0:
+                    label_data = Element(self._lset)
+                    label_data.set_values( values[offset, self._num_feat:self._num_feat+self._num_labels] )
+                else:
+                    label_data = None
 
-        return inst
+                tstamp, kwargs = payload
+                if kwargs is None:
+                    inst = Instance( p_feature_data=feature_data, p_label_data=label_data, p_tstamp=tstamp )
+                else:
+                    inst = Instance( p_feature_data=feature_data, p_label_data=label_data, p_tstamp=tstamp, **kwargs )
 
+                inst.id = inst_id
+                inst_dict[inst_id] = ( inst_type, inst )
 
-## -------------------------------------------------------------------------------------------------
-    def set_instances(self, p_task_id, p_inst:InstDict):
-        """
-        Stores result instances of a task in the shared object.
+        return inst_dict
 
-        Parameters
-        ----------
-        p_task_id
-            Id of related task.
-        p_inst : InstDict
-            Instances of related task.
-        """
 
-        self._instances[p_task_id] = p_inst
+## -------------------------------------------------------------------------------------------------
+    def __del__(self):
+        try:
+            self._shm.close()
+        except:
+            pass
 
 
 
@@ -686,6 +1413,99 @@ class Stream (Mode, Id, ScientificObject):
         raise NotImplementedError
 
 
+## -------------------------------------------------------------------------------------------------
+    def get_next_batch(self, p_num_inst : int) -> InstanceBatch:
+        """
+        Returns the next instances of the data stream as one batch by calling the custom method 
+        _get_next_batch(). The instance ids are assigned in the same way as by method __next__().
+
+        Parameters
+        ----------
+        p_num_inst : int
+            Maximum number of instances. Fewer instances are returned at the end of the stream.
+
+        Returns
+        -------
+        batch : InstanceBatch
+            Next instances of the data stream. At the end of the stream exception StopIteration is 
+            raised.
+        """
+
+        if p_num_inst <= 0: raise ParamError('Parameter p_num_inst needs to be greater than 0')
+
+        if self._sampler is not None:
+            # Samplers decide instance by instance
+            batch = Stream._get_next_batch(self, p_num_inst=p_num_inst)
+        else:
+            batch = self._get_next_batch(p_num_inst=p_num_inst)
+
+        num_inst = len(batch)
+        if num_inst == 0: raise StopIteration
+
+        batch.set_ids( np.arange(self._next_inst_id, self._next_inst_id + num_inst) )
+        self._next_inst_id += num_inst
+        return batch
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next_batch(self, p_num_inst : int) -> InstanceBatch:
+        """
+        Custom method to determine the next instances of the data stream as one batch. Streams that
+        are able to compute their data vectorized should redefine this method. The default 
+        implementation collects the instances of method _get_next(). See method get_next_batch() for
+        more details.
+
+        Parameters
+        ----------
+        p_num_inst : int
+            Maximum number of instances.
+
+        Returns
+        -------
+        batch : InstanceBatch
+            Next instances of the data stream without ids. At the end of the stream, the batch can 
+            be shorter or empty.
+        """
+
+        f_values = []
+        l_values = []
+        tstamps  = []
+        inst     = None
+
+        try:
+            while len(f_values) < p_num_inst:
+                inst = self._get_next()
+                if ( self._sampler is not None ) and self._sampler.omit_instance(inst): continue
+
+                f_values.append(inst.get_feature_data().get_values())
+                if inst.get_label_data() is not None: l_values.append(inst.get_label_data().get_values())
+                tstamps.append(inst.tstamp)
+
+        except StopIteration:
+            pass
+
+        if len(f_values) == 0:
+            return InstanceBatch( p_feature_set=self.get_feature_space(), 
+                                  p_feature_data=np.empty((0, self.get_feature_space().get_num_dim())) )
+        
+        if len(l_values) == len(f_values):
+            label_set  = inst.get_label_data().get_related_set()
+            label_data = np.array(l_values)
+        else:
+            label_set  = label_data = None
+
+        if tstamps.count(None) == 0:
+            tstamps = np.array(tstamps)
+        else:
+            tstamps = None
+
+        return InstanceBatch( p_feature_set=inst.get_feature_data().get_related_set(),
+                              p_feature_data=np.array(f_values),
+                              p_label_set=label_set,
+                              p_label_data=label_data,
+                              p_tstamps=tstamps )
+
+
 
 
 
@@ -832,6 +1652,11 @@ class StreamTask (Task):
     """
     Template class for stream-based tasks.
 
+    Tasks that transform the values of numeric instances can additionally implement the vectorized
+    custom method _run_batch() and set C_BATCH_NATIVE = True. The incoming instances are then 
+    processed as one InstanceBatch per run. Method _run() remains the fallback for instances that 
+    can not be batched.
+
     Parameters
     ----------
     p_name : str
@@ -850,6 +1675,8 @@ class StreamTask (Task):
 
     C_TYPE                  = 'Stream-Task'
 
+    C_BATCH_NATIVE          = False
+
     C_PLOT_ACTIVE           = True
     C_PLOT_STANDALONE       = True
     C_PLOT_VALID_VIEWS      = [ PlotSettings.C_VIEW_2D, PlotSettings.C_VIEW_3D, PlotSettings.C_VIEW_ND ]
@@ -877,6 +1704,9 @@ class StreamTask (Task):
                        **p_kwargs )
 
         self._duplicate_data      = p_duplicate_data
+        self._shm_client          = None
+        self._shm_client_pid      = None
+        self._stats : TaskStats   = None
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -884,6 +1714,58 @@ class StreamTask (Task):
         return self._run_wrapper
 
 
+## -------------------------------------------------------------------------------------------------
+    def _get_shm_client(self) -> StreamSharedMemoryClient:
+        """
+        Internal use. Returns the process-local client for the exchange of instances via shared
+        memory or None, if the shared object does not support it.
+        """
+
+        pid = os.getpid()
+
+        if self._shm_client_pid != pid:
+            self._shm_client     = StreamSharedMemoryClient.create(p_so=self.get_so())
+            self._shm_client_pid = pid
+
+        return self._shm_client
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_instances(self, p_task_ids : list) -> InstDict:
+        """
+        Internal use. Gets the result instances of the given tasks from the shared object.
+        """
+
+        inst   = self.get_so().get_instances(p_task_ids=p_task_ids)
+        client = self._get_shm_client()
+        if client is None: return inst
+        return client.decode(p_blocks=inst)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _set_instances(self, p_inst : InstDict):
+        """
+        Internal use. Stores the result instances of the task in the shared object.
+        """
+
+        client = self._get_shm_client()
+
+        if client is None:
+            self.get_so().set_instances( p_task_id = self.get_tid(), p_inst=p_inst )
+        else:
+            self.get_so().set_instances( p_task_id = self.get_tid(), p_inst=client.encode(p_inst=p_inst) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reduce_state(self, p_state: dict, p_path: str, p_os_sep: str, p_filename_stub: str):
+        super()._reduce_state( p_state = p_state, 
+                               p_path = p_path, 
+                               p_os_sep = p_os_sep, 
+                               p_filename_stub = p_filename_stub )
+        p_state['_shm_client']     = None
+        p_state['_shm_client_pid'] = None
+
+
 ## -------------------------------------------------------------------------------------------------
     def run( self, 
              p_range : int = None, 
@@ -916,10 +1798,22 @@ class StreamTask (Task):
                 instances = so.get_instances(p_task_ids=self._predecessor_ids)
             except AttributeError:
                 raise ImplementationError('Shared object not compatible to class StreamShared')
+
+            if self._get_shm_client() is not None:
+                # Only the block references cross the process boundary. They are decoded by the
+                # executing process in method _run_wrapper().
+                if StreamSharedMemoryClient.get_num_inst(p_blocks=instances) == 0: 
+                    self.log(Log.C_LOG_TYPE_S, 'No inputs -> SKIP')
+
+                if self._stats is not None: self._stats.tstamp_start_req = perf_counter()
+                Task.run(self, p_range=p_range, p_wait=p_wait, p_inst=None, p_inst_blocks=instances)
+                return
         
         if len(instances) == 0: 
             self.log(Log.C_LOG_TYPE_S, 'No inputs -> SKIP')
 
+        if self._stats is not None: self._stats.tstamp_start_req = perf_counter()
+
         if self._duplicate_data:
             inst_copy : InstDict = {}
 
@@ -932,13 +1826,74 @@ class StreamTask (Task):
 
 
 ## -------------------------------------------------------------------------------------------------
-    def _run_wrapper( self, p_inst : InstDict ):
+    def _run_wrapper( self, p_inst : InstDict = None, p_inst_blocks : list = None ):
+        """
+        Internal use. Instances exchanged via shared memory are handed over as block references and
+        decoded here, i.e. inside the executing process.
+        """
+
+        if p_inst_blocks is not None:
+            p_inst = self._get_shm_client().decode( p_blocks = p_inst_blocks, 
+                                                    p_copy_objects = self._duplicate_data )
+
+        stats = self._stats
+
+        if stats is not None:
+            tstamp_start = perf_counter()
+            num_in       = self._count_inst( p_inst = p_inst )
+
+        if self.C_BATCH_NATIVE:
+            batch = InstanceBatch.from_inst_dict(p_inst=p_inst)
+        else:
+            batch = None
+
+        if batch is not None:
+            self._run_batch( p_batch = batch )
+        else:
+            self._run( p_inst = p_inst )
+
+        if stats is not None:
+            if stats.tstamp_start_req is not None:
+                wait = tstamp_start - stats.tstamp_start_req
+            else:
+                wait = None
+
+            stats.add_run( p_duration = perf_counter() - tstamp_start, 
+                           p_wait = wait,
+                           p_num_in = num_in, 
+                           p_num_out = self._count_inst( p_inst = p_inst ) )
+            stats.tstamp_start_req = None
+
+        self._set_instances( p_inst = p_inst )
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _count_inst( p_inst : InstDict ) -> tuple:
         """
-        Internal use.
+        Internal use. Returns the numbers of new and obsolete instances.
         """
 
-        self._run( p_inst = p_inst )
-        self.get_so().set_instances( p_task_id = self.get_tid(), p_inst=p_inst )
+        num_del = 0
+        for inst_type, inst in p_inst.values():
+            if inst_type == InstTypeDel: num_del += 1
+
+        return len(p_inst) - num_del, num_del
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_stats(self, p_stats : TaskStats):
+        """
+        Attaches run statistics to the task (see class StreamInstrumentation). Value None switches the
+        instrumentation of the task off.
+        """
+
+        self._stats = p_stats
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_stats(self) -> TaskStats:
+        return self._stats
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -953,6 +1908,41 @@ class StreamTask (Task):
         """
 
         raise NotImplementedError
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run_batch( self, p_batch : InstanceBatch ):
+        """
+        Optional vectorized custom method that is called by method run() instead of method _run(), 
+        if constant C_BATCH_NATIVE is True and the incoming instances can be batched. The values of
+        the instances are to be manipulated in place on the arrays of the batch.
+
+        Parameters
+        ----------
+        p_batch : InstanceBatch
+            Instances to be processed.
+        """
+
+        raise NotImplementedError
+
+
+## -------------------------------------------------------------------------------------------------
+    def finish(self):
+        """
+        Finishes the processing after the last run, e.g. at the end of a stream scenario run. Calls
+        custom method _finish().
+        """
+
+        self._finish()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _finish(self):
+        """
+        Custom method that is called by method finish(), e.g. to write buffered data. 
+        """
+
+        pass
   
 
 ## -------------------------------------------------------------------------------------------------
@@ -1096,7 +2086,7 @@ class StreamTask (Task):
             return
 
         if p_inst is None:
-            inst = self.get_so().get_instances(p_task_ids=[self.get_tid()])
+            inst = self._get_instances(p_task_ids=[self.get_tid()])
         else:
             inst = p_inst
 
@@ -1526,6 +2516,11 @@ class StreamWorkflow (StreamTask, Workflow):
                   p_logging = Log.C_LOG_ALL, 
                   **p_kwargs ):
 
+        if isinstance(p_class_shared, type) and issubclass(p_class_shared, StreamSharedMemory):
+            # The manager process of the shared object and all task processes shall share the 
+            # resource tracker of this process, that releases the shared memory in the end
+            resource_tracker.ensure_running()
+
         Workflow.__init__( self,
                            p_name=p_name, 
                            p_range_max=p_range_max, 
@@ -1534,6 +2529,65 @@ class StreamWorkflow (StreamTask, Workflow):
                            p_logging=p_logging, 
                            **p_kwargs )
 
+        self._shm_client      = None
+        self._shm_client_pid  = None
+        self._instrumentation : StreamInstrumentation = None
+        self._stats : TaskStats = None
+        self._tstamp_start_run = None
+        self._num_in_run      = (0, 0)
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_task(self, p_task : Task, p_pred_tasks : list = None):
+        Workflow.add_task(self, p_task=p_task, p_pred_tasks=p_pred_tasks)
+
+        if ( self._instrumentation is not None ) and isinstance(p_task, StreamTask):
+            p_task.set_stats( self._instrumentation.get_task_stats( p_tid=p_task.get_tid(), p_name=p_task.get_name() ) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_instrumentation(self, p_active : bool = True) -> StreamInstrumentation:
+        """
+        Switches the instrumentation of the workflow and all of its stream tasks on or off. When 
+        switched on, wall time, waiting time and numbers of instances are recorded per task and for
+        the workflow itself. The run of the workflow is recorded when all of its final tasks have 
+        finished, so that asynchronous runs are timed completely. Statistics of tasks running as 
+        separate processes are not collected. Incoming instances of the workflow are only counted if
+        they are handed over to method run().
+
+        Parameters
+        ----------
+        p_active : bool
+            Boolean switch. Default = True.
+
+        Returns
+        -------
+        instrumentation : StreamInstrumentation
+            Container of the task statistics or None.
+        """
+
+        if p_active:
+            if self._instrumentation is None: self._instrumentation = StreamInstrumentation()
+            self._stats = self._instrumentation.get_task_stats( p_tid=self.get_tid(), p_name=self.get_name() )
+        else:
+            self._instrumentation = None
+            self._stats           = None
+
+        for task in self._tasks:
+            if not isinstance(task, StreamTask): continue
+
+            if p_active:
+                task.set_stats( self._instrumentation.get_task_stats( p_tid=task.get_tid(), p_name=task.get_name() ) )
+            else:
+                task.set_stats(None)
+
+        return self._instrumentation
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_instrumentation(self) -> StreamInstrumentation:
+        return self._instrumentation
+
 
 ## -------------------------------------------------------------------------------------------------
     def run( self, 
@@ -1556,14 +2610,61 @@ class StreamWorkflow (StreamTask, Workflow):
             is used instead. Default = None.
         """
 
+        if self._stats is not None:
+            self._tstamp_start_run = perf_counter()
+            self._num_in_run       = StreamTask._count_inst( p_inst = p_inst ) if p_inst is not None else (0, 0)
+
         if p_inst is not None:
             # This workflow is the leading workflow and opens a new process cycle based on external instances
+            client = self._get_shm_client()
+            if client is not None: p_inst = client.encode(p_inst=p_inst, p_new_cycle=True)
+
             try:
                 self.get_so().reset( p_inst )
             except AttributeError:
                 raise ImplementationError('Stream workflows need a shared object of type StreamShared (or inherited)')
 
-        Workflow.run(self, p_range=p_range, p_wait=p_wait)                          
+        Workflow.run(self, p_range=p_range, p_wait=p_wait)
+
+
+## -------------------------------------------------------------------------------------------------
+    def event_forwarder(self, p_event_id, p_event_object : Event):
+        """
+        Internally used to raise event C_EVENT_FINISHED on workflow level if all final tasks have
+        been finished. The run statistics of the workflow are completed beforehand.
+
+        Parameters
+        ----------
+        p_event_id 
+            Event id.
+        p_event_object : Event
+            Event object with further context informations.
+        """
+
+        if ( self._stats is not None ) and ( self._tstamp_start_run is not None ) and ( self._ctr_final_tasks <= 1 ):
+            inst_out = self._get_instances( p_task_ids = [ task.get_tid() for task in self._final_tasks ] )
+            self._stats.add_run( p_duration = perf_counter() - self._tstamp_start_run, 
+                                 p_wait = None, 
+                                 p_num_in = self._num_in_run, 
+                                 p_num_out = StreamTask._count_inst( p_inst = inst_out ) )
+            self._tstamp_start_run = None
+
+        Workflow.event_forwarder(self, p_event_id=p_event_id, p_event_object=p_event_object)
+
+
+## -------------------------------------------------------------------------------------------------
+    def finish(self):
+        """
+        Finishes all stream tasks of the workflow after their asynchronous runs and the workflow 
+        itself.
+        """
+
+        for task in self._tasks:
+            if not isinstance(task, StreamTask): continue
+            Task.wait_async_tasks(task)
+            task.finish()
+
+        self._finish()
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -1636,6 +2737,13 @@ class StreamScenario (ScenarioBase):
     """
     Template class for stream based scenarios.
 
+    By default, each cycle pulls exactly one instance from the stream and lets it process by the
+    stream workflow. In micro-batch mode (p_batch_size > 1 and/or p_batch_duration set), several
+    instances are pulled per cycle and handed over to the workflow in a single instance dictionary. 
+    The order of the instances and the semantics of new/deleted instances remain unchanged, but the 
+    per-cycle overhead of all tasks is shared by all instances of a batch. Please note that the cycle
+    limit then refers to the number of batches.
+
     Parameters
     ----------
     p_mode
@@ -1646,6 +2754,18 @@ class StreamScenario (ScenarioBase):
         Boolean switch for visualisation. Default = False.
     p_logging
         Log level (see constants of class Log). Default: Log.C_LOG_ALL.  
+    p_batch_size : int
+        Maximum number of stream instances pulled per cycle. Value 0 means no limit and requires
+        a time budget p_batch_duration. Default = 1.
+    p_batch_duration : timedelta
+        Optional time budget per cycle for pulling stream instances. The batch is closed as soon as
+        the budget is exhausted or the batch size is reached. Default = None.
+    p_instrumentation : bool
+        If True, the stream workflow records run statistics per task. See method 
+        StreamWorkflow.set_instrumentation(). Default = False.
+    p_instrumentation_path : str
+        Optional folder for the export of the run statistics as CSV and JSON at the end of method
+        run(). Default = None (no export).
     p_kwargs : dict
         Custom keyword parameters handed over to custom method setup().
     """
@@ -1659,11 +2779,18 @@ class StreamScenario (ScenarioBase):
                   p_cycle_limit=0, 
                   p_visualize:bool=False, 
                   p_logging=Log.C_LOG_ALL,
+                  p_batch_size : int = 1,
+                  p_batch_duration : timedelta = None,
+                  p_instrumentation : bool = False,
+                  p_instrumentation_path : str = None,
                   **p_kwargs ):
 
         self._stream : Stream           = None
         self._iterator : Stream         = None
         self._workflow : StreamWorkflow = None
+        self._instrumentation_path      = p_instrumentation_path
+
+        self.set_batch_size( p_batch_size = p_batch_size, p_batch_duration = p_batch_duration )
 
         ScenarioBase.__init__( self,
                                p_mode, 
@@ -1673,6 +2800,8 @@ class StreamScenario (ScenarioBase):
                                p_logging=p_logging,
                                **p_kwargs )
 
+        if p_instrumentation: self._workflow.set_instrumentation(p_active=True)
+
 
 ## -------------------------------------------------------------------------------------------------
     def setup(self, **p_kwargs):
@@ -1720,6 +2849,38 @@ class StreamScenario (ScenarioBase):
         raise NotImplementedError
 
 
+## -------------------------------------------------------------------------------------------------
+    def set_batch_size(self, p_batch_size : int = 1, p_batch_duration : timedelta = None):
+        """
+        Sets the number of stream instances and/or the time budget per cycle. See class description
+        for further details.
+
+        Parameters
+        ----------
+        p_batch_size : int
+            Maximum number of stream instances pulled per cycle. Value 0 means no limit and requires
+            a time budget p_batch_duration. Default = 1.
+        p_batch_duration : timedelta
+            Optional time budget per cycle for pulling stream instances. Default = None.
+        """
+
+        if ( p_batch_size < 0 ) or ( ( p_batch_size == 0 ) and ( p_batch_duration is None ) ):
+            raise ParamError('Please specify a batch size > 0 or a time budget per cycle')
+
+        self._batch_size     = p_batch_size
+        self._batch_duration = p_batch_duration
+
+        if p_batch_duration is not None:
+            self._batch_duration_sec = p_batch_duration.total_seconds()
+        else:
+            self._batch_duration_sec = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_batch_size(self) -> int:
+        return self._batch_size
+
+
 ## -------------------------------------------------------------------------------------------------
     def _set_mode(self, p_mode):
         self._stream.set_mode(p_mode=p_mode)
@@ -1736,10 +2897,43 @@ class StreamScenario (ScenarioBase):
         return None
 
 
+## -------------------------------------------------------------------------------------------------
+    def get_instrumentation(self) -> StreamInstrumentation:
+        """
+        Returns the run statistics of the stream workflow or None, if the instrumentation is off.
+        """
+
+        return self._workflow.get_instrumentation()
+
+
+## -------------------------------------------------------------------------------------------------
+    def run( self, 
+             p_term_on_success : bool = True,        
+             p_term_on_error : bool = True,          
+             p_term_on_timeout : bool = False ):
+        
+        results = ScenarioBase.run( self,
+                                    p_term_on_success = p_term_on_success,
+                                    p_term_on_error = p_term_on_error,
+                                    p_term_on_timeout = p_term_on_timeout )
+
+        self._workflow.finish()
+        
+        instrumentation = self._workflow.get_instrumentation()
+
+        if ( instrumentation is not None ) and ( self._instrumentation_path is not None ):
+            instrumentation.export(p_path=self._instrumentation_path)
+            self.log(self.C_LOG_TYPE_I, 'Run statistics exported to', self._instrumentation_path)
+
+        return results
+
+
 ## -------------------------------------------------------------------------------------------------
     def _run_cycle(self):
         """
-        Gets next instance from the stream and lets process it by the stream workflow.
+        Gets the next instance(s) from the stream and lets process them by the stream workflow. In 
+        micro-batch mode, all instances of a cycle are processed in one workflow run. If the end of 
+        the stream is reached within a batch, the instances collected so far are still processed.
 
         Returns
         -------
@@ -1753,13 +2947,50 @@ class StreamScenario (ScenarioBase):
             True, if the end of the related data source has been reached. False otherwise.
         """
 
-        try:
-            inst_new = next(self._iterator)
-            inst     = { inst_new.id : (InstTypeNew, inst_new) }
+        # 1 Fast path: one instance per cycle
+        if ( self._batch_size == 1 ) and ( self._batch_duration_sec is None ):
+            try:
+                inst_new = next(self._iterator)
+                inst     = { inst_new.id : (InstTypeNew, inst_new) }
+                self._workflow.run( p_inst = inst )
+                end_of_data = False
+            except StopIteration:
+                end_of_data = True
+
+            return False, False, False, end_of_data
+
+
+        # 2 Micro-batch mode
+        inst : InstDict = {}
+        end_of_data     = False
+
+        if self._batch_duration_sec is None:
+            # 2.1 Fixed batch size: the stream provides all instances at once
+            try:
+                inst = self._stream.get_next_batch(p_num_inst=self._batch_size).get_inst_dict()
+                end_of_data = ( len(inst) < self._batch_size )
+            except StopIteration:
+                end_of_data = True
+
+        else:
+            # 2.2 Collect instances until batch size or time budget is exhausted
+            tstamp_end = perf_counter() + self._batch_duration_sec
+
+            try:
+                while True:
+                    inst_new = next(self._iterator)
+                    inst[inst_new.id] = (InstTypeNew, inst_new)
+
+                    if ( self._batch_size > 0 ) and ( len(inst) >= self._batch_size ): break
+                    if perf_counter() >= tstamp_end: break
+
+            except StopIteration:
+                end_of_data = True
+
+
+        # 3 Processing of the whole batch within one workflow run
+        if len(inst) > 0: 
             self._workflow.run( p_inst = inst )
-            end_of_data = False
-        except StopIteration:
-            end_of_data = True
 
         return False, False, False, end_of_data
 
@@ -0,0 +1,320 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.streams
+## -- Module  : instrumentation.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  0.0.0     DA       Creation
+## -- 2026-10-16  1.0.0     DA       First release
+## -- 2026-10-17  1.0.1     DA       Bugfix: statistics are reset in place, so that the tasks keep
+## --                                their references (new methods DurationHistogram.reset(),
+## --                                TaskStats.reset())
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-17)
+
+This module provides an opt-in instrumentation for stream workflows. It records per task the wall
+time of the runs, the waiting time between start request and execution, the numbers of incoming
+and outgoing new/obsolete instances and the adaptations of online adaptive tasks. Durations are
+kept in histograms with logarithmic bins. See methods StreamWorkflow.set_instrumentation() and the
+parameters p_instrumentation, p_instrumentation_path of class StreamScenario.
+
+"""
+
+
+import os
+import math
+import csv
+import json
+import numpy as np
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class DurationHistogram:
+    """
+    Histogram of durations in seconds with logarithmic bins between C_MIN_SEC and C_MAX_SEC. Durations
+    outside this range are counted in the first/last bin.
+    """
+
+    C_MIN_SEC           = 1e-7
+    C_MAX_SEC           = 100.0
+    C_BINS_PER_DECADE   = 5
+
+    _log_min            = math.log10(C_MIN_SEC)
+    _num_bins           = int(round((math.log10(C_MAX_SEC) - _log_min) * C_BINS_PER_DECADE))
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self):
+        self.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self):
+        self._counts = np.zeros(self._num_bins, dtype=np.int64)
+        self.num     = 0
+        self.sum     = 0.0
+        self.min     = math.inf
+        self.max     = 0.0
+
+
+## -------------------------------------------------------------------------------------------------
+    def add(self, p_duration : float):
+        """
+        Adds a duration in seconds.
+        """
+
+        if p_duration > 0:
+            idx = int((math.log10(p_duration) - self._log_min) * self.C_BINS_PER_DECADE)
+            idx = min(max(idx, 0), self._num_bins - 1)
+        else:
+            idx = 0
+
+        self._counts[idx] += 1
+        self.num          += 1
+        self.sum          += p_duration
+        if p_duration < self.min: self.min = p_duration
+        if p_duration > self.max: self.max = p_duration
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_bin_edges(self) -> np.ndarray:
+        """
+        Returns the num_bins + 1 edges of the bins in seconds.
+        """
+
+        return np.logspace( self._log_min,
+                            self._log_min + self._num_bins / self.C_BINS_PER_DECADE,
+                            self._num_bins + 1 )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_counts(self) -> np.ndarray:
+        return self._counts
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_mean(self) -> float:
+        return self.sum / self.num if self.num > 0 else 0.0
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_quantile(self, p_q : float) -> float:
+        """
+        Returns an estimation of the given quantile as upper edge of the related bin.
+        """
+
+        if self.num == 0: return 0.0
+
+        idx = int(np.searchsorted(np.cumsum(self._counts), p_q * self.num))
+        return min(float(self.get_bin_edges()[min(idx, self._num_bins - 1) + 1]), self.max)
+
+
+## -------------------------------------------------------------------------------------------------
+    def to_dict(self) -> dict:
+        return { 'num' : self.num,
+                 'sum_sec' : self.sum,
+                 'min_sec' : self.min if self.num > 0 else 0.0,
+                 'max_sec' : self.max,
+                 'mean_sec' : self.get_mean(),
+                 'p50_sec' : self.get_quantile(0.5),
+                 'p99_sec' : self.get_quantile(0.99),
+                 'bin_edges_sec' : self.get_bin_edges().tolist(),
+                 'counts' : self._counts.tolist() }
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class TaskStats:
+    """
+    Statistics of a single task. Instances of this class are attached to the tasks of an
+    instrumented workflow and updated by them.
+
+    Parameters
+    ----------
+    p_tid
+        Task id.
+    p_name : str
+        Task name.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_tid, p_name : str):
+        self.tid              = p_tid
+        self.name             = p_name
+        self.duration         = DurationHistogram()
+        self.wait             = DurationHistogram()
+        self.duration_adapt   = DurationHistogram()
+        self.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self):
+        """
+        Resets all counters and histograms in place.
+        """
+
+        self.num_runs         = 0
+        self.num_inst_new_in  = 0
+        self.num_inst_del_in  = 0
+        self.num_inst_new_out = 0
+        self.num_inst_del_out = 0
+        self.num_adapt_calls  = 0
+        self.num_adaptations  = 0
+        self.tstamp_start_req = None
+        self.duration.reset()
+        self.wait.reset()
+        self.duration_adapt.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_run(self, p_duration : float, p_wait : float, p_num_in : tuple, p_num_out : tuple):
+        """
+        Adds a task run with its duration, waiting time and the numbers of new/obsolete instances
+        (tuples) before and after the run.
+        """
+
+        self.num_runs         += 1
+        self.num_inst_new_in  += p_num_in[0]
+        self.num_inst_del_in  += p_num_in[1]
+        self.num_inst_new_out += p_num_out[0]
+        self.num_inst_del_out += p_num_out[1]
+        self.duration.add(p_duration)
+        if p_wait is not None: self.wait.add(p_wait)
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_adaptation(self, p_duration : float, p_adapted : bool):
+        self.num_adapt_calls += 1
+        if p_adapted: self.num_adaptations += 1
+        self.duration_adapt.add(p_duration)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_throughput(self) -> float:
+        """
+        Returns the number of incoming instances per second of task run time.
+        """
+
+        if self.duration.sum == 0: return 0.0
+        return ( self.num_inst_new_in + self.num_inst_del_in ) / self.duration.sum
+
+
+## -------------------------------------------------------------------------------------------------
+    def to_dict(self, p_histograms : bool = True) -> dict:
+        stats = { 'tid' : str(self.tid),
+                  'name' : self.name,
+                  'num_runs' : self.num_runs,
+                  'num_inst_new_in' : self.num_inst_new_in,
+                  'num_inst_del_in' : self.num_inst_del_in,
+                  'num_inst_new_out' : self.num_inst_new_out,
+                  'num_inst_del_out' : self.num_inst_del_out,
+                  'num_adapt_calls' : self.num_adapt_calls,
+                  'num_adaptations' : self.num_adaptations,
+                  'throughput_inst_per_sec' : self.get_throughput() }
+
+        for key, histogram in [ ('duration', self.duration), ('wait', self.wait), ('duration_adapt', self.duration_adapt) ]:
+            hist_dict = histogram.to_dict()
+
+            if p_histograms:
+                stats[key] = hist_dict
+            else:
+                for hist_key in [ 'sum_sec', 'mean_sec', 'p50_sec', 'p99_sec', 'max_sec' ]:
+                    stats[key + '_' + hist_key] = hist_dict[hist_key]
+
+        return stats
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamInstrumentation:
+    """
+    Container of the task statistics of an instrumented stream workflow. Statistics are only
+    collected in the process of the workflow, i.e. for tasks running synchronously or as threads.
+    """
+
+    C_FNAME_CSV     = 'instrumentation.csv'
+    C_FNAME_JSON    = 'instrumentation.json'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self):
+        self._stats = {}
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_task_stats(self, p_tid, p_name : str = '') -> TaskStats:
+        """
+        Returns the statistics of a task. They are created on the first call.
+        """
+
+        try:
+            return self._stats[p_tid]
+        except KeyError:
+            stats = TaskStats(p_tid=p_tid, p_name=p_name)
+            self._stats[p_tid] = stats
+            return stats
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_stats(self) -> list:
+        """
+        Returns the statistics of all tasks in the order of their registration.
+        """
+
+        return list(self._stats.values())
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self):
+        """
+        Resets the statistics of all tasks. The objects are kept, since the tasks refer to them.
+        """
+
+        for stats in self._stats.values(): stats.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    def to_dict(self) -> dict:
+        return { 'tasks' : [ stats.to_dict() for stats in self._stats.values() ] }
+
+
+## -------------------------------------------------------------------------------------------------
+    def export_json(self, p_filename : str):
+        with open(p_filename, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+
+## -------------------------------------------------------------------------------------------------
+    def export_csv(self, p_filename : str):
+        """
+        Exports one row of summarized statistics per task.
+        """
+
+        rows = [ stats.to_dict(p_histograms=False) for stats in self._stats.values() ]
+        if len(rows) == 0: return
+
+        with open(p_filename, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+## -------------------------------------------------------------------------------------------------
+    def export(self, p_path : str):
+        """
+        Exports the statistics to the files C_FNAME_CSV and C_FNAME_JSON in the given folder.
+        """
+
+        os.makedirs(p_path, exist_ok=True)
+        self.export_csv(p_path + os.sep + self.C_FNAME_CSV)
+        self.export_json(p_path + os.sep + self.C_FNAME_JSON)
@@ -4,4 +4,5 @@ from mlpro.bf.streams.streams.doublespiral2d import *
 from mlpro.bf.streams.streams.csv_file import *
 from mlpro.bf.streams.streams.clouds import *
 from mlpro.bf.streams.streams.point_outliers import *
-from mlpro.bf.streams.streams.clusters import *
\ No newline at end of file
+from mlpro.bf.streams.streams.clusters import *
+from mlpro.bf.streams.streams.recorded import *
@@ -16,10 +16,15 @@
 ## -- 2024-02-06  1.2.1     DA       Class StreamMLProClouds3D8C10000Dynamic: corrections on constants
 ## -- 2024-02-09  1.2.2     DA       Completion of class documentations
 ## -- 2024-06-04  1.2.3     DA       Bugfix: ESpace instead of MSpace
+## -- 2026-10-16  1.3.0     DA       Class StreamMLProClouds: 
+## --                                - new vectorized method _get_next_batch()
+## --                                - bugfix in _init_dataset(): centers are recomputed on reset
+## -- 2026-10-17  1.3.1     DA       Class StreamMLProClouds: methods _get_next() and 
+## --                                _get_next_batch() draw the same random values from self._rng
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.2.3 (2024-06-04)
+Ver. 1.3.1 (2026-10-17)
 
 This module provides the native stream classes StreamMLProClouds, StreamMLProClouds2D4C1000Static,
 StreamMLProClouds3D8C2000Static, StreamMLProClouds2D4C5000Dynamic and StreamMLProClouds3D8C10000Dynamic.
@@ -96,6 +101,12 @@ class StreamMLProClouds (StreamMLProBase):
         self._centers         = []
         self._centers_step    = []
 
+        # Number of random values per instance: cloud selection + point generation
+        if self._num_dim == 2:
+            self._num_rnd     = 3
+        else:
+            self._num_rnd     = 1 + self._num_dim
+
         self.C_NUM_INSTANCES  = p_num_instances
 
         self.set_random_seed(p_seed=p_seed)
@@ -135,6 +146,9 @@ class StreamMLProClouds (StreamMLProBase):
     def _init_dataset(self):
 
         # 1 Compute the initial positions of the centers
+        self._centers      = []
+        self._centers_step = []
+
         for c in range(self._num_clouds):
 
             center = np.zeros(self._num_dim)
@@ -181,13 +195,15 @@ class StreamMLProClouds (StreamMLProBase):
 
 
         # 2 Determination of the cloud to be fed
+        rnd = self._rng.random(self._num_rnd)
+
         if self._num_cloud_ids == 0:
             # 2.1 Next cloud is found randomly
-            c = random.randint(0, self._num_clouds - 1)
+            c = int(rnd[0] * self._num_clouds)
 
         else:
             # 2.1 Next cloud is found by user requirement (see parameter p_weights)
-            c_id = random.randint(0, self._num_cloud_ids - 1)
+            c_id = int(rnd[0] * self._num_cloud_ids)
             c    = self._cloud_ids[c_id]
 
 
@@ -203,22 +219,22 @@ class StreamMLProClouds (StreamMLProBase):
 
         if self._num_dim == 2:
             # 3.1 Generation of a random 2D point within a circle around the center
-            radian          = random.random() * 2 * math.pi
-            radius_rnd      = radius * random.random()
+            radian          = rnd[1] * 2 * math.pi
+            radius_rnd      = radius * rnd[2]
             point_values[0] = center[0] + math.cos(radian) * radius_rnd
             point_values[1] = center[1] + math.sin(radian) * radius_rnd
         elif self._num_dim == 3:
             # 3.2 Generation of a random 3D point within a sphere around the center
-            radian1         = random.random() * 2 * math.pi
-            radian2         = random.random() * 2 * math.pi
-            radius_rnd      = radius * random.random()
+            radian1         = rnd[1] * 2 * math.pi
+            radian2         = rnd[2] * 2 * math.pi
+            radius_rnd      = radius * rnd[3]
             point_values[0] = center[0] + math.cos(radian1) * math.cos(radian2) * radius_rnd
             point_values[1] = center[1] + math.sin(radian2) * radius_rnd
             point_values[2] = center[2] + math.sin(radian1) * math.cos(radian2) * radius_rnd
         else:
             # 3.3 Generation of a random nD point in a hypercube with edge length (2 * radius) around the center
             for d in range(self._num_dim):
-                point_values[d] = center[d] + random.randint(0, 2 * radius) - radius
+                point_values[d] = center[d] + int(rnd[1 + d] * (int(2 * radius) + 1)) - radius
 
         feature_data.set_values(point_values)
 
@@ -227,6 +243,65 @@ class StreamMLProClouds (StreamMLProBase):
         return Instance( p_feature_data=feature_data )
 
 
+## -------------------------------------------------------------------------------------------------
+    def _get_next_batch(self, p_num_inst : int) -> InstanceBatch:
+
+        # 0 Preparation: the random values are drawn in the same order as by method _get_next()
+        num_inst = self._get_batch_len(p_num_inst)
+        rnd      = self._rng.random((num_inst, self._num_rnd))
+
+
+        # 1 Determination of the clouds to be fed
+        if self._num_cloud_ids == 0:
+            clouds = ( rnd[:,0] * self._num_clouds ).astype(int)
+        else:
+            clouds = np.array(self._cloud_ids)[( rnd[:,0] * self._num_cloud_ids ).astype(int)]
+
+
+        # 2 Center positions per instance, including the movement of the centers step by step
+        if self._velocity != 0.0:
+            steps     = np.broadcast_to( np.array(self._centers_step), (num_inst, self._num_clouds, self._num_dim) )
+            positions = np.cumsum( np.concatenate( ( np.array(self._centers)[np.newaxis], steps ) ), axis=0 )
+            centers   = positions[np.arange(1, num_inst + 1), clouds]
+
+            self._centers = list(positions[-1].copy())
+
+        else:
+            centers = np.array(self._centers)[clouds]
+
+        if len(self._radii) == 1:
+            radii = np.full(num_inst, self._radii[0], dtype=np.float64)
+        else:
+            radii = np.array(self._radii, dtype=np.float64)[clouds]
+
+
+        # 3 Generation of random points around the selected centers
+        if self._num_dim == 2:
+            # 3.1 Random 2D points within circles around the centers
+            radian       = rnd[:,1] * 2 * np.pi
+            radius_rnd   = radii * rnd[:,2]
+            point_values = centers + np.column_stack( (np.cos(radian), np.sin(radian)) ) * radius_rnd.reshape(-1,1)
+
+        elif self._num_dim == 3:
+            # 3.2 Random 3D points within spheres around the centers
+            radian1      = rnd[:,1] * 2 * np.pi
+            radian2      = rnd[:,2] * 2 * np.pi
+            radius_rnd   = radii * rnd[:,3]
+            point_values = centers + np.column_stack( ( np.cos(radian1) * np.cos(radian2),
+                                                        np.sin(radian2),
+                                                        np.sin(radian1) * np.cos(radian2) ) ) * radius_rnd.reshape(-1,1)
+
+        else:
+            # 3.3 Random nD points in hypercubes with edge length (2 * radius) around the centers
+            radii        = radii.reshape(-1,1)
+            offsets      = np.floor( rnd[:,1:] * ( (2 * radii).astype(np.int64) + 1 ) )
+            point_values = centers + offsets - radii
+
+        self._index += num_inst
+
+        return InstanceBatch( p_feature_set=self._feature_space, p_feature_data=point_values )
+
+
 
 
 
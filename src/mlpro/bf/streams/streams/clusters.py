@@ -13,10 +13,14 @@
 ## -- 2024-06-04  1.2.0     SK       Addition of split and merge functionalities to clusters
 ## -- 2024-06-16  1.2.1     SK       Optimization and restructuring
 ## -- 2024-06-17  1.3.0     SK       Functionality for appearance of outliers
+## -- 2026-10-16  1.4.0     DA       - New method _get_next_batch() with vectorized point generation
+## --                                - Method _init_dataset() resets the cluster selection
+## -- 2026-10-17  1.4.1     DA       Methods _get_next() and _get_next_batch() draw the same random 
+## --                                values from self._rng
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.3.0 (2024-06-17)
+Ver. 1.4.1 (2026-10-17)
 
 This module provides the native stream class StreamMLProClusterGenerator.
 These stream provides instances with self._num_dim dimensional random feature data, placed around
@@ -222,6 +226,17 @@ class StreamMLProClusterGenerator (StreamMLProBase):
 
         self._outlier_appearance = p_outlier_appearance
         self._outlier_rate       = p_outlier_rate
+
+        # Number of random values per instance: point generation + optional outlier generation
+        if self._num_dim == 2:
+            self._num_rnd_point  = 2
+        else:
+            self._num_rnd_point  = self._num_dim
+
+        if self._outlier_appearance:
+            self._num_rnd        = self._num_rnd_point + 1 + self._num_dim
+        else:
+            self._num_rnd        = self._num_rnd_point
     
         StreamMLProBase.__init__ (self,
                                   p_logging=p_logging,
@@ -299,6 +314,9 @@ class StreamMLProClusterGenerator (StreamMLProBase):
 
 ## -------------------------------------------------------------------------------------------------
     def _init_dataset(self):
+        self._current_cluster = 1
+        self._cycle           = 1
+
         for cluster_id in self._cluster_ids:
             # Add cluster to dictionary
             self._clusters[cluster_id] = self._define_cluster(cluster_id)
@@ -345,12 +363,14 @@ class StreamMLProClusterGenerator (StreamMLProBase):
         cluster_id = self._get_next_cluster()
 
         feature_data = Element(self._feature_space)
+        rnd          = self._rng.random(self._num_rnd)
+        k            = self._num_rnd_point
 
-        if self._outlier_appearance and (random.uniform(0, 1) <= self._outlier_rate):
-            point_values = np.array([random.randint(self.C_BOUNDARIES[0], self.C_BOUNDARIES[1])
-                                     for _ in range(self._num_dim)])
+        if self._outlier_appearance and (rnd[k] <= self._outlier_rate):
+            point_values = np.array([self.C_BOUNDARIES[0] + int(rnd[k + 1 + d] * (self.C_BOUNDARIES[1] - self.C_BOUNDARIES[0] + 1))
+                                     for d in range(self._num_dim)])
         else:
-            point_values = self._generate_random_point_around_cluster(cluster_id)
+            point_values = self._generate_random_point_around_cluster(cluster_id, rnd)
         
         feature_data.set_values(point_values)
 
@@ -358,6 +378,58 @@ class StreamMLProClusterGenerator (StreamMLProBase):
         return Instance(p_feature_data=feature_data)
     
 
+## -------------------------------------------------------------------------------------------------
+    def _get_next_batch(self, p_num_inst : int) -> InstanceBatch:
+
+        # 1 The evolution of the clusters is determined instance by instance...
+        num_inst = self._get_batch_len(p_num_inst)
+        centers  = np.empty((num_inst, self._num_dim))
+        radii    = np.empty(num_inst)
+
+        for i in range(num_inst):
+            self._prepare_clusters_for_changes()
+            self._update_cluster_properties()
+            cluster    = self._clusters[self._get_next_cluster()]
+            centers[i] = cluster["center"]
+            radii[i]   = cluster["radius"]
+            self._index += 1
+
+
+        # 2 ... while the random points around the centers are generated vectorized, based on the
+        #   same random values as drawn by method _get_next()
+        rnd = self._rng.random((num_inst, self._num_rnd))
+
+        if self._num_dim == 2:
+            # 2.1 Random 2D points within circles around the centers
+            radian       = rnd[:,0] * 2 * np.pi
+            radius_rnd   = radii * rnd[:,1]
+            point_values = centers + np.column_stack( (np.cos(radian), np.sin(radian)) ) * radius_rnd.reshape(-1,1)
+
+        elif self._num_dim == 3:
+            # 2.2 Random 3D points within spheres around the centers
+            radian1      = rnd[:,0] * 2 * np.pi
+            radian2      = rnd[:,1] * 2 * np.pi
+            radius_rnd   = radii * rnd[:,2]
+            point_values = centers + np.column_stack( ( np.cos(radian1) * np.cos(radian2),
+                                                        np.sin(radian2),
+                                                        np.sin(radian1) * np.cos(radian2) ) ) * radius_rnd.reshape(-1,1)
+
+        else:
+            # 2.3 Random nD points in hypercubes with edge length (2 * radius) around the centers
+            radii        = radii.reshape(-1,1)
+            offsets      = np.floor( rnd[:,:self._num_dim] * ( (2 * radii).astype(np.int64) + 1 ) )
+            point_values = centers + offsets - radii
+
+
+        # 3 Random outliers within the boundaries
+        if self._outlier_appearance:
+            k       = self._num_rnd_point
+            outlier = rnd[:,k] <= self._outlier_rate
+            point_values[outlier] = self.C_BOUNDARIES[0] + np.floor( rnd[outlier, k + 1:] * ( self.C_BOUNDARIES[1] - self.C_BOUNDARIES[0] + 1 ) )
+
+        return InstanceBatch( p_feature_set=self._feature_space, p_feature_data=point_values )
+    
+
 ## -------------------------------------------------------------------------------------------------
     def _prepare_clusters_for_changes(self):
         if self._change_in_radius:
@@ -538,7 +610,7 @@ class StreamMLProClusterGenerator (StreamMLProBase):
 
 
 ## -------------------------------------------------------------------------------------------------
-    def _generate_random_point_around_cluster(self, cluster_id):
+    def _generate_random_point_around_cluster(self, cluster_id, p_rnd : np.ndarray):
         cluster = self._clusters[cluster_id]
         center = cluster["center"]
         radius = cluster["radius"]
@@ -546,22 +618,22 @@ class StreamMLProClusterGenerator (StreamMLProBase):
 
         if self._num_dim == 2:
             # 3.1 Generation of a random 2D point within a circle around the center
-            radian          = random.random() * 2 * math.pi
-            radius_rnd      = radius * random.random()
+            radian          = p_rnd[0] * 2 * math.pi
+            radius_rnd      = radius * p_rnd[1]
             point_values[0] = center[0] + math.cos(radian) * radius_rnd
             point_values[1] = center[1] + math.sin(radian) * radius_rnd
         elif self._num_dim == 3:
             # 3.2 Generation of a random 3D point within a sphere around the center
-            radian1         = random.random() * 2 * math.pi
-            radian2         = random.random() * 2 * math.pi
-            radius_rnd      = radius * random.random()
+            radian1         = p_rnd[0] * 2 * math.pi
+            radian2         = p_rnd[1] * 2 * math.pi
+            radius_rnd      = radius * p_rnd[2]
             point_values[0] = center[0] + math.cos(radian1) * math.cos(radian2) * radius_rnd
             point_values[1] = center[1] + math.sin(radian2) * radius_rnd
             point_values[2] = center[2] + math.sin(radian1) * math.cos(radian2) * radius_rnd
         else:
             # 3.3 Generation of a random nD point in a hypercube with edge length (2 * radius) around the center
             for d in range(self._num_dim):
-                point_values[d] = center[d] + random.randint(0, int(2 * radius)) - radius
+                point_values[d] = center[d] + int(p_rnd[d] * (int(2 * radius) + 1)) - radius
 
         return point_values
     
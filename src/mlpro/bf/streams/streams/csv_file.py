@@ -15,17 +15,28 @@
 ## -- 2024-06-04  1.1.3     DA       Bugfix: ESpace instead of MSpace
 ## -- 2024-07-04  1.1.4     SY       Allowing string in the datasets 
 ## -- 2024-07-19  1.1.5     SY       Allowing string in the datasets 
+## -- 2026-10-16  1.2.0     DA       New method _get_next_batch()
+## -- 2026-10-16  1.3.0     DA       New lazy mode: chunked parsing of typed columns and optional
+## --                                memory-mapped binary cache (parameters p_chunk_size, p_cache)
+## -- 2026-10-17  1.3.1     DA       Lazy mode: 
+## --                                - file is closed on reset, at the end of the stream and on 
+## --                                  deletion of the stream
+## --                                - method _count_rows() ignores blank lines
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.1.5 (2024-07-19)
+Ver. 1.3.1 (2026-10-17)
 
 This module provides the native stream class StreamMLProCSV.
 This stream provides a functionality to convert csv file to a MLPro compatible stream data.
 """
 
 
+import os
+import csv
+from itertools import islice
 import numpy as np
+from numpy.lib import recfunctions
 from mlpro.bf.data import *
 from mlpro.bf.streams.basics import *
 
@@ -73,6 +84,17 @@ class StreamMLProCSV(Stream):
         List of the file's headers that is loaded as features in the stream. Default: None
     p_list_labels
         List of the file's headers that is loaded as labels in the stream. Default: None
+    p_chunk_size
+        Optional number of rows that are parsed at once. If set, the stream runs in lazy mode: the
+        file is parsed block by block into float64 columns instead of being loaded completely. All
+        selected columns need to be numeric. Default: None (complete loading).
+    p_cache
+        If True, the selected columns are stored once in a binary numpy file (see parameter 
+        p_cache_filename), which is memory-mapped by all further runs. Implies the lazy mode.
+        Default: False
+    p_cache_filename
+        Optional file name of the binary cache in path p_path_load. Default: None (name of the CSV
+        file plus extension '.npy').
 
     """
 
@@ -81,6 +103,8 @@ class StreamMLProCSV(Stream):
     C_NAME      = ''
     C_VERSION   = '1.0.0'
 
+    C_CHUNK_SIZE    = 10000
+
     C_SCIREF_TYPE   = ScientificObject.C_SCIREF_TYPE_ONLINE
     C_SCIREF_AUTHOR = 'MLPro'
     C_SCIREF_URL    = 'https://mlpro.readthedocs.io'
@@ -122,6 +146,18 @@ class StreamMLProCSV(Stream):
             self._list_labels = None
         else:
             self._list_labels = self._kwargs['p_list_labels']
+
+        self._chunk_size = self._kwargs.get('p_chunk_size', None)
+        self._cache      = self._kwargs.get('p_cache', False)
+        self._lazy       = ( self._chunk_size is not None ) or self._cache
+        self._file       = None
+        self._mmap       = None
+
+        if self._lazy:
+            if self._chunk_size is None: 
+                self._chunk_size = self.C_CHUNK_SIZE
+            elif self._chunk_size <= 0:
+                raise ParamError('p_chunk_size needs to be greater than 0')
     
 
 ## -------------------------------------------------------------------------------------------------
@@ -175,6 +211,8 @@ class StreamMLProCSV(Stream):
 ## -------------------------------------------------------------------------------------------------
     def _init_dataset(self):
 
+        if self._lazy: return self._init_dataset_lazy()
+
         if self._loaded == False:
             p_variable      = []
             self._from_csv  = DataStoring(p_variable)
@@ -238,10 +276,224 @@ class StreamMLProCSV(Stream):
             self._loaded = True
 
 
+## -------------------------------------------------------------------------------------------------
+    def _init_dataset_lazy(self):
+        """
+        Prepares the lazy mode. On first call, the header is evaluated, the spaces are set up and the
+        number of instances is determined by the binary cache or by counting the rows of the file. 
+        Afterwards, the file is (re)opened for chunked parsing unless the cache is used.
+        """
+
+        path = self._kwargs['p_path_load'] + os.sep + self._kwargs['p_csv_filename']
+
+        if not self._loaded:
+
+            # 1 Column names and positions of features and labels
+            with open(path, 'r', newline='') as file:
+                header = next(csv.reader(file, delimiter=self._kwargs['p_delimiter']))
+
+            if self._kwargs['p_frame']: del header[0:1]
+
+            if self._kwargs['p_header']:
+                names = header
+            else:
+                names = [ 'Data_%i'%(i+1) for i in range(len(header)) ]
+
+            list_labels   = [ name for name in ( self._list_labels or [] ) if name in names ]
+
+            if self._list_features is None:
+                list_features = [ name for name in names if name not in list_labels ]
+            else:
+                list_features = [ name for name in self._list_features if name in names ]
+
+            offset         = 1 if self._kwargs['p_frame'] else 0
+            self._columns  = [ names.index(name) + offset for name in list_features + list_labels ]
+            self._num_dim  = len(list_features)
+
+
+            # 2 Feature and label space with real-valued dimensions
+            self._feature_space = ESpace()
+            for name in list_features:
+                self._feature_space.add_dim( Feature( p_name_short = name,
+                                                      p_base_set = Feature.C_BASE_SET_R,
+                                                      p_name_long = name,
+                                                      p_name_latex = '',
+                                                      p_description = '',
+                                                      p_symmetrical = False,
+                                                      p_logging=Log.C_LOG_NOTHING ) )
+
+            self._label_space = ESpace()
+            for name in list_labels:
+                self._label_space.add_dim( Label( p_name_short = name,
+                                                  p_base_set = Label.C_BASE_SET_R,
+                                                  p_name_long = name,
+                                                  p_name_latex = '',
+                                                  p_description = '',
+                                                  p_symmetrical = False,
+                                                  p_logging=Log.C_LOG_NOTHING ) )
+
+
+            # 3 Number of instances
+            if self._cache:
+                self._mmap = self._load_cache(p_path=path, p_names=list_features + list_labels)
+                num_inst   = self._mmap.shape[0]
+            else:
+                num_inst   = self._count_rows(p_path=path)
+
+            self.C_NUM_INSTANCES = self._num_instances = num_inst
+
+            if self._sampler is not None:
+                self._sampler.set_num_instances(self._num_instances)
+
+            self._loaded = True
+
+
+        # 4 Preparation of the chunked parsing
+        self._block     = np.empty((0, len(self._columns)))
+        self._block_pos = 0
+        self._mmap_pos  = 0
+
+        if self._mmap is not None: return
+
+        self._close_file()
+        self._file = open(path, 'r')
+        if self._kwargs['p_header']: next(self._file)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _count_rows(self, p_path) -> int:
+        """
+        Counts the data rows of the CSV file without parsing them. Blank lines are skipped like by the
+        parser.
+        """
+
+        num_lines = 0
+
+        with open(p_path, 'rb') as file:
+            for line in file:
+                if not line.isspace(): num_lines += 1
+
+        if self._kwargs['p_header']: num_lines -= 1
+        return max(0, num_lines)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _close_file(self):
+        """
+        Lazy mode: closes the CSV file opened for chunked parsing.
+        """
+
+        if self._file is None: return
+        self._file.close()
+        self._file = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _parse_rows(self, p_file, p_num_rows : int) -> np.ndarray:
+        """
+        Parses the next rows of an opened CSV file into a float64 array with the selected columns.
+        """
+
+        lines = list(islice(p_file, p_num_rows))
+        if len(lines) == 0: return np.empty((0, len(self._columns)))
+
+        try:
+            return np.loadtxt( lines,
+                               delimiter=self._kwargs['p_delimiter'],
+                               quotechar='"',
+                               usecols=self._columns,
+                               dtype=np.float64,
+                               ndmin=2 )
+        except ValueError as error:
+            raise Error('Lazy mode requires numeric columns: ' + str(error))
+
+
+## -------------------------------------------------------------------------------------------------
+    def _load_cache(self, p_path, p_names : list) -> np.ndarray:
+        """
+        Returns the memory-mapped binary cache of the selected columns. The cache is (re)built if it
+        is missing, older than the CSV file or belongs to a different column selection.
+        """
+
+        if self._kwargs.get('p_cache_filename', None) is not None:
+            path_cache = self._kwargs['p_path_load'] + os.sep + self._kwargs['p_cache_filename']
+        else:
+            path_cache = p_path + '.npy'
+
+        dtype = np.dtype([ (name, np.float64) for name in p_names ])
+
+        try:
+            if os.path.getmtime(path_cache) >= os.path.getmtime(p_path):
+                mmap = np.load(path_cache, mmap_mode='r')
+                if mmap.dtype == dtype: return mmap
+        except (OSError, ValueError):
+            pass
+
+        self.log(self.C_LOG_TYPE_I, 'Building binary cache', path_cache)
+
+        num_rows  = self._count_rows(p_path=p_path)
+        mmap      = np.lib.format.open_memmap(path_cache, mode='w+', dtype=dtype, shape=(num_rows,))
+        row       = 0
+
+        with open(p_path, 'r') as file:
+            if self._kwargs['p_header']: next(file)
+
+            while row < num_rows:
+                block = self._parse_rows(file, self._chunk_size)
+                if block.shape[0] == 0: break
+                mmap[row:row+block.shape[0]] = recfunctions.unstructured_to_structured(block, dtype=dtype)
+                row += block.shape[0]
+
+        mmap.flush()
+        del mmap
+        return np.load(path_cache, mmap_mode='r')
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_rows(self, p_num_rows : int) -> np.ndarray:
+        """
+        Lazy mode: returns up to p_num_rows next rows of the selected columns as float64 array.
+        """
+
+        p_num_rows = min(p_num_rows, self.C_NUM_INSTANCES - self._index)
+        if ( p_num_rows <= 0 ) or ( ( self._mmap is None ) and ( self._file is None ) ): 
+            return np.empty((0, len(self._columns)))
+
+        parts    = []
+        num_rows = 0
+
+        while num_rows < p_num_rows:
+            if self._block_pos == self._block.shape[0]:
+                num_block = max(self._chunk_size, p_num_rows - num_rows)
+
+                if self._mmap is not None:
+                    self._block     = recfunctions.structured_to_unstructured(self._mmap[self._mmap_pos:self._mmap_pos+num_block], copy=True)
+                    self._mmap_pos += self._block.shape[0]
+                else:
+                    self._block     = self._parse_rows(self._file, num_block)
+
+                self._block_pos = 0
+                if self._block.shape[0] == 0: break
+
+            num = min(p_num_rows - num_rows, self._block.shape[0] - self._block_pos)
+            parts.append(self._block[self._block_pos:self._block_pos+num])
+            self._block_pos += num
+            num_rows        += num
+
+        self._index += num_rows
+
+        # The file is not needed anymore at the end of the stream
+        if ( self._index == self.C_NUM_INSTANCES ) or ( num_rows < p_num_rows ): self._close_file()
+
+        if len(parts) == 1: return parts[0]
+        return np.concatenate(parts) if len(parts) > 0 else np.empty((0, len(self._columns)))
+
+
 ## -------------------------------------------------------------------------------------------------
     def _reset(self):
 
         self._index = 0
+        if self._lazy: self._close_file()
         self._init_dataset()
 
 
@@ -250,9 +502,58 @@ class StreamMLProCSV(Stream):
 
         if self._index == self.C_NUM_INSTANCES: raise StopIteration
 
+        if self._lazy:
+            rows = self._get_rows(1)
+            if rows.shape[0] == 0: raise StopIteration
+
+            feature_data = Element(self._feature_space)
+            feature_data.set_values(p_values=rows[0,:self._num_dim])
+
+            if self._label_space.get_num_dim() == 0: 
+                return Instance( p_feature_data=feature_data )
+
+            label_data = Element(self._label_space)
+            label_data.set_values(p_values=rows[0,self._num_dim:])
+            return Instance( p_feature_data=feature_data, p_label_data=label_data )
+
         feature_data = Element(self._feature_space)
         feature_data.set_values(p_values=self._dataset[self._index])
 
         self._index += 1
 
-        return Instance( p_feature_data=feature_data )
\ No newline at end of file
+        return Instance( p_feature_data=feature_data )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next_batch(self, p_num_inst : int) -> InstanceBatch:
+
+        if self._lazy:
+            rows = self._get_rows(p_num_inst)
+
+            if self._label_space.get_num_dim() == 0:
+                return InstanceBatch( p_feature_set=self._feature_space, p_feature_data=rows[:,:self._num_dim] )
+
+            return InstanceBatch( p_feature_set=self._feature_space, 
+                                  p_feature_data=rows[:,:self._num_dim],
+                                  p_label_set=self._label_space,
+                                  p_label_data=rows[:,self._num_dim:] )
+
+        index_start  = self._index
+        self._index  = min(self._index + p_num_inst, self.C_NUM_INSTANCES)
+        feature_data = self._dataset[index_start:self._index]
+
+        # Numeric columns are handed over as float array, others keep their object type
+        try:
+            feature_data = feature_data.astype(np.float64)
+        except (TypeError, ValueError):
+            feature_data = feature_data.copy()
+
+        return InstanceBatch( p_feature_set=self._feature_space, p_feature_data=feature_data )
+
+
+## -------------------------------------------------------------------------------------------------
+    def __del__(self):
+        try:
+            self._close_file()
+        except:
+            pass
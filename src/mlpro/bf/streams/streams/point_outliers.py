@@ -10,10 +10,15 @@
 ## -- 2024-04-26  1.1.0     DA       Refactoring: replaced parameter p_outlier_frequency by
 ## --                                p_outlier_rate
 ## -- 2024-06-04  1.1.1     DA       Bugfix: ESpace instead of MSpace
+## -- 2026-10-16  1.2.0     DA       New vectorized method _get_next_batch() and vectorized baseline
+## --                                functions
+## -- 2026-10-17  1.2.1     DA       Methods _get_next() and _get_next_batch() draw the same random 
+## --                                values from self._rng, which are handed over to the baseline 
+## --                                functions as new parameter p_rnd
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.1.1 (2024-06-04)
+Ver. 1.2.1 (2026-10-17)
 
 This module provides a multivariate benchmark stream with configurable baselines per feature and
 additional random point outliers.
@@ -21,8 +26,8 @@ additional random point outliers.
 """
 
 
-import random
 import math
+import numpy as np
 from mlpro.bf.streams.basics import *
 from mlpro.bf.streams.streams.provider_mlpro import StreamMLProBase
 
@@ -113,44 +118,93 @@ class StreamMLProPOutliers (StreamMLProBase):
         values       = []
         feature_data = Element(self._feature_space)     
 
-        for fct_method in self._fct_methods:
-            outlier = random.uniform(0,1) <= self.p_outlier_rate
-            values.append( fct_method(self._index, outlier) )   
+        # Two random values per feature: outlier decision and outlier value
+        rnd          = self._rng.random((self._num_dim, 2))
+
+        for d, fct_method in enumerate(self._fct_methods):
+            outlier = rnd[d,0] <= self.p_outlier_rate
+            values.append( fct_method(self._index, outlier, rnd[d,1]) )   
 
         feature_data.set_values(values)
 
         self._index += 1
 
         return Instance( p_feature_data=feature_data )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next_batch(self, p_num_inst : int) -> InstanceBatch:
+
+        # 0 Vectorized baseline functions are named _fct_<name>_batch(); custom functions without a
+        #   vectorized version are computed instance by instance
+        try:
+            fct_methods = [ getattr(self, '_fct_' + fct + '_batch') for fct in self._functions ]
+        except AttributeError:
+            return Stream._get_next_batch(self, p_num_inst=p_num_inst)
+
+        num_inst = self._get_batch_len(p_num_inst)
+        x        = np.arange(self._index, self._index + num_inst, dtype=np.float64)
+        values   = np.empty((num_inst, self._num_dim))
+
+        # 1 The random values are drawn in the same order as by method _get_next()
+        rnd      = self._rng.random((num_inst, self._num_dim, 2))
+
+        for d, fct_method in enumerate(fct_methods):
+            outlier     = rnd[:,d,0] <= self.p_outlier_rate
+            values[:,d] = fct_method(x, outlier, rnd[:,d,1])
+
+        self._index += num_inst
+
+        return InstanceBatch( p_feature_set=self._feature_space, p_feature_data=values )
     
 
 ## -------------------------------------------------------------------------------------------------
-    def _fct_sin(self, p_x, p_outlier : bool):
+    def _fct_sin(self, p_x, p_outlier : bool, p_rnd : float):
         if p_outlier:
-            return random.random() * 6 - 3
+            return p_rnd * 6 - 3
 
         return math.sin( p_x * math.pi / 180 )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _fct_sin_batch(self, p_x : np.ndarray, p_outlier : np.ndarray, p_rnd : np.ndarray) -> np.ndarray:
+        return np.where(p_outlier, p_rnd * 6 - 3, np.sin( p_x * np.pi / 180 ))
     
 
 ## -------------------------------------------------------------------------------------------------
-    def _fct_cos(self, p_x, p_outlier : bool):
+    def _fct_cos(self, p_x, p_outlier : bool, p_rnd : float):
         if p_outlier:
-            return random.random() * 6 - 3
+            return p_rnd * 6 - 3
 
         return math.cos( p_x * math.pi / 180 )
 
 
 ## -------------------------------------------------------------------------------------------------
-    def _fct_const(self, p_x, p_outlier : bool):
+    def _fct_cos_batch(self, p_x : np.ndarray, p_outlier : np.ndarray, p_rnd : np.ndarray) -> np.ndarray:
+        return np.where(p_outlier, p_rnd * 6 - 3, np.cos( p_x * np.pi / 180 ))
+
+
+## -------------------------------------------------------------------------------------------------
+    def _fct_const(self, p_x, p_outlier : bool, p_rnd : float):
         if p_outlier:
-            return random.random() * 6 - 2
+            return p_rnd * 6 - 2
 
         return 1.0
     
+
+## -------------------------------------------------------------------------------------------------
+    def _fct_const_batch(self, p_x : np.ndarray, p_outlier : np.ndarray, p_rnd : np.ndarray) -> np.ndarray:
+        return np.where(p_outlier, p_rnd * 6 - 2, 1.0)
+    
     
 ## -------------------------------------------------------------------------------------------------
-    def _fct_lin(self, p_x, p_outlier : bool):
+    def _fct_lin(self, p_x, p_outlier : bool, p_rnd : float):
         if p_outlier:
-            return p_x + random.random() * 20 - 10
+            return p_x + p_rnd * 20 - 10
 
-        return p_x    
\ No newline at end of file
+        return p_x
+    
+
+## -------------------------------------------------------------------------------------------------
+    def _fct_lin_batch(self, p_x : np.ndarray, p_outlier : np.ndarray, p_rnd : np.ndarray) -> np.ndarray:
+        return np.where(p_outlier, p_x + p_rnd * 20 - 10, p_x)    
\ No newline at end of file
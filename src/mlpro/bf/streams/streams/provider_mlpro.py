@@ -12,15 +12,21 @@
 ## -- 2023-04-12  1.0.2     SY       Remove p_kwargs in StreamProviderMLPro
 ## -- 2023-12-26  1.1.0     DA       StreamProviderMLPro.__init__(): recursive consideration of all 
 ## --                                subclasses of class StreamMLProBase
+## -- 2026-10-16  1.2.0     DA       Class StreamMLProBase: 
+## --                                - new numpy random generator self._rng
+## --                                - new methods _get_batch_len(), _get_next_batch()
+## -- 2026-10-17  1.2.1     DA       Class StreamMLProBase: documentation of the common use of 
+## --                                self._rng by methods _get_next() and _get_next_batch()
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.1.0 (2023-12-26)
+Ver. 1.2.1 (2026-10-17)
 
 This module consists of a native stream provider and a template for builtin streams.
 
 """
 
+import numpy as np
 from mlpro.bf.various import Log, ScientificObject
 from mlpro.bf.ops import Mode
 from mlpro.bf.streams.basics import *
@@ -33,6 +39,12 @@ from mlpro.bf.streams.basics import *
 class StreamMLProBase (Stream): 
     """
     Base class for MLPro's native data streams.
+
+    Native streams that generate their data randomly shall draw the random values of both methods
+    _get_next() and _get_next_batch() from the numpy random generator self._rng in the same order, 
+    so that a batch contains the same instances as the equivalent number of calls of _get_next(). 
+    The generator is reinitialized on each reset and by method set_random_seed() so that the data 
+    are reproducible for a given seed.
     """
 
     C_ID                = ''
@@ -58,9 +70,22 @@ class StreamMLProBase (Stream):
                           **p_kwargs )
 
 
+## -------------------------------------------------------------------------------------------------
+    def set_random_seed(self, p_seed=None):
+        super().set_random_seed(p_seed=p_seed)
+        self._random_seed = p_seed
+        self._rng         = np.random.default_rng(p_seed)
+
+
 ## -------------------------------------------------------------------------------------------------
     def _reset(self):
         self._index = 0
+
+        try:
+            self._rng = np.random.default_rng(self._random_seed)
+        except AttributeError:
+            self._rng = np.random.default_rng()
+
         self._init_dataset()
 
 
@@ -86,6 +111,41 @@ class StreamMLProBase (Stream):
         return Instance( p_feature_data=feature_data )
 
 
+## -------------------------------------------------------------------------------------------------
+    def _get_batch_len(self, p_num_inst : int) -> int:
+        """
+        Determines the number of instances of the next batch with respect to the remaining instances 
+        of the stream. Streams with C_NUM_INSTANCES = 0 are endless.
+
+        Parameters
+        ----------
+        p_num_inst : int
+            Requested number of instances.
+
+        Returns
+        -------
+        num_inst : int
+            Possible number of instances.
+        """
+
+        if self.C_NUM_INSTANCES == 0: return p_num_inst
+        return max(0, min(p_num_inst, self.C_NUM_INSTANCES - self._index))
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next_batch(self, p_num_inst : int) -> InstanceBatch:
+        """
+        Vectorized version of method _get_next() that slices the next rows of self._dataset.
+        """
+
+        num_inst    = self._get_batch_len(p_num_inst)
+        index_start = self._index
+        self._index += num_inst
+
+        return InstanceBatch( p_feature_set=self._feature_space,
+                              p_feature_data=np.array(self._dataset[index_start:self._index], dtype=np.float64) )
+
+
 
 
 
@@ -0,0 +1,417 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.streams.streams
+## -- Module  : recorded.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  0.0.0     DA       Creation
+## -- 2026-10-16  1.0.0     DA       First release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module provides a chunked columnar binary format for recorded data streams, the stream class
+StreamRecorded to replay such recordings and the stream provider StreamProviderRecorded for all
+recordings within a folder. Recordings are created by the stream task StreamRecorder (see module
+mlpro.bf.streams.tasks.recorder).
+
+A recording is a folder that contains a description file 'recording.json' and a sequence of
+segments. Each segment consists of the numpy files <segment>.id.npy (instance ids), <segment>.f.npy
+(feature values), <segment>.l.npy (optional label values) and <segment>.t.npy (optional time
+stamps), which are memory-mapped on replay.
+
+"""
+
+import os
+import json
+import numpy as np
+from mlpro.bf.various import Log, ScientificObject
+from mlpro.bf.ops import Mode
+from mlpro.bf.streams.basics import *
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamRecording:
+    """
+    Constants and helpers of the binary format for recorded data streams.
+    """
+
+    C_VERSION           = '1.0.0'
+    C_FNAME_DESCR       = 'recording.json'
+    C_FNAME_SEGMENT     = 'seg_%06i'
+    C_EXT_IDS           = '.id.npy'
+    C_EXT_FEATURES      = '.f.npy'
+    C_EXT_LABELS        = '.l.npy'
+    C_EXT_TSTAMPS       = '.t.npy'
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def load_descr(p_path : str) -> dict:
+        """
+        Loads the description of the recording in the given folder.
+
+        Parameters
+        ----------
+        p_path : str
+            Folder of the recording.
+
+        Returns
+        -------
+        descr : dict
+            Description of the recording.
+        """
+
+        with open(p_path + os.sep + StreamRecording.C_FNAME_DESCR, 'r') as file:
+            return json.load(file)
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def save_descr(p_path : str, p_descr : dict):
+        """
+        Saves the description of a recording atomically.
+        """
+
+        path_descr = p_path + os.sep + StreamRecording.C_FNAME_DESCR
+
+        with open(path_descr + '.tmp', 'w') as file:
+            json.dump(p_descr, file, indent=2)
+
+        os.replace(path_descr + '.tmp', path_descr)
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def is_recording(p_path : str) -> bool:
+        return os.path.isfile(p_path + os.sep + StreamRecording.C_FNAME_DESCR)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamRecorded (Stream):
+    """
+    Stream that replays a recording of the binary stream format (see class StreamRecording). The
+    segments of the recording are memory-mapped, so that a recording is replayed at disk bandwidth.
+    Besides the sequential access, the recorded instances can be accessed by their original ids
+    and time stamps.
+
+    Parameters
+    ----------
+    p_path : str
+        Folder of the recording.
+    p_name : str
+        Optional name of the stream. Default = '' (name stored in the recording).
+    p_mode
+        Operation mode. Default: Mode.C_MODE_SIM.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'Stream Recorded'
+
+    C_SCIREF_TYPE   = ScientificObject.C_SCIREF_TYPE_ONLINE
+    C_SCIREF_AUTHOR = 'MLPro'
+    C_SCIREF_URL    = 'https://mlpro.readthedocs.io'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_path : str,
+                  p_name : str = '',
+                  p_mode = Mode.C_MODE_SIM,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        self._path      = p_path
+        self._descr     = StreamRecording.load_descr(p_path)
+        self._segments  = {}
+        num_inst        = sum([ seg['num_inst'] for seg in self._descr['segments'] ])
+
+        if p_name == '': p_name = self._descr.get('name', os.path.basename(os.path.normpath(p_path)))
+
+        super().__init__( p_id = p_name,
+                          p_name = p_name,
+                          p_num_instances = num_inst,
+                          p_version = self._descr['version'],
+                          p_feature_space = self._setup_space(self._descr['features'], Feature),
+                          p_label_space = self._setup_space(self._descr['labels'], Label),
+                          p_mode = p_mode,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_space(self, p_names : list, p_dim_cls) -> MSpace:
+
+        space = ESpace()
+
+        for name in p_names:
+            space.add_dim( p_dim_cls( p_name_short = name,
+                                      p_base_set = p_dim_cls.C_BASE_SET_R,
+                                      p_name_long = name,
+                                      p_name_latex = '',
+                                      p_description = '',
+                                      p_symmetrical = False,
+                                      p_logging=Log.C_LOG_NOTHING ) )
+
+        return space
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_segment(self, p_seg : int) -> dict:
+        """
+        Returns the memory-mapped arrays of a segment.
+        """
+
+        try:
+            return self._segments[p_seg]
+        except KeyError:
+            pass
+
+        path    = self._path + os.sep + self._descr['segments'][p_seg]['file']
+        segment = { 'ids' : np.load(path + StreamRecording.C_EXT_IDS, mmap_mode='r'),
+                    'features' : np.load(path + StreamRecording.C_EXT_FEATURES, mmap_mode='r'),
+                    'labels' : None,
+                    'tstamps' : None }
+
+        if len(self._descr['labels']) > 0:
+            segment['labels'] = np.load(path + StreamRecording.C_EXT_LABELS, mmap_mode='r')
+
+        if self._descr['tstamp_dtype'] is not None:
+            segment['tstamps'] = np.load(path + StreamRecording.C_EXT_TSTAMPS, mmap_mode='r')
+
+        self._segments[p_seg] = segment
+        return segment
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_rows(self, p_seg : int, p_rows, p_recorded_ids : bool = True) -> InstanceBatch:
+        """
+        Copies the given rows of a segment into a new batch with the recorded time stamps and
+        optionally the recorded ids.
+        """
+
+        segment = self._get_segment(p_seg)
+
+        if segment['labels'] is not None:
+            label_set, label_data = self._label_space, np.array(segment['labels'][p_rows])
+        else:
+            label_set, label_data = None, None
+
+        if segment['tstamps'] is not None:
+            tstamps = np.array(segment['tstamps'][p_rows])
+            if tstamps.dtype.kind == 'M': tstamps = tstamps.astype(object)
+        else:
+            tstamps = None
+
+        return InstanceBatch( p_feature_set=self._feature_space,
+                              p_feature_data=np.array(segment['features'][p_rows]),
+                              p_label_set=label_set,
+                              p_label_data=label_data,
+                              p_ids=np.array(segment['ids'][p_rows]) if p_recorded_ids else None,
+                              p_tstamps=tstamps )
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _concat(p_batches : list) -> InstanceBatch:
+
+        if len(p_batches) == 1: return p_batches[0]
+
+        first = p_batches[0]
+
+        if first.get_label_data() is not None:
+            label_data = np.concatenate([ batch.get_label_data() for batch in p_batches ])
+        else:
+            label_data = None
+
+        if first.get_tstamps() is not None:
+            tstamps = np.concatenate([ batch.get_tstamps() for batch in p_batches ])
+        else:
+            tstamps = None
+
+        return InstanceBatch( p_feature_set=first.get_feature_set(),
+                              p_feature_data=np.concatenate([ batch.get_feature_data() for batch in p_batches ]),
+                              p_label_set=first.get_label_set(),
+                              p_label_data=label_data,
+                              p_ids=None if first.get_ids() is None else np.concatenate([ batch.get_ids() for batch in p_batches ]),
+                              p_tstamps=tstamps )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self):
+        self._seg     = 0
+        self._seg_pos = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next_batch(self, p_num_inst : int) -> InstanceBatch:
+
+        batches  = []
+        num_inst = 0
+
+        while ( num_inst < p_num_inst ) and ( self._seg < len(self._descr['segments']) ):
+            seg_len = self._descr['segments'][self._seg]['num_inst']
+            num     = min(p_num_inst - num_inst, seg_len - self._seg_pos)
+
+            if num > 0:
+                batches.append(self._get_rows(self._seg, slice(self._seg_pos, self._seg_pos + num), p_recorded_ids=False))
+                self._seg_pos += num
+                num_inst      += num
+
+            if self._seg_pos == seg_len:
+                self._seg    += 1
+                self._seg_pos = 0
+
+        if num_inst == 0:
+            return InstanceBatch( p_feature_set=self._feature_space,
+                                  p_feature_data=np.empty((0, self._feature_space.get_num_dim())) )
+
+        return self._concat(batches)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next(self) -> Instance:
+
+        # Ids are assigned by the stream; the recorded time stamps are kept
+        batch = self._get_next_batch(p_num_inst=1)
+        if len(batch) == 0: raise StopIteration
+        return batch.get_instance(0)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_instances_by_id(self, p_id_first : int, p_id_last : int) -> InstanceBatch:
+        """
+        Random access to recorded instances by their original ids.
+
+        Parameters
+        ----------
+        p_id_first : int
+            First instance id.
+        p_id_last : int
+            Last instance id (inclusive).
+
+        Returns
+        -------
+        batch : InstanceBatch
+            Recorded instances with ids in the given range, including their original ids and time
+            stamps. None, if no instance was found.
+        """
+
+        batches = []
+
+        for seg, descr_seg in enumerate(self._descr['segments']):
+            if ( descr_seg['id_last'] < p_id_first ) or ( descr_seg['id_first'] > p_id_last ): continue
+
+            ids  = self._get_segment(seg)['ids']
+            rows = np.nonzero( ( ids >= p_id_first ) & ( ids <= p_id_last ) )[0]
+            if rows.size > 0: batches.append(self._get_rows(seg, rows))
+
+        if len(batches) == 0: return None
+        return self._concat(batches)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_instances_by_tstamp(self, p_tstamp_first, p_tstamp_last) -> InstanceBatch:
+        """
+        Random access to recorded instances by their time stamps.
+
+        Parameters
+        ----------
+        p_tstamp_first
+            Begin of the time range.
+        p_tstamp_last
+            End of the time range (inclusive).
+
+        Returns
+        -------
+        batch : InstanceBatch
+            Recorded instances with time stamps in the given range, including their original ids
+            and time stamps. None, if no instance was found or if the recording has no time stamps.
+        """
+
+        if self._descr['tstamp_dtype'] is None: return None
+
+        dtype   = np.dtype(self._descr['tstamp_dtype'])
+        t_first = np.array(p_tstamp_first).astype(dtype)
+        t_last  = np.array(p_tstamp_last).astype(dtype)
+        batches = []
+
+        for seg in range(len(self._descr['segments'])):
+            tstamps = self._get_segment(seg)['tstamps']
+            rows    = np.nonzero( ( tstamps >= t_first ) & ( tstamps <= t_last ) )[0]
+            if rows.size > 0: batches.append(self._get_rows(seg, rows))
+
+        if len(batches) == 0: return None
+        return self._concat(batches)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamProviderRecorded (StreamProvider):
+    """
+    Stream provider for all recordings in the sub folders of a given folder. The ids and names of
+    the streams are the names of the sub folders.
+
+    Parameters
+    ----------
+    p_path : str
+        Folder with recordings.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    """
+
+    C_NAME          = 'Recorded'
+
+    C_SCIREF_TYPE   = ScientificObject.C_SCIREF_TYPE_ONLINE
+    C_SCIREF_AUTHOR = 'MLPro'
+    C_SCIREF_URL    = 'https://mlpro.readthedocs.io'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_path : str, p_logging=Log.C_LOG_ALL):
+        super().__init__(p_logging)
+        self._path = p_path
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_stream_list(self, p_mode=Mode.C_MODE_SIM, p_logging=Log.C_LOG_ALL, **p_kwargs) -> list:
+
+        stream_list = []
+
+        for name in sorted(os.listdir(self._path)):
+            path = self._path + os.sep + name
+            if StreamRecording.is_recording(path):
+                stream_list.append( StreamRecorded( p_path=path,
+                                                    p_name=name,
+                                                    p_mode=p_mode,
+                                                    p_logging=p_logging,
+                                                    **p_kwargs ) )
+
+        return stream_list
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_stream( self,
+                     p_id: str = None,
+                     p_name: str = None,
+                     p_mode=Mode.C_MODE_SIM,
+                     p_logging=Log.C_LOG_ALL,
+                     **p_kwargs ) -> Stream:
+
+        name = p_id if p_id is not None else p_name
+        path = self._path + os.sep + name
+        if not StreamRecording.is_recording(path): return None
+
+        return StreamRecorded( p_path=path, p_name=name, p_mode=p_mode, p_logging=p_logging, **p_kwargs )
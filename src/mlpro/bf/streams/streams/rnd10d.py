@@ -8,10 +8,11 @@
 ## -- 2022-12-13  0.0.0     DA       Creation 
 ## -- 2022-12-13  1.0.0     DA       First implementation
 ## -- 2024-06-04  1.0.1     DA       Bugfix: ESpace instead of MSpace
+## -- 2026-10-16  1.1.0     DA       New method _get_next_batch()
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.1 (2024-06-03)
+Ver. 1.1.0 (2026-10-16)
 
 This module provides the native stream class StreamMLProRnd10D. This stream provides 1000 instances
 with 10-dimensional random feature data and 2-dimensional random label data.
@@ -111,4 +112,16 @@ class StreamMLProRnd10D (StreamMLProBase):
         label_data = Element(self._label_space)
         label_data.set_values(p_values=self._dataset_l[self._index-1])
         inst.set_label_data(p_label_data=label_data)
-        return inst
\ No newline at end of file
+        return inst
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next_batch(self, p_num_inst : int) -> InstanceBatch:
+        num_inst    = self._get_batch_len(p_num_inst)
+        index_start = self._index
+        self._index += num_inst
+
+        return InstanceBatch( p_feature_set=self._feature_space,
+                              p_feature_data=self._dataset[index_start:self._index].copy(),
+                              p_label_set=self._label_space,
+                              p_label_data=self._dataset_l[index_start:self._index].copy() )
\ No newline at end of file
@@ -1,3 +1,4 @@
 from mlpro.bf.streams.tasks.windows import *
 from mlpro.bf.streams.tasks.rearranger import *
-from mlpro.bf.streams.tasks.deriver import *
\ No newline at end of file
+from mlpro.bf.streams.tasks.deriver import *
+from mlpro.bf.streams.tasks.recorder import *
\ No newline at end of file
@@ -11,12 +11,14 @@
 ## -- 2024-05-22  1.1.0     DA       Refactoring
 ## -- 2024-07-17  1.1.1     SY       Method Deriver._prepare_derivation(): takeover of feature 
 ## --                                and label space from first instance
+## -- 2026-10-16  1.2.0     DA       New class MultiDeriver
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.1.1 (2024-07-17)
+Ver. 1.2.0 (2026-10-16)
 
-This module provides a stream task class Deriver to derive the data of instances.
+This module provides the stream task classes Deriver and MultiDeriver to derive the data of 
+instances.
 """
 
 
@@ -24,7 +26,7 @@ from mlpro.bf.exceptions import *
 from mlpro.bf.various import Log
 from mlpro.bf.mt import Task
 from mlpro.bf.math import Element
-from mlpro.bf.streams import Instance, InstDict, StreamTask, Feature, Label
+from mlpro.bf.streams import Instance, InstDict, InstTypeNew, StreamTask, Feature, Label
 from mlpro.bf.physics import TransferFunction
 import numpy as np
 
@@ -208,6 +210,191 @@ class Deriver(StreamTask):
 
                  
                         
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MultiDeriver(StreamTask):
+    """
+    This stream task extends the feature data of incoming new instances with derivatives of several
+    features in several orders at once. Per feature and order, a new feature is appended in the 
+    order of the parameters.
+
+    The task remembers only the last n+1 values of the selected features in a fixed-size array,
+    where n is the highest order. All derivatives of a run are determined in one vectorized step
+    by repeated backward differences over the remembered and the new values. As in class Deriver,
+    the differences are divided by the elapsed time in seconds, if the time stamps of the instances
+    support it, and by 1 otherwise. Derivatives of order k are 0 for the first k instances.
+
+    Parameters
+    ----------
+    p_features : list
+        Features to be derived.
+    p_orders : list
+        Orders of the derivatives to be determined for each feature. Default = [1].
+    p_name : str
+        Optional name of the task. Default is None.
+    p_range_max : int
+        Maximum range of asynchonicity. See class Range. Default is Range.C_RANGE_THREAD.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default = False.
+    p_visualize : bool
+        Boolean switch for visualisation. Default = False.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_NAME              = 'Multi-Deriver'
+    C_PLOT_STANDALONE   = True
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_features : list,
+                  p_orders : list = [1],
+                  p_name : str = None,
+                  p_range_max = Task.C_RANGE_THREAD,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+        if ( p_features is None ) or ( len(p_features) == 0 ):
+            raise ParamError('Please provide the features to be derived')
+
+        for feature in p_features:
+            if not isinstance(feature, Feature):
+                raise ParamError('Please provide the features to be derived as objects of type Feature')
+
+        if ( len(p_orders) == 0 ) or ( min(p_orders) < 1 ):
+            raise ParamError('The orders of the derivatives can not be lower than 1')
+
+        self._features      = list(p_features)
+        self._orders        = sorted(set(p_orders))
+        self._order_max     = self._orders[-1]
+        self._feature_space = None
+        self._idx_features  = None
+
+        # Memory of the last n+1 feature values and the time differences to their predecessors
+        self._mem_values    = None
+        self._mem_tdiffs    = np.ones(self._order_max + 1)
+        self._mem_len       = 0
+        self._tstamp_last   = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _prepare_derivation(self, p_inst : Instance):
+
+        feature_data        = p_inst.get_feature_data()
+        feature_ids         = feature_data.get_dim_ids()
+        self._feature_space = type(feature_data.get_related_set())()
+        self._idx_features  = np.array([ feature_ids.index(feature.get_id()) for feature in self._features ])
+
+        for feature in feature_data.get_related_set().get_dims():
+            self._feature_space.add_dim(p_dim=feature)
+
+        for feature in self._features:
+            for order in self._orders:
+                feature_der             = feature.copy()
+                feature_der._name_short = feature_der._name_short + ' OD-' + str(order)
+                feature_der._name_long  = feature_der._name_long + ' OD-' + str(order)
+                self._feature_space.add_dim(p_dim=feature_der)
+
+        self._mem_values = np.zeros((self._order_max + 1, len(self._features)))
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_time_diff(p_tstamp_1, p_tstamp_2) -> float:
+        try:
+            return ( p_tstamp_2 - p_tstamp_1 ).total_seconds()
+        except:
+            return 1.0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _derive(self, p_values : np.ndarray, p_tdiffs : np.ndarray) -> np.ndarray:
+        """
+        Determines the derivatives of new feature values.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Values of the features to be derived with one row per new instance.
+        p_tdiffs : np.ndarray
+            Time differences of the new instances to their predecessors.
+
+        Returns
+        -------
+        np.ndarray
+            Derivatives with one row per new instance. The columns are ordered by feature and order.
+        """
+
+        num_new     = p_values.shape[0]
+        len_mem     = self._mem_len
+        values      = np.concatenate( (self._mem_values[self._order_max + 1 - len_mem:], p_values) )
+        tdiffs      = np.concatenate( (self._mem_tdiffs[self._order_max + 1 - len_mem:], p_tdiffs) )
+        derivatives = np.zeros((num_new, len(self._features), len(self._orders)))
+
+        # 1 Repeated backward differences over the remembered and the new values
+        diffs = values
+        for order in range(1, self._order_max + 1):
+            if diffs.shape[0] < 2: break
+            tdiffs_order = tdiffs[order:, np.newaxis]
+            diffs        = np.divide( np.diff(diffs, axis=0), tdiffs_order,
+                                      out=np.zeros((diffs.shape[0] - 1, diffs.shape[1])),
+                                      where=(tdiffs_order != 0) )
+
+            if order in self._orders:
+                start = max(0, order - len_mem)
+                if start < num_new:
+                    derivatives[start:, :, self._orders.index(order)] = diffs[len_mem + start - order:]
+
+        # 2 Update of the memory
+        self._mem_values[self._order_max + 1 - min(len(values), self._order_max + 1):] = values[-(self._order_max + 1):]
+        self._mem_tdiffs[self._order_max + 1 - min(len(tdiffs), self._order_max + 1):] = tdiffs[-(self._order_max + 1):]
+        self._mem_len = min(len(values), self._order_max + 1)
+
+        return derivatives.reshape(num_new, -1)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+
+        new_instances = [ inst for inst_id, (inst_type, inst) in sorted(p_inst.items()) if inst_type == InstTypeNew ]
+        if len(new_instances) == 0: return
+
+        if self._feature_space is None:
+            self._prepare_derivation(p_inst=new_instances[0])
+
+        # 1 Values and time differences of the new instances
+        values = np.array([ inst.get_feature_data().get_values() for inst in new_instances ], dtype=np.float64)
+        tdiffs = np.empty(len(new_instances))
+
+        for i, inst in enumerate(new_instances):
+            tstamp = inst.get_tstamp()
+            tdiffs[i] = self._get_time_diff(self._tstamp_last, tstamp)
+            self._tstamp_last = tstamp
+
+        # 2 Derivatives of all new instances in one step
+        values_new = np.hstack( (values, self._derive(values[:, self._idx_features], tdiffs)) )
+
+        # 3 Extension of the feature data
+        for inst, row in zip(new_instances, values_new):
+            feature_data = Element(p_set=self._feature_space)
+            feature_data.set_values(row)
+            inst.set_feature_data(p_feature_data=feature_data)
+
+
+
+
+
 ## -------------------------------------------------------------------------------------------------
 ## -------------------------------------------------------------------------------------------------
 class DerivativeFunction(TransferFunction):
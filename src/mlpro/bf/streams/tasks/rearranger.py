@@ -13,10 +13,12 @@
 ## -- 2024-05-22  1.1.0     DA       Refactoring
 ## -- 2024-06-17  1.1.1.    DA       Method Rearranger._prepare_rearrangement(): takeover of feature 
 ## --                                and label space from first instance
+## -- 2026-10-17  1.2.0     DA       Batch-native rearrangement by index vectors (new method 
+## --                                _run_batch())
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.1.1 (2024-06-17)
+Ver. 1.2.0 (2026-10-17)
 
 This module provides a stream task class Rearranger to rearrange the feature and label space of
 instances.
@@ -24,11 +26,12 @@ instances.
 """
 
 
+import numpy as np
 from mlpro.bf.exceptions import *
 from mlpro.bf.various import Log
 from mlpro.bf.mt import Task
 from mlpro.bf.math import Element
-from mlpro.bf.streams import Instance, InstDict, StreamTask
+from mlpro.bf.streams import Instance, InstDict, InstanceBatch, StreamTask
 
 
 
@@ -39,7 +42,8 @@ class Rearranger (StreamTask):
     """
     This stream task rearrange the feature and/or label data of incoming instances. To this regard,
     two additional parameters p_features_new and p_labels_new describe the dimensions of the 
-    feature/label space of the resulting instances.
+    feature/label space of the resulting instances. Batches of numeric instances are rearranged at
+    once by index vectors.
 
     Parameters
     ----------
@@ -65,6 +69,7 @@ class Rearranger (StreamTask):
 
     C_NAME                  = 'Rearranger'
     C_PLOT_STANDALONE       = True
+    C_BATCH_NATIVE          = True
 
 ## -------------------------------------------------------------------------------------------------
     def __init__( self, 
@@ -210,4 +215,48 @@ class Rearranger (StreamTask):
 
         # 2 Rearrange new instances (order doesn't matter)
         for (inst_type,inst) in p_inst.values(): 
-            self._rearrange(p_inst=inst)
\ No newline at end of file
+            self._rearrange(p_inst=inst)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_index_vectors(self, p_mapping : list):
+        """
+        Internal use. Converts a list of index pairs (new, old) into two index vectors.
+        """
+
+        if len(p_mapping) == 0: return None, None
+        idx = np.array(p_mapping, dtype=int)
+        return idx[:,0], idx[:,1]
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run_batch(self, p_batch : InstanceBatch):
+
+        # 1 Late preparation based on first incoming instance
+        if not self._prepared:
+            self._prepare_rearrangement(p_inst=p_batch.get_instance(0))
+            self._prepared = True
+
+        f_values_old = p_batch.get_feature_data()
+        l_values_old = p_batch.get_label_data()
+        num_inst     = len(p_batch)
+
+        # 2 Collect new feature values
+        f_values_new = np.zeros((num_inst, self._feature_space.get_num_dim()))
+
+        for mapping, values_old in [ ( self._mapping_f2f, f_values_old ), ( self._mapping_l2f, l_values_old ) ]:
+            idx_new, idx_old = self._get_index_vectors(mapping)
+            if idx_new is not None: f_values_new[:, idx_new] = values_old[:, idx_old]
+
+        p_batch.set_feature_data( p_feature_set = self._feature_space, p_feature_data = f_values_new )
+
+        # 3 Collect new label values
+        if l_values_old is None: return
+
+        l_values_new = np.zeros((num_inst, self._label_space.get_num_dim()))
+
+        for mapping, values_old in [ ( self._mapping_f2l, f_values_old ), ( self._mapping_l2l, l_values_old ) ]:
+            idx_new, idx_old = self._get_index_vectors(mapping)
+            if idx_new is not None: l_values_new[:, idx_new] = values_old[:, idx_old]
+
+        p_batch.set_label_data( p_label_set = self._label_space, p_label_data = l_values_new )
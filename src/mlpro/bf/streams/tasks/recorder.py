@@ -0,0 +1,257 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.streams.tasks
+## -- Module  : recorder.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  0.0.0     DA       Creation
+## -- 2026-10-16  1.0.0     DA       First release
+## -- 2026-10-17  1.1.0     DA       - New parameter p_overwrite: an existing recording is only 
+## --                                  replaced on request
+## --                                - Buffered instances are written by method finish()
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module provides the stream task class StreamRecorder that records the incoming instances in the
+chunked columnar binary format of module mlpro.bf.streams.streams.recorded.
+"""
+
+
+import os
+import numpy as np
+from mlpro.bf.exceptions import *
+from mlpro.bf.various import Log
+from mlpro.bf.mt import Task
+from mlpro.bf.streams import InstDict, InstanceBatch, StreamTask
+from mlpro.bf.streams.streams.recorded import StreamRecording
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamRecorder (StreamTask):
+    """
+    Stream task that records all new incoming instances in a folder. The instances are buffered and
+    written in segments of fixed size. The description of the recording is updated after each
+    segment, so that the recording can be replayed at any time by class StreamRecorded. Obsolete
+    instances are not recorded and all incoming instances are forwarded unchanged. An existing
+    recording in the folder is only replaced if parameter p_overwrite is True.
+
+    Remaining buffered instances are written by method flush(). It is called by method finish(), 
+    which a stream scenario calls for all tasks of its workflow at the end of a run. Since the 
+    buffer lives in the process of the task, the task range should not exceed Task.C_RANGE_THREAD.
+
+    Parameters
+    ----------
+    p_path : str
+        Folder of the recording.
+    p_segment_size : int
+        Number of instances per segment. Default = C_SEGMENT_SIZE.
+    p_recording_name : str
+        Optional name of the recording. Default = None (name of the folder).
+    p_overwrite : bool
+        If True, an existing recording in the folder is replaced. Otherwise, an exception is raised.
+        Default = False.
+    p_name : str
+        Optional name of the task. Default is None.
+    p_range_max : int
+        Maximum range of asynchonicity. See class Range. Default is Range.C_RANGE_THREAD.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default = False.
+    p_visualize : bool
+        Boolean switch for visualisation. Default = False.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_NAME              = 'Recorder'
+    C_BATCH_NATIVE      = True
+    C_PLOT_ACTIVE       = False
+
+    C_SEGMENT_SIZE      = 10000
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_path : str,
+                  p_segment_size : int = C_SEGMENT_SIZE,
+                  p_recording_name : str = None,
+                  p_overwrite : bool = False,
+                  p_name : str = None,
+                  p_range_max = Task.C_RANGE_THREAD,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+        if p_segment_size <= 0:
+            raise ParamError('Parameter p_segment_size needs to be greater than 0')
+
+        self._path           = p_path
+        self._segment_size   = int(p_segment_size)
+        self._recording_name = p_recording_name or os.path.basename(os.path.normpath(p_path))
+        self._descr          = None
+        self._buffer         = []
+        self._buffer_len     = 0
+
+        os.makedirs(p_path, exist_ok=True)
+
+        if StreamRecording.is_recording(p_path):
+            if not p_overwrite:
+                raise Error('Folder ' + p_path + ' already contains a recording. Use p_overwrite=True to replace it.')
+            
+            self._remove_recording()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _remove_recording(self):
+        """
+        Removes the files of an existing recording in the folder.
+        """
+
+        if not StreamRecording.is_recording(self._path): return
+
+        descr = StreamRecording.load_descr(self._path)
+
+        for seg in descr['segments']:
+            for ext in [ StreamRecording.C_EXT_IDS, StreamRecording.C_EXT_FEATURES,
+                         StreamRecording.C_EXT_LABELS, StreamRecording.C_EXT_TSTAMPS ]:
+                try:
+                    os.remove(self._path + os.sep + seg['file'] + ext)
+                except FileNotFoundError:
+                    pass
+
+        os.remove(self._path + os.sep + StreamRecording.C_FNAME_DESCR)
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _convert_tstamps(p_tstamps) -> np.ndarray:
+        """
+        Converts time stamps into a numeric or datetime64 vector. Returns None for time stamps that
+        can not be stored.
+        """
+
+        if p_tstamps is None: return None
+
+        tstamps = np.asarray(p_tstamps)
+
+        if tstamps.dtype.kind == 'O':
+            try:
+                tstamps = tstamps.astype('datetime64[us]')
+            except (TypeError, ValueError):
+                return None
+
+        if tstamps.dtype.kind not in 'iufM': return None
+        return tstamps
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_recording(self, p_batch : InstanceBatch, p_tstamps : np.ndarray):
+
+        label_set = p_batch.get_label_set()
+
+        self._descr = { 'version' : StreamRecording.C_VERSION,
+                        'name' : self._recording_name,
+                        'features' : [ dim.get_name_short() for dim in p_batch.get_feature_set().get_dims() ],
+                        'labels' : [ dim.get_name_short() for dim in label_set.get_dims() ] if label_set is not None else [],
+                        'tstamp_dtype' : str(p_tstamps.dtype) if p_tstamps is not None else None,
+                        'segment_size' : self._segment_size,
+                        'segments' : [] }
+
+        StreamRecording.save_descr(self._path, self._descr)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+        if len(p_inst) > 0:
+            raise Error('Only instances with numeric feature and label data of the same spaces can be recorded')
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run_batch(self, p_batch : InstanceBatch):
+
+        new = p_batch.get_new_mask()
+        if not new.any(): return
+
+        tstamps = self._convert_tstamps(p_batch.get_tstamps())
+        if self._descr is None: self._setup_recording(p_batch, tstamps)
+
+        label_data = p_batch.get_label_data()
+
+        self._buffer.append( ( np.array(p_batch.get_ids()[new], dtype=np.int64),
+                               p_batch.get_feature_data()[new].copy(),
+                               label_data[new].copy() if label_data is not None else None,
+                               tstamps[new].copy() if self._descr['tstamp_dtype'] is not None else None ) )
+        self._buffer_len += np.count_nonzero(new)
+
+        while self._buffer_len >= self._segment_size:
+            self._write_segment(self._segment_size)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _write_segment(self, p_num_inst : int):
+        """
+        Writes the first p_num_inst buffered instances as new segment.
+        """
+
+        columns = []
+
+        for col in range(4):
+            if self._buffer[0][col] is None:
+                columns.append(None)
+            else:
+                columns.append(np.concatenate([ entry[col] for entry in self._buffer ]))
+
+        seg_file = StreamRecording.C_FNAME_SEGMENT % len(self._descr['segments'])
+        path     = self._path + os.sep + seg_file
+
+        for col, ext in enumerate([ StreamRecording.C_EXT_IDS, StreamRecording.C_EXT_FEATURES,
+                                    StreamRecording.C_EXT_LABELS, StreamRecording.C_EXT_TSTAMPS ]):
+            if columns[col] is not None: np.save(path + ext, columns[col][:p_num_inst])
+
+        ids = columns[0][:p_num_inst]
+        self._descr['segments'].append( { 'file' : seg_file,
+                                          'num_inst' : int(p_num_inst),
+                                          'id_first' : int(ids.min()),
+                                          'id_last' : int(ids.max()) } )
+        StreamRecording.save_descr(self._path, self._descr)
+
+        # Remaining instances stay in the buffer
+        if columns[0].shape[0] > p_num_inst:
+            self._buffer = [ tuple( col[p_num_inst:] if col is not None else None for col in columns ) ]
+        else:
+            self._buffer = []
+
+        self._buffer_len -= p_num_inst
+
+
+## -------------------------------------------------------------------------------------------------
+    def flush(self):
+        """
+        Writes all buffered instances as last segment.
+        """
+
+        if self._buffer_len > 0: self._write_segment(self._buffer_len)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _finish(self):
+        self.flush()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_path(self) -> str:
+        return self._path
@@ -1 +1,2 @@
 from mlpro.bf.streams.tasks.windows.ringbuffer import RingBuffer
+from mlpro.bf.streams.tasks.windows.timewindow import TimeWindow, SessionWindow
@@ -24,10 +24,11 @@
 ## -- 2022-12-31  1.1.4     LSB      Refactoring
 ## -- 2023-02-02  1.1.5     DA       Methods Window._init_plot_*: removed figure creation
 ## -- 2024-05-22  1.2.0     DA       Refactoring and splitting
+## -- 2026-10-16  1.3.0     DA       New method Window._get_numeric_features()
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.2.0 (2024-05-22)
+Ver. 1.3.0 (2026-10-16)
 
 This module provides pool of window objects further used in the context of online adaptivity.
 """
@@ -100,6 +101,34 @@ class Window (StreamTask):
         self._statistics_enabled = p_enable_statistics
 
 
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_numeric_features(p_feature_data : Element):
+        """
+        Determines the numeric features of the given feature data.
+
+        Parameters
+        ----------
+        p_feature_data : Element
+            Feature data of a stream instance.
+
+        Returns
+        -------
+        numeric_features : list
+            Ids of the numeric feature dimensions.
+        numeric_idx : np.ndarray
+            Related positions in the feature value vector.
+        """
+
+        dim_ids          = p_feature_data.get_dim_ids()
+        related_set      = p_feature_data.get_related_set()
+        numeric_features = [ j for j in dim_ids if related_set.get_dim(j).get_base_set() in [ Dimension.C_BASE_SET_N,
+                                                                                               Dimension.C_BASE_SET_R,
+                                                                                               Dimension.C_BASE_SET_Z ] ]
+
+        return numeric_features, np.array([ dim_ids.index(j) for j in numeric_features ], dtype=np.int64)
+
+
 ## -------------------------------------------------------------------------------------------------
     def get_buffered_data(self) -> Tuple[dict,int]:
         """
@@ -26,10 +26,20 @@
 ## -- 2024-05-22  1.2.0     DA       Refactoring, splitting, and renaming to RingBuffer
 ## -- 2024-05-23  1.2.1     DA       Bugfixes on plotting
 ## -- 2024-10-31  1.2.2     DA       Bugfix in RingBuffer.get_boundaries()
+## -- 2026-10-16  1.2.3     DA       Method RingBuffer._run(): support of micro-batches larger than
+## --                                the buffer
+## -- 2026-10-16  1.3.0     DA       Class RingBuffer: 
+## --                                - numeric data, ids and time stamps in preallocated numpy rings
+## --                                  filled block-wise per run
+## --                                - sliding min/max by monotonic deques and running sums, so that
+## --                                  get_boundaries(), get_mean(), get_variance() are O(1) per 
+## --                                  instance
+## --                                - new methods get_buffered_arrays(), get_std_deviation()
+## -- 2026-10-16  1.3.1     DA       Method RingBuffer._init_statistics(): refactoring
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.2.2 (2024-10-31)
+Ver. 1.3.1 (2026-10-16)
 
 This module provides pool of window objects further used in the context of online adaptivity.
 """
@@ -38,6 +48,7 @@ This module provides pool of window objects further used in the context of onlin
 from matplotlib.axes import Axes
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 from matplotlib.patches import Rectangle
+from collections import deque
 import numpy as np
 from mlpro.bf.streams.basics import *
 from mlpro.bf.events import *
@@ -52,6 +63,12 @@ class RingBuffer (Window):
     """
     This class implements a ring buffer.
 
+    If statistics are enabled, the numeric features, ids and time stamps of the buffered instances are
+    additionally stored in preallocated numpy rings. The sliding minimum/maximum per feature is 
+    maintained by monotonic deques and the sum/sum of squares incrementally, so that boundaries, mean 
+    and variance are available in O(1) per instance independently of the buffer size. To avoid a 
+    drift of the running sums, they are recomputed once per buffer cycle.
+
     Parameters
     ----------
         p_buffer_size:int
@@ -104,6 +121,16 @@ class RingBuffer (Window):
         self._statistics_enabled        = p_enable_statistics or p_visualize
         self._numeric_buffer:np.ndarray = None
         self._numeric_features          = []
+        self._numeric_idx               = None
+        self._ids_buffer:np.ndarray     = None
+        self._tstamp_buffer:np.ndarray  = None
+        self._num_buffered              = 0
+        self._seq                       = 0
+        self._num_since_recalc          = 0
+        self._sum:np.ndarray            = None
+        self._sum_sq:np.ndarray         = None
+        self._deques_min                = None
+        self._deques_max                = None
         self._raise_event_data_removed  = False
         self._buffer_full               = False
 
@@ -122,6 +149,9 @@ class RingBuffer (Window):
         # 0 Intro
         inst = p_inst.copy()
         p_inst.clear()
+        inst_new       = []
+        feature_value  = None
+        raise_buffer_full = False
 
 
         # 1 Main processing loop
@@ -139,21 +169,20 @@ class RingBuffer (Window):
 
             # 1.2 Checking the numeric dimensions/features in Stream
             if self._numeric_buffer is None and self._statistics_enabled:
-                for j in feature_value.get_dim_ids():
-                    if feature_value.get_related_set().get_dim(j).get_base_set() in [Dimension.C_BASE_SET_N,
-                                                                                     Dimension.C_BASE_SET_R,
-                                                                                     Dimension.C_BASE_SET_Z]:
-                        self._numeric_features.append(j)
-
-                self._numeric_buffer = np.zeros((self.buffer_size, len(self._numeric_features)))
+                self._init_statistics( p_feature_data = feature_value )
 
 
             # 1.3 Internal ring buffer already filled?
             if len(self._buffer) == self.buffer_size:
 
-                # The oldest instance is extracted from the buffer and forwarded
+                # The oldest instance is extracted from the buffer and forwarded. If it has been
+                # buffered within the same (micro-batch) cycle, it is not forwarded at all.
                 inst_del = self._buffer[self._buffer_pos]
-                p_inst[inst_del.id] = ( InstTypeDel, inst_del )
+                try:
+                    del p_inst[inst_del.id]
+                except KeyError:
+                    p_inst[inst_del.id] = ( InstTypeDel, inst_del )
+
                 self._raise_event_data_removed = True
 
                 p_inst[inst.id] = ( InstTypeNew, inst )
@@ -164,35 +193,166 @@ class RingBuffer (Window):
 
             # 1.4 New instance is buffered
             self._buffer[self._buffer_pos] = inst
-               
+            if self._statistics_enabled: inst_new.append(inst)
 
-            # 1.5 Update of internal statistics
-            if self._statistics_enabled:
-                self._numeric_buffer[self._buffer_pos] = [feature_value.get_value(k) for k in self._numeric_features]
 
-
-            # 1.6 Increment of buffer position
+            # 1.5 Increment of buffer position
             self._buffer_pos = (self._buffer_pos + 1) % self.buffer_size
 
 
-            # 1.7 Raise events at the end of instance processing
+            # 1.6 Buffer filled for the first time
             if ( not self._buffer_full ) and ( len(self._buffer) == self.buffer_size ):
                 self._buffer_full = True
+                raise_buffer_full = True
 
                 if self._delay:
                     for i in range(self.buffer_size):
                         inst_fwd = self._buffer[i]
                         p_inst[inst_fwd.id] = ( InstTypeNew, inst_fwd )
 
-                self._raise_event( p_event_id = self.C_EVENT_BUFFER_FULL, 
-                                   p_event_object = Event( p_raising_object=self, 
-                                                           p_related_set=feature_value.get_related_set() ) )
+
+        # 2 Block-wise update of the numeric rings and statistics
+        if len(inst_new) > 0:
+            self._update_statistics( p_inst_new = inst_new )
+
+
+        # 3 Raise events at the end of processing
+        if feature_value is None: return
+
+        if raise_buffer_full:
+            self._raise_event( p_event_id = self.C_EVENT_BUFFER_FULL, 
+                               p_event_object = Event( p_raising_object=self, 
+                                                       p_related_set=feature_value.get_related_set() ) )
+
+        if self._raise_event_data_removed:
+            self._raise_event( p_event_id = self.C_EVENT_DATA_REMOVED, 
+                               p_event_object = Event( p_raising_object=self, 
+                                                       p_related_set=feature_value.get_related_set() ) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _init_statistics(self, p_feature_data : Element):
+        """
+        Determines the numeric features and allocates the numeric rings.
+        """
+
+        self._numeric_features, self._numeric_idx = self._get_numeric_features( p_feature_data = p_feature_data )
+
+        num_features         = len(self._numeric_features)
+        self._numeric_buffer = np.zeros((self.buffer_size, num_features))
+        self._ids_buffer     = np.zeros(self.buffer_size, dtype=np.int64)
+        self._sum            = np.zeros(num_features)
+        self._sum_sq         = np.zeros(num_features)
+        self._deques_min     = [ deque() for i in range(num_features) ]
+        self._deques_max     = [ deque() for i in range(num_features) ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_statistics(self, p_inst_new : list):
+        """
+        Writes the numeric data, ids and time stamps of new instances block-wise into the rings and
+        updates the running sums and the monotonic deques.
+
+        Parameters
+        ----------
+        p_inst_new : list
+            New instances in the order of buffering.
+        """
+
+        # 1 Only the last buffer_size instances remain in the buffer
+        num_new  = len(p_inst_new)
+        num_ring = min(num_new, self.buffer_size)
+        insts    = p_inst_new[num_new - num_ring:]
+
+        values   = np.array([ inst.get_feature_data().get_values() for inst in insts ], dtype=np.float64)
+        values   = values[:, self._numeric_idx]
+        seq_last = self._seq + num_new - 1
+        seqs     = np.arange(seq_last - num_ring + 1, seq_last + 1, dtype=np.int64)
+        pos      = seqs % self.buffer_size
+
+
+        # 2 Running sums: overwritten rows are subtracted, new rows are added
+        pos_old = pos[pos < self._num_buffered]
+        if pos_old.shape[0] > 0:
+            values_old    = self._numeric_buffer[pos_old]
+            self._sum    -= values_old.sum(axis=0)
+            self._sum_sq -= np.square(values_old).sum(axis=0)
+
+        self._sum    += values.sum(axis=0)
+        self._sum_sq += np.square(values).sum(axis=0)
+
+
+        # 3 Update of the rings
+        self._numeric_buffer[pos] = values
+        self._ids_buffer[pos]     = [ inst.id for inst in insts ]
+
+        tstamps = [ inst.tstamp for inst in insts ]
+        if self._tstamp_buffer is None:
+            tstamps_np = np.asarray(tstamps)
+            dtype      = tstamps_np.dtype if tstamps_np.dtype.kind in 'iufM' else object
+            self._tstamp_buffer = np.empty(self.buffer_size, dtype=dtype)
+        self._tstamp_buffer[pos] = tstamps
+
+        self._seq          = seq_last + 1
+        self._num_buffered = min(self._num_buffered + num_new, self.buffer_size)
+
+
+        # 4 Running sums are recomputed once per buffer cycle to avoid a numerical drift
+        self._num_since_recalc += num_new
+        if self._num_since_recalc >= self.buffer_size:
+            buffered          = self._numeric_buffer[:self._num_buffered]
+            self._sum[:]      = buffered.sum(axis=0)
+            self._sum_sq[:]   = np.square(buffered).sum(axis=0)
+            self._num_since_recalc = 0
 
 
-            if self._raise_event_data_removed:
-                self._raise_event( p_event_id = self.C_EVENT_DATA_REMOVED, 
-                                   p_event_object = Event( p_raising_object=self, 
-                                                           p_related_set=feature_value.get_related_set() ) )
+        # 5 Monotonic deques of sequence numbers for the sliding minimum and maximum
+        seq_first_valid = self._seq - self._num_buffered
+        suffix_max      = np.maximum.accumulate(values[::-1], axis=0)[::-1]
+        suffix_min      = np.minimum.accumulate(values[::-1], axis=0)[::-1]
+        cand_max        = np.ones(values.shape, dtype=bool)
+        cand_min        = np.ones(values.shape, dtype=bool)
+        cand_max[:-1]   = values[:-1] > suffix_max[1:]
+        cand_min[:-1]   = values[:-1] < suffix_min[1:]
+
+        for j in range(values.shape[1]):
+            for dq, block_extr, cand, better in [ ( self._deques_max[j], suffix_max[0, j], cand_max[:, j], np.greater ), 
+                                                  ( self._deques_min[j], suffix_min[0, j], cand_min[:, j], np.less ) ]:
+                
+                # 5.1 Expired entries are removed from the front
+                while ( len(dq) > 0 ) and ( dq[0] < seq_first_valid ): dq.popleft()
+
+                # 5.2 Entries dominated by the new block are removed from the back
+                while ( len(dq) > 0 ) and not better(self._numeric_buffer[dq[-1] % self.buffer_size, j], block_extr): dq.pop()
+
+                # 5.3 Non-dominated new entries are appended
+                dq.extend(seqs[cand].tolist())
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_buffered_arrays(self):
+        """
+        Returns the numeric rings in chronological order (oldest instance first). Requires enabled
+        statistics.
+
+        Returns
+        -------
+        ids : np.ndarray
+            Ids of the buffered instances.
+        feature_data : np.ndarray
+            Numeric feature data of the buffered instances.
+        tstamps : np.ndarray
+            Time stamps of the buffered instances.
+        """
+
+        if self._num_buffered == 0: return None, None, None
+
+        if self._num_buffered < self.buffer_size:
+            idx = np.arange(self._num_buffered)
+        else:
+            idx = np.roll(np.arange(self.buffer_size), -(self._seq % self.buffer_size))
+
+        return self._ids_buffer[idx], self._numeric_buffer[idx], self._tstamp_buffer[idx]
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -206,14 +366,39 @@ class RingBuffer (Window):
             Current window boundaries in the form of a Numpy array.
         """
 
-        if not self._buffer_full:
-            boundaries = np.stack( ( [ np.min(self._numeric_buffer[0:self._buffer_pos], axis=0),
-                                       np.max(self._numeric_buffer[0:self._buffer_pos], axis=0) ] ), axis=1)
-        else:
-            boundaries = np.stack( ( [ np.min(self._numeric_buffer, axis=0),
-                                       np.max(self._numeric_buffer, axis=0) ] ), axis=1)
-            
-        return boundaries
+        buffer = self._numeric_buffer
+        size   = self.buffer_size
+
+        return np.array( [ [ buffer[dq_min[0] % size, j], buffer[dq_max[0] % size, j] ] 
+                           for j, (dq_min, dq_max) in enumerate(zip(self._deques_min, self._deques_max)) ] )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_mean(self) -> np.ndarray:
+        """
+        Returns the mean of the numeric data in the buffer.
+        """
+
+        return self._sum / self._num_buffered
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_variance(self) -> np.ndarray:
+        """
+        Returns the (population) variance of the numeric data in the buffer.
+        """
+
+        mean = self._sum / self._num_buffered
+        return np.maximum(self._sum_sq / self._num_buffered - np.square(mean), 0)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_std_deviation(self) -> np.ndarray:
+        """
+        Returns the (population) standard deviation of the numeric data in the buffer.
+        """
+
+        return np.sqrt(self.get_variance())
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -0,0 +1,405 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.streams.tasks.windows
+## -- Module  : timewindow.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  0.0.0     DA       Creation
+## -- 2026-10-16  1.0.0     DA       First release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module provides time-based windows. In contrast to the count-based ring buffer, the content of
+these windows is determined by the time stamps of the instances.
+"""
+
+
+from collections import deque
+from datetime import timedelta
+from typing import Union
+import numpy as np
+from mlpro.bf.exceptions import *
+from mlpro.bf.streams.basics import *
+from mlpro.bf.events import *
+from mlpro.bf.streams.tasks.windows.basics import Window
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class TimeWindow (Window):
+    """
+    Time-based window keyed on the time stamps of the incoming instances. In sliding mode, an instance
+    is removed as soon as an instance arrives that is at least p_duration younger. In tumbling mode,
+    the time axis is divided into consecutive panes of length p_duration and all instances of a pane
+    are removed at once as soon as the first instance of a later pane arrives.
+
+    New instances are forwarded immediately; removed instances are forwarded as obsolete, unless they
+    have been buffered in the same (micro-batch) cycle. Time stamps can be numeric or of type datetime
+    and instances are expected in chronological order.
+
+    Event C_EVENT_BUFFER_FULL is raised when data are removed for the first time, i.e. when the
+    window has been completed once. Event C_EVENT_DATA_REMOVED is raised at the end of each run in
+    which data have been removed.
+
+    Parameters
+    ----------
+    p_duration : Union[timedelta, float]
+        Length of the window. Needs to match the type of the time stamps.
+    p_tumbling : bool
+        If True, the window is tumbling instead of sliding. Default = False.
+    p_enable_statistics : bool
+        If True, boundaries, mean and variance of the numeric features are maintained incrementally.
+        Default = False.
+    p_name : str
+        Optional name of the window. Default is None.
+    p_range_max
+        Maximum range of task parallelism. Default is set to multithread.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default = False.
+    p_visualize : bool
+        Boolean switch for visualisation. Default = False.
+    p_logging
+        Log level for the object. Default is log everything.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_NAME                  = 'Time Window'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_duration : Union[timedelta, float],
+                 p_tumbling : bool = False,
+                 p_enable_statistics : bool = False,
+                 p_name : str = None,
+                 p_range_max = StreamTask.C_RANGE_THREAD,
+                 p_duplicate_data : bool = False,
+                 p_visualize : bool = False,
+                 p_logging = Log.C_LOG_ALL,
+                 **p_kwargs):
+
+        super().__init__( p_buffer_size = None,
+                          p_delay = False,
+                          p_enable_statistics = p_enable_statistics,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+        if p_duration <= p_duration * 0:
+            raise ParamError('Parameter p_duration needs to be greater than 0')
+
+        self._duration          = p_duration
+        self._tumbling          = p_tumbling
+        self._buffer            = deque()
+        self._pane_start        = None
+        self._buffer_full       = False
+
+        # Incremental statistics
+        self._numeric_idx       = None
+        self._values            = deque()
+        self._seq               = 0
+        self._num_since_recalc  = 0
+        self._sum : np.ndarray  = None
+        self._sum_sq : np.ndarray = None
+        self._deques_min        = None
+        self._deques_max        = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_buffered_data(self) -> Tuple[dict,int]:
+        """
+        Returns the buffered instances in chronological order.
+
+        Returns
+        -------
+        buffer : dict
+            Buffered instances by their ids.
+        num_inst : int
+            Number of buffered instances.
+        """
+
+        return { inst.id : inst for inst in self._buffer }, len(self._buffer)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_expired(self, p_tstamp) -> int:
+        """
+        Returns the number of buffered instances (from the oldest) that expire on the arrival of an
+        instance with the given time stamp.
+        """
+
+        if self._tumbling:
+            if self._pane_start is None:
+                self._pane_start = p_tstamp
+                return 0
+
+            if p_tstamp - self._pane_start < self._duration: return 0
+
+            # Panes are aligned to the first time stamp
+            self._pane_start += self._duration * int( ( p_tstamp - self._pane_start ) // self._duration )
+            return len(self._buffer)
+
+        num_expired = 0
+        for inst in self._buffer:
+            if p_tstamp - inst.tstamp < self._duration: break
+            num_expired += 1
+
+        return num_expired
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+
+        # 0 Intro
+        inst = p_inst.copy()
+        p_inst.clear()
+        feature_value     = None
+        data_removed      = False
+        raise_buffer_full = False
+
+
+        # 1 Main processing loop
+        for inst_id, (inst_type, inst) in sorted(inst.items()):
+
+            if inst_type != InstTypeNew:
+                self.log(self.C_LOG_TYPE_W, 'Handling of obsolete data not yet implemented')
+                continue
+
+            if inst.tstamp is None:
+                raise Error('Time-based windows need instances with time stamps')
+
+            feature_value = inst.get_feature_data()
+
+
+            # 1.1 Removal of expired instances
+            num_expired = self._get_expired( p_tstamp = inst.tstamp )
+
+            if num_expired > 0:
+                for i in range(num_expired):
+                    inst_del = self._buffer.popleft()
+                    try:
+                        del p_inst[inst_del.id]
+                    except KeyError:
+                        p_inst[inst_del.id] = ( InstTypeDel, inst_del )
+
+                if self._statistics_enabled: self._remove_statistics( p_num_inst = num_expired )
+
+                data_removed = True
+                if not self._buffer_full:
+                    self._buffer_full = True
+                    raise_buffer_full = True
+
+
+            # 1.2 New instance is buffered and forwarded
+            self._buffer.append(inst)
+            p_inst[inst.id] = ( InstTypeNew, inst )
+
+            if self._statistics_enabled: self._add_statistics( p_feature_data = feature_value )
+
+
+        # 2 Raise events at the end of processing
+        if feature_value is None: return
+
+        if raise_buffer_full:
+            self._raise_event( p_event_id = self.C_EVENT_BUFFER_FULL,
+                               p_event_object = Event( p_raising_object=self,
+                                                       p_related_set=feature_value.get_related_set() ) )
+
+        if data_removed:
+            self._raise_event( p_event_id = self.C_EVENT_DATA_REMOVED,
+                               p_event_object = Event( p_raising_object=self,
+                                                       p_related_set=feature_value.get_related_set() ) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _add_statistics(self, p_feature_data : Element):
+        """
+        Adds the numeric data of a new instance to the incremental statistics.
+        """
+
+        if self._numeric_idx is None:
+            self._numeric_idx = self._get_numeric_features( p_feature_data = p_feature_data )[1]
+            num_features      = self._numeric_idx.shape[0]
+            self._sum         = np.zeros(num_features)
+            self._sum_sq      = np.zeros(num_features)
+            self._deques_min  = [ deque() for i in range(num_features) ]
+            self._deques_max  = [ deque() for i in range(num_features) ]
+
+        values = np.asarray(p_feature_data.get_values(), dtype=np.float64)[self._numeric_idx]
+        self._values.append(values)
+        self._sum    += values
+        self._sum_sq += np.square(values)
+
+        # Monotonic deques of (sequence number, value) for the sliding minimum and maximum
+        for j, value in enumerate(values.tolist()):
+            dq = self._deques_max[j]
+            while ( len(dq) > 0 ) and ( dq[-1][1] <= value ): dq.pop()
+            dq.append( (self._seq, value) )
+
+            dq = self._deques_min[j]
+            while ( len(dq) > 0 ) and ( dq[-1][1] >= value ): dq.pop()
+            dq.append( (self._seq, value) )
+
+        self._seq += 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _remove_statistics(self, p_num_inst : int):
+        """
+        Removes the numeric data of the given number of oldest instances from the incremental
+        statistics.
+        """
+
+        if p_num_inst >= len(self._values):
+            self._values.clear()
+            self._sum[:]    = 0
+            self._sum_sq[:] = 0
+            for dq in self._deques_min + self._deques_max: dq.clear()
+            self._num_since_recalc = 0
+            return
+
+        for i in range(p_num_inst):
+            values        = self._values.popleft()
+            self._sum    -= values
+            self._sum_sq -= np.square(values)
+
+        seq_first_valid = self._seq - len(self._values)
+        for dq in self._deques_min + self._deques_max:
+            while dq[0][0] < seq_first_valid: dq.popleft()
+
+        # Running sums are recomputed from time to time to avoid a numerical drift
+        self._num_since_recalc += p_num_inst
+        if self._num_since_recalc >= len(self._values):
+            values          = np.array(self._values)
+            self._sum[:]    = values.sum(axis=0)
+            self._sum_sq[:] = np.square(values).sum(axis=0)
+            self._num_since_recalc = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_boundaries(self) -> np.ndarray:
+        """
+        Returns the current boundaries of the numeric data in the window. Requires enabled statistics.
+
+        Returns
+        -------
+        boundaries : np.ndarray
+            Minimum and maximum per numeric feature.
+        """
+
+        return np.array( [ [ dq_min[0][1], dq_max[0][1] ] for dq_min, dq_max in zip(self._deques_min, self._deques_max) ] )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_mean(self) -> np.ndarray:
+        """
+        Returns the mean of the numeric data in the window. Requires enabled statistics.
+        """
+
+        return self._sum / len(self._values)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_variance(self) -> np.ndarray:
+        """
+        Returns the (population) variance of the numeric data in the window. Requires enabled
+        statistics.
+        """
+
+        mean = self._sum / len(self._values)
+        return np.maximum(self._sum_sq / len(self._values) - np.square(mean), 0)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_std_deviation(self) -> np.ndarray:
+        """
+        Returns the (population) standard deviation of the numeric data in the window. Requires
+        enabled statistics.
+        """
+
+        return np.sqrt(self.get_variance())
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class SessionWindow (TimeWindow):
+    """
+    Session window with gap detection. Instances are collected as long as the time between two
+    consecutive instances does not exceed p_gap. When a larger gap is detected, the session is closed
+    and all of its instances are removed. Since the gap is detected by the next incoming instance,
+    the removal takes place on its arrival. Optionally, sessions are closed after a maximum duration.
+
+    Parameters
+    ----------
+    p_gap : Union[timedelta, float]
+        Maximum gap between two instances of a session. Needs to match the type of the time stamps.
+    p_max_duration : Union[timedelta, float]
+        Optional maximum duration of a session. Default = None.
+    p_enable_statistics : bool
+        If True, boundaries, mean and variance of the numeric features are maintained incrementally.
+        Default = False.
+    p_name : str
+        Optional name of the window. Default is None.
+    p_range_max
+        Maximum range of task parallelism. Default is set to multithread.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default = False.
+    p_visualize : bool
+        Boolean switch for visualisation. Default = False.
+    p_logging
+        Log level for the object. Default is log everything.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_NAME                  = 'Session Window'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_gap : Union[timedelta, float],
+                 p_max_duration : Union[timedelta, float] = None,
+                 p_enable_statistics : bool = False,
+                 p_name : str = None,
+                 p_range_max = StreamTask.C_RANGE_THREAD,
+                 p_duplicate_data : bool = False,
+                 p_visualize : bool = False,
+                 p_logging = Log.C_LOG_ALL,
+                 **p_kwargs):
+
+        super().__init__( p_duration = p_gap,
+                          p_tumbling = True,
+                          p_enable_statistics = p_enable_statistics,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+        self._gap          = p_gap
+        self._max_duration = p_max_duration
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_expired(self, p_tstamp) -> int:
+
+        if len(self._buffer) == 0: return 0
+
+        if p_tstamp - self._buffer[-1].tstamp > self._gap:
+            return len(self._buffer)
+
+        if ( self._max_duration is not None ) and ( p_tstamp - self._buffer[0].tstamp >= self._max_duration ):
+            return len(self._buffer)
+
+        return 0
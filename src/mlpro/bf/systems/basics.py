@@ -51,10 +51,14 @@
 ## -- 2024-09-09  2.3.0     DA       Class Action: parent TSTamp replaced by Instance
 ## -- 2024-09-11  2.4.0     DA       - code review and documentation
 ## --                                - new method State.get_kwargs()
+## -- 2026-10-16  2.5.0     DA       Class System: new methods simulate_reaction_batch(),
+## --                                _simulate_reaction_batch() and constant C_BATCH_NATIVE
+## -- 2026-10-17  2.5.1     DA       Class System: new method _is_batch_native(); no batch mode for
+## --                                systems with an own method simulate_reaction()
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 2.4.0 (2024-09-11)
+Ver. 2.5.1 (2026-10-17)
 
 This module provides models and templates for state based systems.
 """
@@ -1155,6 +1159,8 @@ class System (FctSTrans, FctSuccess, FctBroken, Task, Mode, Plottable, Persisten
 
     C_LATENCY       = timedelta(0, 1, 0)  # Default latency 1s
 
+    C_BATCH_NATIVE  = False
+
     C_PLOT_ACTIVE   = True
 
 ## -------------------------------------------------------------------------------------------------
@@ -1765,6 +1771,77 @@ class System (FctSTrans, FctSuccess, FctBroken, Task, Mode, Plottable, Persisten
         raise NotImplementedError('External FctSTrans object not provided. Please implement inner state transition here.')
 
 
+## -------------------------------------------------------------------------------------------------
+    def simulate_reaction_batch(self, p_states : np.ndarray, p_actions : np.ndarray, p_t_step : timedelta = None) -> np.ndarray:
+        """
+        Simulates the state transitions of a batch of states and actions. Systems that set
+        C_BATCH_NATIVE = True carry out all transitions at once in the custom method
+        _simulate_reaction_batch(). Otherwise, or if an external state transition function, MuJoCo
+        or an own method simulate_reaction() is used, the transitions are simulated one by one by
+        method simulate_reaction(). See method _is_batch_native() for further details.
+
+        Parameters
+        ----------
+        p_states : np.ndarray
+            Matrix with one state vector per row.
+        p_actions : np.ndarray
+            Matrix with one action vector per row.
+        p_t_step : timedelta
+            Optional time step.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix with the subsequent state vectors.
+        """
+
+        states  = np.asarray(p_states, dtype=np.float64)
+        actions = np.asarray(p_actions, dtype=np.float64).reshape(states.shape[0], -1)
+
+        if self._is_batch_native():
+            return self._simulate_reaction_batch(states, actions, p_t_step)
+
+        states_new = np.empty_like(states)
+        for i in range(states.shape[0]):
+            state = State(self.get_state_space())
+            state.set_values(states[i])
+            action = Action(p_action_space=self.get_action_space(), p_values=actions[i])
+            states_new[i] = self.simulate_reaction(state, action, p_t_step).get_values()
+
+        return states_new
+
+
+## -------------------------------------------------------------------------------------------------
+    def _is_batch_native(self) -> bool:
+        """
+        Checks whether state transitions can be simulated at once by the custom method 
+        _simulate_reaction_batch(). This requires C_BATCH_NATIVE = True, no external state transition
+        function, no MuJoCo and the default method simulate_reaction(). Child classes that redefine
+        simulate_reaction(), e.g. to add an adaptive workflow, are simulated one by one.
+
+        Returns
+        -------
+        bool
+            True, if the batch mode can be used. False otherwise.
+        """
+
+        return ( self.C_BATCH_NATIVE 
+                 and ( self._fct_strans is None ) 
+                 and ( self._mujoco_handler is None )
+                 and ( type(self).simulate_reaction is System.simulate_reaction ) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _simulate_reaction_batch(self, p_states : np.ndarray, p_actions : np.ndarray, p_t_step : timedelta = None) -> np.ndarray:
+        """
+        Custom method for simulated state transitions of a batch of states and actions. Implement
+        this method and set C_BATCH_NATIVE = True, if the transitions can be vectorized. See method
+        simulate_reaction_batch() for further details.
+        """
+
+        raise NotImplementedError
+
+
 ## -------------------------------------------------------------------------------------------------
     def action_to_mujoco(self, p_mlpro_action):
         """
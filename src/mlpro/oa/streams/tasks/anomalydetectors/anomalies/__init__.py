@@ -1,4 +1,4 @@
-from mlpro.oa.streams.tasks.anomalydetectors.anomalies.basics import Anomaly
+from mlpro.oa.streams.tasks.anomalydetectors.anomalies.basics import AnomalyRecord, Anomaly
 from mlpro.oa.streams.tasks.anomalydetectors.anomalies.point import PointAnomaly
 from mlpro.oa.streams.tasks.anomalydetectors.anomalies.group import GroupAnomaly
 from mlpro.oa.streams.tasks.anomalydetectors.anomalies.drift import DriftAnomaly
@@ -14,14 +14,18 @@
 ## -- 2024-05-07  1.3.1     SK       Bug fix related to p_instances
 ## -- 2024-05-09  1.3.2     DA       Bugfix in method Anomaly._update_plot()
 ## -- 2024-05-22  1.4.0     SK       Refactoring
+## -- 2026-10-16  1.5.0     DA       - New class AnomalyRecord
+## --                                - New method Anomaly.get_record()
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.4.0 (2024-05-22)
+Ver. 1.5.0 (2026-10-16)
 
 This module provides a template class for anomalies to be used in anomaly detection algorithms.
 """
 
+import json
+import numpy as np
 from mlpro.bf.various import Id
 from mlpro.bf.plot import Plottable, PlotSettings
 from mlpro.bf.events import Event
@@ -32,6 +36,101 @@ from mlpro.bf.math.properties import PropertyDefinitions, Properties
 
 
 
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class AnomalyRecord:
+    """
+    Compact record of an anomaly. It keeps the ids of the related instances, the time stamps and the
+    anomaly scores but no references to instances, clusters or plot artists. See method 
+    Anomaly.get_record().
+
+    Parameters
+    ----------
+    p_id : int
+        Anomaly ID.
+    p_type : str
+        Name of the anomaly class.
+    p_tstamp
+        Time stamp of the anomaly. Default = None.
+    p_inst_ids : list
+        Ids of the related instances. Default = None.
+    p_inst_tstamp
+        Time stamp of the last related instance. Default = None.
+    p_ano_scores : list
+        Anomaly scores. Default = None.
+    """
+
+    __slots__ = ( 'id', 'type', 'tstamp', 'inst_ids', 'inst_tstamp', 'ano_scores' )
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_id : int,
+                  p_type : str,
+                  p_tstamp = None,
+                  p_inst_ids : list = None,
+                  p_inst_tstamp = None,
+                  p_ano_scores : list = None ):
+
+        self.id          = p_id
+        self.type        = p_type
+        self.tstamp      = p_tstamp
+        self.inst_ids    = p_inst_ids if p_inst_ids is not None else []
+        self.inst_tstamp = p_inst_tstamp
+        self.ano_scores  = p_ano_scores
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _to_json(p_value):
+        if ( p_value is None ) or isinstance(p_value, (bool, int, float, str)): return p_value
+
+        try:
+            return np.asarray(p_value, dtype=np.float64).tolist()
+        except (TypeError, ValueError):
+            return str(p_value)
+
+
+## -------------------------------------------------------------------------------------------------
+    def to_dict(self) -> dict:
+        """
+        Returns the record as JSON-serializable dictionary. Time stamps that are not numeric are 
+        converted to strings.
+        """
+
+        return { 'id' : self.id,
+                 'type' : self.type,
+                 'tstamp' : self._to_json(self.tstamp),
+                 'inst_ids' : [ self._to_json(inst_id) for inst_id in self.inst_ids ],
+                 'inst_tstamp' : self._to_json(self.inst_tstamp),
+                 'ano_scores' : self._to_json(self.ano_scores) }
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def from_dict(p_dict : dict):
+        return AnomalyRecord( p_id = p_dict['id'],
+                              p_type = p_dict['type'],
+                              p_tstamp = p_dict['tstamp'],
+                              p_inst_ids = p_dict['inst_ids'],
+                              p_inst_tstamp = p_dict['inst_tstamp'],
+                              p_ano_scores = p_dict['ano_scores'] )
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def load(p_filename : str) -> list:
+        """
+        Loads the records of a file with one JSON record per line. See class AnomalyDetector, 
+        parameter p_retention_file.
+        """
+
+        with open(p_filename, 'r') as file:
+            return [ AnomalyRecord.from_dict(json.loads(line)) for line in file if line.strip() != '' ]
+
+
+
+
+
 ## -------------------------------------------------------------------------------------------------
 ## -------------------------------------------------------------------------------------------------
 class Anomaly (Id, Event, Plottable):
@@ -122,5 +221,26 @@ class Anomaly (Id, Event, Plottable):
             The list of anomaly scores.
         """
         return self._ano_scores
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_record(self) -> AnomalyRecord:
+        """
+        Method that returns a compact record of the anomaly without references to instances.
+
+        Returns
+        -------
+        AnomalyRecord
+            Compact record of the anomaly.
+        """
+
+        instances = self._instances if self._instances is not None else []
+
+        return AnomalyRecord( p_id = self.get_id(),
+                              p_type = type(self).__name__,
+                              p_tstamp = self.get_tstamp(),
+                              p_inst_ids = [ inst.get_id() for inst in instances ],
+                              p_inst_tstamp = instances[-1].get_tstamp() if len(instances) > 0 else None,
+                              p_ano_scores = self._ano_scores )
     
 
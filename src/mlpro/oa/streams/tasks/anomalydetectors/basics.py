@@ -14,16 +14,25 @@
 ## --                                forwarding of changes on ax limits
 ## -- 2024-05-22  1.4.0     SK       Refactoring
 ## -- 2024-08-12  1.4.1     DA       Correction in AnomalyDetector.update_plot()
+## -- 2026-10-16  1.5.0     DA       Class AnomalyDetector: retention policies for buffered anomalies
+## --                                with event C_EVENT_ANOMALY_REMOVED on eviction and optional
+## --                                storage of compact anomaly records
+## -- 2026-10-16  1.5.1     DA       Bugfix in method AnomalyDetector._renormalize()
+## -- 2026-10-17  1.5.2     DA       Method AnomalyDetector.__init__(): parameters p_retention_* 
+## --                                moved to the end of the parameter list
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.4.1 (2024-08-12)
+Ver. 1.5.2 (2026-10-17)
 
 This module provides templates for anomaly detection to be used in the context of online adaptivity.
 """
 
+import json
 from typing import List
 from matplotlib.figure import Figure
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.events import Event as MLProEvent
 from mlpro.bf.math.properties import *
 from mlpro.bf.plot import PlotSettings
 from mlpro.bf.streams import Instance, InstDict
@@ -31,7 +40,7 @@ from mlpro.bf.various import *
 from mlpro.bf.plot import *
 from mlpro.oa.streams import OAStreamTask
 from mlpro.bf.math.normalizers import Normalizer
-from mlpro.oa.streams.tasks.anomalydetectors.anomalies import Anomaly
+from mlpro.oa.streams.tasks.anomalydetectors.anomalies import Anomaly, AnomalyRecord
 
 
 
@@ -42,6 +51,12 @@ class AnomalyDetector(OAStreamTask):
     Base class for online anomaly detectors. It raises an event when an
     anomaly is detected.
 
+    Detected anomalies are buffered until they are removed. Optional retention policies limit the
+    number and the age of buffered anomalies for long-running deployments. Evicted anomalies are
+    removed with their plots. Event C_EVENT_ANOMALY_REMOVED is raised with the anomaly and its 
+    compact record (see class AnomalyRecord). Optionally, the records of evicted anomalies are 
+    appended to a file.
+
     Parameters
     ----------
     p_name : str
@@ -56,6 +71,18 @@ class AnomalyDetector(OAStreamTask):
         Boolean switch for visualisation. Default = False.
     p_logging
         Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    p_retention_max : int
+        Maximum number of buffered anomalies. Default = 0 (no limit).
+    p_retention_age
+        Maximum age of buffered anomalies, relative to the time stamp of the latest anomaly. The 
+        type needs to match the time stamps of the instances (e.g. int, float, timedelta). 
+        Default = None (no limit).
+    p_retention_policy : int
+        Order of eviction if the maximum number of anomalies is exceeded. See class attributes 
+        C_RETENTION_*. Default = C_RETENTION_FIFO.
+    p_retention_file : str
+        Optional file to which the records of evicted anomalies are appended, one JSON record per
+        line. See method AnomalyRecord.load(). Default = None.
     p_kwargs : dict
         Further optional named parameters.
     """
@@ -68,6 +95,10 @@ class AnomalyDetector(OAStreamTask):
     C_PLOT_ACTIVE           = True
     C_PLOT_STANDALONE       = False
 
+    # Possible eviction orders
+    C_RETENTION_FIFO        = 0         # Oldest anomaly first
+    C_RETENTION_LRU         = 1         # Least recently used anomaly first (see get_anomaly())
+
 ## -------------------------------------------------------------------------------------------------
     def __init__(self,
                  p_name:str = None,
@@ -76,6 +107,10 @@ class AnomalyDetector(OAStreamTask):
                  p_duplicate_data : bool = False,
                  p_visualize : bool = False,
                  p_logging=Log.C_LOG_ALL,
+                 p_retention_max : int = 0,
+                 p_retention_age = None,
+                 p_retention_policy : int = C_RETENTION_FIFO,
+                 p_retention_file : str = None,
                  **p_kwargs):
 
         super().__init__(p_name = p_name,
@@ -86,10 +121,22 @@ class AnomalyDetector(OAStreamTask):
                          p_logging = p_logging,
                          **p_kwargs)
         
+        if p_retention_max < 0:
+            raise ParamError('Parameter p_retention_max must not be negative')
+
+        if p_retention_policy not in [ self.C_RETENTION_FIFO, self.C_RETENTION_LRU ]:
+            raise ParamError('Invalid retention policy ' + str(p_retention_policy))
+        
         self._ano_id = 0
         self._anomalies = {}
         self._ano_scores = []
 
+        self._retention_max    = p_retention_max
+        self._retention_age    = p_retention_age
+        self._retention_lru    = p_retention_policy == self.C_RETENTION_LRU
+        self._retention_file   = p_retention_file
+        self._ano_tstamps      = {}     # Time stamps of buffered anomalies in the order of their detection
+
 
 ## -------------------------------------------------------------------------------------------------
     def _run(self, p_inst : InstDict):
@@ -124,6 +171,130 @@ class AnomalyDetector(OAStreamTask):
         return self._anomalies
     
 
+## -------------------------------------------------------------------------------------------------
+    def get_anomaly(self, p_id) -> Anomaly:
+        """
+        Method to return a buffered anomaly by its id. With retention policy C_RETENTION_LRU, the 
+        anomaly is marked as recently used.
+
+        Parameters
+        ----------
+        p_id : int
+            Anomaly ID.
+
+        Returns
+        -------
+        Anomaly
+            Anomaly object or None, if the anomaly is not buffered (anymore).
+        """
+
+        anomaly = self._anomalies.get(p_id)
+        if ( anomaly is not None ) and self._retention_lru: 
+            self._anomalies[p_id] = self._anomalies.pop(p_id)
+        return anomaly
+    
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_anomaly_tstamp(p_anomaly : Anomaly):
+        """
+        Returns the time stamp of the latest instance of an anomaly or the time stamp of the anomaly 
+        itself.
+        """
+
+        instances = p_anomaly.get_instances()
+        if instances: return instances[-1].get_tstamp()
+        return p_anomaly.get_tstamp()
+    
+
+## -------------------------------------------------------------------------------------------------
+    def _add_anomaly(self, p_anomaly : Anomaly):
+        """
+        Adds an anomaly with an id to the buffer and applies the retention policies.
+
+        Parameters
+        ----------
+        p_anomaly : Anomaly
+            Anomaly object to be added.
+        """
+
+        ano_id = p_anomaly.get_id()
+        self._anomalies[ano_id]   = p_anomaly
+        self._ano_tstamps[ano_id] = self._get_anomaly_tstamp(p_anomaly)
+        self._apply_retention()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_anomaly(self, p_anomaly : Anomaly):
+        """
+        Marks a buffered anomaly as updated, e.g. after adding further instances. The anomaly is 
+        treated like a new one by the retention policies.
+
+        Parameters
+        ----------
+        p_anomaly : Anomaly
+            Anomaly object that was updated.
+        """
+
+        ano_id = p_anomaly.get_id()
+        if ano_id not in self._anomalies: return
+
+        self._anomalies[ano_id] = self._anomalies.pop(ano_id)
+        self._ano_tstamps.pop(ano_id)
+        self._ano_tstamps[ano_id] = self._get_anomaly_tstamp(p_anomaly)
+        self._apply_retention()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _apply_retention(self):
+        """
+        Evicts buffered anomalies according to the retention policies.
+        """
+
+        # 1 Eviction of outdated anomalies
+        if ( self._retention_age is not None ) and ( len(self._ano_tstamps) > 1 ):
+            tstamp_latest = next(reversed(self._ano_tstamps.values()))
+
+            try:
+                while len(self._ano_tstamps) > 1:
+                    ano_id, tstamp = next(iter(self._ano_tstamps.items()))
+                    if tstamp_latest - tstamp <= self._retention_age: break
+                    self._evict_anomaly( p_anomaly = self._anomalies[ano_id] )
+            except TypeError:
+                # Time stamps without arithmetic (e.g. strings) can not be aged
+                pass
+
+        # 2 Eviction of surplus anomalies
+        if self._retention_max > 0:
+            while len(self._anomalies) > self._retention_max:
+                self._evict_anomaly( p_anomaly = next(iter(self._anomalies.values())) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _evict_anomaly(self, p_anomaly : Anomaly):
+        """
+        Removes an anomaly due to the retention policies. Its compact record is optionally appended
+        to the retention file and event C_EVENT_ANOMALY_REMOVED is raised.
+
+        Parameters
+        ----------
+        p_anomaly : Anomaly
+            Anomaly object to be evicted.
+        """
+
+        self.remove_anomaly( p_anomaly = p_anomaly )
+        record = p_anomaly.get_record()
+
+        if self._retention_file is not None:
+            with open(self._retention_file, 'a') as file:
+                file.write(json.dumps(record.to_dict()) + '\n')
+
+        self._raise_event( p_event_id = self.C_EVENT_ANOMALY_REMOVED,
+                           p_event_object = MLProEvent( p_raising_object = self,
+                                                        p_anomaly = p_anomaly,
+                                                        p_record = record ) )
+
+
 ## -------------------------------------------------------------------------------------------------
     def _buffer_anomaly(self, p_anomaly:Anomaly):
         """
@@ -136,7 +307,7 @@ class AnomalyDetector(OAStreamTask):
         """
 
         p_anomaly.set_id( p_id = self._get_next_anomaly_id() )
-        self._anomalies[p_anomaly.get_id()] = p_anomaly
+        self._add_anomaly( p_anomaly = p_anomaly )
         return p_anomaly
 
 
@@ -152,7 +323,8 @@ class AnomalyDetector(OAStreamTask):
         """
 
         p_anomaly.remove_plot(p_refresh=True)
-        del self._anomalies[p_anomaly.get_id()]
+        self._anomalies.pop(p_anomaly.get_id(), None)
+        self._ano_tstamps.pop(p_anomaly.get_id(), None)
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -252,5 +424,6 @@ class AnomalyDetector(OAStreamTask):
             instances = anomaly.get_instances()
 
             for inst in instances:
-                inst.remormalize( p_normalizer=p_normalizer)
+                feature_data = inst.get_feature_data()
+                feature_data.set_values( p_normalizer.renormalize( np.asarray(feature_data.get_values(), dtype=np.float64) ) )
 
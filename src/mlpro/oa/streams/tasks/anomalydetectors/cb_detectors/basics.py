@@ -11,10 +11,12 @@
 ## -- 2024-02-25  1.1.0     SK       Visualisation update
 ## -- 2024-04-10  1.2.0     DA/SK    Refactoring
 ## -- 2024-05-28  1.3.0     SK       Refactoring
+## -- 2026-10-16  1.4.0     DA       New method _update_trend_states() for the vectorized evaluation
+## --                                of cluster histories
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.3.0 (2024-05-28)
+Ver. 1.4.0 (2026-10-16)
 
 This module provides template for cluster-based anomaly detection algorithms to be used in the context of online adaptivity.
 """
@@ -24,6 +26,7 @@ from mlpro.oa.streams.tasks.anomalydetectors.basics import AnomalyDetector
 from mlpro.oa.streams.tasks.anomalydetectors.anomalies.clusterbased import *
 from mlpro.oa.streams.tasks.clusteranalyzers.basics import ClusterAnalyzer
 from mlpro.bf.math.properties import *
+from mlpro.oa.streams.tasks.anomalydetectors.cb_detectors.history import ClusterHistory
 
 
 
@@ -75,3 +78,115 @@ class AnomalyDetectorCB(AnomalyDetector):
         
         self._visualize = p_visualize
 
+
+## -------------------------------------------------------------------------------------------------
+    def _get_thresholds(self, p_thresh : dict, p_ids : list) -> np.ndarray:
+        """
+        Returns the current thresholds of several clusters. Clusters without an individual
+        threshold get the initial one stored under the key 'thresh'.
+
+        Parameters
+        ----------
+        p_thresh : dict
+            Thresholds per cluster id and the initial threshold under the key 'thresh'.
+        p_ids : list
+            Ids of the related clusters.
+
+        Returns
+        -------
+        np.ndarray
+            Thresholds per cluster. NaN, if a threshold is not set.
+        """
+
+        if not p_thresh["thresh"]: return np.full(len(p_ids), np.nan)
+
+        for id in p_ids:
+            if id not in p_thresh:
+                p_thresh[id] = p_thresh["thresh"]
+
+        return np.array([ p_thresh[id] if p_thresh[id] else np.nan for id in p_ids ], dtype=np.float64)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_trend_states(self,
+                             p_history : ClusterHistory,
+                             p_ids : list,
+                             p_values : list,
+                             p_tstamp : float,
+                             p_thresh : np.ndarray,
+                             p_roc_thresh : np.ndarray,
+                             p_states : dict) -> list:
+        """
+        Evaluates the histories of a scalar cluster property for several clusters at once and
+        determines their trend states. A cluster is in state 'LI'/'LD' if one of its first
+        differences exceeds the threshold upwards/downwards and in state 'VI'/'VD' if one of its
+        second differences exceeds the rate-of-change threshold upwards/downwards. Otherwise, its
+        state is 'NC'. Afterwards, the current values are added to the histories.
+
+        Parameters
+        ----------
+        p_history : ClusterHistory
+            Histories of the cluster property with first and second differences.
+        p_ids : list
+            Ids of the clusters to be evaluated.
+        p_values : list
+            Current values of the cluster property.
+        p_tstamp : float
+            Current time stamp.
+        p_thresh : np.ndarray
+            Thresholds for the first differences per cluster. NaN deactivates the check.
+        p_roc_thresh : np.ndarray
+            Thresholds for the second differences per cluster. NaN deactivates the check.
+        p_states : dict
+            Trend states per cluster id. Updated by this method.
+
+        Returns
+        -------
+        list
+            List of tuples (cluster id, previous state, new state) for all clusters with a changed
+            trend state.
+        """
+
+        changes = []
+        if len(p_ids) == 0: return changes
+
+        # 1 Histories of new clusters start with their current value
+        new_ids = [ id for id in p_ids if id not in p_history ]
+        if len(new_ids) > 0:
+            new_values = [ p_values[i] for i, id in enumerate(p_ids) if id not in p_history ]
+            p_history.push_batch(new_ids, new_values, p_tstamp)
+            p_history.push_batch(new_ids, new_values, p_tstamp)
+
+        # 2 Clusters with short histories are in state 'NC'
+        ready = p_history.get_lengths(p_ids) >= 3
+        for i in np.flatnonzero(~ready):
+            p_states[p_ids[i]] = 'NC'
+
+        # 3 Vectorized detection of the trend states of all other clusters
+        if np.any(ready):
+            idx              = np.flatnonzero(ready)
+            ids              = [ p_ids[i] for i in idx ]
+            values           = np.asarray(p_values, dtype=np.float64)[idx]
+            diffs_1, diffs_2 = p_history.get_next_diffs(ids, values, p_tstamp)
+            diffs_1          = np.column_stack( (p_history.get_windows(ids, 1)[:, :, 0], diffs_1) )
+            diffs_2          = np.column_stack( (p_history.get_windows(ids, 2)[:, :, 0], diffs_2) )
+            thresh           = p_thresh[idx][:, np.newaxis]
+            roc_thresh       = p_roc_thresh[idx][:, np.newaxis]
+
+            states  = np.full(len(ids), 'NC', dtype=object)
+            inc     = np.any(diffs_1 > thresh, axis=1)
+            states[inc]  = 'LI'
+            states[~inc & np.any(diffs_1 < -thresh, axis=1)] = 'LD'
+            inc     = np.any(diffs_2 > roc_thresh, axis=1)
+            states[inc]  = 'VI'
+            states[~inc & np.any(diffs_2 < -roc_thresh, axis=1)] = 'VD'
+
+            for id, state in zip(ids, states):
+                if state != p_states[id]:
+                    changes.append( (id, p_states[id], state) )
+                    p_states[id] = state
+
+        # 4 Update of the histories
+        p_history.push_batch(p_ids, p_values, p_tstamp)
+
+        return changes
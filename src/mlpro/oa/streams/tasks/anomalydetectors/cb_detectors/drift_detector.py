@@ -9,16 +9,19 @@
 ## -- 2023-09-12  1.0.0     SK       Release
 ## -- 2024-04-10  1.1.0     DA/SK    Refactoring
 ## -- 2024-05-28  1.2.0     SK       Refactoring
+## -- 2026-10-16  1.3.0     DA       Refactoring: ring buffer histories and vectorized evaluation
+## --                                of all clusters
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.2.0 (2024-05-28)
+Ver. 1.3.0 (2026-10-16)
 
 This module provides cluster drift detector algorithm.
 """
 
 from mlpro.oa.streams.basics import *
 from mlpro.oa.streams.tasks.anomalydetectors.cb_detectors.basics import AnomalyDetectorCB
+from mlpro.oa.streams.tasks.anomalydetectors.cb_detectors.history import ClusterHistory
 from mlpro.oa.streams.tasks.anomalydetectors.anomalies.clusterbased.drift import ClusterDrift
 from mlpro.oa.streams.tasks.clusteranalyzers.basics import ClusterAnalyzer
 from mlpro.bf.streams import Instance, InstDict
@@ -78,11 +81,10 @@ class ClusterDriftDetector(AnomalyDetectorCB):
         self._count = 0
         self._count_change = {}
         
-        # Data structures for storing previous states and buffers
-        self._centroids_history = {}
-        self._times_history = {}
-        self._velocities_history = {}
-        self._accelerations_history = {}
+        # Ring buffers for previous centroids, velocities and accelerations of all clusters
+        self._centroids_history = ClusterHistory(p_size=1, p_dim=None)
+        self._velocities_history = ClusterHistory(p_size=p_buffer_size, p_dim=None, p_init_value=0)
+        self._accelerations_history = ClusterHistory(p_size=p_buffer_size, p_dim=None, p_init_value=0)
         self._cluster_states = {}
 
 
@@ -97,50 +99,51 @@ class ClusterDriftDetector(AnomalyDetectorCB):
         drifting_clusters = {}
         properties = {}
 
-        for id, cluster in clusters.items():
-            current_centroid = np.array(cluster.centroid.value)
-            current_time = time.time()  # Get the current timestamp
+        # 1 Histories of removed clusters are discarded
+        for id in self._centroids_history.get_ids():
+            if id not in clusters:
+                self._remove_cluster(id)
 
-            # Initialize cluster if it does not exist
-            if id not in self._centroids_history:
-                self._initialize_cluster(id, current_centroid, current_time)
+        if len(clusters) != 0:
+            ids = list(clusters.keys())
+            current_centroids = np.array([cluster.centroid.value for cluster in clusters.values()], dtype=np.float64)
+            current_time = time.time()
 
-            previous_centroid = self._centroids_history[id]
-            if self._with_time_calculation:
-                previous_time = self._times_history[id]
-            else:
-                previous_time = None
-            
-            # Calculate velocity
-            velocity = self._calculate_velocity(previous_centroid, current_centroid, previous_time, current_time, cluster_id=id)
-            
-            if velocity:
-                drift = False
-                state_change = False
-                # Calculate average velocity
-                self._calculate_ema(id)
-
-                # Calculate acceleration
-                self._calculate_acceleration(self._velocities_history[id], previous_time, current_time, cluster_id=id)
-
-                # Update previous centroid and time
-                self._centroids_history[id] = current_centroid
-                if self._with_time_calculation:
-                    self._times_history[id] = current_time
-                else:
-                    self._count_change[id] = 1
-
-                # Detection of instantaneous velocity change
-                if self._inst_change_det:
-                    drift = self._inst_vel_change_detection(self._velocities_history[id][-1], self._min_vel_thresh)
-
-                else:
-                    # Detect state changes and anomalies
-                    state_change = self._detect_state_change(id, self._velocities_history[id], self._accelerations_history[id], self._min_vel_thresh, self._min_acc_thresh)
-                
-                if drift or state_change:
-                        drifting_clusters[id] = cluster
-                        properties[id] = {"velocity":np.linalg.norm(self._velocities_history[id][-1]), "acceleration":np.linalg.norm(self._accelerations_history[id][-1])}
+            # 2 Initialize new clusters
+            new = [i for i, id in enumerate(ids) if id not in self._centroids_history]
+            if len(new) != 0:
+                self._initialize_clusters([ids[i] for i in new], current_centroids[new], current_time)
+
+            # 3 Determine the moved clusters and their velocities
+            velocities, divisors = self._calculate_velocities(ids, current_centroids, current_time)
+            moved = np.flatnonzero(np.any(velocities != 0, axis=1))
+
+            if len(moved) != 0:
+                moved_ids = [ids[i] for i in moved]
+
+                # 3.1 Calculate average velocities and accelerations
+                velocities = self._calculate_ema(moved_ids, velocities[moved])
+                self._calculate_accelerations(moved_ids, velocities, divisors[moved])
+
+                # 3.2 Update previous centroids and times
+                self._centroids_history.push_batch(moved_ids, current_centroids[moved], current_time)
+                if not self._with_time_calculation:
+                    for id in moved_ids:
+                        self._count_change[id] = 1
+
+                # 3.3 Detection of instantaneous velocity changes or state changes
+                velocity_norms = np.linalg.norm(self._velocities_history.get_windows(moved_ids), axis=2)
+                acceleration_norms = np.linalg.norm(self._accelerations_history.get_windows(moved_ids), axis=2)
+
+                for i, id in enumerate(moved_ids):
+                    if self._inst_change_det:
+                        drift = self._inst_vel_change_detection(velocities[i], self._min_vel_thresh)
+                    else:
+                        drift = self._detect_state_change(id, velocity_norms[i], acceleration_norms[i], self._min_vel_thresh, self._min_acc_thresh)
+
+                    if drift:
+                        drifting_clusters[id] = clusters[id]
+                        properties[id] = {"velocity":velocity_norms[i][-1], "acceleration":acceleration_norms[i][-1]}
 
         # Raise Anomaly event
         if (self._count >= self._init_skip):
@@ -158,58 +161,63 @@ class ClusterDriftDetector(AnomalyDetectorCB):
 
 
     ## -------------------------------------------------------------------------------------------------
-    def _initialize_cluster(self, cluster_id, current_centroid, timestamp):
-        # Initialize cluster state and data structures
-        self._centroids_history[cluster_id] = current_centroid         
-        self._velocities_history[cluster_id] = np.zeros((self._buffer_size, current_centroid.shape[0]))
-        self._accelerations_history[cluster_id] = np.zeros((self._buffer_size, current_centroid.shape[0]))
-        self._cluster_states[cluster_id] = 'initial'
-        self._count_change[cluster_id] = 0
-        if self._with_time_calculation:
-            self._times_history[cluster_id] = timestamp
+    def _initialize_clusters(self, p_ids, p_centroids, p_tstamp):
+        # Initialize cluster states and histories; velocities and accelerations start with zeros
+        self._centroids_history.push_batch(p_ids, p_centroids, p_tstamp)
+        self._velocities_history.push_batch(p_ids, np.zeros_like(p_centroids))
+        self._accelerations_history.push_batch(p_ids, np.zeros_like(p_centroids))
+        for id in p_ids:
+            self._cluster_states[id] = 'initial'
+            self._count_change[id] = 0
 
 
     ## -------------------------------------------------------------------------------------------------
-    def _calculate_velocity(self, previous_centroid, current_centroid, previous_time, current_time, cluster_id):
-        # Calculate the difference in centroids to get velocity
-        difference = current_centroid - previous_centroid
-        
-        # Calculate time-based velocity if enabled
-        if self._with_time_calculation and previous_time is not None and current_time is not None:
-            time_diff = current_time - previous_time
-            if not np.all(difference==0):
-                if time_diff > 0:
-                    velocity = difference / time_diff
-                    self._velocities_history[cluster_id] = np.append(self._velocities_history[cluster_id][1:], [velocity], axis=0)
-                    return True
-                else:
-                    return False
-            else:
-                return False
-            
-        else:
-            if np.all(difference==0):
-                self._count_change[cluster_id] += 1
-                return False
-            else:
-                velocity = difference/self._count_change[cluster_id]
-                
-                self._velocities_history[cluster_id] = np.append(self._velocities_history[cluster_id][1:], [velocity], axis=0)
-                return True
+    def _remove_cluster(self, p_id):
+        self._centroids_history.remove(p_id)
+        self._velocities_history.remove(p_id)
+        self._accelerations_history.remove(p_id)
+        self._cluster_states.pop(p_id, None)
+        self._count_change.pop(p_id, None)
+
 
     ## -------------------------------------------------------------------------------------------------
-    def _calculate_acceleration(self, velocity_buffer, previous_time, current_time, cluster_id):
-        # Calculate acceleration as the change in velocity
-        acceleration = velocity_buffer[-1] - velocity_buffer[-2]
+    def _calculate_velocities(self, p_ids, p_centroids, p_tstamp):
+        # Calculate the difference in centroids to get the velocities of all clusters at once
+        differences = p_centroids - self._centroids_history.get_last(p_ids)
+        moved = np.any(differences != 0, axis=1)
         
-        # Calculate time-based acceleration if enabled
+        # Calculate time-based velocities if enabled
         if self._with_time_calculation:
-            time_diff = current_time - previous_time
-            acceleration /= time_diff
-            self._accelerations_history[cluster_id] = np.append(self._accelerations_history[cluster_id][1:], [acceleration], axis=0)
+            divisors = p_tstamp - self._centroids_history.get_last_tstamps(p_ids)
+            moved &= divisors > 0
         else:
-            acceleration = acceleration/self._count_change[cluster_id]
-            self._accelerations_history[cluster_id] = np.append(self._accelerations_history[cluster_id][1:], [acceleration], axis=0)
+            divisors = np.array([self._count_change[id] for id in p_ids], dtype=np.float64)
+            for i in np.flatnonzero(~moved):
+                self._count_change[p_ids[i]] += 1
+
+        velocities = np.zeros_like(differences)
+        velocities[moved] = differences[moved] / divisors[moved][:, np.newaxis]
+        return velocities, divisors
+
+
+    ## -------------------------------------------------------------------------------------------------
+    def _calculate_ema(self, p_ids, p_velocities):
+        # Calculate Exponential Moving Average (EMA) for smoothing, unless the previous velocity is zero
+        previous = self._velocities_history.get_last(p_ids)
+        alpha = self._ema_alpha
+        smoothing = np.any(previous != 0, axis=1)[:, np.newaxis]
+        velocities = np.where(smoothing, alpha * p_velocities + (1 - alpha) * previous, p_velocities)
+
+        self._velocities_history.push_batch(p_ids, velocities)
+        return velocities
+
+
+    ## -------------------------------------------------------------------------------------------------
+    def _calculate_accelerations(self, p_ids, p_velocities, p_divisors):
+        # Calculate accelerations as the change in velocity, divided by the elapsed time or number of steps
+        previous = self._velocities_history.get_windows(p_ids)[:, -2]
+        accelerations = (p_velocities - previous) / p_divisors[:, np.newaxis]
+        self._accelerations_history.push_batch(p_ids, accelerations)
 
 
     ## -------------------------------------------------------------------------------------------------
@@ -221,26 +229,10 @@ class ClusterDriftDetector(AnomalyDetectorCB):
 
         
     ## -------------------------------------------------------------------------------------------------
-    def _calculate_ema(self, cluster_id):
-        # Calculate Exponential Moving Average (EMA) for smoothing
-        ema = self._velocities_history[cluster_id][-2]
-        alpha = self._ema_alpha
-        if np.all(self._velocities_history[cluster_id][-2] == 0):
-            velocity = self._velocities_history[cluster_id][-1]
-        else:
-            velocity = alpha * self._velocities_history[cluster_id][-1] + (1 - alpha) * self._velocities_history[cluster_id][-2]
-    
-        self._velocities_history[cluster_id] = np.append(self._velocities_history[cluster_id][:-1], [velocity], axis=0)
-    
-
-    ## -------------------------------------------------------------------------------------------------
-    def _detect_state_change(self, cluster_id, average_velocity_buffer, average_acceleration_buffer, vel_thresh, acc_thresh):
-        # Detect various states of cluster behavior
+    def _detect_state_change(self, cluster_id, velocity_norms, acceleration_norms, vel_thresh, acc_thresh):
+        # Detect various states of cluster behavior based on the norms of the buffered velocities and accelerations
         previous_state = self._cluster_states[cluster_id]
 
-        velocity_norms = np.linalg.norm(average_velocity_buffer, axis=1)
-        acceleration_norms = norms = np.linalg.norm(average_acceleration_buffer, axis=1)
-
         detected = False
 
         if vel_thresh and acc_thresh:
@@ -279,10 +271,10 @@ class ClusterDriftDetector(AnomalyDetectorCB):
 
     ## -------------------------------------------------------------------------------------------------
     def get_velocities(self):
-        return self._velocities_history
+        return {id: self._velocities_history.get_values(id) for id in self._velocities_history.get_ids()}
 
 
     ## -------------------------------------------------------------------------------------------------
     def get_accelerations(self):
-        return self._accelerations_history
+        return {id: self._accelerations_history.get_values(id) for id in self._accelerations_history.get_ids()}
     
\ No newline at end of file
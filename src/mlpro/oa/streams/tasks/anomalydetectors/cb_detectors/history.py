@@ -0,0 +1,440 @@
+## -- ----------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.oa.tasks.anomalydetectors.cb_detectors
+## -- Module  : history.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  0.0.0     DA       Creation
+## -- 2026-10-16  1.0.0     DA       First release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module provides the class ClusterHistory, a ring buffer for the histories of cluster properties
+that is shared by the cluster-based anomaly detectors.
+"""
+
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ClusterHistory:
+    """
+    Ring buffer for the histories of a cluster property. The values of all clusters are stored in
+    preallocated arrays with one row per cluster, so that a new value is added in O(1) without
+    any reallocation. Each value is written twice, at its position p and at p + size of the ring,
+    so that the chronological history of a cluster is always a contiguous slice of its row.
+
+    Optionally, the values are smoothed by an exponential moving average before they are stored.
+    The first and second differences of the stored values are determined incrementally on each
+    push and are kept in further ring buffers of the same kind.
+
+    All methods accept lists of cluster ids, so that the histories of all clusters can be updated
+    and evaluated at once.
+
+    Parameters
+    ----------
+    p_size : int
+        Maximum number of values kept per cluster.
+    p_dim : int
+        Dimensionality of the values. If None, it is determined on the first push. Default = 1.
+    p_max_order : int
+        Highest order of differences to be kept (0, 1 or 2). Default = 0.
+    p_ema_alpha : float
+        Smoothing factor of the exponential moving average. If None, the values are stored as
+        they are. Default = None.
+    p_with_time_calculation : bool
+        If True, differences are divided by the differences of the related time stamps. Equal time
+        stamps lead to a difference of 0. Default = False.
+    p_init_value : float
+        If not None, the ring buffers of new clusters are completely filled with this value instead
+        of being empty. Default = None.
+    """
+
+    C_CAPACITY      = 16
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_size : int,
+                  p_dim : int = 1,
+                  p_max_order : int = 0,
+                  p_ema_alpha : float = None,
+                  p_with_time_calculation : bool = False,
+                  p_init_value : float = None ):
+
+        if p_max_order not in [0, 1, 2]:
+            raise ParamError('Parameter p_max_order needs to be 0, 1 or 2')
+
+        if p_size <= p_max_order:
+            raise ParamError('Parameter p_size needs to be greater than p_max_order')
+
+        self._size             = p_size
+        self._dim              = p_dim
+        self._lens             = [ p_size - order for order in range(p_max_order + 1) ]
+        self._ema_alpha        = p_ema_alpha
+        self._time_calculation = p_with_time_calculation
+        self._init_value       = np.nan if p_init_value is None else p_init_value
+        self.clear()
+
+
+## -------------------------------------------------------------------------------------------------
+    def clear(self):
+        """
+        Removes the histories of all clusters.
+        """
+
+        self._rows    = {}
+        self._free    = []
+        self._buffers = None
+        self._tstamps = None
+        self._heads   = None
+        self._counts  = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def __len__(self):
+        return len(self._rows)
+
+
+## -------------------------------------------------------------------------------------------------
+    def __contains__(self, p_id):
+        return p_id in self._rows
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_ids(self) -> list:
+        """
+        Returns the ids of all clusters with a history.
+        """
+
+        return list(self._rows.keys())
+
+
+## -------------------------------------------------------------------------------------------------
+    def remove(self, p_id):
+        """
+        Removes the history of a cluster. The related row is reused for the next new cluster.
+
+        Parameters
+        ----------
+        p_id
+            Id of the related cluster.
+        """
+
+        try:
+            self._free.append(self._rows.pop(p_id))
+        except KeyError:
+            pass
+
+
+## -------------------------------------------------------------------------------------------------
+    def _allocate(self, p_capacity : int):
+
+        num_orders = len(self._lens)
+        buffers    = [ np.empty((p_capacity, 2 * length, self._dim)) for length in self._lens ]
+        tstamps    = np.empty((p_capacity, 2 * self._size))
+        heads      = np.zeros((p_capacity, num_orders), dtype=np.int64)
+        counts     = np.zeros((p_capacity, num_orders), dtype=np.int64)
+
+        if self._buffers is None:
+            self._free = list(range(p_capacity - 1, -1, -1))
+        else:
+            capacity = self._heads.shape[0]
+            for order, buffer in enumerate(self._buffers):
+                buffers[order][:capacity] = buffer
+            tstamps[:capacity] = self._tstamps
+            heads[:capacity]   = self._heads
+            counts[:capacity]  = self._counts
+            self._free = list(range(p_capacity - 1, capacity - 1, -1)) + self._free
+
+        self._buffers = buffers
+        self._tstamps = tstamps
+        self._heads   = heads
+        self._counts  = counts
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_rows(self, p_ids, p_add : bool = False) -> np.ndarray:
+
+        rows = np.empty(len(p_ids), dtype=np.int64)
+
+        for i, id in enumerate(p_ids):
+            try:
+                rows[i] = self._rows[id]
+            except KeyError:
+                if not p_add: raise
+
+                if len(self._free) == 0:
+                    self._allocate( self.C_CAPACITY if self._heads is None else 2 * self._heads.shape[0] )
+
+                row = self._free.pop()
+                for order, buffer in enumerate(self._buffers):
+                    buffer[row] = self._init_value
+                self._tstamps[row] = np.nan
+                self._heads[row]   = 0
+                self._counts[row]  = 0 if np.isnan(self._init_value) else self._lens
+
+                self._rows[id] = row
+                rows[i]        = row
+
+        return rows
+
+
+## -------------------------------------------------------------------------------------------------
+    def _write(self, p_order : int, p_rows : np.ndarray, p_values : np.ndarray, p_tstamps : np.ndarray = None):
+
+        length = self._lens[p_order]
+        buffer = self._buffers[p_order]
+        heads  = self._heads[p_rows, p_order]
+
+        buffer[p_rows, heads]          = p_values
+        buffer[p_rows, heads + length] = p_values
+
+        if p_tstamps is not None:
+            self._tstamps[p_rows, heads]          = p_tstamps
+            self._tstamps[p_rows, heads + length] = p_tstamps
+
+        self._heads[p_rows, p_order]  = ( heads + 1 ) % length
+        self._counts[p_rows, p_order] = np.minimum( self._counts[p_rows, p_order] + 1, length )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_diffs(self, p_values : np.ndarray, p_last : np.ndarray, p_tstamps : np.ndarray, p_last_tstamps : np.ndarray) -> np.ndarray:
+
+        diffs = p_values - p_last
+        if not self._time_calculation: return diffs
+
+        time_diffs = ( p_tstamps - p_last_tstamps )[:, np.newaxis]
+        return np.divide( diffs, time_diffs, out=np.zeros_like(diffs), where=(time_diffs != 0) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _prepare(self, p_ids, p_values, p_tstamps):
+
+        if self._dim is None:
+            self._dim = np.asarray(p_values[0]).size
+
+        values = np.asarray(p_values, dtype=np.float64).reshape(len(p_ids), self._dim)
+
+        if p_tstamps is None:
+            tstamps = np.zeros(len(p_ids))
+        else:
+            tstamps = np.broadcast_to(np.asarray(p_tstamps, dtype=np.float64), (len(p_ids),))
+
+        return values, tstamps
+
+
+## -------------------------------------------------------------------------------------------------
+    def push(self, p_id, p_value, p_tstamp : float = None):
+        """
+        Adds a new value to the history of a cluster. See method push_batch() for further details.
+
+        Parameters
+        ----------
+        p_id
+            Id of the related cluster.
+        p_value
+            New value.
+        p_tstamp : float
+            Time stamp of the new value. Default = None.
+        """
+
+        self.push_batch([p_id], [p_value], p_tstamp)
+
+
+## -------------------------------------------------------------------------------------------------
+    def push_batch(self, p_ids : list, p_values, p_tstamps = None):
+        """
+        Adds a new value to the histories of several clusters at once. Histories of unknown clusters
+        are created on the fly. If configured, the values are smoothed and their differences to the
+        preceding values are added to the histories of differences.
+
+        Parameters
+        ----------
+        p_ids : list
+            Unique ids of the related clusters.
+        p_values
+            New values with one entry/row per cluster.
+        p_tstamps
+            Time stamps of the new values. A single time stamp is used for all clusters.
+            Default = None.
+        """
+
+        if len(p_ids) == 0: return
+
+        values, tstamps = self._prepare(p_ids, p_values, p_tstamps)
+        rows            = self._get_rows(p_ids, p_add=True)
+        valid           = self._counts[rows, 0] > 0
+        last            = self._get_last(rows)
+
+        if self._ema_alpha is not None:
+            values = np.where( valid[:, np.newaxis], self._ema_alpha * values + ( 1 - self._ema_alpha ) * last, values )
+
+        if len(self._lens) > 1:
+            diffs = self._get_diffs(values, last, tstamps, self._get_last_tstamps(rows))
+
+            if len(self._lens) > 2:
+                valid_2 = valid & ( self._counts[rows, 1] > 0 )
+                self._write(2, rows[valid_2], ( diffs - self._get_last(rows, 1) )[valid_2])
+
+            self._write(1, rows[valid], diffs[valid])
+
+        self._write(0, rows, values, tstamps)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_last(self, p_rows : np.ndarray, p_order : int = 0) -> np.ndarray:
+
+        length = self._lens[p_order]
+        return self._buffers[p_order][p_rows, self._heads[p_rows, p_order] + length - 1]
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_last_tstamps(self, p_rows : np.ndarray) -> np.ndarray:
+
+        return self._tstamps[p_rows, self._heads[p_rows, 0] + self._size - 1]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_last(self, p_ids : list, p_order : int = 0) -> np.ndarray:
+        """
+        Returns the latest values or differences of several clusters.
+
+        Parameters
+        ----------
+        p_ids : list
+            Ids of the related clusters.
+        p_order : int
+            0 for values, 1 for first differences, 2 for second differences. Default = 0.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix with one row per cluster. Rows of empty histories are filled with NaN.
+        """
+
+        return self._get_last(self._get_rows(p_ids), p_order)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_last_tstamps(self, p_ids : list) -> np.ndarray:
+        """
+        Returns the time stamps of the latest values of several clusters.
+        """
+
+        return self._get_last_tstamps(self._get_rows(p_ids))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_lengths(self, p_ids : list, p_order : int = 0) -> np.ndarray:
+        """
+        Returns the current lengths of the histories of several clusters.
+        """
+
+        return self._counts[self._get_rows(p_ids), p_order]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_windows(self, p_ids : list, p_order : int = 0) -> np.ndarray:
+        """
+        Returns the chronological histories of several clusters at once.
+
+        Parameters
+        ----------
+        p_ids : list
+            Ids of the related clusters.
+        p_order : int
+            0 for values, 1 for first differences, 2 for second differences. Default = 0.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (number of clusters, length of history, dimensionality). The oldest
+            entries come first. Histories that are not yet complete are padded with NaN at
+            their beginning.
+        """
+
+        rows    = self._get_rows(p_ids)
+        length  = self._lens[p_order]
+        indices = self._heads[rows, p_order][:, np.newaxis] + np.arange(length)
+        return self._buffers[p_order][rows[:, np.newaxis], indices]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_values(self, p_id, p_order : int = 0) -> np.ndarray:
+        """
+        Returns the chronological history of a single cluster.
+
+        Parameters
+        ----------
+        p_id
+            Id of the related cluster.
+        p_order : int
+            0 for values, 1 for first differences, 2 for second differences. Default = 0.
+
+        Returns
+        -------
+        np.ndarray
+            Copy of the history with one row per entry. The oldest entry comes first.
+        """
+
+        row    = self._rows[p_id]
+        length = self._lens[p_order]
+        head   = self._heads[row, p_order]
+        return self._buffers[p_order][row, head + length - self._counts[row, p_order] : head + length].copy()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_tstamps(self, p_id) -> np.ndarray:
+        """
+        Returns the chronological time stamps of the values of a single cluster.
+        """
+
+        row  = self._rows[p_id]
+        head = self._heads[row, 0]
+        return self._tstamps[row, head + self._size - self._counts[row, 0] : head + self._size].copy()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_next_diffs(self, p_ids : list, p_values, p_tstamps = None):
+        """
+        Determines the first and second differences of new raw values to the histories of several
+        clusters without storing them.
+
+        Parameters
+        ----------
+        p_ids : list
+            Ids of the related clusters.
+        p_values
+            New values with one entry/row per cluster.
+        p_tstamps
+            Time stamps of the new values. A single time stamp is used for all clusters.
+            Default = None.
+
+        Returns
+        -------
+        diffs_1 : np.ndarray
+            First differences with one row per cluster.
+        diffs_2 : np.ndarray
+            Second differences with one row per cluster. NaN if there is no preceding first
+            difference or if no first differences are kept.
+        """
+
+        values, tstamps = self._prepare(p_ids, p_values, p_tstamps)
+        rows            = self._get_rows(p_ids)
+        diffs_1         = self._get_diffs(values, self._get_last(rows), tstamps, self._get_last_tstamps(rows))
+
+        if len(self._lens) > 1:
+            diffs_2 = diffs_1 - self._get_last(rows, 1)
+        else:
+            diffs_2 = np.full_like(diffs_1, np.nan)
+
+        return diffs_1, diffs_2
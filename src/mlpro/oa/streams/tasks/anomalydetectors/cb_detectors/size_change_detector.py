@@ -9,16 +9,19 @@
 ## -- 2023-09-12  1.0.0     SK       Release
 ## -- 2024-04-10  1.1.0     DA/SK    Refactoring
 ## -- 2024-05-28  1.2.0     SK       Refactoring
+## -- 2026-10-16  1.3.0     DA       Refactoring: ring buffer histories and vectorized evaluation
+## --                                of all clusters
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.2.0 (2024-05-28)
+Ver. 1.3.0 (2026-10-16)
 
 This module provides cluster size change detector algorithm.
 """
 
 from mlpro.oa.streams.basics import *
 from mlpro.oa.streams.tasks.anomalydetectors.cb_detectors.basics import AnomalyDetectorCB
+from mlpro.oa.streams.tasks.anomalydetectors.cb_detectors.history import ClusterHistory
 from mlpro.oa.streams.tasks.anomalydetectors.anomalies.clusterbased.size import ClusterSizeVariation
 from mlpro.oa.streams.tasks.clusteranalyzers.basics import ClusterAnalyzer
 from mlpro.bf.streams import Instance, InstDict
@@ -79,10 +82,12 @@ class ClusterSizeChangeDetector(AnomalyDetectorCB):
         self._time_calculation = p_with_time_calculation
         self._window_size = p_window_size
 
-        self._avg_size_history = {}
-        self._time_history = {}
+        self._size_history = ClusterHistory(p_size=p_window_size,
+                                            p_max_order=2,
+                                            p_ema_alpha=p_ema_alpha,
+                                            p_with_time_calculation=p_with_time_calculation)
         self._current_state = {}
-        self._buffer = {}
+
 
 ## -------------------------------------------------------------------------------------------------
     def _run(self, p_inst : InstDict):
@@ -95,37 +100,40 @@ class ClusterSizeChangeDetector(AnomalyDetectorCB):
 
         affected_clusters = {}
 
-        for id in clusters.keys():
-            if clusters[id].size.value == None:
-                continue
-
-            if self._thresh["thresh"]:
-                if id not in self._thresh.keys():
-                    self._thresh[id] = self._thresh["thresh"]
-                thresh = self._thresh[id]
-            else:
-                thresh = None
-            if self._roc_thresh["thresh"]:
-                if id not in self._roc_thresh.keys():
-                    self._roc_thresh[id] = self._roc_thresh["thresh"]
-                roc_thresh = self._roc_thresh[id]  
-            else:
-                roc_thresh = None
-
-            if id not in self._avg_size_history.keys():
-                self._size_history[id] = []
-                self._avg_size_history[id] = [clusters[id].size.value]
-                self._time_history[id] = [current_time]
-                self._update_history(id, clusters[id].size.value ,current_time)
-            #self._size_history[id].append(clusters[id].size.value)
-
-            self._detect_anomalies(id, clusters[id], affected_clusters,
-                                   thresh, roc_thresh, current_time)
-            
-            self._update_history(id, clusters[id].size.value ,current_time)
-            
-            if id in affected_clusters.keys():
-                    self._update_threshold(id, clusters)
+        # 1 Histories of removed clusters are discarded
+        for id in self._size_history.get_ids():
+            if id not in clusters:
+                self._size_history.remove(id)
+                self._current_state.pop(id, None)
+
+        # 2 Current sizes of all clusters
+        ids = [id for id, cluster in clusters.items() if cluster.size.value != None]
+        values = np.array([clusters[id].size.value for id in ids], dtype=np.float64)
+
+        # 3 Detection of violated size limits
+        exceeded = np.zeros(len(ids), dtype=bool)
+        if self._thresh_u:
+            exceeded |= values >= self._thresh_u
+        if self._thresh_l:
+            exceeded |= values <= self._thresh_l
+
+        for i in np.flatnonzero(exceeded):
+            affected_clusters[ids[i]] = clusters[ids[i]]
+
+        # 4 Detection of changed trends of all clusters at once
+        changes = self._update_trend_states(p_history=self._size_history,
+                                            p_ids=ids,
+                                            p_values=values,
+                                            p_tstamp=current_time,
+                                            p_thresh=self._get_thresholds(self._thresh, ids),
+                                            p_roc_thresh=self._get_thresholds(self._roc_thresh, ids),
+                                            p_states=self._current_state)
+
+        for id, prev_state, state in changes:
+            affected_clusters[id] = clusters[id]
+
+        for id in affected_clusters.keys():
+            self._update_threshold(id, clusters)
 
         if self._count <= self._init_skip:
             self._count+= 1
@@ -139,78 +147,6 @@ class ClusterSizeChangeDetector(AnomalyDetectorCB):
             self._raise_anomaly_event(p_anomaly=anomaly)
 
 
-## -------------------------------------------------------------------------------------------------
-    def _update_history(self, id, value, current_time):
-        avg_size = self[id][-1]*(1-self._ema) + value*self._ema
-
-        self[id].append(avg_size)
-        self._time_history[id].append(current_time)
-
-        if len(self[id]) > self._window_size:
-            self._avg_size_history[id].pop(0)
-            self._time_history[id].pop(0)
-
-
-## -------------------------------------------------------------------------------------------------
-    def _detect_anomalies(self, id, cluster, affected_clusters, thresh, roc_thresh, current_time):
-        if self._thresh_u and cluster.size.value != None and cluster.size.value >= self._thresh_u:
-            affected_clusters[id] = cluster
-            
-        if self._thresh_l and cluster.size.value != None and cluster.size.value <= self._thresh_l:
-            affected_clusters[id] = cluster
-
-        if len(self._avg_size_history[id]) < 3:
-            self._current_state[id] = "NC"
-        else:
-            self._state_change_detection(id, cluster, affected_clusters, thresh, roc_thresh, current_time)
-
-
-## -------------------------------------------------------------------------------------------------
-    def _state_change_detection(self, id, cluster, affected_clusters, thresh, roc_thresh, current_time):
-        # Calculate first differences
-        if self._time_calculation:
-            first_diff = [(self._avg_size_history[id][i+1] - self._avg_size_history[id][i]) / (self._time_history[id][i+1] - self._time_history[id][i]) if (self._time_history[id][i+1] - self._time_history[id][i]) != 0 else 0 for i in range(len(self._avg_size_history[id])-1)]
-            time_diff = current_time - self._time_history[id][-1]
-            diff = (cluster.size.value - self._avg_size_history[id][-1]) / time_diff if time_diff != 0 else 0.0
-            first_diff.append(diff)
-        else:
-            first_diff = [self._avg_size_history[id][i+1] - self._avg_size_history[id][i] for i in range(len(self._avg_size_history[id])-1)]
-            diff = cluster.size.value - self._avg_size_history[id][-1]
-            first_diff.append(diff)
-
-
-        # Calculate second differences if enough data points are available
-        if roc_thresh:
-            if len(self._avg_size_history[id]) > 2:
-                second_diff = [first_diff[i+1] - first_diff[i] for i in range(len(first_diff)-1)]
-            else:
-                second_diff = []
-
-        #if self._rel_change_thresh:
-        #    if abs(diff) > self._rel_change_thresh:
-        #        affected_clusters[id] = cluster
-
-        current_state = None
-        if thresh:
-            if any(d > thresh for d in first_diff):
-                current_state = "LI"
-            elif any(d < -thresh for d in first_diff):
-                current_state = "LD"
-
-        if roc_thresh:
-            if any(d2 > roc_thresh for d2 in second_diff):
-                current_state = "VI"
-            elif any(d2 < -roc_thresh for d2 in second_diff):
-                current_state = "VD"
-
-        if not current_state:
-            current_state = "NC"
-
-        if current_state != self._current_state[id]:
-            affected_clusters[id] = cluster
-            self._current_state[id] = current_state
-            
-
 ## -------------------------------------------------------------------------------------------------
     def _update_threshold(self, id, clusters):
         if clusters[id].size.value > 0:
@@ -12,10 +12,15 @@
 ## -- 2024-04-10  1.2.0     DA/SK    Code review
 ## -- 2024-05-07  1.2.1     SK       Bug fix on groupanomaly visualisation
 ## -- 2024-08-12  1.3.0     DA       Review and adjustments on documentation
+## -- 2026-10-16  1.4.0     DA       Class AnomalyDetectorPAGA:
+## --                                - support of retention policies of the parent class
+## --                                - new parameter p_group_size_max
+## -- 2026-10-17  1.4.1     DA       Class AnomalyDetectorPAGA: parameter p_group_size_max moved to 
+## --                                the end
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.3.0 (2024-08-12)
+Ver. 1.4.1 (2026-10-17)
 
 This module provides a ready-to-use detector for point and group anomalies.
 """
@@ -48,8 +53,12 @@ class AnomalyDetectorPAGA(AnomalyDetector):
         Boolean switch for visualisation. Default = False.
     p_logging
         Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    p_group_size_max : int
+        Maximum number of instances of a group anomaly. If reached, the group is closed and further
+        consecutive anomalies start a new group. Default = 0 (no limit).
     p_kwargs : dict
-        Further optional named parameters.
+        Further optional named parameters. See class AnomalyDetector for the parameters of the
+        retention policies.
 
     """
 
@@ -67,6 +76,7 @@ class AnomalyDetectorPAGA(AnomalyDetector):
                  p_duplicate_data : bool = False,
                  p_visualize : bool = False,
                  p_logging=Log.C_LOG_ALL,
+                 p_group_size_max : int = 0,
                  **p_kwargs):
 
         super().__init__(p_name = p_name,
@@ -81,6 +91,27 @@ class AnomalyDetectorPAGA(AnomalyDetector):
         self.group_anomalies_instances : list[Instance] = []
         self.group_ano_scores = []
         self.group_anomaly_det = p_group_anomaly_det
+        self.group_size_max = p_group_size_max
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset_group(self):
+        """
+        Closes the current group of consecutive anomalies.
+        """
+
+        for anomaly in self.group_anomalies:
+            if isinstance(anomaly, GroupAnomaly):
+                anomaly.plot_update = False
+        self.group_anomalies = []
+        self.group_anomalies_instances = []
+        self.group_ano_scores = []
+
+
+## -------------------------------------------------------------------------------------------------
+    def _evict_anomaly(self, p_anomaly):
+        if p_anomaly in self.group_anomalies: self._reset_group()
+        super()._evict_anomaly( p_anomaly = p_anomaly )
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -123,40 +154,41 @@ class AnomalyDetectorPAGA(AnomalyDetector):
                                                p_raising_object=self,
                                                p_det_time=str(inst_2.get_tstamp()))
                         anomaly.set_id( p_id = self._get_next_anomaly_id() )
-                        self._anomalies[anomaly.get_id()] = anomaly
+                        self._add_anomaly( p_anomaly = anomaly )
                         self.group_anomalies = []
                         self.group_anomalies.append(anomaly)
                         return anomaly
 
                     elif len(self.group_anomalies_instances) > 3:
-                        self.group_anomalies[0].set_instances(self.group_anomalies_instances, self.group_ano_scores)
+                        anomaly = self.group_anomalies[0]
+                        anomaly.set_instances(self.group_anomalies_instances, self.group_ano_scores)
                         self.group_anomalies.pop(-1)
-                        return self.group_anomalies[0]
+                        self._update_anomaly( p_anomaly = anomaly )
+
+                        if ( self.group_size_max > 0 ) and ( len(self.group_anomalies_instances) >= self.group_size_max ):
+                            self._reset_group()
+
+                        return anomaly
                         
                     else:
                         p_anomaly.set_id( p_id = self._get_next_anomaly_id() )
-                        self._anomalies[p_anomaly.get_id()] = p_anomaly
+                        self._add_anomaly( p_anomaly = p_anomaly )
                         return p_anomaly
                     
                 else:
-                    for anomaly in self.group_anomalies:
-                        if isinstance(anomaly, GroupAnomaly):
-                            anomaly.plot_update = False
-                    self.group_anomalies = []
-                    self.group_anomalies_instances = []
-                    self.group_ano_scores = []
+                    self._reset_group()
                     self.group_anomalies.append(p_anomaly)
                     self.group_anomalies_instances.append(p_anomaly.get_instances()[-1])
                     self.group_ano_scores.append(p_anomaly.get_ano_scores())
                     p_anomaly.set_id( p_id = self._get_next_anomaly_id() )
-                    self._anomalies[p_anomaly.get_id()] = p_anomaly
+                    self._add_anomaly( p_anomaly = p_anomaly )
                     return p_anomaly
             else:
                 p_anomaly.set_id( p_id = self._get_next_anomaly_id() )
-                self._anomalies[p_anomaly.get_id()] = p_anomaly
+                self._add_anomaly( p_anomaly = p_anomaly )
                 return p_anomaly
             
         else:
             p_anomaly.set_id( p_id = self._get_next_anomaly_id() )
-            self._anomalies[p_anomaly.get_id()] = p_anomaly
+            self._add_anomaly( p_anomaly = p_anomaly )
             return p_anomaly
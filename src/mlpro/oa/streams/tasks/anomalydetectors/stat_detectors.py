@@ -0,0 +1,288 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.oa.streams.tasks.anomalydetectors
+## -- Module  : stat_detectors.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  0.0.0     DA       Creation
+## -- 2026-10-16  1.0.0     DA       First release
+## -- 2026-10-17  1.0.1     DA       Class AnomalyDetectorStat: 
+## --                                - finite default values for p_retention_max, p_group_size_max
+## --                                - parameter p_group_size_max moved to the end
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-17)
+
+This module provides a ready-to-use detector for point anomalies based on incremental statistics.
+"""
+
+from mlpro.oa.streams.basics import *
+from mlpro.bf.math.statistics import RunningMoments, EWMoments, P2Quantile
+from mlpro.oa.streams.tasks.anomalydetectors.paga_detectors import AnomalyDetectorPAGA
+from mlpro.oa.streams.tasks.anomalydetectors.anomalies import PointAnomaly
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class AnomalyDetectorStat(AnomalyDetectorPAGA):
+    """
+    Ready-to-use detector for point anomalies based on incremental statistics of the feature data.
+    Each new instance is scored against the statistics of the preceding instances. The statistics
+    are adapted on each new instance in O(1) and with a fixed memory footprint, independent of the
+    length of the stream. The following scoring methods are available:
+
+    - C_SCORE_ZSCORE: z-score based on the running mean and variance,
+    - C_SCORE_ROBUST: robust z-score based on the approximate median and interquartile range,
+    - C_SCORE_EWMA: z-score based on the exponentially weighted moving average and variance,
+    - C_SCORE_QUANTILE: distance to the approximate median relative to the distance of the
+      approximate lower/upper quantile. A score greater than 1 means that the quantile is exceeded.
+
+    The score of an instance is the maximum absolute score of its features. Instances with a score
+    above the threshold are raised as point anomalies. Consecutive anomalies are combined to group
+    anomalies as described in class AnomalyDetectorPAGA.
+
+    To keep the memory footprint bounded on endless streams, the number of buffered anomalies and
+    the size of group anomalies are limited by default (see C_RETENTION_MAX and C_GROUP_SIZE_MAX).
+    A value of 0 explicitly turns off the respective limit.
+
+    Parameters
+    ----------
+    p_method : int
+        Scoring method. See constants C_SCORE_*. Default = C_SCORE_ROBUST.
+    p_threshold : float
+        Minimum score of an anomaly. Default = 3.0.
+    p_warm_up : int
+        Number of initial instances that are used for adaptation only. Default = 20.
+    p_ema_alpha : float
+        Smoothing factor for method C_SCORE_EWMA. Default = 0.05.
+    p_quantile : float
+        Upper quantile for method C_SCORE_QUANTILE. The lower quantile is 1 - p_quantile.
+        Default = 0.99.
+    p_group_anomaly_det : bool
+        Paramter to activate group anomaly detection. Default is True.
+    p_name : str
+        Optional name of the task. Default is None.
+    p_range_max : int
+        Maximum range of asynchonicity. See class Range. Default is Range.C_RANGE_THREAD.
+    p_ada : bool
+        Boolean switch for adaptivitiy. If False, the statistics are frozen. Default = True.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default = False.
+    p_visualize : bool
+        Boolean switch for visualisation. Default = False.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    p_group_size_max : int
+        Maximum number of instances of a group anomaly. Default = C_GROUP_SIZE_MAX.
+    p_retention_max : int
+        Maximum number of buffered anomalies. Default = C_RETENTION_MAX.
+    p_kwargs : dict
+        Further optional named parameters. See class AnomalyDetector for the further parameters of
+        the retention policies.
+    """
+
+    C_NAME              = 'Statistical Anomaly Detector'
+
+    C_BATCH_NATIVE      = True
+
+    C_SCORE_ZSCORE      = 0
+    C_SCORE_ROBUST      = 1
+    C_SCORE_EWMA        = 2
+    C_SCORE_QUANTILE    = 3
+
+    C_IQR_TO_STD        = 1.349     # Interquartile range of the standard normal distribution
+
+    C_RETENTION_MAX     = 1000      # Default maximum number of buffered anomalies
+    C_GROUP_SIZE_MAX    = 100       # Default maximum number of instances of a group anomaly
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_method : int = C_SCORE_ROBUST,
+                 p_threshold : float = 3.0,
+                 p_warm_up : int = 20,
+                 p_ema_alpha : float = 0.05,
+                 p_quantile : float = 0.99,
+                 p_group_anomaly_det : bool = True,
+                 p_name:str = None,
+                 p_range_max = StreamTask.C_RANGE_THREAD,
+                 p_ada : bool = True,
+                 p_duplicate_data : bool = False,
+                 p_visualize : bool = False,
+                 p_logging=Log.C_LOG_ALL,
+                 p_group_size_max : int = C_GROUP_SIZE_MAX,
+                 p_retention_max : int = C_RETENTION_MAX,
+                 **p_kwargs):
+
+        super().__init__(p_group_anomaly_det = p_group_anomaly_det,
+                         p_name = p_name,
+                         p_range_max = p_range_max,
+                         p_ada = p_ada,
+                         p_duplicate_data = p_duplicate_data,
+                         p_visualize = p_visualize,
+                         p_logging = p_logging,
+                         p_group_size_max = p_group_size_max,
+                         p_retention_max = p_retention_max,
+                         **p_kwargs)
+
+        if p_threshold <= 0:
+            raise ParamError('Parameter p_threshold needs to be greater than 0')
+
+        if p_warm_up < 1:
+            raise ParamError('Parameter p_warm_up needs to be greater than 0')
+
+        if p_method == self.C_SCORE_ZSCORE:
+            self._statistics = [ RunningMoments() ]
+        elif p_method == self.C_SCORE_ROBUST:
+            self._statistics = [ P2Quantile(0.25), P2Quantile(0.5), P2Quantile(0.75) ]
+        elif p_method == self.C_SCORE_EWMA:
+            self._statistics = [ EWMoments(p_alpha=p_ema_alpha) ]
+        elif p_method == self.C_SCORE_QUANTILE:
+            self._statistics = [ P2Quantile(1 - p_quantile), P2Quantile(0.5), P2Quantile(p_quantile) ]
+        else:
+            raise ParamError('Invalid scoring method ' + str(p_method))
+
+        self._method    = p_method
+        self._threshold = p_threshold
+        self._warm_up   = p_warm_up
+        self._num_inst  = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_scores(self, p_values : np.ndarray) -> np.ndarray:
+        """
+        Scores feature values against the current statistics.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Matrix with the feature values of one instance per row.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of scores with one row per instance and one column per feature. Features with
+            a spread of zero get a score of 0 if they match the center and infinity otherwise.
+        """
+
+        if self._method in [ self.C_SCORE_ZSCORE, self.C_SCORE_EWMA ]:
+            center = self._statistics[0].get_mean()
+            spread = np.sqrt(self._statistics[0].get_variance())
+            deviation = p_values - center
+
+        elif self._method == self.C_SCORE_ROBUST:
+            center = self._statistics[1].get_quantile()
+            spread = ( self._statistics[2].get_quantile() - self._statistics[0].get_quantile() ) / self.C_IQR_TO_STD
+            deviation = p_values - center
+
+        else:
+            center = self._statistics[1].get_quantile()
+            deviation = p_values - center
+            spread = np.where( deviation >= 0,
+                               self._statistics[2].get_quantile() - center,
+                               center - self._statistics[0].get_quantile() )
+
+        spread = np.broadcast_to(spread, deviation.shape)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where( spread > 0,
+                             deviation / np.where(spread > 0, spread, 1),
+                             np.where(deviation == 0, 0, np.inf * np.sign(deviation)) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _detect(self, p_values : np.ndarray, p_get_instance):
+        """
+        Scores new feature values and raises point anomalies.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Matrix with the feature values of one new instance per row.
+        p_get_instance
+            Function that returns the instance of a row.
+        """
+
+        num_scored = len(p_values) - max(0, self._warm_up - self._num_inst)
+        self._num_inst += len(p_values)
+        if ( num_scored <= 0 ) or ( self._statistics[0].get_num() == 0 ): return
+
+        rows        = np.arange(len(p_values) - num_scored, len(p_values))
+        scores      = self.get_scores(p_values[rows])
+        inst_scores = np.max(np.abs(scores), axis=1)
+
+        for i in np.flatnonzero(inst_scores > self._threshold):
+            inst = p_get_instance(rows[i])
+            self._raise_anomaly_event( PointAnomaly( p_instances = [inst],
+                                                     p_ano_scores = [float(inst_scores[i])],
+                                                     p_det_time = str(inst.get_tstamp()),
+                                                     p_deviation = scores[i],
+                                                     p_visualize = self._visualize,
+                                                     p_raising_object = self ) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+
+        new_instances = [ inst for inst_id, (inst_type, inst) in sorted(p_inst.items()) if inst_type == InstTypeNew ]
+
+        if len(new_instances) > 0:
+            values = np.array([ inst.get_feature_data().get_values() for inst in new_instances ], dtype=np.float64)
+            self._detect( p_values = values, p_get_instance = lambda i: new_instances[i] )
+
+        self.adapt(p_inst=p_inst)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run_batch(self, p_batch : InstanceBatch):
+
+        rows = np.flatnonzero(p_batch.get_new_mask())
+
+        if len(rows) > 0:
+            self._detect( p_values = p_batch.get_feature_data()[rows],
+                          p_get_instance = lambda i: p_batch.get_instance(rows[i]) )
+
+        self.adapt(p_batch=p_batch)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_statistics(self, p_values : np.ndarray):
+        for statistic in self._statistics:
+            statistic.update(p_values)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt(self, p_inst_new : Instance) -> bool:
+        self._update_statistics( np.asarray(p_inst_new.get_feature_data().get_values(), dtype=np.float64) )
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt_reverse(self, p_inst_del : Instance) -> bool:
+        # The statistics cover the entire stream, obsolete instances are not taken back
+        return False
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt_batch(self, p_batch : InstanceBatch) -> bool:
+        values = p_batch.get_feature_data()[p_batch.get_new_mask()]
+        if len(values) == 0: return False
+
+        if self._method == self.C_SCORE_ZSCORE:
+            self._statistics[0].update_batch(values)
+        else:
+            for row in values:
+                self._update_statistics(row)
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _renormalize(self, p_normalizer : Normalizer):
+        super()._renormalize( p_normalizer = p_normalizer )
+
+        scale, offset = p_normalizer.get_renormalization()
+        for statistic in self._statistics:
+            statistic.renormalize( p_scale = scale, p_offset = offset )
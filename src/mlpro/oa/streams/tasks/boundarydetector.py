@@ -35,10 +35,16 @@
 ## -- 2024-10-29  1.5.0     DA       - Refactoring
 ## --                                - Pseudo-implementation of BoundaryDetector._adapt_reverse()
 ## -- 2024-11-05  1.5.1     DA       Bugfix in method BoundaryDetector._upate_plot_nd()
+## -- 2026-10-16  1.6.0     DA       Class BoundaryDetector:
+## --                                - batch processing with vectorized min/max and one update of
+## --                                  the related set per run
+## --                                - new parameter p_margin for hysteresis of boundaries
+## --                                - bugfix in method _adapt_on_event(): undefined boundaries
+## -- 2026-10-17  1.6.1     DA       Class BoundaryDetector: parameter p_margin moved to the end
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.5.1 (2024-11-05)
+Ver. 1.6.1 (2026-10-17)
 
 This module provides pool of boundary detector object further used in the context of online adaptivity.
 
@@ -46,16 +52,17 @@ This module provides pool of boundary detector object further used in the contex
 
 from itertools import repeat
 
+import numpy as np
 import matplotlib.colors
 from matplotlib.figure import Figure
 
 from mlpro.bf.various import Log
-from mlpro.bf.exceptions import ImplementationError
+from mlpro.bf.exceptions import ImplementationError, ParamError
 from mlpro.bf.plot import PlotSettings
 from mlpro.bf.mt import Task
 from mlpro.bf.events import Event
 from mlpro.bf.math import Set
-from mlpro.bf.streams import Instance, InstDict
+from mlpro.bf.streams import Instance, InstDict, InstanceBatch
 from mlpro.oa.streams.basics import OAStreamTask
 
 
@@ -68,6 +75,11 @@ class BoundaryDetector (OAStreamTask):
     This class provides the functionality of boundary observation of incoming instances. It raises 
     event C_EVENT_ADAPTED when a change in the current boundaries is detected.
 
+    All new instances of a run are processed in one step. The boundaries of each dimension of the 
+    related set are updated at most once per run and event C_EVENT_ADAPTED is raised at most once 
+    per run. Optionally, exceeded boundaries are extended by a safety margin, so that small jitter 
+    around the boundaries does not lead to a renormalization in each cycle.
+
     Parameters
     ----------
     p_name: str, Optional.
@@ -82,10 +94,14 @@ class BoundaryDetector (OAStreamTask):
         True to turn on the visualization.
     p_logging
         Logging level for the task, default is Log all.
+    p_margin : float
+        Safety margin as fraction of the boundary range. An exceeded boundary is moved beyond the 
+        new extreme value by this margin. Default = 0.0.
 
     """
 
     C_NAME                      = 'Boundary Detector'
+    C_BATCH_NATIVE              = True
 
     C_PLOT_ND_XLABEL_FEATURE    = 'Features'
     C_PLOT_ND_YLABEL            = 'Boundaries'
@@ -102,6 +118,7 @@ class BoundaryDetector (OAStreamTask):
                   p_duplicate_data : bool = False,
                   p_visualize : bool = False,
                   p_logging=Log.C_LOG_ALL,
+                  p_margin : float = 0.0,
                   **p_kwargs ):
 
         super().__init__( p_name = p_name,
@@ -112,7 +129,59 @@ class BoundaryDetector (OAStreamTask):
                           p_logging = p_logging,
                           **p_kwargs )
 
+        if p_margin < 0:
+            raise ParamError('Parameter p_margin must not be negative')
+
         self._related_set: Set = None
+        self._margin = p_margin
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_boundaries(self, p_set : Set, p_lower : np.ndarray, p_upper : np.ndarray) -> bool:
+        """
+        Extends the boundaries of the dimensions of the given set to the given lower and upper 
+        values. Only dimensions with exceeded boundaries are updated.
+
+        Parameters
+        ----------
+        p_set : Set
+            Related set.
+        p_lower : np.ndarray
+            Minimum values per dimension.
+        p_upper : np.ndarray
+            Maximum values per dimension.
+
+        Returns
+        -------
+        adapted : bool
+            True, if at least one boundary has changed. False otherwise.
+        """
+
+        dims     = p_set.get_dims()
+        adapted  = False
+
+        for i, dim in enumerate(dims):
+            boundary = dim.get_boundaries()
+
+            if ( boundary is None ) or ( len(boundary) == 0 ):
+                dim.set_boundaries([p_lower[i], p_upper[i]])
+                adapted = True
+                continue
+
+            exceeded_low  = p_lower[i] < boundary[0]
+            exceeded_high = p_upper[i] > boundary[1]
+            if not ( exceeded_low or exceeded_high ): continue
+
+            lower  = p_lower[i] if exceeded_low else boundary[0]
+            upper  = p_upper[i] if exceeded_high else boundary[1]
+            margin = self._margin * ( upper - lower )
+            if exceeded_low: lower -= margin
+            if exceeded_high: upper += margin
+
+            dim.set_boundaries([lower, upper])
+            adapted = True
+
+        return adapted
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -131,30 +200,42 @@ class BoundaryDetector (OAStreamTask):
             Returns true if there is a change of boundaries, false otherwise.
         """
 
-        adapted = False
-
         feature_data = p_inst_new.get_feature_data()
 
         # Storing the related set for events
         self._related_set = feature_data.get_related_set()
 
-        dim = feature_data.get_related_set().get_dims()
+        values = feature_data.get_values()
+        return self._update_boundaries( p_set = self._related_set, p_lower = values, p_upper = values )
 
-        for i,value in enumerate(feature_data.get_values()):
-            boundary = dim[i].get_boundaries()
-            if len(boundary) == 0 or boundary is None:
-                dim[i].set_boundaries([value,value])
-                adapted = True
-                continue
 
-            if value < boundary[0]:
-                dim[i].set_boundaries([value, boundary[1]])
-                adapted = True
-            elif value > boundary[1]:
-                dim[i].set_boundaries([boundary[0],value])
-                adapted = True
+## -------------------------------------------------------------------------------------------------
+    def _adapt_batch(self, p_batch: InstanceBatch) -> bool:
+        """
+        Method to check if the new instances of a batch exceed the current boundaries of the Set. 
+        The extreme values of all new instances are determined in one vectorized step.
 
-        return adapted
+        Parameters
+        ----------
+        p_batch : InstanceBatch
+            Batch of new and obsolete instances.
+
+        Returns
+        -------
+        adapted : bool
+            Returns true if there is a change of boundaries, false otherwise.
+        """
+
+        new = p_batch.get_new_mask()
+        if not new.any(): return False
+
+        # Storing the related set for events
+        self._related_set = p_batch.get_feature_set()
+
+        feature_data = p_batch.get_feature_data()[new]
+        return self._update_boundaries( p_set = self._related_set, 
+                                        p_lower = np.minimum.reduce(feature_data, axis=0),
+                                        p_upper = np.maximum.reduce(feature_data, axis=0) )
     
     
 ## -------------------------------------------------------------------------------------------------
@@ -179,6 +260,20 @@ class BoundaryDetector (OAStreamTask):
         self.adapt(p_inst=p_inst)
 
 
+## -------------------------------------------------------------------------------------------------
+    def _run_batch(self, p_batch: InstanceBatch):
+        """
+        Method to run the boundary detector task on a batch of instances.
+
+        Parameters
+        ----------
+        p_batch : InstanceBatch
+            Instances to be processed.
+        """
+
+        self.adapt(p_batch=p_batch)
+
+
 ## -------------------------------------------------------------------------------------------------
     def _adapt_on_event(self, p_event_id:str, p_event_object:Event):
         """
@@ -211,7 +306,7 @@ class BoundaryDetector (OAStreamTask):
             bd_dim_current = dim.get_boundaries()
             bd_dim_new     = bd_new[i]
 
-            if ( bd_dim_new[0] != bd_dim_current[0] ) or ( bd_dim_new[1] != bd_dim_current[1] ):
+            if ( len(bd_dim_current) == 0 ) or ( bd_dim_new[0] != bd_dim_current[0] ) or ( bd_dim_new[1] != bd_dim_current[1] ):
                 dim.set_boundaries(bd_dim_new)
                 adapted = True
         
@@ -1,2 +1,3 @@
 from mlpro.oa.streams.tasks.clusteranalyzers.basics import ClusterAnalyzer
-from mlpro.oa.streams.tasks.clusteranalyzers.clusters import *
\ No newline at end of file
+from mlpro.oa.streams.tasks.clusteranalyzers.clusters import *
+from mlpro.oa.streams.tasks.clusteranalyzers.index import CentroidIndex
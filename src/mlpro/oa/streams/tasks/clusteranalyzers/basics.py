@@ -38,16 +38,24 @@
 ## -- 2024-06-16  1.2.1     DA       Bugfix in ClusterAnalyzer.align_cluster_properties()
 ## -- 2024-08-20  1.3.0     DA       Raising of events Cluster.C_CLUSTER_ADDED, Cluster.C_CLUSTER_REMOVED
 ## -- 2024-08-21  1.3.1     DA       Resolved name collision of class mlpro.bf.events.Event
+## -- 2026-10-16  1.4.0     DA       Class ClusterAnalyzer:
+## --                                - new parameter p_spatial_index for a centroid index
+## --                                - vectorized determination of cluster influences
+## --                                - new methods get_cluster_memberships_batch(), 
+## --                                  get_cluster_influences_batch()
+## -- 2026-10-17  1.4.1     DA       Class ClusterAnalyzer: parameter p_spatial_index moved to the end
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.3.1 (2024-08-21)
+Ver. 1.4.1 (2026-10-17)
 
 This module provides a template class for online cluster analysis.
 """
 
 
+import sys
 from typing import List, Tuple
+import numpy as np
 from matplotlib.figure import Figure
 
 from mlpro.bf.events import Event as MLProEvent
@@ -57,8 +65,10 @@ from mlpro.bf.streams import Instance, InstDict
 from mlpro.bf.various import *
 from mlpro.bf.plot import *
 from mlpro.oa.streams import OAStreamTask
+from mlpro.bf.math import ESpace
 from mlpro.bf.math.normalizers import Normalizer
-from mlpro.oa.streams.tasks.clusteranalyzers.clusters import Cluster, ClusterId
+from mlpro.oa.streams.tasks.clusteranalyzers.clusters import Cluster, ClusterId, ClusterCentroid
+from mlpro.oa.streams.tasks.clusteranalyzers.index import CentroidIndex
 
 
 
@@ -97,6 +107,11 @@ class ClusterAnalyzer (OAStreamTask):
         Boolean switch for visualisation. Default = False.
     p_logging
         Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    p_spatial_index : int
+        Spatial index of the cluster centroids for the determination of cluster influences. See class
+        attributes C_SPATIAL_INDEX_* for possible values. The index is used for clusters with the
+        default influence of class ClusterCentroid in Euclidean feature spaces. Default = 
+        C_SPATIAL_INDEX_MATRIX.
     p_kwargs : dict
         Further optional named parameters.
 
@@ -108,6 +123,12 @@ class ClusterAnalyzer (OAStreamTask):
         Result scope, that includes just clusters with result values > 0
     C_RESULT_SCOPE_MAX : int = 2
         Result scope, that includes just the cluster with the highest result value.
+    C_SPATIAL_INDEX_NONE : int = 0
+        No spatial index. Each cluster is evaluated separately.
+    C_SPATIAL_INDEX_MATRIX : int = 1
+        Centroid matrix. The distances to all centroids are computed in one vectorized step.
+    C_SPATIAL_INDEX_KDTREE : int = 2
+        Centroid matrix plus KD-tree for the determination of the nearest centroid.
     C_CLUSTER_PROPERTIES : PropertyDefinitions
         List of cluster properties supported/maintained by the algorithm. These properties 
         are handed over to each new cluster.
@@ -126,6 +147,11 @@ class ClusterAnalyzer (OAStreamTask):
     C_RESULT_SCOPE_NONZERO : int    = 1
     C_RESULT_SCOPE_MAX : int        = 2
 
+    # Possible spatial indices of the cluster centroids
+    C_SPATIAL_INDEX_NONE : int      = 0
+    C_SPATIAL_INDEX_MATRIX : int    = 1
+    C_SPATIAL_INDEX_KDTREE : int    = 2
+
     # List of cluster properties supported/maintained by the algorithm
     C_CLUSTER_PROPERTIES : PropertyDefinitions = []
 
@@ -139,6 +165,7 @@ class ClusterAnalyzer (OAStreamTask):
                   p_duplicate_data: bool = False, 
                   p_visualize: bool = False, 
                   p_logging = Log.C_LOG_ALL, 
+                  p_spatial_index : int = C_SPATIAL_INDEX_MATRIX,
                   **p_kwargs ):
         
         super().__init__( p_name = p_name, 
@@ -158,6 +185,14 @@ class ClusterAnalyzer (OAStreamTask):
         for prop in self.C_CLUSTER_PROPERTIES:
             self._cluster_properties[prop[0]] = prop
 
+        # Spatial index for clusters with the default influence based on the centroid
+        if ( p_spatial_index != self.C_SPATIAL_INDEX_NONE ) and \
+           issubclass(p_cls_cluster, ClusterCentroid) and \
+           ( p_cls_cluster.get_influence is ClusterCentroid.get_influence ):
+            self._index = CentroidIndex( p_kdtree = p_spatial_index == self.C_SPATIAL_INDEX_KDTREE )
+        else:
+            self._index = None
+
 
 ## -------------------------------------------------------------------------------------------------
     def align_cluster_properties( self, p_properties : PropertyDefinitions ) -> list:
@@ -248,6 +283,14 @@ class ClusterAnalyzer (OAStreamTask):
 
         self._clusters[p_cluster.id] = p_cluster
 
+        if self._index is not None:
+            try:
+                p_cluster.centroid.set_index( p_index = self._index )
+            except AttributeError:
+                # Cluster without an indexable centroid: index is switched off
+                self.log(self.C_LOG_TYPE_W, 'Centroid of cluster', p_cluster.id, 'can not be indexed. Spatial index switched off.')
+                self._index = None
+
         if self.get_visualization(): 
             p_cluster.init_plot( p_figure=self._figure, p_plot_settings=self.get_plot_settings() )
 
@@ -270,6 +313,10 @@ class ClusterAnalyzer (OAStreamTask):
         p_cluster.remove_plot(p_refresh=True)
         del self._clusters[p_cluster.id]
 
+        if self._index is not None:
+            p_cluster.centroid.set_index( p_index = None )
+            self._index.remove( p_id = p_cluster.id )
+
         self._raise_event( p_event_id = self.C_EVENT_CLUSTER_REMOVED, 
                            p_event_object = MLProEvent( p_raising_object = self,
                                                         p_cluster = p_cluster ) )
@@ -303,6 +350,15 @@ class ClusterAnalyzer (OAStreamTask):
             value in [0,1] and a reference to the cluster object.
         """
 
+        # 0 Vectorized determination of cluster influences
+        if p_relation_type == 1:
+            feature_data = p_inst.get_feature_data()
+
+            if self._is_index_usable( p_set = feature_data.get_related_set() ):
+                return self._get_cluster_influences_vectorized( p_data = np.asarray(feature_data.get_values()).reshape(1,-1),
+                                                                p_scope = p_scope )[0]
+
+
         # 1 Determination of membership values of the instance for all clusters
         sum_results         = 0
         list_results_abs    = []
@@ -343,6 +399,67 @@ class ClusterAnalyzer (OAStreamTask):
 
         return list_results_rel
 
+
+## -------------------------------------------------------------------------------------------------
+    def _is_index_usable(self, p_set) -> bool:
+        """
+        Internal method to check whether the spatial index is complete and the distance of the given
+        feature space is Euclidean.
+        """
+
+        return ( self._index is not None ) and \
+               ( len(self._index) > 0 ) and \
+               ( len(self._index) == len(self._clusters) ) and \
+               ( getattr(type(p_set), 'distance', None) is ESpace.distance )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_cluster_influences_vectorized( self, 
+                                            p_data : np.ndarray,
+                                            p_scope : int ) -> List[List[ResultItem]]:
+        """
+        Internal method to determine the relative influences of all clusters on the given feature
+        data in one vectorized step. The results are the same as of method ClusterCentroid.get_influence().
+
+        Parameters
+        ----------
+        p_data : np.ndarray
+            Feature data with one instance per row.
+        p_scope : int
+            Scope of the result list. See class attributes C_RESULT_SCOPE_* for possible values.
+
+        Returns
+        -------
+        results : List[List[ResultItem]]
+            One list of result items per instance.
+        """
+
+        ids      = self._index.get_ids()
+        clusters = self._clusters
+
+        # 1 Cluster with highest influence = cluster with nearest centroid
+        if p_scope == self.C_RESULT_SCOPE_MAX:
+            rows, _ = self._index.get_nearest( p_points = p_data )
+            return [ [ ( ids[row], 1.0, clusters[ids[row]] ) ] for row in rows.tolist() ]
+
+        # 2 Influences of all clusters
+        with np.errstate(divide='ignore'):
+            influences = 1 / self._index.get_distances( p_points = p_data )
+        influences[np.isinf(influences)] = sys.float_info.max
+
+        sums      = influences.sum(axis=1, keepdims=True)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rel_influences = np.where( sums > 0, influences / sums, 0 )
+
+        results = []
+        for inst_infl, inst_rel in zip(influences.tolist(), rel_influences.tolist()):
+            if p_scope == self.C_RESULT_SCOPE_ALL:
+                results.append( [ ( cid, rel, clusters[cid] ) for cid, rel in zip(ids, inst_rel) ] )
+            else:
+                results.append( [ ( cid, rel, clusters[cid] ) for cid, infl, rel in zip(ids, inst_infl, inst_rel) if infl != 0 ] )
+
+        return results
+
     
 ## -------------------------------------------------------------------------------------------------
     def get_cluster_memberships( self, 
@@ -403,6 +520,63 @@ class ClusterAnalyzer (OAStreamTask):
                                             p_inst = p_inst,
                                             p_scope = p_scope )
 
+
+## -------------------------------------------------------------------------------------------------
+    def get_cluster_memberships_batch( self,
+                                       p_inst : List[Instance],
+                                       p_scope : int = C_RESULT_SCOPE_MAX ) -> List[List[ResultItem]]:
+        """
+        Batch variant of method get_cluster_memberships(). Since the membership depends on the shape
+        of the cluster body, the instances are evaluated one by one.
+
+        Parameters
+        ----------
+        p_inst : List[Instance]
+            Instances to be evaluated.
+        p_scope : int
+            Scope of the result lists. See class attributes C_RESULT_SCOPE_* for possible values. Default
+            value is C_RESULT_SCOPE_MAX.
+
+        Returns
+        -------
+        List[List[ResultItem]]
+            One list of membership items per instance. See method get_cluster_memberships().
+        """
+
+        return [ self.get_cluster_memberships( p_inst = inst, p_scope = p_scope ) for inst in p_inst ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_cluster_influences_batch( self,
+                                      p_inst : List[Instance],
+                                      p_scope : int = C_RESULT_SCOPE_MAX ) -> List[List[ResultItem]]:
+        """
+        Batch variant of method get_cluster_influences(). If the spatial index is usable, the 
+        influences on all instances are determined with one distance computation or one nearest 
+        neighbour query.
+
+        Parameters
+        ----------
+        p_inst : List[Instance]
+            Instances to be evaluated.
+        p_scope : int
+            Scope of the result lists. See class attributes C_RESULT_SCOPE_* for possible values. Default
+            value is C_RESULT_SCOPE_MAX.
+
+        Returns
+        -------
+        List[List[ResultItem]]
+            One list of influence items per instance. See method get_cluster_influences().
+        """
+
+        if len(p_inst) == 0: return []
+
+        if self._is_index_usable( p_set = p_inst[0].get_feature_data().get_related_set() ):
+            data = np.array( [ inst.get_feature_data().get_values() for inst in p_inst ], dtype=np.float64 )
+            return self._get_cluster_influences_vectorized( p_data = data, p_scope = p_scope )
+
+        return [ self.get_cluster_influences( p_inst = inst, p_scope = p_scope ) for inst in p_inst ]
+
         
 ## -------------------------------------------------------------------------------------------------
     def init_plot(self, p_figure: Figure = None, p_plot_settings: PlotSettings = None):
@@ -36,10 +36,11 @@
 ## --                                  depends on the shape of a cluster body
 ## --                                - implemented new method get_influence()
 ## -- 2024-06-18  1.3.0     DA       Removed method ClusterCentroid.__init__()
+## -- 2026-10-16  1.3.1     DA       Bugfix in ClusterCentroid.get_influence(): zero distance
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.3.0 (2024-06-18)
+Ver. 1.3.1 (2026-10-16)
 
 This module provides templates for cluster analysis to be used in the context of online adaptivity.
 """
@@ -92,7 +93,6 @@ class ClusterCentroid (Cluster):
 
         centroid_elem.set_values( p_values=self.centroid.value )
 
-        try:
-            return 1 / feature_data.get_related_set().distance( p_e1 = feature_data, p_e2 = centroid_elem )
-        except ZeroDivisionError:
-            return sys.float_info.max
\ No newline at end of file
+        distance = feature_data.get_related_set().distance( p_e1 = feature_data, p_e2 = centroid_elem )
+        if distance == 0: return sys.float_info.max
+        return 1 / distance
\ No newline at end of file
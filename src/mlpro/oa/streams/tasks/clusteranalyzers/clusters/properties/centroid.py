@@ -13,10 +13,11 @@
 ## -- 2024-06-26  0.6.0     DA       Refactoring
 ## -- 2024-07-13  0.7.0     DA       Refactoring
 ## -- 2024-10-31  0.8.0     DA       New parent class Crosshair
+## -- 2026-10-16  0.9.0     DA       Class Centroid: optional update of a spatial index on changes
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 0.8.0 (2024-10-31)
+Ver. 0.9.0 (2026-10-16)
 
 This module provides ...
 
@@ -46,6 +47,7 @@ class Centroid (Crosshair, Id):
     - optionally its velocity and acceleration as auto-derivatives
     - plot functionality
     - renormalization
+    - optional update of a spatial index of a cluster analyzer (see method set_index())
 
     Hint: please assign the id of the cluster to the centroid as well to get a proper visualization.
 
@@ -78,6 +80,8 @@ class Centroid (Crosshair, Id):
                   p_visualize : bool = False,
                   **p_kwargs ):
 
+        self._index = None
+
         Crosshair.__init__( self, 
                             p_name = p_name, 
                             p_derivative_order_max = p_derivative_order_max,
@@ -90,6 +94,50 @@ class Centroid (Crosshair, Id):
         self.color = None
 
 
+## -------------------------------------------------------------------------------------------------
+    def set_index(self, p_index):
+        """
+        Assigns a spatial index (see class CentroidIndex) that is updated whenever the centroid is 
+        moved or renormalized. The centroid is registered in the index with its id.
+
+        Parameters
+        ----------
+        p_index : CentroidIndex
+            Spatial index or None.
+        """
+
+        self._index = p_index
+        if ( p_index is not None ) and ( self._value is not None ): 
+            p_index.update( p_id = self.id, p_value = self._value )
+
+
+## -------------------------------------------------------------------------------------------------
+    def set( self, 
+             p_value, 
+             p_time_stamp = None,
+             p_upd_time_stamp : bool = True,
+             p_upd_derivatives : bool = True ):
+
+        Crosshair.set( self,
+                       p_value = p_value,
+                       p_time_stamp = p_time_stamp,
+                       p_upd_time_stamp = p_upd_time_stamp,
+                       p_upd_derivatives = p_upd_derivatives )
+        
+        if ( self._index is not None ) and ( self._value is not None ): 
+            self._index.update( p_id = self.id, p_value = self._value )
+
+
+## -------------------------------------------------------------------------------------------------
+    def renormalize(self, p_normalizer):
+        Crosshair.renormalize(self, p_normalizer = p_normalizer)
+        if self._index is not None: self._index.update( p_id = self.id, p_value = self._value )
+
+
+## -------------------------------------------------------------------------------------------------
+    value       = property( fget = Crosshair._get, fset = set )
+
+
 ## -------------------------------------------------------------------------------------------------
     def _init_plot_2d(self, p_figure: Figure, p_settings: PlotSettings):
         Crosshair._init_plot_2d(self, p_figure=p_figure, p_settings=p_settings)
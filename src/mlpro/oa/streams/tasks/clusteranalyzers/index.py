@@ -0,0 +1,215 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.oa.streams.tasks.clusteranalyzers
+## -- Module  : index.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  0.0.0     DA       Creation
+## -- 2026-10-16  1.0.0     DA       First release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module provides the spatial index CentroidIndex for the centroids of clusters. It enables
+vectorized distance computations and nearest neighbour queries in cluster analyzers.
+"""
+
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from mlpro.bf.exceptions import ParamError
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class CentroidIndex:
+    """
+    Spatial index for the centroids of clusters. The centroids are stored as rows of a preallocated
+    matrix in the order of their registration. The matrix is updated incrementally whenever a
+    centroid is added, moved or removed.
+
+    Optionally, nearest neighbour queries are answered by a KD-tree. Since a KD-tree can not be
+    updated incrementally, it is rebuilt lazily on the first query after a change of the centroids.
+
+    Parameters
+    ----------
+    p_kdtree : bool
+        If True, nearest neighbour queries are answered by a KD-tree. Default = False.
+    p_kdtree_min_size : int
+        Minimum number of centroids for the use of the KD-tree. Below this limit, the brute force
+        search in the centroid matrix is faster. Default = C_KDTREE_MIN_SIZE.
+    """
+
+    C_CAPACITY          = 64
+    C_KDTREE_MIN_SIZE   = 64
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_kdtree : bool = False,
+                  p_kdtree_min_size : int = C_KDTREE_MIN_SIZE ):
+
+        if p_kdtree_min_size < 1:
+            raise ParamError('Parameter p_kdtree_min_size needs to be greater than 0')
+
+        self._kdtree_on       = p_kdtree
+        self._kdtree_min_size = p_kdtree_min_size
+        self.clear()
+
+
+## -------------------------------------------------------------------------------------------------
+    def clear(self):
+        """
+        Removes all centroids.
+        """
+
+        self._rows      = {}
+        self._ids       = []
+        self._centroids = None
+        self._size      = 0
+        self._kdtree    = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def __len__(self):
+        return self._size
+
+
+## -------------------------------------------------------------------------------------------------
+    def __contains__(self, p_id):
+        return p_id in self._rows
+
+
+## -------------------------------------------------------------------------------------------------
+    def update(self, p_id, p_value):
+        """
+        Adds a new centroid or moves an existing one.
+
+        Parameters
+        ----------
+        p_id
+            Id of the related cluster.
+        p_value
+            Current position of the centroid.
+        """
+
+        value = np.asarray(p_value, dtype=np.float64).ravel()
+
+        try:
+            row = self._rows[p_id]
+        except KeyError:
+            if self._centroids is None:
+                self._centroids = np.empty((self.C_CAPACITY, value.size), dtype=np.float64)
+            elif self._size == self._centroids.shape[0]:
+                centroids = np.empty((2 * self._size, self._centroids.shape[1]), dtype=np.float64)
+                centroids[:self._size] = self._centroids
+                self._centroids = centroids
+
+            row = self._size
+            self._rows[p_id] = row
+            self._ids.append(p_id)
+            self._size += 1
+
+        self._centroids[row] = value
+        self._kdtree = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def remove(self, p_id):
+        """
+        Removes the centroid of a cluster. The order of the remaining centroids is kept.
+
+        Parameters
+        ----------
+        p_id
+            Id of the related cluster.
+        """
+
+        try:
+            row = self._rows.pop(p_id)
+        except KeyError:
+            return
+
+        self._centroids[row:self._size-1] = self._centroids[row+1:self._size]
+        del self._ids[row]
+        self._size -= 1
+
+        for i in range(row, self._size):
+            self._rows[self._ids[i]] = i
+
+        self._kdtree = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_ids(self) -> list:
+        """
+        Returns the cluster ids in the order of the rows of the centroid matrix.
+        """
+
+        return self._ids
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_centroids(self) -> np.ndarray:
+        """
+        Returns a view on the centroid matrix with one row per cluster.
+        """
+
+        if self._centroids is None: return np.empty((0,0))
+        return self._centroids[:self._size]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_distances(self, p_points : np.ndarray) -> np.ndarray:
+        """
+        Computes the Euclidean distances between the given points and all centroids.
+
+        Parameters
+        ----------
+        p_points : np.ndarray
+            Matrix with one point per row.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of distances with one row per point and one column per centroid.
+        """
+
+        diff = np.asarray(p_points, dtype=np.float64)[:, np.newaxis, :] - self.get_centroids()[np.newaxis, :, :]
+        return np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_nearest(self, p_points : np.ndarray):
+        """
+        Determines the nearest centroid of each given point.
+
+        Parameters
+        ----------
+        p_points : np.ndarray
+            Matrix with one point per row.
+
+        Returns
+        -------
+        rows : np.ndarray
+            Rows of the nearest centroids. See method get_ids().
+        distances : np.ndarray
+            Distances to the nearest centroids.
+        """
+
+        points = np.asarray(p_points, dtype=np.float64)
+
+        if self._kdtree_on and ( self._size >= self._kdtree_min_size ):
+            if self._kdtree is None:
+                self._kdtree = cKDTree(self.get_centroids().copy())
+
+            distances, rows = self._kdtree.query(points, k=1)
+            return rows, distances
+
+        distances = self.get_distances(points)
+        rows      = np.argmin(distances, axis=1)
+        return rows, distances[np.arange(points.shape[0]), rows]
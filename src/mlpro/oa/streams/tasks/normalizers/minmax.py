@@ -21,10 +21,12 @@
 ## -- 2024-07-12  1.3.2     LSB      Renormalization error
 ## -- 2024-10-29  1.3.3     DA       - Refactoring of NormalizerMinMax._adapt_on_event()
 ## --                                - Bugfix in NormalizerMinMax._update_plot_data_3d()
+## -- 2026-10-16  1.4.0     DA       New method NormalizerMinMax._run_batch()
+## -- 2026-10-16  1.5.0     DA       Lazy renormalization of plot data
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.3.3 (2024-10-29)
+Ver. 1.5.0 (2026-10-16)
 
 This module provides implementation for adaptive normalizers for MinMax Normalization.
 """
@@ -60,6 +62,7 @@ class NormalizerMinMax (OAStreamTask, Norm.NormalizerMinMax):
     """
 
     C_NAME = 'Normalizer MinMax' 
+    C_BATCH_NATIVE = True
 
 ## -------------------------------------------------------------------------------------------------
     def __init__(self,p_name: str = None,
@@ -81,12 +84,7 @@ class NormalizerMinMax (OAStreamTask, Norm.NormalizerMinMax):
 
 
         Norm.NormalizerMinMax.__init__(self)
-        self._parameters_updated:bool = None
-
-        if p_visualize:
-            self._plot_data_2d = None
-            self._plot_data_3d = None
-            self._plot_data_nd = None
+        self._plot_renormalizer = Norm.LazyRenormalizer()
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -108,6 +106,23 @@ class NormalizerMinMax (OAStreamTask, Norm.NormalizerMinMax):
             inst.get_feature_data().set_values(normalized_element.get_values())
 
 
+## -------------------------------------------------------------------------------------------------
+    def _run_batch(self, p_batch:InstanceBatch):
+        """
+        Normalizes all instances of a batch in place with one broadcasted operation.
+
+        Parameters
+        ----------
+        p_batch : InstanceBatch
+            Instances to be processed
+        """
+
+        if self._param is None:
+            self.update_parameters( p_set = p_batch.get_feature_set() )
+
+        self.normalize_batch( p_batch.get_feature_data() )
+
+
 ## -------------------------------------------------------------------------------------------------
     def _adapt_on_event(self, p_event_id:str, p_event_object:Event) -> bool:
         """
@@ -132,21 +147,29 @@ class NormalizerMinMax (OAStreamTask, Norm.NormalizerMinMax):
 
         self.update_parameters(set)
 
-        if self._visualize:
-            if self._plot_settings.view == PlotSettings.C_VIEW_2D:
-                self._update_plot_data_2d()
-            elif self._plot_settings.view == PlotSettings.C_VIEW_3D:
-                self._update_plot_data_3d()
-            elif self._plot_settings.view == PlotSettings.C_VIEW_ND:
-                self._update_plot_data_nd()
-            else:
-                raise Error
+        # Buffered plot data are renormalized lazily on the next plot update
+        if self._visualize: self._plot_renormalizer.add( p_normalizer = self )
 
         return True
 
 
 ## -------------------------------------------------------------------------------------------------
-    def _update_plot_data_2d(self):
+    def update_plot_data(self):
+        """
+        Applies the pending renormalizations to the buffered plot data.
+        """
+
+        if not self._plot_renormalizer.is_pending(): return
+
+        self._renormalize_plot_data( p_renormalizer = self._plot_renormalizer )
+        self._plot_renormalizer.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_plot_2d( self,
+                         p_settings : PlotSettings,
+                         p_inst : InstDict,
+                         **p_kwargs ):
         """
         Updates the 2d plot for Normalizer. Extended to renormalize the obsolete data on change of parameters.
 
@@ -159,33 +182,20 @@ class NormalizerMinMax (OAStreamTask, Norm.NormalizerMinMax):
         p_kwargs : dict
             Further optional plot parameters.
         """
-        try:
-            if len(self._plot_2d_xdata) != 0 and len(self._plot_2d_xdata):
-                if ( self._plot_data_2d is None ) or ( len(self._plot_2d_xdata) > self._plot_data_2d.shape[0] ):
-                    self._plot_data_2d = np.zeros((len(self._plot_2d_xdata),2))
-                ids = []
-                for i, (id, val) in enumerate(self._plot_2d_xdata.items()):
-                    ids.extend([id])
-                    self._plot_data_2d[i][0] = self._plot_2d_xdata[id]
-                    self._plot_data_2d[i][1] = self._plot_2d_ydata[id]
-
-                plot_data_renormalized = self.renormalize(self._plot_data_2d)
 
-                self._plot_2d_xdata = {}
-                self._plot_2d_ydata = {}
+        self.update_plot_data()
 
-                for i, data_2d in enumerate(plot_data_renormalized):
-                    self._plot_2d_xdata[ids[i]] = data_2d[0]
-                    self._plot_2d_ydata[ids[i]] = data_2d[1]
-
-
-                self._parameters_updated = False
-        except:
-            raise Error
+        OAStreamTask._update_plot_2d( self,
+                                p_settings = p_settings,
+                                p_inst = p_inst,
+                                **p_kwargs )
 
 
 ## -------------------------------------------------------------------------------------------------
-    def _update_plot_data_3d(self):
+    def _update_plot_3d( self,
+                         p_settings : PlotSettings,
+                         p_inst : InstDict,
+                         **p_kwargs ):
         """
         Method to update the 3d plot for Normalizer. Extended to renormalize the obsolete data on change of parameters.
 
@@ -199,35 +209,20 @@ class NormalizerMinMax (OAStreamTask, Norm.NormalizerMinMax):
             Further optional plot parameters.
 
         """
-        try:
-            if len(self._plot_3d_xdata) != 0:
-                if ( self._plot_data_3d is None ) or ( len(self._plot_3d_xdata) > self._plot_data_3d.shape[0] ):
-                    self._plot_data_3d = np.zeros((len(self._plot_3d_xdata),3))
-
-                ids = []
-                for i, (id,val) in enumerate(self._plot_3d_xdata.items()):
-                    ids.extend([id])
-                    self._plot_data_3d[i][0] = self._plot_3d_xdata[id]
-                    self._plot_data_3d[i][1] = self._plot_3d_ydata[id]
-                    self._plot_data_3d[i][2] = self._plot_3d_zdata[id]
 
-                plot_data_renormalized = self.renormalize(self._plot_data_3d)
-
-                self._plot_3d_xdata = {}
-                self._plot_3d_ydata = {}
-                self._plot_3d_zdata = {}
-
-                for i, data_3d in enumerate(plot_data_renormalized):
-                    self._plot_3d_xdata[ids[i]] = data_3d[0]
-                    self._plot_3d_ydata[ids[i]] = data_3d[1]
-                    self._plot_3d_zdata[ids[i]] = data_3d[2]
-        except:
-            pass
+        self.update_plot_data()
 
+        OAStreamTask._update_plot_3d( self,
+                                p_settings = p_settings,
+                                p_inst = p_inst,
+                                **p_kwargs )
 
 
 ## -------------------------------------------------------------------------------------------------
-    def _update_plot_data_nd(self):
+    def _update_plot_nd( self,
+                         p_settings : PlotSettings,
+                         p_inst : InstDict,
+                         **p_kwargs ):
         """
 
         Method to update the nd plot for Normalizer. Extended to renormalize the obsolete data on change of parameters.
@@ -242,18 +237,9 @@ class NormalizerMinMax (OAStreamTask, Norm.NormalizerMinMax):
             Further optional plot parameters.
         """
 
-        try:
-            if self._plot_nd_plots:
-                if ( self._plot_data_nd is None ) or ( len(self._plot_nd_plots[0][0]) > self._plot_data_nd.shape[0] ):
-                        self._plot_data_nd = np.zeros((len(self._plot_nd_plots[0][0]),len(self._plot_nd_plots)))
-                ids = []
-                for j in range(len(self._plot_nd_plots)):
-                    for i in range(len(self._plot_nd_plots[0][0])):
-                        self._plot_data_nd[i][j] = self._plot_nd_plots[j][0][i]
-
-                plot_data_renormalized = self.renormalize(self._plot_data_nd)
-
-                for j in range(len(self._plot_nd_plots)):
-                    self._plot_nd_plots[j][0] = list(k[j] for k in plot_data_renormalized)
-        except:
-            pass
\ No newline at end of file
+        self.update_plot_data()
+
+        OAStreamTask._update_plot_nd( self,
+                                p_settings = p_settings,
+                                p_inst = p_inst,
+                                **p_kwargs )
@@ -21,10 +21,12 @@
 ## -- 2024-05-27  1.3.2     LSB      Fixed Plotting
 ## -- 2024-05-28  1.3.3     LSB      Fixing the plotting bugs
 ## -- 2024-05-28  1.3.4     LSB      Fixed the denormalizing method when zero std
+## -- 2026-10-16  1.4.0     DA       New methods NormalizerZTransform._run_batch(), _adapt_batch()
+## -- 2026-10-16  1.5.0     DA       Lazy renormalization of plot data
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.3.4 (2024-05-27)
+Ver. 1.5.0 (2026-10-16)
 
 This module provides implementation for adaptive normalizers for ZTransformation
 """
@@ -60,6 +62,7 @@ class NormalizerZTransform (OAStreamTask, Norm.NormalizerZTrans):
     """
 
     C_NAME = 'Normalizer Z Transform'
+    C_BATCH_NATIVE = True
 
 ## -------------------------------------------------------------------------------------------------
     def __init__(self, p_name: str = None,
@@ -80,12 +83,8 @@ class NormalizerZTransform (OAStreamTask, Norm.NormalizerZTrans):
             **p_kwargs)
 
         Norm.NormalizerZTrans.__init__(self)
-        self._parameters_updated:bool = None
-        self._test_data = None
-        if p_visualize:
-            self._plot_data_2d = None
-            self._plot_data_3d = None
-            self._plot_data_nd = None
+        self._plot_renormalizer = Norm.LazyRenormalizer()
+
 
 ## -------------------------------------------------------------------------------------------------
     def _run(self, p_inst : InstDict):
@@ -108,13 +107,68 @@ class NormalizerZTransform (OAStreamTask, Norm.NormalizerZTrans):
             if self._param is None:
                 if inst_type == InstTypeNew:
                     self.update_parameters( p_data_new = feature_data )
-                    self.update_plot_data()
+                    self._add_plot_renormalization()
                 else:
                     self.update_parameters( p_data_del = feature_data )
-                    self.update_plot_data()
+                    self._add_plot_renormalization()
             feature_data.set_values( p_values = self.normalize(feature_data).get_values() )
 
 
+## -------------------------------------------------------------------------------------------------
+    def _run_batch(self, p_batch : InstanceBatch):
+        """
+        Vectorized variant of method _run(). The parameters are updated on the whole batch in one
+        step and all instances are normalized in place with one broadcasted operation.
+
+        Parameters
+        ----------
+        p_batch : InstanceBatch
+            Stream instances to be processed
+        """
+
+        # 1 Online update of transformation parameters
+        self.adapt( p_batch = p_batch )
+        feature_data = p_batch.get_feature_data()
+
+        if self._param is None:
+            if p_batch.get_new_mask()[0]:
+                self.update_parameters( p_data_new = feature_data[0] )
+            else:
+                self.update_parameters( p_data_del = feature_data[0] )
+            self._add_plot_renormalization()
+
+        # 2 Normalization of all instances
+        self.normalize_batch( feature_data )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt_batch(self, p_batch : InstanceBatch) -> bool:
+        """
+        Custom method for adapting of Z-transform parameters on all new and obsolete instances of a
+        batch in one step.
+
+        Parameters
+        ----------
+        p_batch : InstanceBatch
+            Instances to be adapted on.
+
+        Returns
+        -------
+        adapted : bool
+            Returns True, if task has adapted.
+        """
+
+        new          = p_batch.get_new_mask()
+        feature_data = p_batch.get_feature_data()
+        num_new      = np.count_nonzero(new)
+
+        self.update_parameters( p_data_new = feature_data[new] if num_new > 0 else None,
+                                p_data_del = feature_data[~new] if num_new < len(p_batch) else None )
+        self._add_plot_renormalization()
+
+        return True
+
+
 ## -------------------------------------------------------------------------------------------------
     def _adapt(self, p_inst_new : Instance) -> bool:
         """
@@ -133,8 +187,7 @@ class NormalizerZTransform (OAStreamTask, Norm.NormalizerZTrans):
         """
 
         self.update_parameters( p_data_new = p_inst_new.get_feature_data() )
-        self.update_plot_data()
-        self._parameters_updated = True
+        self._add_plot_renormalization()
 
         return True
 
@@ -157,37 +210,30 @@ class NormalizerZTransform (OAStreamTask, Norm.NormalizerZTrans):
         """
 
         self.update_parameters( p_data_del = p_inst_del.get_feature_data() )
-        self.update_plot_data()
-        self._parameters_updated = True
+        self._add_plot_renormalization()
 
         return True
 
 
 ## -------------------------------------------------------------------------------------------------
-    def _update_plot_data_2d(self):
+    def _add_plot_renormalization(self):
         """
-        Renormalizing the plot data.
+        Buffered plot data are renormalized lazily on the next plot update.
         """
-        if self._parameters_updated and (len(self._plot_2d_xdata) != 0):
 
-            if self._parameters_updated and (len(self._plot_2d_xdata) != 0):
+        if self._visualize: self._plot_renormalizer.add( p_normalizer = self )
 
-                if (self._plot_data_2d is None) or (len(self._plot_2d_xdata) > self._plot_data_2d.shape[0]):
-                    self._plot_data_2d = np.zeros((len(self._plot_2d_xdata), 2))
-                    self._parameters_updated = False
-                    # return
 
-            for i in range(len(self._plot_2d_xdata)):
-                self._plot_data_2d[i][0] = self._plot_2d_xdata[i]
-                self._plot_data_2d[i][1] = self._plot_2d_ydata[i]
-
-            plot_data_renormalized = self.renormalize(self._plot_data_2d)
+## -------------------------------------------------------------------------------------------------
+    def update_plot_data(self):
+        """
+        Applies the pending renormalizations to the buffered plot data.
+        """
 
-            for i, data_2d in enumerate(plot_data_renormalized):
-                self._plot_2d_xdata[i] = data_2d[0]
-                self._plot_2d_ydata[i] = data_2d[1]
+        if not self._plot_renormalizer.is_pending(): return
 
-            self._parameters_updated = False
+        self._renormalize_plot_data( p_renormalizer = self._plot_renormalizer )
+        self._plot_renormalizer.reset()
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -215,30 +261,6 @@ class NormalizerZTransform (OAStreamTask, Norm.NormalizerZTrans):
                                 p_inst = p_inst,
                                 **p_kwargs )
 
-## -------------------------------------------------------------------------------------------------
-    def _update_plot_data_3d(self):
-        if self._parameters_updated and (len(self._plot_3d_xdata) != 0):
-
-            if (self._plot_data_3d is None) or (len(self._plot_3d_xdata) > self._plot_data_3d.shape[0]):
-                self._plot_data_3d = np.zeros((len(self._plot_3d_xdata), 3))
-
-            for i in range(len(self._plot_3d_xdata)):
-                self._plot_data_3d[i][0] = self._plot_3d_xdata[i]
-                self._plot_data_3d[i][1] = self._plot_3d_ydata[i]
-                self._plot_data_3d[i][2] = self._plot_3d_zdata[i]
-
-            plot_data_renormalized = self.renormalize(self._plot_data_3d)
-
-            self._plot_3d_xdata = {}
-            self._plot_3d_ydata = {}
-            self._plot_3d_zdata = {}
-
-            for i, data_3d in enumerate(plot_data_renormalized):
-                self._plot_3d_xdata[i] = data_3d[0]
-                self._plot_3d_ydata[i] = data_3d[1]
-                self._plot_3d_zdata[i] = data_3d[2]
-
-            self._parameters_updated = False
 
 ## -------------------------------------------------------------------------------------------------
     def _update_plot_3d( self,
@@ -259,7 +281,7 @@ class NormalizerZTransform (OAStreamTask, Norm.NormalizerZTrans):
 
         """
 
-        self._update_plot_data_3d()
+        self.update_plot_data()
 
         OAStreamTask._update_plot_3d( self,
                                 p_settings = p_settings,
@@ -267,26 +289,6 @@ class NormalizerZTransform (OAStreamTask, Norm.NormalizerZTrans):
                                 **p_kwargs )
 
 
-## -------------------------------------------------------------------------------------------------
-    def _update_plot_data_nd(self):
-        if self._parameters_updated and self._plot_nd_plots:
-            if (len(self._plot_nd_plots[0][0])) != 0:
-
-                if (self._plot_data_nd is None) or (len(self._plot_nd_plots[0][0]) > self._plot_data_nd.shape[0]):
-                    self._plot_data_nd = np.zeros((len(self._plot_nd_plots[0][0]), len(self._plot_nd_plots)))
-
-                for j in range(len(self._plot_nd_plots)):
-                    for i in range(len(self._plot_nd_plots[0][0])):
-                        self._plot_data_nd[i][j] = self._plot_nd_plots[j][0][i]
-
-                plot_data_renormalized = self.renormalize(self._plot_data_nd)
-
-                for j in range(len(self._plot_nd_plots)):
-                    self._plot_nd_plots[j][0] = list(k[j] for k in plot_data_renormalized)
-
-                self._parameters_updated = False
-
-
 ## -------------------------------------------------------------------------------------------------
     def _update_plot_nd( self,
                          p_settings : PlotSettings,
@@ -306,29 +308,9 @@ class NormalizerZTransform (OAStreamTask, Norm.NormalizerZTrans):
             Further optional plot parameters.
         """
 
-        self._update_plot_data_nd()
+        self.update_plot_data()
 
         OAStreamTask._update_plot_nd( self,
                                 p_settings = p_settings,
                                 p_inst = p_inst,
                                 **p_kwargs )
-
-
-
-## -------------------------------------------------------------------------------------------------
-    def update_plot_data(self):
-        """
-        Updates the plot data.
-        """
-        try:
-            self._update_plot_data_2d()
-        except:
-            pass
-        try:
-            self._update_plot_data_3d()
-        except:
-            pass
-        try:
-            self._update_plot_data_nd()
-        except:
-            pass
\ No newline at end of file
@@ -7,10 +7,11 @@
 ## -- yyyy-mm-dd  Ver.      Auth.    Description
 ## -- 2023-05-30  1.0.0     LSB      Creation
 ## -- 2023-06-07  1.0.1     LSB      Refactoring due to removal of DP at BF-ML-Pool level
+## -- 2026-10-17  1.0.2     DA       Class DoublePendulumOA4: no batched state transitions
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.1 (2023-06-07)
+Ver. 1.0.2 (2026-10-17)
 
 This module provides the online adaptive extensions of the Double Pendulum System.
 
@@ -30,6 +31,9 @@ class DoublePendulumOA4(OASystem, DoublePendulumSystemS4):
 
     C_NAME = 'DoublePendulumOA4'
 
+    # The adaptive workflow of method simulate_reaction() is not batch-native
+    C_BATCH_NATIVE = False
+
     def __init__(self,
                  p_id = None,
                  p_name: str = None,
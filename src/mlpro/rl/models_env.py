@@ -44,10 +44,17 @@
 ## --                                to p_state_old
 ## -- 2023-02-13  1.7.3     MRD       Simplify State Space and Action Space generation
 ## -- 2023-05-30  1.7.4     LSB      Redefining the inheritence order in EnvBase to resolve MRO in OAEnv
+## -- 2026-10-16  1.8.0     DA       New class VecEnvironment
+## -- 2026-10-17  1.8.1     DA       - Class EnvBase: new method _complete_transition()
+## --                                - Class VecEnvironment: batch mode only for simulated copies with
+## --                                  default action processing
+## -- 2026-10-17  1.8.2     DA       Class VecEnvironment: batch mode check via System._is_batch_native()
+## -- 2026-10-17  1.8.3     DA       Class EnvBase: new methods compute_reward_batch() and
+## --                                _compute_reward_batch()
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.7.4 (2023-05-30)
+Ver. 1.8.3 (2026-10-17)
 
 This module provides model classes for environments.
 """
@@ -380,8 +387,30 @@ class EnvBase (FctReward, System):
         process_action() for further details.
         """
 
-        result = System._process_action( self, p_action=p_action)
+        state_old = self.get_state()
+        result    = System._process_action( self, p_action=p_action)
+        self._complete_transition(p_state_old=state_old, p_action=p_action)
+        return result
+
+
+## -------------------------------------------------------------------------------------------------
+    def _complete_transition(self, p_state_old: State, p_action: Action):
+        """
+        Completes a state transition after the new state has been set and evaluated. The previous
+        state and the action are stored, the cycle is counted and the new state is labelled as
+        timeout when the cycle limit is reached. A successful terminal state avoids the timeout
+        labelling.
+
+        Parameters
+        ----------
+        p_state_old : State
+            State before the transition.
+        p_action : Action
+            Processed action.
+        """
 
+        self._prev_state  = p_state_old
+        self._last_action = p_action
         self._num_cycles += 1
 
         cycle_limit = self.get_cycle_limit()
@@ -390,8 +419,6 @@ class EnvBase (FctReward, System):
         if not (state.get_terminal() and state.get_success()):
             state.set_timeout((cycle_limit > 0) and (self._num_cycles >= cycle_limit))
 
-        return result
-
 
 ## -------------------------------------------------------------------------------------------------
     def compute_reward(self, p_state_old: State = None, p_state_new: State = None) -> Reward:
@@ -440,6 +467,57 @@ class EnvBase (FctReward, System):
         return self._last_reward
 
 
+## -------------------------------------------------------------------------------------------------
+    def compute_reward_batch(self, p_states_old : np.ndarray, p_states_new : np.ndarray) -> np.ndarray:
+        """
+        Computes the overall rewards of a batch of state transitions. Environments that redefine the
+        custom method _compute_reward_batch() compute all rewards at once. Otherwise, or if an 
+        external reward function is used, the rewards are computed one by one by method 
+        compute_reward().
+
+        Parameters
+        ----------
+        p_states_old : np.ndarray
+            Matrix with one state vector before transition per row.
+        p_states_new : np.ndarray
+            Matrix with one state vector after transition per row.
+
+        Returns
+        -------
+        np.ndarray
+            Overall rewards of all transitions.
+        """
+
+        states_old = np.asarray(p_states_old, dtype=np.float64)
+        states_new = np.asarray(p_states_new, dtype=np.float64)
+
+        if ( self._fct_reward is None ) and ( type(self)._compute_reward_batch is not EnvBase._compute_reward_batch ):
+            return np.asarray(self._compute_reward_batch(states_old, states_new), dtype=np.float64)
+
+        state_space = self.get_state_space()
+        rewards     = np.empty(states_old.shape[0])
+
+        for i in range(states_old.shape[0]):
+            state_old = State(state_space)
+            state_old.set_values(states_old[i])
+            state_new = State(state_space)
+            state_new.set_values(states_new[i])
+            rewards[i] = self.compute_reward(p_state_old=state_old, p_state_new=state_new).get_overall_reward()
+
+        return rewards
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compute_reward_batch(self, p_states_old : np.ndarray, p_states_new : np.ndarray) -> np.ndarray:
+        """
+        Custom method for the overall rewards of a batch of state transitions. Redefine this method,
+        if the reward computation can be vectorized. See method compute_reward_batch() for further
+        details.
+        """
+
+        raise NotImplementedError
+
+
 
 
 
@@ -545,4 +623,212 @@ class Environment (EnvBase):
             return self.C_CYCLE_LIMIT
         else:
             # In real operation mode there is no cycle limit
-            return 0
\ No newline at end of file
+            return 0
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class VecEnvironment (Log):
+    """
+    Vectorized environment that holds N copies of an environment and steps them at once with a
+    matrix of actions. States, rewards and state labels are exchanged as numpy arrays with one row
+    per copy. Terminated copies are reset automatically.
+
+    If the environment class sets C_BATCH_NATIVE = True, the state transitions of all copies are
+    simulated at once by method System.simulate_reaction_batch(). This requires all copies to be in
+    simulation mode and to keep the default action processing of class EnvBase and the default
+    state transition of class System (see method System._is_batch_native()). Otherwise, each copy
+    processes its action on its own. Rewards are expected to be of type Reward.C_TYPE_OVERALL.
+
+    Parameters
+    ----------
+    p_envs : list
+        List of environment objects of the same kind.
+    p_auto_reset : bool
+        If True (default), copies in a terminal state are reset after each step.
+    p_logging 
+        Log level (see class Log for more details). Default = Log.C_LOG_ALL.
+    """
+
+    C_TYPE          = 'Vec Environment'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_envs : list,
+                  p_auto_reset : bool = True,
+                  p_logging = Log.C_LOG_ALL ):
+
+        if len(p_envs) == 0:
+            raise ParamError('Parameter p_envs needs to contain at least one environment')
+
+        self.C_NAME      = type(p_envs[0]).C_NAME
+        Log.__init__(self, p_logging=p_logging)
+
+        self._envs       = p_envs
+        self._auto_reset = p_auto_reset
+        self._states     = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def __len__(self):
+        return len(self._envs)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_envs(self) -> list:
+        return self._envs
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_state_space(self) -> MSpace:
+        return self._envs[0].get_state_space()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_action_space(self) -> MSpace:
+        return self._envs[0].get_action_space()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_states(self) -> np.ndarray:
+        """
+        Returns the current states of all copies, one state vector per row.
+        """
+
+        if self._states is None:
+            self._states = np.array([ env.get_state().get_values() for env in self._envs ], dtype=np.float64)
+        return self._states
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self, p_seed = None) -> np.ndarray:
+        """
+        Resets all copies.
+
+        Parameters
+        ----------
+        p_seed : int
+            Optional seed. Copy i is reset with seed p_seed + i.
+
+        Returns
+        -------
+        np.ndarray
+            Initial states of all copies, one state vector per row.
+        """
+
+        for i, env in enumerate(self._envs):
+            env.reset(p_seed = None if p_seed is None else p_seed + i)
+
+        self._states = None
+        return self.get_states()
+
+
+## -------------------------------------------------------------------------------------------------
+    def simulate_reaction(self, p_states : np.ndarray, p_actions : np.ndarray, p_t_step : timedelta = None) -> np.ndarray:
+        """
+        Simulates the state transitions of a batch of states and actions without changing the
+        copies. See method System.simulate_reaction_batch() for further details.
+        """
+
+        return self._envs[0].simulate_reaction_batch(p_states, p_actions, p_t_step)
+
+
+## -------------------------------------------------------------------------------------------------
+    def process_actions(self, p_actions : np.ndarray):
+        """
+        Processes one action per copy and computes the rewards and state labels. Afterwards, copies
+        in a terminal state are reset, if auto reset is active. Method get_states() then returns the
+        states after the reset.
+
+        Parameters
+        ----------
+        p_actions : np.ndarray
+            Matrix with one action vector per row.
+
+        Returns
+        -------
+        states : np.ndarray
+            Subsequent states of all copies before the auto reset, one state vector per row.
+        rewards : np.ndarray
+            Overall rewards of all copies.
+        success : np.ndarray
+            Boolean vector of the label 'success'.
+        broken : np.ndarray
+            Boolean vector of the label 'broken'.
+        timeout : np.ndarray
+            Boolean vector of the label 'timeout'.
+        """
+
+        num_envs = len(self._envs)
+        actions  = np.asarray(p_actions, dtype=np.float64).reshape(num_envs, -1)
+        rewards  = np.zeros(num_envs)
+        success  = np.zeros(num_envs, dtype=bool)
+        broken   = np.zeros(num_envs, dtype=bool)
+        timeout  = np.zeros(num_envs, dtype=bool)
+        native   = all( self._is_native(env) for env in self._envs )
+
+        # 1 State transition of all copies
+        if native:
+            states = self.simulate_reaction(self.get_states(), actions)
+        else:
+            states = np.empty_like(self.get_states())
+
+        # 2 Labels and rewards of the new states
+        for i, env in enumerate(self._envs):
+            action = Action(p_action_space=env.get_action_space(), p_values=actions[i])
+
+            if native:
+                state = State(env.get_state_space())
+                state.set_values(states[i])
+                self._process_state(env, state, action)
+            else:
+                env.process_action(action)
+                state = env.get_state()
+                states[i] = state.get_values()
+
+            rewards[i] = env.compute_reward().get_overall_reward()
+            success[i] = state.get_success()
+            broken[i]  = state.get_broken()
+            timeout[i] = state.get_timeout()
+
+        # 3 Auto reset of terminated copies
+        self._states = states.copy()
+
+        if self._auto_reset:
+            for i in np.flatnonzero(success | broken | timeout):
+                self._envs[i].reset()
+                self._states[i] = self._envs[i].get_state().get_values()
+
+        return states, rewards, success, broken, timeout
+
+
+## -------------------------------------------------------------------------------------------------
+    def _is_native(self, p_env : EnvBase) -> bool:
+        """
+        Checks whether the state transition of a copy can be simulated in batch mode. This requires
+        a batch-native state transition, the simulation mode and the default action processing of
+        class EnvBase.
+        """
+
+        env_cls = type(p_env)
+        return ( p_env._is_batch_native()
+                 and ( p_env.get_mode() == Mode.C_MODE_SIM )
+                 and ( env_cls.process_action is System.process_action )
+                 and ( env_cls._process_action is EnvBase._process_action ) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _process_state(self, p_env : EnvBase, p_state : State, p_action : Action):
+        """
+        Sets a state simulated in batch mode as the new state of a copy and labels it in the same
+        way as method EnvBase.process_action().
+        """
+
+        state_old = p_env.get_state()
+        p_env._set_state(p_state)
+        p_state.set_success(p_env.compute_success(p_state))
+        p_state.set_broken(p_env.compute_broken(p_state))
+        p_env._complete_transition(p_state_old=state_old, p_action=p_action)
@@ -50,10 +50,11 @@
 ## -- 2023-03-09  1.9.1     DA       Class RLTrainingResults: removed parameter p_path
 ## -- 2023-03-26  2.0.0     DA       Class RLScenario: refactoring persistence
 ## -- 2023-09-25  2.0.1     SY       Class RLScenario: debugging reward storing in _run_cycle 
+## -- 2026-10-16  2.0.2     DA       Method RLScenario._run_cycle(): lazy logging
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 2.0.1 (2023-09-25)
+Ver. 2.0.2 (2026-10-16)
 
 This module provides model classes to define and run rl scenarios and to train agents inside them.
 """
@@ -510,7 +511,8 @@ class RLScenario (Scenario):
 
 
         # 2 Agent: compute and log next action
-        self.log(self.C_LOG_TYPE_I, 'Process time', self._timer.get_time(), ': Agent computes action...')
+        log_i = self.is_enabled(self.C_LOG_TYPE_I)
+        if log_i: self.log(self.C_LOG_TYPE_I, 'Process time', self._timer.get_time(), ': Agent computes action...')
         action = self._agent.compute_action(state)
         ts = self._timer.get_time()
         action.set_tstamp(ts)
@@ -519,7 +521,7 @@ class RLScenario (Scenario):
 
 
         # 3 Environment: process agent's action
-        self.log(self.C_LOG_TYPE_I, 'Process time', self._timer.get_time(), ': Env processes action...')
+        if log_i: self.log(self.C_LOG_TYPE_I, 'Process time', self._timer.get_time(), ': Env processes action...')
         self._env.process_action(action)
         self._timer.add_time(self._env.get_latency())  # in virtual mode only...
         self._env.get_state().set_tstamp(self._timer.get_time())
@@ -549,7 +551,7 @@ class RLScenario (Scenario):
 
 
         # 5 Agent: adapt policy
-        self.log(self.C_LOG_TYPE_I, 'Process time', self._timer.get_time(), ': Agent adapts policy...')
+        if log_i: self.log(self.C_LOG_TYPE_I, 'Process time', self._timer.get_time(), ': Agent adapts policy...')
         adapted = self._agent.adapt(p_state=self._env.get_state(), p_reward=reward)
 
 
@@ -558,10 +560,10 @@ class RLScenario (Scenario):
         error = self._env.get_state().get_terminal()
 
         if success:
-            self.log(self.C_LOG_TYPE_S, 'Process time', self._timer.get_time(), ': Environment goal achieved')
+            self.log_lazy(self.C_LOG_TYPE_S, lambda: ('Process time', self._timer.get_time(), ': Environment goal achieved'))
 
         if error:
-            self.log(self.C_LOG_TYPE_E, 'Process time', self._timer.get_time(), ': Environment terminated')
+            self.log_lazy(self.C_LOG_TYPE_E, lambda: ('Process time', self._timer.get_time(), ': Environment terminated'))
 
         return success, error, adapted, end_of_data
 
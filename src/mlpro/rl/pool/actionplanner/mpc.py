@@ -10,10 +10,13 @@
 ## -- 2022-10-08  1.0.1     SY       Bug fixing
 ## -- 2023-01-02  1.1.0     SY       Add multiprocessing functionality
 ## -- 2023-02-04  1.1.1     SY       Bug fixing
+## -- 2026-10-16  1.2.0     DA       New batched planning mode with optional CEM/MPPI refinement
+## -- 2026-10-17  1.2.1     DA       Batched mode: rewards via EnvBase.compute_reward_batch()
+## -- 2026-10-17  1.2.2     DA       New parameter p_seed
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.1.1 (2023-02-04)
+Ver. 1.2.2 (2026-10-17)
 
 This module provides a default implementation of model predictive control (MPC).
 """
@@ -32,24 +35,60 @@ class MPC(ActionPlanner, ScientificObject, mt.Async):
     Template class for MPC to be used as part of model-based planning agents. 
     The goal is to find the best sequence of actions that leads to a maximum reward.
 
+    In batched mode, the actions of all candidate paths are sampled at once as a tensor of shape
+    (width, horizon, action dimensions). All candidates are then rolled out in lockstep by method
+    simulate_reaction_batch() of the environment model and their rewards are computed by method
+    compute_reward_batch(), so that the number of calls scales with the prediction horizon rather
+    than with width x horizon. Optionally, the sampling distribution can
+    be refined iteratively by the cross-entropy method (CEM) or by model predictive path integral
+    control (MPPI), reusing the same tensors. The best candidate found so far is always kept.
+
+    Please note: the lockstep rollout is only vectorized if the environment model simulates its
+    state transitions natively in batches (see method System._is_batch_native()). An EnvModel with
+    an adaptive state transition function falls back to a loop over the candidates in each step of
+    the prediction horizon. The batched mode still saves the Python overhead of the per-element
+    sampling, but the number of calls of the state transition function stays width x horizon.
+
     Parameters
     ----------
     p_range : int
-        Range of asynchonicity.
+        Range of asynchonicity. Not relevant in batched mode.
     p_state_thsld : float
         Threshold for metric difference between two states to be equal. Default = 0.00000001.
+    p_batched : bool
+        If True, all candidate paths are sampled and evaluated at once. Default = False.
+    p_refinement : int
+        Refinement method in batched mode. See constants C_REFINE_*. Default = C_REFINE_NONE.
+    p_num_iterations : int
+        Number of refinement iterations in batched mode. Default = 0.
+    p_elite_ratio : float
+        Ratio of elite candidates for refinement method C_REFINE_CEM. Default = 0.1.
+    p_temperature : float
+        Temperature of the path weights for refinement method C_REFINE_MPPI. Default = 1.0.
     p_logging
         Log level (see constants of class Log). Default = Log.C_LOG_ALL.
+    p_seed : int
+        Optional seed of the random generator for the sampling in batched mode. Default = None.
 
     """
 
-    C_TYPE = 'Model Predictive Control'
+    C_TYPE          = 'Model Predictive Control'
+
+    C_REFINE_NONE   = 0
+    C_REFINE_CEM    = 1
+    C_REFINE_MPPI   = 2
 
 ## -------------------------------------------------------------------------------------------------
     def __init__(self,
                  p_range_max=mt.Async.C_RANGE_NONE,
                  p_state_thsld=0.00000001,
-                 p_logging=Log.C_LOG_ALL):
+                 p_batched : bool = False,
+                 p_refinement : int = C_REFINE_NONE,
+                 p_num_iterations : int = 0,
+                 p_elite_ratio : float = 0.1,
+                 p_temperature : float = 1.0,
+                 p_logging=Log.C_LOG_ALL,
+                 p_seed : int = None):
         
         self.C_SCIREF_TYPE          = self.C_SCIREF_TYPE_ARTICLE
         self.C_SCIREF_AUTHOR        = "Grady Williams, Nolan Wagener, Brian Goldfain, Paul Drews, James M. Rehg, Byron Boots, Evangelos A. Theodorou"
@@ -67,6 +106,25 @@ class MPC(ActionPlanner, ScientificObject, mt.Async):
                           p_class_shared=mt.Shared,
                           p_logging=p_logging)
 
+        if p_refinement not in [ self.C_REFINE_NONE, self.C_REFINE_CEM, self.C_REFINE_MPPI ]:
+            raise ParamError('Invalid refinement method ' + str(p_refinement))
+
+        if p_num_iterations < 0:
+            raise ParamError('Parameter p_num_iterations must not be negative')
+
+        if ( p_elite_ratio <= 0 ) or ( p_elite_ratio > 1 ):
+            raise ParamError('Parameter p_elite_ratio must be in the interval (0, 1]')
+
+        if p_temperature <= 0:
+            raise ParamError('Parameter p_temperature needs to be greater than 0')
+
+        self._batched        = p_batched
+        self._refinement     = p_refinement
+        self._num_iterations = p_num_iterations if p_refinement != self.C_REFINE_NONE else 0
+        self._elite_ratio    = p_elite_ratio
+        self._temperature    = p_temperature
+        self._rng            = np.random.default_rng(p_seed)
+
 
 ## -------------------------------------------------------------------------------------------------
     def _plan_action(self, p_obs: State) -> SARSBuffer:
@@ -87,6 +145,9 @@ class MPC(ActionPlanner, ScientificObject, mt.Async):
 
         """
         
+        if self._batched:
+            return self._plan_action_batch(p_obs)
+
         if self._range == self.C_RANGE_NONE: 
             # initialize variable to store best path and its predicted overall reward
             best_path = None
@@ -142,6 +203,147 @@ class MPC(ActionPlanner, ScientificObject, mt.Async):
                 
         return best_path
 
+
+## -------------------------------------------------------------------------------------------------
+    def _get_action_boundaries(self):
+        """
+        Determines the boundaries and the integer property of all action dimensions.
+
+        Returns
+        -------
+        lower : np.ndarray
+            Lower boundaries.
+        upper : np.ndarray
+            Upper boundaries.
+        integer : np.ndarray
+            Boolean mask of the integer dimensions (base set Z or N).
+        """
+
+        action_space = self._envmodel._action_space
+        num_dim      = action_space.get_num_dim()
+        lower        = np.zeros(num_dim)
+        upper        = np.zeros(num_dim)
+        integer      = np.zeros(num_dim, dtype=bool)
+
+        for d, dim_id in enumerate(action_space.get_dim_ids()):
+            try:
+                base_set = action_space.get_dim(dim_id).get_base_set()
+            except:
+                raise ParamError('Mandatory base set is not defined.')
+
+            try:
+                boundaries = action_space.get_dim(dim_id).get_boundaries()
+                if len(boundaries) == 1:
+                    upper[d] = boundaries[0]
+                else:
+                    lower[d] = boundaries[0]
+                    upper[d] = boundaries[1]
+            except:
+                raise ParamError('Mandatory boundaries are not defined.')
+
+            integer[d] = ( base_set == 'Z' ) or ( base_set == 'N' )
+
+        return lower, upper, integer
+
+
+## -------------------------------------------------------------------------------------------------
+    def _rollout_batch(self, p_obs_values : np.ndarray, p_actions : np.ndarray):
+        """
+        Rolls out all candidate paths in lockstep.
+
+        Parameters
+        ----------
+        p_obs_values : np.ndarray
+            Values of the initial observation.
+        p_actions : np.ndarray
+            Actions of all candidates of shape (width, horizon, action dimensions).
+
+        Returns
+        -------
+        states : np.ndarray
+            States of all candidates of shape (width, horizon + 1, state dimensions).
+        returns : np.ndarray
+            Overall rewards of all candidates.
+        """
+
+        width, horizon = p_actions.shape[0], p_actions.shape[1]
+        states         = np.empty((width, horizon + 1, len(p_obs_values)))
+        states[:, 0]   = p_obs_values
+        returns        = np.zeros(width)
+
+        for pred in range(horizon):
+            states[:, pred + 1] = self._envmodel.simulate_reaction_batch(states[:, pred], p_actions[:, pred])
+            returns += self._envmodel.compute_reward_batch(states[:, pred], states[:, pred + 1])
+
+        return states, returns
+
+
+## -------------------------------------------------------------------------------------------------
+    def _plan_action_batch(self, p_obs: State) -> SARSBuffer:
+        """
+        Batched planning algorithm. See class description for further details.
+
+        Parameters
+        ----------
+        p_obs : State
+            Observation data.
+
+        Returns
+        -------
+        action_path : SARSBuffer
+            Sequence of SARSElement objects with included actions that lead to the best possible reward.
+        """
+
+        # 1 Random shooting: all candidate paths at once
+        lower, upper, integer = self._get_action_boundaries()
+        shape   = (self._width_limit, self._prediction_horizon, len(lower))
+        actions = self._rng.uniform(lower, upper, size=shape)
+        actions[..., integer] = self._rng.integers(lower[integer], upper[integer] + 1, size=shape[:2] + (np.count_nonzero(integer),))
+
+        obs_values      = np.asarray(p_obs.get_values(), dtype=np.float64)
+        states, returns = self._rollout_batch(obs_values, actions)
+        best            = np.argmax(returns)
+        best_actions, best_states, best_return = actions[best].copy(), states[best].copy(), returns[best]
+
+        # 2 Optional refinement of the sampling distribution
+        num_elites = max(1, int(round(self._elite_ratio * self._width_limit)))
+
+        for i in range(self._num_iterations):
+            if self._refinement == self.C_REFINE_CEM:
+                elites = np.argpartition(returns, -num_elites)[-num_elites:]
+                mean   = np.mean(actions[elites], axis=0)
+                std    = np.std(actions[elites], axis=0)
+            else:
+                weights = np.exp( ( returns - np.max(returns) ) / self._temperature )
+                weights /= np.sum(weights)
+                mean    = np.tensordot(weights, actions, axes=1)
+                std     = np.sqrt(np.tensordot(weights, ( actions - mean ) ** 2, axes=1))
+
+            actions[:] = self._rng.normal(mean, std, size=shape)
+            actions[..., integer] = np.round(actions[..., integer])
+            np.clip(actions, lower, upper, out=actions)
+            actions[0] = best_actions
+
+            states, returns = self._rollout_batch(obs_values, actions)
+            best = np.argmax(returns)
+            if returns[best] > best_return:
+                best_actions, best_states, best_return = actions[best].copy(), states[best].copy(), returns[best]
+
+        # 3 Action path of the best candidate
+        state_space = self._envmodel.get_state_space()
+        path        = SARSBuffer(p_size=self._prediction_horizon)
+        state       = p_obs
+
+        for pred in range(self._prediction_horizon):
+            action     = Action(pred, self._envmodel._action_space, best_actions[pred])
+            next_state = State(state_space)
+            next_state.set_values(best_states[pred + 1])
+            reward     = self._envmodel.compute_reward(p_state_old=state, p_state_new=next_state)
+            path.add_element(SARSElement(state, action, reward, next_state))
+            state      = next_state
+
+        return path
+
     
 ## -------------------------------------------------------------------------------------------------
     def execute(self, **p_kwargs):
@@ -71,10 +71,12 @@
 ## -- 2023-05-30  3.0.0     LSB      Adaptive Extensions for Double Pendulum:
 ##                                       - DoublePendulumA4
 ##                                       - DoublePendulumA7
+## -- 2026-10-16  3.1.0     DA       Class DoublePendulumRoot: new parameter p_integrator
+## -- 2026-10-17  3.1.1     DA       Class DoublePendulumRoot: parameter p_integrator moved to the end
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 3.0.0 (2023-05-30)
+Ver. 3.1.1 (2026-10-17)
 
 The Double Pendulum environment is an implementation of a classic control problem of Double Pendulum system. The
 dynamics of the system are based on the `Double Pendulum <https://matplotlib.org/stable/gallery/animation/double_pendulum.html>`_  implementation by
@@ -178,6 +180,8 @@ class DoublePendulumRoot (DoublePendulumSystemRoot, Environment):
         Boolean value stating whether the environment shall be broken outside the balancing region
     p_logging
         Log level (see constants of class mlpro.bf.various.Log). Default = Log.C_LOG_WE.
+    p_integrator : str
+        Integrator of the equations of motion. See class DoublePendulumSystemRoot. Default = C_INTEGRATOR_ODEINT.
     """
 
 
@@ -236,7 +240,8 @@ class DoublePendulumRoot (DoublePendulumSystemRoot, Environment):
                    p_balancing_range:list = (-0.2,0.2),
                    p_swinging_outer_pole_range = (0.2,0.5),
                    p_break_swinging:bool = False,
-                   p_logging=Log.C_LOG_ALL ):
+                   p_logging=Log.C_LOG_ALL,
+                   p_integrator = DoublePendulumSystemRoot.C_INTEGRATOR_ODEINT ):
 
 
         DoublePendulumSystemRoot.__init__(self,p_id = p_id,
@@ -259,6 +264,7 @@ class DoublePendulumRoot (DoublePendulumSystemRoot, Environment):
                          p_balancing_range = p_balancing_range,
                          p_swinging_outer_pole_range = p_swinging_outer_pole_range,
                          p_break_swinging = p_break_swinging,
+                         p_integrator = p_integrator,
                          p_visualize = p_visualize,
                          p_logging = p_logging)
 
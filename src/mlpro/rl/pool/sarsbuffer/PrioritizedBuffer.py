@@ -9,21 +9,34 @@
 ## -- 2021-09-22  1.0.0     WB       Added PrioritizedBuffer Class and PrioritizedBufferElement,
 ## --                                including the required SegmentTree data structure
 ## -- 2021-09-26  1.0.1     WB       Bug Fix 
+## -- 2026-10-16  1.1.0     DA       - Segment trees backed by numpy arrays with batched retrieval
+## --                                  and batched leaf updates
+## --                                - PrioritizedBuffer: batched sampling, priority updates and
+## --                                  importance-sampling weights
+## --                                - Bug fixes in sampling and importance-sampling weights
+## -- 2026-10-16  1.2.0     DA       Adjustments to the ring storage of class Buffer
+## -- 2026-10-17  1.2.1     DA       - PrioritizedBuffer: sampling distribution of version 1.0.1 restored
+## --                                - New parameter p_seed for an own random generator
+## -- 2026-10-17  1.3.0     DA       PrioritizedBuffer: bug fixes in sampling and importance-sampling
+## --                                weights
+## -- 2026-10-17  1.3.1     DA       New parameter p_as_array of class Buffer
+## -- 2026-10-17  1.3.2     DA       PrioritizedBuffer: sampling distribution and importance-sampling
+## --                                weights of version 1.2.1 restored
 ## -------------------------------------------------------------------------------------------------
 ## -- Reference
 ## -- https://github.com/openai/baselines/blob/master/baselines/deepq/replay_buffer.py
 
 
 """
-Ver. 1.0.1 (2021-09-26)
+Ver. 1.3.2 (2026-10-17)
 
-This module provides the Prioritized Buffer based on the reference.
+This module provides the Prioritized Buffer based on the reference. The underlying segment trees are
+stored in numpy arrays, so that all samples of a batch are retrieved and all priorities of a batch
+are updated level by level in a few vectorized operations.
 """
 
 import numpy as np
 from typing import List, Callable
-import random
-import operator
 from mlpro.rl.models import *
 
 
@@ -47,13 +60,14 @@ class PrioritizedBuffer(SARSBuffer):
     
     
 ## -------------------------------------------------------------------------------------------------
-    def __init__(self, p_size=1, alpha: float=0.3, beta: float=1):
+    def __init__(self, p_size=1, alpha: float=0.3, beta: float=1, p_seed=None):
     
         """
         Parameters:
             p_size (int, optional): Buffer size. Defaults to 1.
             alpha (float, optional): Prioritization level. Defaults to 0.3
             beta (float, optional): Prioritization Control. Defaults to 1. Should be increased gradualy to 1 by the end of training.
+            p_seed (int, optional): Seed of the random generator used for sampling. Defaults to None.
         """
         assert alpha >= 0
         assert beta >= 0
@@ -69,6 +83,7 @@ class PrioritizedBuffer(SARSBuffer):
         self.sum_tree = SumSegmentTree(tree_capacity)
         self.min_tree = MinSegmentTree(tree_capacity)
         self.max_priority = 1.0
+        self._rng = np.random.default_rng(p_seed)
     
     
 ## -------------------------------------------------------------------------------------------------    
@@ -88,7 +103,8 @@ class PrioritizedBuffer(SARSBuffer):
 ## -------------------------------------------------------------------------------------------------
     def _gen_sample_ind(self, p_num:int) -> list:
         """
-        Generate random indices from the buffer.
+        Generate random storage slots from the buffer. One upper bound is drawn uniformly from each
+        of p_num consecutive segments and all upper bounds are retrieved at once.
 
         Parameters:
             p_num (int): Number of sample
@@ -98,40 +114,33 @@ class PrioritizedBuffer(SARSBuffer):
         """
         buffer_length = len(self._data_buffer)
         p_sum = self.sum_tree.sum(0, buffer_length-1)
-        p_list_idx = []
         segment = p_sum / buffer_length
-        for i in range(p_num):
-            a = segment*i
-            b = segment*(i+1)
-            upperbound = random.uniform(a, b)
-            idx = self.sum_tree.retrieve(upperbound)
-            p_list_idx.append(idx)
-        return p_list_idx
+        upperbounds = segment * ( np.arange(p_num) + self._rng.uniform(size=p_num) )
+        assert upperbounds.size == 0 or upperbounds.max() <= self.sum_tree.sum() + 1e-5, "upperbound: {}".format(upperbounds.max())
+        return self.sum_tree.retrieve_batch(upperbounds).tolist()
         
 
 ## -------------------------------------------------------------------------------------------------
-    def _extract_rows(self, p_list_idx:list):
+    def _extract_rows(self, p_list_idx:list, p_as_array:bool=False):
         """
         Extract the element in the buffer based on a
         list of indices.
 
         Parameters:
             p_list_idx (list): List of indices
+            p_as_array (bool): If True, numerical fields are returned as numpy arrays. Default = False.
 
         Returns:
             Samples in dictionary
         """
-        rows = {}
-        for key in self._data_buffer:
-            rows[key] = [self._data_buffer[key][i] for i in p_list_idx]
-        p_sample = []
+        rows = super()._extract_rows(p_list_idx, p_as_array=p_as_array)
         buffer_length = len(self._data_buffer)
         
-        p_min = self.min_tree.min()/self.sum_tree.sum()
+        p_sum = self.sum_tree.sum()
+        p_min = self.min_tree.min()/p_sum
         max_weight = (p_min*buffer_length)**(-self.beta)
-        for idx in p_list_idx:
-            p_sample.append(self.sum_tree[idx]/self.sum_tree.sum())
-        weights = (np.array(p_sample*buffer_length)**(-self.beta))/max_weight
+        p_sample = self.sum_tree.get_values(p_list_idx)/p_sum
+        weights = (np.tile(p_sample, buffer_length)**(-self.beta))/max_weight
         
         rows['weights'] = list(weights)
         rows['p_list_idx'] = p_list_idx
@@ -145,18 +154,18 @@ class PrioritizedBuffer(SARSBuffer):
         Returns latest buffered element. 
         """
         try:
-            return self._extract_rows([len(self._data_buffer)-1])
+            return self._extract_rows([self._get_latest_ind()])
         except:
             return None
         
         
 ## -------------------------------------------------------------------------------------------------
-    def get_all(self):
+    def get_all(self, p_as_array:bool=False):
         """
         Return all buffered elements.
         """
-        p_list_idx = [i for i in range(len(self._data_buffer))]
-        return self._extract_rows(p_list_idx)
+        p_list_idx = self._get_ordered_ind().tolist()
+        return self._extract_rows(p_list_idx, p_as_array=p_as_array)
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -165,15 +174,16 @@ class PrioritizedBuffer(SARSBuffer):
         Updates the priority tree.
         Needs to be called during each training step, utilising the element-wise calculated loss.
         """
+        p_list_idx = np.asarray(p_list_idx, dtype=np.int64)
+        priorities = np.asarray(priorities, dtype=np.float64).ravel()
         assert len(p_list_idx) == len(priorities)
         assert np.min(priorities) > 0 
-        assert min(p_list_idx) >= 0
-        assert max(p_list_idx) <= len(self._data_buffer)
+        assert np.min(p_list_idx) >= 0
+        assert np.max(p_list_idx) <= len(self._data_buffer)
         
         new_priorities = priorities**self.alpha
-        for i in range(len(p_list_idx)):
-            self.sum_tree[p_list_idx[i]] = new_priorities[i]
-            self.min_tree[p_list_idx[i]] = new_priorities[i]
+        self.sum_tree.set_values(p_list_idx, new_priorities)
+        self.min_tree.set_values(p_list_idx, new_priorities)
         
         self.max_priority = max(self.max_priority, np.max(new_priorities))
 
@@ -184,10 +194,14 @@ class SegmentTree:
     """ 
     Reference:
     https://github.com/openai/baselines/blob/master/baselines/common/segment_tree.py
+
+    The nodes are stored in a numpy array. Node 1 is the root, the children of node i are the nodes
+    2i and 2i+1 and the leaves are the nodes capacity, ..., 2*capacity-1.
+
     Attributes:
         capacity (int)
-        tree (list)
-        operation (function)
+        tree (np.ndarray)
+        operation (np.ufunc): Binary numpy ufunc, e.g. np.add or np.minimum
     """
 
 
@@ -197,7 +211,7 @@ class SegmentTree:
             capacity > 0 and capacity & (capacity - 1) == 0
         ), "capacity must be positive and a power of 2."
         self.capacity = capacity
-        self.tree = [init_value for _ in range(2 * capacity)]
+        self.tree = np.full(2 * capacity, init_value, dtype=np.float64)
         self.operation = operation
         
         
@@ -228,7 +242,10 @@ class SegmentTree:
             end += self.capacity
         end -= 1
 
-        return self._operate_helper(start, end, 1, 0, self.capacity - 1)
+        if ( start == 0 ) and ( end == self.capacity - 1 ):
+            return float(self.tree[1])
+
+        return float(self._operate_helper(start, end, 1, 0, self.capacity - 1))
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -248,7 +265,34 @@ class SegmentTree:
         """Get real value in leaf node of tree."""
         assert 0 <= idx < self.capacity
 
-        return self.tree[self.capacity + idx]
+        return float(self.tree[self.capacity + idx])
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_values(self, idx, val):
+        """
+        Sets the values of several leaves at once. The parent nodes are recomputed level by level,
+        each level in one vectorized operation. If an index occurs more than once, the last value
+        is taken.
+
+        Parameters:
+            idx (array-like): Indices of the leaves
+            val (array-like): New values of the leaves
+        """
+        nodes = np.asarray(idx, dtype=np.int64).ravel() + self.capacity
+        if nodes.size == 0: return
+        self.tree[nodes] = val
+
+        nodes = np.unique(nodes // 2)
+        while nodes[-1] >= 1:
+            self.tree[nodes] = self.operation(self.tree[2 * nodes], self.tree[2 * nodes + 1])
+            nodes = np.unique(nodes // 2)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_values(self, idx) -> np.ndarray:
+        """Get real values in several leaf nodes of tree."""
+        return self.tree[np.asarray(idx, dtype=np.int64) + self.capacity]
         
         
 ## -------------------------------------------------------------------------------------------------
@@ -263,32 +307,45 @@ class SumSegmentTree(SegmentTree):
 ## -------------------------------------------------------------------------------------------------
     def __init__(self, capacity: int):
         super(SumSegmentTree, self).__init__(
-            capacity=capacity, operation=operator.add, init_value=0.0
+            capacity=capacity, operation=np.add, init_value=0.0
         )
 
 
 ## -------------------------------------------------------------------------------------------------
     def sum(self, start: int = 0, end: int = 0) -> float:
-        """Returns arr[start] + ... + arr[end]."""
+        """Returns arr[start] + ... + arr[end-1]."""
         return super(SumSegmentTree, self).operate(start, end)
 
 
 ## -------------------------------------------------------------------------------------------------
     def retrieve(self, upperbound: float) -> int:
         """Find the highest index `i` about upper bound in the tree"""
-        # TODO: Check assert case and fix bug
         assert 0 <= upperbound <= self.sum() + 1e-5, "upperbound: {}".format(upperbound)
 
-        idx = 1
+        return int(self.retrieve_batch(np.array([upperbound]))[0])
+
+
+## -------------------------------------------------------------------------------------------------
+    def retrieve_batch(self, upperbounds: np.ndarray) -> np.ndarray:
+        """
+        Finds the leaf indices for several upper bounds at once. All upper bounds descend the tree
+        in lockstep, one vectorized step per level.
+
+        Parameters:
+            upperbounds (np.ndarray): Prefix sums in [0, sum()]
+
+        Returns:
+            Array of leaf indices
+        """
+        upperbounds = np.array(upperbounds, dtype=np.float64)
+        idx = np.ones(upperbounds.shape, dtype=np.int64)
 
-        while idx < self.capacity:  # while non-leaf
+        for level in range(self.capacity.bit_length() - 1):  # while non-leaf
             left = 2 * idx
-            right = left + 1
-            if self.tree[left] > upperbound:
-                idx = 2 * idx
-            else:
-                upperbound -= self.tree[left]
-                idx = right
+            left_values = self.tree[left]
+            right = left_values <= upperbounds
+            upperbounds -= np.where(right, left_values, 0.0)
+            idx = left + right
         return idx - self.capacity
         
         
@@ -304,11 +361,11 @@ class MinSegmentTree(SegmentTree):
 ## -------------------------------------------------------------------------------------------------
     def __init__(self, capacity: int):
         super(MinSegmentTree, self).__init__(
-            capacity=capacity, operation=min, init_value=float("inf")
+            capacity=capacity, operation=np.minimum, init_value=float("inf")
         )
 
 
 ## -------------------------------------------------------------------------------------------------
     def min(self, start: int = 0, end: int = 0) -> float:
-        """Returns min(arr[start], ...,  arr[end])."""
-        return super(MinSegmentTree, self).operate(start, end)
\ No newline at end of file
+        """Returns min(arr[start], ...,  arr[end-1])."""
+        return super(MinSegmentTree, self).operate(start, end)
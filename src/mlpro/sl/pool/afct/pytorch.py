@@ -19,10 +19,11 @@
 ## -- 2023-06-20  3.0.5     LSB       Updating the sampling method
 ## -- 2023-07-02  3.0.6     LSB       Refactoring the postproc and preproc methods
 ## -- 2023-07-14  3.0.7     LSB       Bug Fix
+## -- 2026-10-16  3.0.8     DA        PyTorchBuffer: adjustments to the ring storage of class Buffer
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 3.0.7 (2023-07-14)
+Ver. 3.0.8 (2026-10-16)
 
 This a helper module for supervised learning models using PyTorch. 
 """
@@ -145,7 +146,7 @@ class PyTorchBuffer (Buffer, torch.utils.data.Dataset):
             data.
         """
 
-        dataset_size    = len(self._data_buffer["input"])
+        dataset_size    = len(self)
         indices         = list(range(dataset_size))
         split           = int(np.floor(self._testing_data*dataset_size))
         np.random.shuffle(indices)
@@ -7,10 +7,11 @@
 ## -- yyyy-mm-dd  Ver.      Auth.    Description
 ## -- 2021-10-26  1.0.0     SY       Creation/Release
 ## -- 2023-03-02  1.0.1     LSB      Refactoring
+## -- 2026-10-16  1.1.0     DA       Batch insertion
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.1 (2023-03-02)
+Ver. 1.1.0 (2026-10-16)
 
 This module demonstrates how to use classes Buffer and BufferElement.
 
@@ -23,6 +24,8 @@ You will learn:
 2. How to add buffer elements with data to the buffer object.
 
 3. How to get the buffer elements and data from a buffer object and clear a buffer object.
+
+4. How to add a batch of data to a buffer object at once.
 """
 
 
@@ -77,3 +80,9 @@ if __name__ == "__main__":
         buffer.clear()
         print('Buffer is cleared!')
 
+
+    # 4 Add a batch of data at once, one element per row
+    buffer.add_batch({"reward":[random.uniform(-10,10) for i in range(num_cycles)],
+                      "actions":[[random.uniform(0,1),random.uniform(0,1)] for i in range(num_cycles)]})
+    print('Batch added, buffer contains %.i elements!'%len(buffer))
+
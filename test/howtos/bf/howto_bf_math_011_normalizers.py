@@ -13,10 +13,12 @@
 ## -- 2022-11-03  1.0.4     LSB      refacoring for update with replaced data (Z-
 ## -- 2023-09-23  1.0.5     LSB      Bug Fix, the input to normalizer shall be copied as it returns the same object
 ## -- 2024-04-30  1.1.0     DA       Refactoring
+## -- 2026-10-16  1.2.0     DA       Block updates and batch normalization
+## -- 2026-10-16  1.3.0     DA       Lazy renormalization
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.1.0 (2024-04-30)
+Ver. 1.3.0 (2026-10-16)
 
 Example file for demonstrating the use of MLPro's normalizer for normalizing and de-normalizing data.
 
@@ -32,6 +34,11 @@ You will learn:
 4. How to denormalize a data element (ndarray/mlpro element) by MinMax or ZTransofrm
 
 5. How to renormalize the data element (ndarray/mlpro element) with respect to the changed parameters
+
+6. How to update the Z transformation on blocks of new and obsolete data and how to normalize blocks
+of data in place
+
+7. How to accumulate several parameter changes and renormalize data only once
 """
 
 
@@ -181,4 +188,49 @@ if p_printing:
 # 16. Validating the renormalization
 normalized_state = my_normalizer_minmax.normalize(my_state.copy())
 if p_printing:
-    print('16. Normalized value (Validation renormalization):\n', normalized_state.get_values(),'\n\n')
\ No newline at end of file
+    print('16. Normalized value (Validation renormalization):\n', normalized_state.get_values(),'\n\n')
+
+
+
+# 17. Updating the Z transformation on blocks of new and obsolete data in one step
+my_normalizer_ztrans.update_parameters(p_dataset=my_dataset[:6])
+my_normalizer_ztrans.update_parameters(p_data_new=my_dataset[6:], p_data_del=my_dataset[:3])
+mean_block, std_block = my_normalizer_ztrans._mean.copy(), my_normalizer_ztrans._std.copy()
+
+my_normalizer_ztrans.update_parameters(p_dataset=my_dataset[3:])
+if not ( np.allclose(mean_block, my_normalizer_ztrans._mean) and np.allclose(std_block, my_normalizer_ztrans._std) ):
+    raise Exception('Block update of the Z transformation failed')
+if p_printing:
+    print('17. Parameters updated for the Z transformer on blocks of data\n\n')
+
+
+# 18. Normalizing and renormalizing a block of data in place
+data_block = my_dataset.copy()
+my_normalizer_ztrans.normalize_batch(data_block)
+if not np.array_equal(data_block, my_normalizer_ztrans.normalize(my_dataset)):
+    raise Exception('Batch normalization failed')
+
+my_normalizer_ztrans.update_parameters(p_data_del=my_dataset[3:5])
+renormalized_block = my_normalizer_ztrans.renormalize(data_block.copy())
+my_normalizer_ztrans.renormalize_batch(data_block)
+if not np.array_equal(data_block, renormalized_block):
+    raise Exception('Batch renormalization failed')
+if p_printing:
+    print('18. Renormalized block (Z transformer):\n', data_block, '\n\n')
+
+
+
+# 19. Accumulating several parameter changes and renormalizing the data once
+lazy_renormalizer = LazyRenormalizer()
+lazy_block        = data_block.copy()
+
+for i in range(3):
+    my_normalizer_ztrans.update_parameters(p_data_new=my_dataset[i])
+    data_block = my_normalizer_ztrans.renormalize(data_block)
+    lazy_renormalizer.add(my_normalizer_ztrans)
+
+lazy_renormalizer.renormalize_batch(lazy_block)
+if not np.allclose(lazy_block, data_block):
+    raise Exception('Lazy renormalization failed')
+if p_printing:
+    print('19. Lazily renormalized block (Z transformer):\n', lazy_block, '\n\n')
@@ -10,16 +10,20 @@
 ## -- 2022-10-12  1.2.0     DA       Restructuring of demo steps
 ## -- 2022-10-13  1.3.0     DA       Simplification and reduction to multithreading
 ## -- 2022-11-07  1.3.1     DA       Minor correction
+## -- 2026-10-16  1.4.0     DA       Additional run with a persistent worker pool
+## -- 2026-10-16  1.5.0     DA       Check of the compiled execution plan
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.3.1 (2022-11-07)
+Ver. 1.5.0 (2026-10-16)
 
 This module demonstrates the use of tasks and workflows as part of MLPro's multitasking concept.
 To this regard, a demo custom task class is implemented. At first the task class is instantiated 9 
 times, added to a workflow, and chained by predecessor relations. In two experiments the workflow is 
-executed synchronously and in multithreading mode. In the latter case, the tasks are partly executed 
-parallel which increases the computation performance.
+executed synchronously and in multithreading mode. A synchronous run processes the tasks along an 
+execution plan in topological order that is compiled by the workflow on its first run. In the 
+multithreading mode, the tasks are partly executed parallel which increases the computation 
+performance.
 
 In both experiments pseudo results are stored in a shared object.
 
@@ -33,6 +37,8 @@ You will learn:
 
 4) How to run tasks and workflows in various ranges of asynchronicity
 
+5) How to let a workflow reuse persistent worker threads instead of starting new ones on each run
+
 """
 
 
@@ -157,8 +163,12 @@ wf.add_task( p_task=t3c, p_pred_tasks=[t2a, t2b, t2c] )
 
 # 3 Run the workflow synchronously
 wf.run( p_range=mt.Workflow.C_RANGE_NONE, p_wait=True )
+wf.log(Log.C_LOG_TYPE_I, 'Execution plan:', [ task.get_name() for task in wf.get_exec_plan() ])
 wf.log(Log.C_LOG_TYPE_I, 'Result in shared object:\n', wf.get_so().get_results())
 
+if len(wf.get_so().get_results()) != 9:
+    raise Exception('Not all tasks were executed')
+
 
 # 4 Clear result list in shared object and wait for next run (for better observation)
 wf.get_so().clear_results()
@@ -169,4 +179,18 @@ sleep(pause_sec)
 
 # 5 Run the same workflow asynchronously in multithreading mode
 wf.run( p_range=mt.Workflow.C_RANGE_THREAD, p_wait=True)
-wf.log(Log.C_LOG_TYPE_I, 'Result in shared object:\n', wf.get_so().get_results())
\ No newline at end of file
+wf.log(Log.C_LOG_TYPE_I, 'Result in shared object:\n', wf.get_so().get_results())
+
+
+
+# 6 Clear result list and assign a persistent worker pool with two worker threads to the workflow 
+wf.get_so().clear_results()
+wf.assign_worker_pool( p_worker_pool = mt.WorkerPool( p_range=mt.WorkerPool.C_RANGE_THREAD, 
+                                                      p_num_workers=2, 
+                                                      p_logging=logging ) )
+
+
+# 7 Run the same workflow again. The tasks are now executed by the workers of the pool
+wf.run( p_range=mt.Workflow.C_RANGE_THREAD, p_wait=True)
+wf.log(Log.C_LOG_TYPE_I, 'Result in shared object:\n', wf.get_so().get_results())
+wf.get_worker_pool().shutdown()
@@ -0,0 +1,106 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_mt_003_worker_pool.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-17  1.0.0     DA       Creation/release
+## -- 2026-10-17  1.1.0     DA       More objects than workers
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module demonstrates the persistent worker pool of MLPro. Jobs of several demo objects are 
+executed by a limited number of worker threads and by one worker process per object. Some of the 
+jobs fail on purpose.
+
+You will learn:
+
+1) How to hand over jobs to a worker pool and wait for their completion.
+
+2) How the state of an object persists in its worker process across jobs.
+
+3) How the objects are distributed over the worker threads and worker processes.
+
+4) How to get the jobs that failed.
+
+"""
+
+
+import mlpro.bf.mt as mt
+from mlpro.bf.various import Log
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyCounter:
+    """
+    Demo class that counts jobs and fails on negative increments.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self):
+        self.value = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def add(self, p_inc : int):
+        if p_inc < 0: raise ValueError('Negative increment ' + str(p_inc))
+        self.value += p_inc
+
+
+## -------------------------------------------------------------------------------------------------
+    def check(self, p_value : int):
+        if self.value != p_value: raise ValueError('Unexpected value ' + str(self.value))
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == '__main__':
+    # 1.1 Parameters for demo mode
+    logging  = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    logging  = Log.C_LOG_NOTHING
+
+increments  = [ 1, 2, -1, 3, -2 ]
+num_objects = 3
+num_workers = 2
+
+
+# 2 Jobs of several objects in worker threads and worker processes
+for p_range in [ mt.WorkerPool.C_RANGE_THREAD, mt.WorkerPool.C_RANGE_PROCESS ]:
+    pool     = mt.WorkerPool( p_range=p_range, p_num_workers=num_workers, p_logging=logging )
+    counters = [ MyCounter() for i in range(num_objects) ]
+
+    for inc in increments:
+        for counter in counters:
+            pool.submit( p_target=counter.add, p_inc=inc )
+
+    # 2.1 The state of each counter persists in its worker across all jobs
+    for counter in counters:
+        pool.submit( p_target=counter.check, p_value=sum([ inc for inc in increments if inc > 0 ]) )
+    pool.wait()
+
+    # 2.2 The counters share the limited number of worker threads, but get an own worker process each
+    if p_range == mt.WorkerPool.C_RANGE_THREAD:
+        num_workers_exp = num_workers
+    else:
+        num_workers_exp = num_objects
+
+    if pool.get_num_workers() != num_workers_exp:
+        raise Exception('Unexpected number of workers: ' + str(pool.get_num_workers()))
+
+    # 2.3 Both jobs with a negative increment per counter are reported as failed
+    failures = pool.get_failures()
+    pool.shutdown()
+
+    if ( len(failures) != 2 * num_objects ) or any( target != 'add' for target, error in failures ):
+        raise Exception('Failed jobs not reported properly: ' + str(failures))
+
+    pool.log(Log.C_LOG_TYPE_S, 'Range', p_range, ': failed jobs', failures)
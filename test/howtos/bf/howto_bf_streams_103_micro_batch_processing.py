@@ -0,0 +1,134 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_streams_103_micro_batch_processing.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the micro-batch mode of stream scenarios. Instead of one instance per cycle,
+a configurable number of instances is pulled from the stream and processed by the stream workflow in
+one run.
+
+You will learn:
+
+1) How to set up a stream scenario in micro-batch mode.
+
+2) That the tasks of a workflow receive all instances of a batch in one instance dictionary.
+
+3) That a ring buffer forwards the net effect of a batch: instances that are buffered and removed
+   within the same batch are not forwarded.
+
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.streams import InstDict, InstTypeNew, StreamTask, StreamWorkflow, StreamScenario
+from mlpro.bf.streams.streams import StreamProviderMLPro
+from mlpro.bf.streams.tasks import RingBuffer
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyTask (StreamTask):
+    """
+    Demo stream task that counts the incoming instances.
+    """
+
+    C_NAME      = 'My stream task'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, **p_kwargs):
+        super().__init__(**p_kwargs)
+        self.num_inst_new = 0
+        self.num_inst_del = 0
+        self.last_inst_id = -1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+        for inst_id, (inst_type, inst) in sorted(p_inst.items()):
+            if inst_type == InstTypeNew:
+                if inst_id <= self.last_inst_id:
+                    raise Exception('Instances out of order')
+                self.last_inst_id = inst_id
+                self.num_inst_new += 1
+            else:
+                self.num_inst_del += 1
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyScenario (StreamScenario):
+
+    C_NAME      = 'Micro-batches'
+
+## -------------------------------------------------------------------------------------------------
+    def _setup(self, p_mode, p_visualize: bool, p_logging):
+
+        # 1 Get a native stream from MLPro
+        provider_mlpro = StreamProviderMLPro(p_logging=p_logging)
+        stream = provider_mlpro.get_stream('Rnd10Dx1000', p_mode=p_mode, p_logging=p_logging)
+
+        # 2 Set up a stream workflow with a window and a counting task
+        workflow = StreamWorkflow( p_name='wf1',
+                                   p_range_max=StreamWorkflow.C_RANGE_NONE,
+                                   p_visualize=p_visualize,
+                                   p_logging=p_logging )
+
+        self.task_window = RingBuffer( p_buffer_size=50, p_name='t1', p_logging=p_logging )
+        self.task_count  = MyTask( p_name='t2', p_logging=p_logging )
+
+        workflow.add_task( p_task=self.task_window )
+        workflow.add_task( p_task=self.task_count, p_pred_tasks=[self.task_window] )
+
+        # 3 Return stream and workflow
+        return stream, workflow
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    cycle_limit = 10
+    batch_size  = 100
+    logging     = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    cycle_limit = 3
+    batch_size  = 70
+    logging     = Log.C_LOG_NOTHING
+
+
+# 2 Instantiate the stream scenario in micro-batch mode
+myscenario = MyScenario( p_mode=Mode.C_MODE_SIM,
+                         p_cycle_limit=cycle_limit,
+                         p_batch_size=batch_size,
+                         p_visualize=False,
+                         p_logging=logging )
+
+
+# 3 Reset and run own stream scenario
+myscenario.reset()
+myscenario.run()
+
+
+# 4 The downstream task sees the net effect of the window: instances that entered and left the 
+#   window within the same batch are not forwarded at all
+num_inst = cycle_limit * batch_size
+if myscenario.task_count.num_inst_new - myscenario.task_count.num_inst_del != 50:
+    raise Exception('Unexpected number of instances in the window')
+
+myscenario.log(Log.C_LOG_TYPE_S, 'Instances processed:', num_inst)
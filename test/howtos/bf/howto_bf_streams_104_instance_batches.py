@@ -0,0 +1,256 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_streams_104_instance_batches.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -- 2026-10-17  1.1.0     DA       Batch-native rearrangement compared with per-instance fallback
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module demonstrates the columnar representation of stream instances by class InstanceBatch and
+its use in vectorized stream tasks.
+
+You will learn:
+
+1) How to convert an instance dictionary into an instance batch and back.
+
+2) How to implement a stream task that processes all instances of a run by single numpy operations.
+
+3) That the instances forwarded to subsequent tasks share their values with the batch.
+
+4) That the built-in stream task Rearranger produces the same results batch-wise and per instance.
+
+"""
+
+
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.math import ESpace, Dimension, Element
+from mlpro.bf.streams import Instance, InstDict, InstTypeNew, InstanceBatch, StreamTask, StreamWorkflow, StreamScenario
+from mlpro.bf.streams.streams import StreamProviderMLPro
+from mlpro.bf.streams.tasks import Rearranger
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyScaler (StreamTask):
+    """
+    Demo stream task that scales the feature values of new instances by a constant factor.
+    """
+
+    C_NAME          = 'Scaler'
+    C_BATCH_NATIVE  = True
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_factor : float, **p_kwargs):
+        super().__init__(**p_kwargs)
+        self._factor        = p_factor
+        self.num_batch_runs = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+        # Fallback for instances that can not be batched
+        for inst_id, (inst_type, inst) in p_inst.items():
+            if inst_type == InstTypeNew:
+                inst.get_feature_data().set_values(inst.get_feature_data().get_values() * self._factor)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run_batch(self, p_batch : InstanceBatch):
+        # One numpy operation for all new instances of the batch
+        self.num_batch_runs += 1
+        p_batch.get_feature_data()[p_batch.get_new_mask()] *= self._factor
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyRecorder (StreamTask):
+    """
+    Demo stream task that records the original feature values of the incoming instances.
+    """
+
+    C_NAME      = 'Recorder'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, **p_kwargs):
+        super().__init__(**p_kwargs)
+        self.originals = {}
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+        for inst_id, (inst_type, inst) in p_inst.items():
+            self.originals[inst_id] = np.array(inst.get_feature_data().get_values())
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyChecker (StreamTask):
+    """
+    Demo stream task that compares the incoming feature values with the recorded original ones.
+    """
+
+    C_NAME      = 'Checker'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_factor : float, p_recorder : MyRecorder, **p_kwargs):
+        super().__init__(**p_kwargs)
+        self._factor   = p_factor
+        self._recorder = p_recorder
+        self.num_inst  = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+        for inst_id, (inst_type, inst) in p_inst.items():
+            original = self._recorder.originals[inst_id]
+            if not np.allclose(inst.get_feature_data().get_values(), original * self._factor):
+                raise Exception('Instance ' + str(inst_id) + ' was not scaled')
+            self.num_inst += 1
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyScenario (StreamScenario):
+
+    C_NAME      = 'Instance batches'
+
+## -------------------------------------------------------------------------------------------------
+    def _setup(self, p_mode, p_visualize: bool, p_logging):
+
+        # 1 Get a native stream from MLPro
+        provider_mlpro = StreamProviderMLPro(p_logging=p_logging)
+        stream = provider_mlpro.get_stream('Rnd10Dx1000', p_mode=p_mode, p_logging=p_logging)
+
+        # 2 Set up a stream workflow with a vectorized scaler between a recorder and a checker
+        workflow = StreamWorkflow( p_name='wf1',
+                                   p_range_max=StreamWorkflow.C_RANGE_NONE,
+                                   p_visualize=p_visualize,
+                                   p_logging=p_logging )
+
+        task_recorder     = MyRecorder( p_name='t1', p_logging=p_logging )
+        self.task_scaler  = MyScaler( p_factor=2.0, p_name='t2', p_logging=p_logging )
+        self.task_checker = MyChecker( p_factor=2.0, p_recorder=task_recorder, p_name='t3', p_logging=p_logging )
+
+        workflow.add_task( p_task=task_recorder )
+        workflow.add_task( p_task=self.task_scaler, p_pred_tasks=[task_recorder] )
+        workflow.add_task( p_task=self.task_checker, p_pred_tasks=[self.task_scaler] )
+
+        # 3 Return stream and workflow
+        return stream, workflow
+
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    cycle_limit = 10
+    batch_size  = 100
+    logging     = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    cycle_limit = 3
+    batch_size  = 20
+    logging     = Log.C_LOG_NOTHING
+
+
+# 2 Conversion of an instance dictionary into a batch and back
+provider = StreamProviderMLPro(p_logging=logging)
+stream   = iter(provider.get_stream('Rnd10Dx1000', p_logging=logging))
+
+inst_dict = {}
+for i in range(5):
+    inst = next(stream)
+    inst_dict[inst.id] = ( InstTypeNew, inst )
+
+batch = InstanceBatch.from_inst_dict(p_inst=inst_dict)
+batch.get_feature_data()[:,0] = 0
+
+for inst_id, (inst_type, inst) in batch.get_inst_dict().items():
+    if ( inst is not inst_dict[inst_id][1] ) or ( inst.get_feature_data().get_values()[0] != 0 ):
+        raise Exception('Instances and batch do not share their values')
+
+batch.set_ids(None)
+if list(batch.get_inst_dict().keys()) != sorted(inst_dict.keys()):
+    raise Exception('Instance ids changed by set_ids(None)')
+
+
+# 3 Batch-native rearrangement compared with the per-instance fallback
+feature_space = ESpace()
+label_space   = ESpace()
+for i in range(4): feature_space.add_dim( Dimension( p_name_short='x' + str(i) ) )
+for i in range(2): label_space.add_dim( Dimension( p_name_short='y' + str(i) ) )
+
+features = feature_space.get_dims()
+labels   = label_space.get_dims()
+
+def create_instances() -> InstDict:
+    inst_dict = {}
+    for inst_id in range(batch_size):
+        feature_data = Element(feature_space)
+        feature_data.set_values( np.arange(4, dtype=np.float64) + inst_id )
+        label_data   = Element(label_space)
+        label_data.set_values( np.arange(2, dtype=np.float64) - inst_id )
+        inst         = Instance( p_feature_data=feature_data, p_label_data=label_data, p_tstamp=inst_id )
+        inst.id      = inst_id
+        inst_dict[inst_id] = ( InstTypeNew, inst )
+    return inst_dict
+
+results = []
+for batched in [ True, False ]:
+    rearranger = Rearranger( p_name='Rearranger',
+                             p_features_new=[ ( 'F', features[2:] ), ( 'L', labels[1:] ) ],
+                             p_labels_new=[ ( 'F', features[:1] ), ( 'L', labels[:1] ) ],
+                             p_logging=logging )
+    inst_dict  = create_instances()
+
+    if batched:
+        rearranger._run_batch( p_batch=InstanceBatch.from_inst_dict(p_inst=inst_dict) )
+    else:
+        rearranger._run( p_inst=inst_dict )
+
+    results.append( [ ( inst.get_feature_data().get_dim_ids(), list(inst.get_feature_data().get_values()),
+                        inst.get_label_data().get_dim_ids(), list(inst.get_label_data().get_values()) )
+                      for inst_type, inst in inst_dict.values() ] )
+
+if results[0] != results[1]:
+    raise Exception('Batch-wise and per-instance rearrangement differ')
+
+
+# 4 Instantiate and run a stream scenario with a vectorized stream task
+myscenario = MyScenario( p_mode=Mode.C_MODE_SIM,
+                         p_cycle_limit=cycle_limit,
+                         p_batch_size=batch_size,
+                         p_visualize=False,
+                         p_logging=logging )
+
+myscenario.reset()
+myscenario.run()
+
+if myscenario.task_checker.num_inst != cycle_limit * batch_size:
+    raise Exception('Unexpected number of instances')
+
+if myscenario.task_scaler.num_batch_runs != cycle_limit:
+    raise Exception('Instances were not processed batch-wise')
+
+myscenario.log(Log.C_LOG_TYPE_S, 'Instances processed:', myscenario.task_checker.num_inst)
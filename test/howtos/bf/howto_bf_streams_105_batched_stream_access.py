@@ -0,0 +1,105 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_streams_105_batched_stream_access.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -- 2026-10-17  1.1.0     DA       Comparison of batches with single instances of the same seed
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module demonstrates the batched access to data streams by method Stream.get_next_batch().
+MLPro's native streams compute their instances vectorized, which is considerably faster than the
+iteration instance by instance.
+
+You will learn:
+
+1) How to fetch the instances of a stream batch-wise.
+
+2) That batches of native streams are reproducible for a given random seed and contain the same
+   instances as the iteration instance by instance.
+
+3) How fast the batched access is compared to the iteration instance by instance.
+
+"""
+
+
+from time import perf_counter
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.streams.streams import *
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    batch_size  = 500
+    logging     = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    batch_size  = 50
+    logging     = Log.C_LOG_NOTHING
+
+
+provider = StreamProviderMLPro(p_logging=logging)
+
+
+for stream in provider.get_stream_list():
+
+    # 2 Fetch two batches twice using the same seed
+    batches = []
+
+    for run in range(2):
+        stream.set_random_seed(p_seed=42)
+        iterator = iter(stream)
+        batches.append( [ iterator.get_next_batch(p_num_inst=batch_size) for i in range(2) ] )
+
+    for batch1, batch2 in zip(batches[0], batches[1]):
+        if not np.array_equal(batch1.get_feature_data(), batch2.get_feature_data()):
+            raise Exception('Batches of stream ' + stream.get_id() + ' are not reproducible')
+
+    if not np.array_equal(batches[0][1].get_ids(), np.arange(batch_size, batch_size + len(batches[0][1]))):
+        raise Exception('Unexpected instance ids')
+
+    # 2.1 The batches contain the same instances as an iteration instance by instance
+    stream.set_random_seed(p_seed=42)
+    iterator = iter(stream)
+
+    for batch in batches[0]:
+        values = np.array([ next(iterator).get_feature_data().get_values() for i in range(len(batch)) ])
+        if not np.array_equal(values, batch.get_feature_data()):
+            raise Exception('Batches of stream ' + stream.get_id() + ' differ from single instances')
+
+
+    # 3 Compare the batched access with the iteration instance by instance
+    num_inst = stream.get_num_instances()
+    if num_inst == 0: num_inst = 10 * batch_size
+
+    iterator = iter(stream)
+    tp_start = perf_counter()
+    num_inst_batch = 0
+
+    try:
+        while num_inst_batch < num_inst:
+            num_inst_batch += len(iterator.get_next_batch(p_num_inst=batch_size))
+    except StopIteration:
+        pass
+
+    duration_batch = perf_counter() - tp_start
+
+    iterator = iter(stream)
+    tp_start = perf_counter()
+
+    for i in range(num_inst_batch):
+        next(iterator)
+
+    duration_single = perf_counter() - tp_start
+
+    stream.log( Log.C_LOG_TYPE_W,
+                num_inst_batch, 'instances in', round(duration_batch,4), 's batch-wise vs.',
+                round(duration_single,4), 's instance by instance' )
@@ -0,0 +1,131 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_streams_106_lazy_csv_streams.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -- 2026-10-17  1.1.0     DA       Trailing blank lines and release of the file handle
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module demonstrates the lazy mode of CSV streams. Instead of loading the complete file at
+once, the file is parsed block by block into typed columns. Optionally, the selected columns are
+stored in a binary cache that is memory-mapped by further runs.
+
+You will learn:
+
+1) How to set up a CSV stream in lazy mode (parameter p_chunk_size).
+
+2) How to use a memory-mapped binary cache (parameter p_cache).
+
+3) That all modes provide the same data.
+
+4) That the lazy mode releases the CSV file at the end of the stream and on reset.
+
+"""
+
+
+import os
+import random
+import tempfile
+from time import perf_counter
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.data import DataStoring
+from mlpro.bf.streams.streams import StreamMLProCSV
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == '__main__':
+    num_frames  = 10
+    num_cycles  = 10000
+    logging     = Log.C_LOG_ALL
+else:
+    num_frames  = 2
+    num_cycles  = 500
+    logging     = Log.C_LOG_NOTHING
+
+
+# 2 Generate random data and store them in csv format
+path = tempfile.mkdtemp()
+mem  = DataStoring(['x1', 'x2', 'x3', 'y'])
+
+for frame in range(num_frames):
+    frame_id = 'ep. ' + str(frame + 1)
+    mem.add_frame(frame_id)
+    for i in range(num_cycles):
+        for name in mem.names:
+            mem.memorize(name, frame_id, random.uniform(-1,1))
+
+mem.save_data(path, 'data_storage', '\t')
+
+
+# 3 Read the file completely, block by block, and via the binary cache (twice)
+modes = [ ('complete loading', {}),
+          ('chunked parsing', { 'p_chunk_size' : 1000 }),
+          ('building the cache', { 'p_cache' : True }),
+          ('memory-mapped cache', { 'p_cache' : True }) ]
+
+results = []
+
+for mode, options in modes:
+    tp_start = perf_counter()
+
+    stream = StreamMLProCSV( p_logging=logging,
+                             p_path_load=path,
+                             p_csv_filename='data_storage.csv',
+                             p_delimiter='\t',
+                             p_frame=True,
+                             p_header=True,
+                             p_list_features=['x1', 'x2', 'x3'],
+                             p_list_labels=['y'],
+                             **options )
+
+    values = np.array([ inst.get_feature_data().get_values() for inst in iter(stream) ], dtype=np.float64)
+    results.append(values)
+
+    stream.switch_logging(p_logging=logging)
+    stream.log(Log.C_LOG_TYPE_W, 'Mode "' + mode + '":', len(values), 'instances in', round(perf_counter() - tp_start, 3), 's')
+
+
+# 4 All modes provide the same instances
+for values in results[1:]:
+    if ( values.shape != (num_frames * num_cycles, 3) ) or not np.allclose(values, results[0]):
+        raise Exception('Different data in lazy mode')
+
+
+# 5 Trailing blank lines are not counted as instances
+with open(path + os.sep + 'data_storage.csv', 'a') as file:
+    file.write('\n\n')
+
+stream = StreamMLProCSV( p_logging=logging,
+                         p_path_load=path,
+                         p_csv_filename='data_storage.csv',
+                         p_delimiter='\t',
+                         p_frame=True,
+                         p_header=True,
+                         p_list_features=['x1', 'x2', 'x3'],
+                         p_list_labels=['y'],
+                         p_chunk_size=1000 )
+
+iterator = iter(stream)
+if stream.get_num_instances() != num_frames * num_cycles:
+    raise Exception('Blank lines counted as instances')
+
+
+# 6 The file handle is closed on reset and at the end of the stream
+file = stream._file
+next(iterator)
+iterator = iter(stream)
+if not file.closed:
+    raise Exception('File not closed on reset')
+
+file = stream._file
+num_inst = len([ inst for inst in iterator ])
+if ( num_inst != num_frames * num_cycles ) or not file.closed:
+    raise Exception('File not closed at the end of the stream')
@@ -0,0 +1,179 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_streams_107_recording_and_replay.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -- 2026-10-17  1.1.0     DA       Flush on finish and explicit overwriting of recordings
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module demonstrates how to record the output of a stream workflow in MLPro's binary stream
+format and how to replay it later.
+
+You will learn:
+
+1) How to add a recorder task to a stream workflow.
+
+2) How to replay recorded streams by the stream provider StreamProviderRecorded.
+
+3) How to access recorded instances by their ids and time stamps.
+
+4) That an existing recording is only replaced on request.
+
+"""
+
+
+import tempfile
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.exceptions import Error
+from mlpro.bf.ops import Mode
+from mlpro.bf.streams import InstDict, InstTypeNew, StreamTask, StreamWorkflow, StreamScenario
+from mlpro.bf.streams.streams import StreamProviderMLPro, StreamProviderRecorded
+from mlpro.bf.streams.streams.recorded import StreamRecording
+from mlpro.bf.streams.tasks import StreamRecorder
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyPreprocessing (StreamTask):
+    """
+    Demo stream task that stands for an expensive preprocessing step. The results are kept for
+    the comparison with the replay.
+    """
+
+    C_NAME      = 'Preprocessing'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, **p_kwargs):
+        super().__init__(**p_kwargs)
+        self.results = {}
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+        for inst_id, (inst_type, inst) in p_inst.items():
+            if inst_type == InstTypeNew:
+                inst.get_feature_data().set_values(np.tanh(inst.get_feature_data().get_values()))
+                self.results[inst_id] = ( inst.get_feature_data().get_values().copy(), 
+                                          inst.get_label_data().get_values().copy() )
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyScenario (StreamScenario):
+
+    C_NAME      = 'Recording'
+
+## -------------------------------------------------------------------------------------------------
+    def _setup(self, p_mode, p_visualize: bool, p_logging):
+
+        # 1 Get a native stream from MLPro
+        provider_mlpro = StreamProviderMLPro(p_logging=p_logging)
+        stream = provider_mlpro.get_stream('Rnd10Dx1000', p_mode=p_mode, p_logging=p_logging)
+
+        # 2 Set up a stream workflow with preprocessing and recording
+        workflow = StreamWorkflow( p_name='wf1',
+                                   p_range_max=StreamWorkflow.C_RANGE_NONE,
+                                   p_visualize=p_visualize,
+                                   p_logging=p_logging )
+
+        self.task_prep = MyPreprocessing( p_name='t1', p_logging=p_logging )
+        self.recorder  = StreamRecorder( p_path=path + '/preprocessed',
+                                         p_segment_size=segment_size,
+                                         p_name='t2',
+                                         p_logging=p_logging )
+
+        workflow.add_task( p_task=self.task_prep )
+        workflow.add_task( p_task=self.recorder, p_pred_tasks=[self.task_prep] )
+
+        # 3 Return stream and workflow
+        return stream, workflow
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    cycle_limit  = 10
+    batch_size   = 100
+    segment_size = 250
+    logging      = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    cycle_limit  = 5
+    batch_size   = 20
+    segment_size = 30
+    logging      = Log.C_LOG_NOTHING
+
+path     = tempfile.mkdtemp()
+num_inst = cycle_limit * batch_size
+
+
+# 2 Run the scenario once and record the preprocessed instances. The remaining buffered instances
+#   are written at the end of the run.
+myscenario = MyScenario( p_mode=Mode.C_MODE_SIM,
+                         p_cycle_limit=cycle_limit,
+                         p_batch_size=batch_size,
+                         p_visualize=False,
+                         p_logging=logging )
+
+myscenario.reset()
+myscenario.run()
+
+
+# 3 Replay the recording
+provider = StreamProviderRecorded(p_path=path, p_logging=logging)
+stream   = provider.get_stream(p_id='preprocessed', p_logging=logging)
+
+if stream.get_num_instances() != num_inst:
+    raise Exception('Unexpected number of recorded instances')
+
+for inst in stream:
+    features, labels = myscenario.task_prep.results[inst.id]
+
+    if not np.allclose(features, inst.get_feature_data().get_values()):
+        raise Exception('Replayed instance differs from recorded one')
+
+    if not np.allclose(labels, inst.get_label_data().get_values()):
+        raise Exception('Replayed label differs from recorded one')
+
+
+# 4 Batch-wise replay and random access by id and time stamp
+replay  = iter(stream)
+batch   = replay.get_next_batch(p_num_inst=num_inst)
+by_id   = stream.get_instances_by_id(p_id_first=10, p_id_last=39)
+by_time = stream.get_instances_by_tstamp(p_tstamp_first=10, p_tstamp_last=39)
+
+if ( len(batch) != num_inst ) or ( len(by_id) != 30 ) or ( len(by_time) != 30 ):
+    raise Exception('Unexpected number of instances')
+
+if not np.allclose(by_id.get_feature_data(), batch.get_feature_data()[10:40]):
+    raise Exception('Random access by id failed')
+
+
+
+# 5 An existing recording is only replaced on request
+try:
+    StreamRecorder( p_path=path + '/preprocessed', p_logging=logging )
+    raise Exception('Existing recording not detected')
+except Error:
+    pass
+
+StreamRecorder( p_path=path + '/preprocessed', p_overwrite=True, p_logging=logging )
+
+if StreamRecording.is_recording(path + '/preprocessed'):
+    raise Exception('Existing recording not replaced')
+
+stream.log(Log.C_LOG_TYPE_S, 'Instances recorded and replayed:', num_inst)
@@ -0,0 +1,208 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_streams_108_instrumentation.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -- 2026-10-17  1.1.0     DA       Statistics of the workflow and counting after a reset
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module demonstrates the opt-in instrumentation of stream workflows. Per task, the run times,
+waiting times and numbers of processed instances are recorded and exported as CSV and JSON.
+
+You will learn:
+
+1) How to activate the instrumentation of a stream scenario.
+
+2) How to access the statistics of the tasks.
+
+3) How to export the statistics at the end of a run.
+
+4) How to reset the statistics and that asynchronous workflow runs are timed completely.
+
+"""
+
+
+import os
+import tempfile
+from time import sleep
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.mt import Task
+from mlpro.bf.ops import Mode
+from mlpro.bf.streams import InstDict, InstTypeNew, StreamTask, StreamWorkflow, StreamScenario
+from mlpro.bf.streams.streams import StreamProviderMLPro
+from mlpro.bf.streams.tasks import RingBuffer
+from mlpro.bf.streams.instrumentation import StreamInstrumentation
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyTask (StreamTask):
+    """
+    Demo stream task that scales the feature data of new instances.
+    """
+
+    C_NAME      = 'Scaling'
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+        for inst_type, inst in p_inst.values():
+            if inst_type == InstTypeNew:
+                inst.get_feature_data().set_values(inst.get_feature_data().get_values() * 2)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MySlowTask (StreamTask):
+    """
+    Demo stream task that takes a while.
+    """
+
+    C_NAME      = 'Slow'
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+        sleep(0.05)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyScenario (StreamScenario):
+
+    C_NAME      = 'Instrumentation'
+
+## -------------------------------------------------------------------------------------------------
+    def _setup(self, p_mode, p_visualize: bool, p_logging):
+
+        # 1 Get a native stream from MLPro
+        provider_mlpro = StreamProviderMLPro(p_logging=p_logging)
+        stream = provider_mlpro.get_stream('Rnd10Dx1000', p_mode=p_mode, p_logging=p_logging)
+
+        # 2 Set up a stream workflow with a sliding window and a custom task
+        workflow = StreamWorkflow( p_name='wf1',
+                                   p_range_max=StreamWorkflow.C_RANGE_NONE,
+                                   p_visualize=p_visualize,
+                                   p_logging=p_logging )
+
+        self.task_window = RingBuffer( p_buffer_size=window_size,
+                                       p_name='t1',
+                                       p_visualize=p_visualize,
+                                       p_logging=p_logging )
+        self.task_scale  = MyTask( p_name='t2', p_logging=p_logging )
+
+        workflow.add_task( p_task=self.task_window )
+        workflow.add_task( p_task=self.task_scale, p_pred_tasks=[self.task_window] )
+
+        # 3 Return stream and workflow
+        return stream, workflow
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    cycle_limit = 100
+    batch_size  = 10
+    window_size = 50
+    logging     = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    cycle_limit = 10
+    batch_size  = 5
+    window_size = 20
+    logging     = Log.C_LOG_NOTHING
+
+path     = tempfile.mkdtemp()
+num_inst = cycle_limit * batch_size
+
+
+# 2 Instantiate the scenario with active instrumentation and export folder
+myscenario = MyScenario( p_mode=Mode.C_MODE_SIM,
+                         p_cycle_limit=cycle_limit,
+                         p_batch_size=batch_size,
+                         p_instrumentation=True,
+                         p_instrumentation_path=path,
+                         p_visualize=False,
+                         p_logging=logging )
+
+
+# 3 Reset and run the scenario; the statistics are exported at the end of the run
+myscenario.reset()
+myscenario.run()
+
+
+# 4 Check the statistics of the tasks
+instrumentation = myscenario.get_instrumentation()
+stats           = { task_stats.tid : task_stats for task_stats in instrumentation.get_stats() }
+stats_window    = stats[myscenario.task_window.get_tid()]
+stats_scale     = stats[myscenario.task_scale.get_tid()]
+
+if ( stats_window.num_runs != cycle_limit ) or ( stats_scale.num_runs != cycle_limit ):
+    raise Exception('Unexpected number of task runs')
+
+if stats_window.num_inst_new_in != num_inst:
+    raise Exception('Unexpected number of incoming instances')
+
+if stats_scale.num_inst_del_in != num_inst - window_size:
+    raise Exception('Unexpected number of obsolete instances')
+
+if np.sum(stats_window.duration.get_counts()) != cycle_limit:
+    raise Exception('Unexpected number of recorded durations')
+
+stats_wf = stats[myscenario.get_workflow().get_tid()]
+
+if ( stats_wf.num_runs != cycle_limit ) or ( stats_wf.num_inst_new_in != num_inst ):
+    raise Exception('Unexpected statistics of the workflow')
+
+if ( stats_wf.num_inst_new_out != stats_scale.num_inst_new_out ) or ( stats_wf.num_inst_del_out != num_inst - window_size ):
+    raise Exception('Unexpected number of outgoing instances of the workflow')
+
+if stats_wf.duration.sum < stats_window.duration.sum + stats_scale.duration.sum:
+    raise Exception('Workflow run not timed completely')
+
+for fname in [ StreamInstrumentation.C_FNAME_CSV, StreamInstrumentation.C_FNAME_JSON ]:
+    if not os.path.isfile(path + os.sep + fname):
+        raise Exception('Missing export file ' + fname)
+
+for task_stats in instrumentation.get_stats():
+    myscenario.log( Log.C_LOG_TYPE_S,
+                    task_stats.name + ':', task_stats.num_runs, 'runs,',
+                    'mean duration', '%.6f' % task_stats.duration.get_mean(), 's,',
+                    'throughput', round(task_stats.get_throughput()), 'inst/s' )
+
+
+# 5 After a reset of the statistics, the tasks count again
+instrumentation.reset()
+myscenario.reset()
+myscenario.run()
+
+if ( stats_window.num_runs != cycle_limit ) or ( stats_scale.num_inst_new_in != num_inst ) or ( stats_wf.num_runs != cycle_limit ):
+    raise Exception('Tasks do not count after a reset of the statistics')
+
+
+# 6 Asynchronous runs of a workflow are timed until all of its tasks have finished
+workflow = StreamWorkflow( p_name='wf2', p_range_max=Task.C_RANGE_THREAD, p_logging=logging )
+workflow.add_task( p_task=MySlowTask( p_name='t3', p_range_max=Task.C_RANGE_THREAD, p_logging=logging ) )
+workflow.set_instrumentation(p_active=True)
+
+inst = next(iter(myscenario.get_stream()))
+workflow.run( p_inst={ inst.id : ( InstTypeNew, inst ) }, p_wait=True )
+
+stats_wf = workflow.get_stats()
+if ( stats_wf.num_runs != 1 ) or ( stats_wf.duration.sum < 0.05 ) or ( stats_wf.num_inst_new_out != 1 ):
+    raise Exception('Asynchronous run of the workflow not recorded properly')
@@ -0,0 +1,82 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_streams_109_ring_buffer_statistics.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the incremental statistics of the ring buffer. Boundaries, mean and 
+variance of the buffered data are maintained per incoming instance instead of being recomputed over 
+the complete buffer.
+
+You will learn:
+
+1) How to enable the statistics of a ring buffer.
+
+2) How to access boundaries, mean, variance and the buffered data as numpy arrays.
+
+"""
+
+
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.streams import InstDict, InstTypeNew, StreamWorkflow
+from mlpro.bf.streams.streams import StreamProviderMLPro
+from mlpro.bf.streams.tasks import RingBuffer
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == '__main__':
+    buffer_size = 500
+    batch_size  = 20
+    num_cycles  = 50
+    logging     = Log.C_LOG_ALL
+else:
+    buffer_size = 50
+    batch_size  = 7
+    num_cycles  = 30
+    logging     = Log.C_LOG_NOTHING
+
+
+# 2 Stream and workflow with a ring buffer with enabled statistics
+stream   = StreamProviderMLPro(p_logging=logging).get_stream('Rnd10Dx1000', p_logging=logging)
+workflow = StreamWorkflow( p_name='wf1', p_range_max=StreamWorkflow.C_RANGE_NONE, p_logging=logging )
+window   = RingBuffer( p_buffer_size=buffer_size, 
+                       p_enable_statistics=True, 
+                       p_name='Window', 
+                       p_logging=logging )
+workflow.add_task( p_task=window )
+
+stream_iter = iter(stream)
+history     = []
+
+
+# 3 Micro-batches are buffered and the statistics are compared with a full recomputation
+for cycle in range(num_cycles):
+    batch : InstDict = stream_iter.get_next_batch(p_num_inst=batch_size).get_inst_dict()
+    history.extend([ inst.get_feature_data().get_values().copy() for (inst_type, inst) in batch.values() if inst_type == InstTypeNew ])
+
+    workflow.run(p_inst=batch)
+
+    data = np.array(history[-buffer_size:])
+    ids, feature_data, tstamps = window.get_buffered_arrays()
+
+    if not np.allclose(feature_data, data):
+        raise Exception('Unexpected buffered data')
+
+    if not np.allclose(window.get_boundaries(), np.stack([data.min(axis=0), data.max(axis=0)], axis=1)):
+        raise Exception('Unexpected boundaries')
+
+    if not ( np.allclose(window.get_mean(), data.mean(axis=0)) and np.allclose(window.get_variance(), data.var(axis=0)) ):
+        raise Exception('Unexpected mean or variance')
+
+
+window.log(Log.C_LOG_TYPE_S, 'Mean:', window.get_mean())
+window.log(Log.C_LOG_TYPE_S, 'Standard deviation:', window.get_std_deviation())
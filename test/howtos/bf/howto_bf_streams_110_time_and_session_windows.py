@@ -0,0 +1,140 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_streams_110_time_and_session_windows.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates time-based windows for irregularly sampled streams. 
+
+You will learn:
+
+1) How to set up sliding and tumbling time windows and session windows.
+
+2) How the windows forward new and obsolete instances.
+
+3) How to access the incremental statistics of a time window.
+
+"""
+
+
+from datetime import datetime, timedelta
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.math import Dimension, MSpace, Element
+from mlpro.bf.streams import Instance, InstDict, InstTypeNew, StreamTask, StreamWorkflow
+from mlpro.bf.streams.tasks import TimeWindow, SessionWindow
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyCounter (StreamTask):
+    """
+    Demo stream task that counts the instances forwarded by its predecessor.
+    """
+
+    C_NAME      = 'Counter'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, **p_kwargs):
+        super().__init__(**p_kwargs)
+        self.num_fwd = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+        for inst_type, inst in p_inst.values():
+            self.num_fwd += 1 if inst_type == InstTypeNew else -1
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == '__main__':
+    num_inst = 2000
+    logging  = Log.C_LOG_ALL
+else:
+    num_inst = 200
+    logging  = Log.C_LOG_NOTHING
+
+batch_size = 5
+duration   = timedelta(seconds=10)
+gap        = timedelta(seconds=5)
+
+
+# 2 Irregularly sampled instances in bursts with breaks
+rng      = np.random.default_rng(seed=1)
+fspace   = MSpace()
+fspace.add_dim(Dimension(p_name_short='x1', p_base_set=Dimension.C_BASE_SET_R))
+fspace.add_dim(Dimension(p_name_short='x2', p_base_set=Dimension.C_BASE_SET_R))
+
+deltas   = np.where(rng.random(num_inst) < 0.05, rng.uniform(6, 20, num_inst), rng.exponential(0.5, num_inst))
+tstamps  = [ datetime(2026, 1, 1) + timedelta(seconds=float(sec)) for sec in np.cumsum(deltas) ]
+values   = rng.normal(size=(num_inst, 2))
+insts    = []
+
+for i in range(num_inst):
+    feature_data = Element(fspace)
+    feature_data.set_values(values[i])
+    inst = Instance(p_feature_data=feature_data, p_tstamp=tstamps[i])
+    inst.id = i
+    insts.append(inst)
+
+
+# 3 One workflow per window type
+windows = { 'sliding' : TimeWindow( p_duration=duration, p_enable_statistics=True, p_name='Sliding', p_logging=logging ),
+            'tumbling' : TimeWindow( p_duration=duration, p_tumbling=True, p_name='Tumbling', p_logging=logging ),
+            'session' : SessionWindow( p_gap=gap, p_name='Session', p_logging=logging ) }
+
+workflows = {}
+counters  = {}
+for key, window in windows.items():
+    workflows[key] = StreamWorkflow( p_name=key, p_range_max=StreamWorkflow.C_RANGE_NONE, p_logging=logging )
+    counters[key]  = MyCounter( p_name='Counter ' + key, p_logging=logging )
+    workflows[key].add_task( p_task=window )
+    workflows[key].add_task( p_task=counters[key], p_pred_tasks=[window] )
+
+
+# 4 Micro-batches are processed and checked against a brute-force computation
+for start in range(0, num_inst, batch_size):
+    for key, workflow in workflows.items():
+        batch : InstDict = { inst.id : (InstTypeNew, inst) for inst in insts[start:start + batch_size] }
+        workflow.run(p_inst=batch)
+
+    t_now   = tstamps[min(start + batch_size, num_inst) - 1]
+    in_wind = [ i for i in range(min(start + batch_size, num_inst)) if t_now - tstamps[i] < duration ]
+    buffer, num_buffered = windows['sliding'].get_buffered_data()
+
+    if list(buffer.keys()) != in_wind:
+        raise Exception('Unexpected content of the sliding window')
+
+    data = values[in_wind]
+    if not np.allclose(windows['sliding'].get_boundaries(), np.stack([data.min(axis=0), data.max(axis=0)], axis=1)):
+        raise Exception('Unexpected boundaries')
+
+    if not np.allclose(windows['sliding'].get_mean(), data.mean(axis=0)):
+        raise Exception('Unexpected mean')
+
+    # Sessions: no gap within the buffered instances, but a gap before the first one
+    buffer, num_buffered = windows['session'].get_buffered_data()
+    ids = list(buffer.keys())
+    if ( ids[0] > 0 ) and ( tstamps[ids[0]] - tstamps[ids[0] - 1] <= gap ):
+        raise Exception('Unexpected start of the session')
+
+    if any([ tstamps[i + 1] - tstamps[i] > gap for i in ids[:-1] ]):
+        raise Exception('Unexpected gap within the session')
+
+
+# 5 All removed instances have been forwarded as obsolete (or not at all within the same cycle)
+for key, window in windows.items():
+    if counters[key].num_fwd != window.get_buffered_data()[1]:
+        raise Exception('Unexpected number of obsolete instances')
+
+    window.log(Log.C_LOG_TYPE_S, 'Currently buffered:', window.get_buffered_data()[1], 'instances')
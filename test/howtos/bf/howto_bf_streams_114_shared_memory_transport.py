@@ -0,0 +1,189 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_streams_114_shared_memory_transport.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-17  1.0.0     DA       Creation/release
+## -- 2026-10-17  1.1.0     DA       Online adaptive stream task in a worker process
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module demonstrates the exchange of numeric stream instances between stream tasks in separate
+processes via shared memory. Two tasks of a stream workflow are executed by persistent worker
+processes, together with an online adaptive Z-transformation. Only block references cross the process boundaries, while the feature values are
+exchanged through a ring in a shared memory segment. To prove this, instances refuse to be pickled
+in this demo.
+
+You will learn:
+
+1) How to set up a stream workflow with the shared object StreamSharedMemory.
+
+2) How to run stream tasks and online adaptive stream tasks in worker processes.
+
+3) How an overflow of the shared memory ring is reported.
+
+"""
+
+
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.exceptions import Error
+from mlpro.bf.mt import Task
+from mlpro.bf.math import ESpace, Dimension, Element
+from mlpro.bf.streams import *
+from mlpro.bf.streams.basics import StreamSharedMemory, StreamSharedMemoryClient
+from mlpro.oa.streams.tasks.normalizers import NormalizerZTransform
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyScaler (StreamTask):
+    """
+    Demo stream task that scales the feature values of all instances.
+    """
+
+    C_NAME      = 'Scaler'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_factor : float, **p_kwargs):
+        super().__init__(**p_kwargs)
+        self._factor = p_factor
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+        for inst_id, (inst_type, inst) in p_inst.items():
+            feature_data = inst.get_feature_data()
+            feature_data.set_values( feature_data.get_values() * self._factor )
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MySmallSharedMemory (StreamSharedMemory):
+    """
+    Shared memory with a very small ring.
+    """
+
+    C_CAPACITY  = 8
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == '__main__':
+    # 1.1 Parameters for demo mode
+    num_cycles  = 10
+    logging     = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    num_cycles  = 3
+    logging     = Log.C_LOG_NOTHING
+
+batch_size  = 5
+factors     = [ 2, -1 ]
+
+
+# 2 Instances refuse to be pickled in this demo
+def refuse_pickling(self, p_protocol):
+    raise TypeError('Instance pickled')
+
+feature_space = ESpace()
+for i in range(3): feature_space.add_dim( Dimension( p_name_short='x' + str(i) ) )
+
+def create_instances(p_cycle : int, p_num : int) -> InstDict:
+    inst_dict = {}
+    for i in range(p_num):
+        inst_id      = p_cycle * p_num + i
+        feature_data = Element(feature_space)
+        feature_data.set_values( np.arange(3, dtype=np.float64) + inst_id )
+        inst         = Instance( p_feature_data=feature_data, p_tstamp=inst_id )
+        inst.id      = inst_id
+        inst_dict[inst_id] = ( InstTypeNew, inst )
+    return inst_dict
+
+
+# 3 Stream workflow with two parallel tasks in persistent worker processes
+workflow = StreamWorkflow( p_name='wf',
+                           p_range_max=Task.C_RANGE_PROCESS,
+                           p_class_shared=StreamSharedMemory,
+                           p_worker_pool=True,
+                           p_num_workers=2,
+                           p_logging=logging )
+
+tasks = [ MyScaler( p_factor=factor, p_name='Scaler x' + str(factor), p_range_max=Task.C_RANGE_PROCESS, p_logging=logging )
+          for factor in factors ]
+
+for task in tasks: workflow.add_task( p_task=task )
+
+# 3.1 Online adaptive task in a worker process and its local reference
+ztrans     = NormalizerZTransform( p_name='Z-Trans', p_range_max=Task.C_RANGE_PROCESS, p_logging=logging )
+ztrans_ref = NormalizerZTransform( p_name='Z-Trans Ref', p_range_max=Task.C_RANGE_NONE, p_logging=Log.C_LOG_NOTHING )
+workflow.add_task( p_task=ztrans )
+
+
+# 4 Processing of some cycles
+Instance.__reduce_ex__ = refuse_pickling
+
+try:
+    for cycle in range(num_cycles):
+        inst_dict = create_instances( p_cycle=cycle, p_num=batch_size )
+        workflow.run( p_inst=inst_dict, p_wait=False )
+
+        for task, factor in zip(tasks, factors):
+            task.wait_async_tasks()
+
+            # 4.1 The shared object only holds a block reference per task
+            row, num_rows, entries = workflow.get_so().get_instances( p_task_ids=[task.get_tid()] )[0]
+            if ( num_rows != batch_size ) or any( entry[2] is None for entry in entries ):
+                raise Exception('Instances were not exchanged via shared memory')
+
+            # 4.2 Results of the tasks in the worker processes
+            inst_out = task._get_instances( p_task_ids=[task.get_tid()] )
+            for inst_id, (inst_type, inst) in inst_dict.items():
+                if not np.array_equal( inst_out[inst_id][1].get_feature_data().get_values(),
+                                       inst.get_feature_data().get_values() * factor ):
+                    raise Exception('Wrong results of task ' + task.get_name())
+
+        # 4.3 Results of the online adaptive task in its worker process
+        ztrans.wait_async_tasks()
+        inst_ref = create_instances( p_cycle=cycle, p_num=batch_size )
+        ztrans_ref._run( p_inst=inst_ref )
+        inst_out = ztrans._get_instances( p_task_ids=[ztrans.get_tid()] )
+        for inst_id, (inst_type, inst) in inst_ref.items():
+            if not np.allclose( inst_out[inst_id][1].get_feature_data().get_values(),
+                                inst.get_feature_data().get_values() ):
+                raise Exception('Wrong results of task ' + ztrans.get_name())
+
+finally:
+    del Instance.__reduce_ex__
+    workflow.shutdown_worker_pool()
+
+workflow.log(Log.C_LOG_TYPE_S, 'Cycles processed in worker processes:', num_cycles)
+
+
+# 5 An overflow of the shared memory ring raises an exception instead of overwriting rows
+workflow_small = StreamWorkflow( p_name='wf_small',
+                                 p_range_max=Task.C_RANGE_PROCESS,
+                                 p_class_shared=MySmallSharedMemory,
+                                 p_logging=logging )
+
+client = StreamSharedMemoryClient( p_so=workflow_small.get_so() )
+client.encode( p_inst=create_instances( p_cycle=0, p_num=6 ), p_new_cycle=True )
+
+try:
+    client.encode( p_inst=create_instances( p_cycle=1, p_num=6 ) )
+    raise Exception('Overflow of the shared memory ring not detected')
+except Error:
+    workflow_small.log(Log.C_LOG_TYPE_S, 'Overflow of the shared memory ring detected')
+
+# Rows of the previous cycle are released on a new cycle
+client.encode( p_inst=create_instances( p_cycle=2, p_num=6 ), p_new_cycle=True )
@@ -0,0 +1,147 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_streams_132_stream_task_multideriver.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the stream task MultiDeriver that extends the feature data of instances
+by derivatives of several features in several orders at once. The results are compared with those
+of separate Deriver tasks per feature and order.
+
+You will learn:
+
+1) How to add a task MultiDeriver to a stream workflow.
+
+2) How to derive several features in several orders with a single task.
+
+3) How to process the stream in batches.
+
+"""
+
+
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.mt import Task
+from mlpro.bf.ops import Mode
+from mlpro.bf.streams import StreamTask, StreamWorkflow, StreamScenario, InstDict
+from mlpro.bf.streams.streams import StreamProviderMLPro
+from mlpro.bf.streams.tasks import Deriver, MultiDeriver
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyRecorder (StreamTask):
+    """
+    Demo stream task that records the feature values of all instances.
+    """
+
+    C_NAME      = 'Recorder'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, **p_kwargs):
+        super().__init__(**p_kwargs)
+        self.values = []
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_inst : InstDict):
+        for inst_id, (inst_type, inst) in sorted(p_inst.items()):
+            self.values.append(inst.get_feature_data().get_values().copy())
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyScenario (StreamScenario):
+
+    C_NAME      = 'Demo Multi-Deriver'
+
+## -------------------------------------------------------------------------------------------------
+    def _setup(self, p_mode, p_visualize: bool, p_logging):
+
+        # 1 Import a native stream from MLPro
+        provider_mlpro = StreamProviderMLPro(p_logging=p_logging)
+        stream = provider_mlpro.get_stream('DoubleSpiral2D', p_mode=p_mode, p_logging=p_logging)
+        features = stream.get_feature_space().get_dims()
+
+        # 2 Set up a stream workflow
+        workflow = StreamWorkflow( p_name='wf1',
+                                   p_range_max=Task.C_RANGE_NONE,
+                                   p_visualize=p_visualize,
+                                   p_logging=p_logging )
+
+        # 2.1 Derivatives of both features in orders 1 and 2 determined by a single task
+        task_deriver = MultiDeriver( p_name='T1 - Multi-Deriver',
+                                     p_features=features,
+                                     p_orders=orders,
+                                     p_logging=p_logging )
+
+        self.recorder = MyRecorder( p_name='T2 - Recorder', p_logging=p_logging )
+
+        workflow.add_task( p_task=task_deriver )
+        workflow.add_task( p_task=self.recorder, p_pred_tasks=[task_deriver] )
+
+        # 3 Return stream and workflow
+        return stream, workflow
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == '__main__':
+    # 1.1 Parameters for demo mode
+    cycle_limit = 100
+    logging     = Log.C_LOG_ALL
+
+else:
+    # 1.2 Parameters for internal unit test
+    cycle_limit = 10
+    logging     = Log.C_LOG_NOTHING
+
+batch_size  = 5
+orders      = [1, 2]
+
+
+# 2 Instantiate, reset and run the stream scenario
+myscenario = MyScenario( p_mode=Mode.C_MODE_SIM,
+                         p_cycle_limit=cycle_limit,
+                         p_batch_size=batch_size,
+                         p_visualize=False,
+                         p_logging=logging )
+
+myscenario.reset()
+myscenario.run()
+values = np.array(myscenario.recorder.values)
+
+
+# 3 Comparison with separate Deriver tasks per feature and order
+stream = StreamProviderMLPro(p_logging=Log.C_LOG_NOTHING).get_stream('DoubleSpiral2D', p_mode=Mode.C_MODE_SIM, p_logging=Log.C_LOG_NOTHING)
+stream_iter = iter(stream)
+instances   = [ next(stream_iter) for i in range(cycle_limit * batch_size) ]
+features  = stream.get_feature_space().get_dims()
+column    = len(features)
+
+for feature in features:
+    for order in orders:
+        deriver = Deriver( p_derived_feature=feature, p_order_derivative=order, p_logging=Log.C_LOG_NOTHING )
+        for i, inst in enumerate(instances):
+            inst_copy = inst.copy()
+            deriver._run( { i : ( 0, inst_copy ) } )
+
+            if not np.isclose( inst_copy.get_feature_data().get_values()[-1], values[i, column] ):
+                raise Exception('Derivatives of MultiDeriver and Deriver differ')
+
+        column += 1
+
+myscenario.log(Log.C_LOG_TYPE_S, 'Extended feature data of last instance:', values[-1])
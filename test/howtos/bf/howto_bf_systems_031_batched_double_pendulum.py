@@ -0,0 +1,101 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.bf.examples
+## -- Module  : howto_bf_systems_031_batched_double_pendulum.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -- 2026-10-17  1.1.0     DA       Pendulums with an own method simulate_reaction()
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module demonstrates the batched simulation of several double pendulums with the fixed-step
+RK4 integrator. The results are compared with those of the default integrator odeint.
+
+You will learn:
+
+1) How to select the integrator of the double pendulum system.
+
+2) How to simulate the state transitions of many pendulums in one call.
+
+3) That systems with an own method simulate_reaction() are simulated one by one.
+
+"""
+
+
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.systems.pool import DoublePendulumSystemS7
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyDoublePendulum (DoublePendulumSystemS7):
+    """
+    Double pendulum with an own method simulate_reaction() that counts the simulated transitions.
+    """
+
+    num_transitions = 0
+
+## -------------------------------------------------------------------------------------------------
+    def simulate_reaction(self, p_state = None, p_action = None, p_t_step = None):
+        self.num_transitions += 1
+        return super().simulate_reaction(p_state, p_action, p_t_step)
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    num_pendulums = 1000
+    num_steps     = 100
+    logging       = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    num_pendulums = 20
+    num_steps     = 5
+    logging       = Log.C_LOG_NOTHING
+
+rng = np.random.default_rng(1)
+
+
+# 2 Double pendulum systems with integrators RK4 and odeint
+dp_rk4    = DoublePendulumSystemS7( p_integrator=DoublePendulumSystemS7.C_INTEGRATOR_RK4, p_logging=logging )
+dp_odeint = DoublePendulumSystemS7( p_integrator=DoublePendulumSystemS7.C_INTEGRATOR_ODEINT, p_logging=Log.C_LOG_NOTHING )
+
+
+# 3 Random initial angles of all pendulums
+states = np.zeros((num_pendulums, dp_rk4.get_state_space().get_num_dim()))
+states[:, [0, 2]] = rng.uniform(-180, 180, size=(num_pendulums, 2))
+
+
+# 4 Batched simulation of all pendulums with random torques
+for step in range(num_steps):
+    actions       = rng.uniform(-20, 20, size=(num_pendulums, 1))
+    states_new    = dp_rk4.simulate_reaction_batch( p_states=states, p_actions=actions )
+    states_odeint = dp_odeint.simulate_reaction_batch( p_states=states, p_actions=actions )
+
+    deviation = np.abs(states_new[:, 0:4] - states_odeint[:, 0:4])
+    deviation[:, [0, 2]] = np.minimum(deviation[:, [0, 2]], 360 - deviation[:, [0, 2]])
+    tolerance = 1e-6 * ( 1 + np.max(np.abs(states_odeint[:, [1, 3]]), axis=1) )
+    if np.any(np.max(deviation, axis=1) > tolerance):
+        raise Exception('Integrators RK4 and odeint deviate')
+
+    states = states_new
+
+
+dp_rk4.log(Log.C_LOG_TYPE_S, 'Simulated', num_steps, 'steps of', num_pendulums, 'pendulums, mean |theta 1| =', round(np.mean(np.abs(states[:, 0])), 1))
+
+
+# 5 Pendulums with an own method simulate_reaction() are not simulated in batch mode
+dp_own = MyDoublePendulum( p_integrator=DoublePendulumSystemS7.C_INTEGRATOR_RK4, p_logging=Log.C_LOG_NOTHING )
+dp_own.simulate_reaction_batch( p_states=states, p_actions=np.zeros((num_pendulums, 1)) )
+if dp_own.num_transitions != num_pendulums:
+    raise Exception('Own method simulate_reaction() skipped in batch mode')
@@ -0,0 +1,104 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.oa.examples
+## -- Module  : howto_oa_streams_ad_001_anomaly_retention.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the retention policies of anomaly detectors. The number and the age of
+buffered anomalies are limited, so that the memory consumption stays flat in long-running
+deployments. Evicted anomalies are stored as compact records in a file.
+
+You will learn:
+
+1) How to limit the number and the age of buffered anomalies.
+
+2) How to get informed about evicted anomalies.
+
+3) How to load the records of evicted anomalies.
+
+"""
+
+
+import os
+import tempfile
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.math import ESpace, Dimension, Element
+from mlpro.bf.streams import Instance
+from mlpro.oa.streams.tasks.anomalydetectors import AnomalyDetector, AnomalyDetectorPAGA, AnomalyRecord, PointAnomaly
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    num_inst  = 10000
+    logging   = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    num_inst  = 500
+    logging   = Log.C_LOG_NOTHING
+
+retention_max = 20
+retention_age = 200
+filename      = tempfile.mkdtemp() + os.sep + 'anomalies.jsonl'
+
+
+# 2 Anomaly detector with retention policies
+detector = AnomalyDetectorPAGA( p_group_size_max = 10,
+                                p_retention_max = retention_max,
+                                p_retention_age = retention_age,
+                                p_retention_file = filename,
+                                p_logging = logging )
+
+evicted = []
+def on_anomaly_removed(p_event_id, p_event_object):
+    evicted.append(p_event_object.get_data()['p_record'])
+
+detector.register_event_handler( p_event_id = AnomalyDetector.C_EVENT_ANOMALY_REMOVED,
+                                 p_event_handler = on_anomaly_removed )
+
+
+# 3 Raise point anomalies on every third instance and on a sequence of consecutive instances
+feature_space = ESpace()
+feature_space.add_dim( Dimension( p_name_short='x' ) )
+
+for inst_id in range(num_inst):
+    if ( inst_id % 3 != 0 ) and not ( 100 <= inst_id < 150 ): continue
+
+    feature_data = Element(feature_space)
+    feature_data.set_values( np.array([float(inst_id)]) )
+    inst    = Instance( p_feature_data = feature_data, p_tstamp = inst_id )
+    inst.id = inst_id
+
+    detector._raise_anomaly_event( PointAnomaly( p_instances = [inst],
+                                                 p_ano_scores = [1.0],
+                                                 p_raising_object = detector ) )
+
+
+# 4 Validation
+anomalies = detector.get_anomalies()
+records   = AnomalyRecord.load(filename)
+
+if len(anomalies) > retention_max:
+    raise Exception('Number of buffered anomalies exceeds the limit')
+
+if len(records) != len(evicted):
+    raise Exception('Number of stored records differs from the number of evicted anomalies')
+
+tstamps = [ anomaly.get_instances()[-1].get_tstamp() for anomaly in anomalies.values() ]
+if max(tstamps) - min(tstamps) > retention_age:
+    raise Exception('Buffered anomalies exceed the maximum age')
+
+if max( len(record.inst_ids) for record in records ) > 10:
+    raise Exception('Group anomaly exceeds the maximum size')
+
+detector.log(Log.C_LOG_TYPE_S, 'Buffered anomalies:', len(anomalies), ', evicted anomalies:', len(records))
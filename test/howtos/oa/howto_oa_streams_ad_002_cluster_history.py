@@ -0,0 +1,87 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.oa.examples
+## -- Module  : howto_oa_streams_ad_002_cluster_history.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the ring buffer ClusterHistory that keeps the histories of cluster
+properties in the cluster-based anomaly detectors. New values of all clusters are added at once and
+the first and second differences are determined incrementally.
+
+You will learn:
+
+1) How to set up a cluster history with smoothing and differences.
+
+2) How to add the values of several clusters at once.
+
+3) How to access the chronological histories of all clusters.
+
+"""
+
+
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.oa.streams.tasks.anomalydetectors import ClusterHistory
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    num_steps = 1000
+    logging   = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    num_steps = 50
+    logging   = Log.C_LOG_NOTHING
+
+window_size = 10
+ema_alpha   = 0.7
+cluster_ids = [ 'a', 'b', 'c' ]
+rng         = np.random.default_rng(1)
+log         = Log( p_logging = logging )
+
+
+# 2 Cluster history with first and second differences
+history = ClusterHistory( p_size = window_size,
+                          p_max_order = 2,
+                          p_ema_alpha = ema_alpha )
+
+
+# 3 Add the sizes of all clusters in each step and keep a naive list-based history for comparison
+reference = { id : [] for id in cluster_ids }
+
+for step in range(num_steps):
+    sizes = rng.integers(0, 100, size=len(cluster_ids))
+    history.push_batch( p_ids = cluster_ids, p_values = sizes, p_tstamps = step )
+
+    for id, size in zip(cluster_ids, sizes):
+        if len(reference[id]) == 0:
+            reference[id].append(float(size))
+        else:
+            reference[id].append( ema_alpha * size + ( 1 - ema_alpha ) * reference[id][-1] )
+
+
+# 4 Validation of the histories of all clusters
+values  = history.get_windows( p_ids = cluster_ids )[:, :, 0]
+diffs_1 = history.get_windows( p_ids = cluster_ids, p_order = 1 )[:, :, 0]
+diffs_2 = history.get_windows( p_ids = cluster_ids, p_order = 2 )[:, :, 0]
+
+for i, id in enumerate(cluster_ids):
+    ref = np.array(reference[id][-window_size:])
+
+    if not np.allclose(values[i], ref):
+        raise Exception('Unexpected values in history of cluster ' + id)
+
+    if not np.allclose(diffs_1[i], np.diff(ref)) or not np.allclose(diffs_2[i], np.diff(ref, n=2)):
+        raise Exception('Unexpected differences in history of cluster ' + id)
+
+    log.log(Log.C_LOG_TYPE_S, 'Cluster', id, ': smoothed sizes', np.round(values[i], 1))
@@ -0,0 +1,97 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.oa.examples
+## -- Module  : howto_oa_streams_ad_003_statistical_detector.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the ready-to-use detector for point anomalies based on incremental
+statistics. Outliers are injected into a normally distributed data stream and detected with all
+available scoring methods.
+
+You will learn:
+
+1) How to set up the statistical anomaly detector with different scoring methods.
+
+2) How to process batches of instances in an online-adaptive stream workflow.
+
+3) How to access the detected anomalies and their scores.
+
+"""
+
+
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.math import ESpace, Dimension, Element
+from mlpro.bf.streams import Instance, InstTypeNew
+from mlpro.oa.streams import OAStreamWorkflow
+from mlpro.oa.streams.tasks.anomalydetectors import AnomalyDetectorStat
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    num_inst  = 10000
+    logging   = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    num_inst  = 500
+    logging   = Log.C_LOG_NOTHING
+
+batch_size   = 10
+num_outliers = 10
+rng          = np.random.default_rng(1)
+
+
+# 2 Normally distributed data with outliers
+feature_space = ESpace()
+for i in range(3): feature_space.add_dim( Dimension( p_name_short='x' + str(i) ) )
+
+data     = rng.normal(size=(num_inst, 3))
+outliers = np.linspace(50, num_inst - 1, num_outliers, dtype=int)
+data[outliers, rng.integers(0, 3, size=num_outliers)] += rng.choice( [-10, 10], size=num_outliers )
+
+
+# 3 Detection of the outliers with all scoring methods
+for method, threshold in [ ( AnomalyDetectorStat.C_SCORE_ZSCORE, 5 ),
+                           ( AnomalyDetectorStat.C_SCORE_ROBUST, 5 ),
+                           ( AnomalyDetectorStat.C_SCORE_EWMA, 5 ),
+                           ( AnomalyDetectorStat.C_SCORE_QUANTILE, 2 ) ]:
+
+    # 3.1 Workflow with the statistical anomaly detector
+    workflow = OAStreamWorkflow( p_name='wf', p_range_max=OAStreamWorkflow.C_RANGE_NONE, p_logging=logging )
+    detector = AnomalyDetectorStat( p_method = method,
+                                    p_threshold = threshold,
+                                    p_group_anomaly_det = False,
+                                    p_logging = logging )
+    workflow.add_task( p_task = detector )
+
+    # 3.2 Processing of the data in batches
+    for start in range(0, num_inst, batch_size):
+        inst_dict = {}
+        for inst_id in range(start, min(start + batch_size, num_inst)):
+            feature_data = Element(feature_space)
+            feature_data.set_values(data[inst_id])
+            inst    = Instance( p_feature_data = feature_data, p_tstamp = inst_id )
+            inst.id = inst_id
+            inst_dict[inst_id] = ( InstTypeNew, inst )
+
+        workflow.run( p_inst = inst_dict )
+
+    # 3.3 Validation
+    anomalies = detector.get_anomalies().values()
+    detected  = { anomaly.get_instances()[-1].get_id() for anomaly in anomalies }
+
+    if not set(outliers).issubset(detected):
+        raise Exception('Not all outliers detected by scoring method ' + str(method))
+
+    workflow.log( Log.C_LOG_TYPE_S, 'Scoring method', method, ': outliers', num_outliers, ', detected anomalies', len(detected),
+                  ', max score', round(max( anomaly.get_ano_scores()[0] for anomaly in anomalies ), 1) )
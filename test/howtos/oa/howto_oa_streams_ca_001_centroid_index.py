@@ -0,0 +1,105 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.oa.examples
+## -- Module  : howto_oa_streams_ca_001_centroid_index.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-16)
+
+This module demonstrates the spatial index of cluster analyzers. The centroids of the clusters are
+kept in a matrix that is updated whenever clusters are added, moved or removed. Cluster influences
+are then determined with one vectorized distance computation or one nearest neighbour query.
+
+You will learn:
+
+1) How to set up a cluster analyzer with a spatial index.
+
+2) How to determine the cluster influences on a batch of instances.
+
+"""
+
+
+from time import perf_counter
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.math import ESpace, Dimension, Element
+from mlpro.bf.streams import Instance
+from mlpro.oa.streams.tasks.clusteranalyzers import ClusterAnalyzer, ClusterCentroid
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    num_clusters = 500
+    num_inst     = 1000
+    logging      = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    num_clusters = 50
+    num_inst     = 20
+    logging      = Log.C_LOG_NOTHING
+
+rng = np.random.default_rng(1)
+
+
+# 2 Feature space and instances
+feature_space = ESpace()
+for i in range(3): feature_space.add_dim( Dimension( p_name_short='x' + str(i) ) )
+
+instances = []
+for i in range(num_inst):
+    feature_data = Element(feature_space)
+    feature_data.set_values( rng.normal(size=3) )
+    instances.append( Instance(feature_data) )
+
+
+# 3 Cluster analyzers without and with spatial index, sharing the same cluster centroids
+centroids = rng.normal(size=(num_clusters,3))
+results   = []
+
+for spatial_index in [ ClusterAnalyzer.C_SPATIAL_INDEX_NONE,
+                       ClusterAnalyzer.C_SPATIAL_INDEX_MATRIX,
+                       ClusterAnalyzer.C_SPATIAL_INDEX_KDTREE ]:
+
+    analyzer = ClusterAnalyzer( p_cls_cluster = ClusterCentroid,
+                                p_spatial_index = spatial_index,
+                                p_logging = logging )
+
+    # 3.1 Add clusters, remove some of them and move others
+    for cluster_id, centroid in enumerate(centroids):
+        cluster = ClusterCentroid( p_id = cluster_id )
+        cluster.centroid.value = centroid
+        analyzer._add_cluster( p_cluster = cluster )
+
+    for cluster in list(analyzer.get_clusters().values())[::7]:
+        analyzer._remove_cluster( p_cluster = cluster )
+
+    for cluster in list(analyzer.get_clusters().values())[::5]:
+        cluster.centroid.value = cluster.centroid.value * 0.5
+
+    # 3.2 Determine the influences of all clusters and of the nearest one
+    tstamp = perf_counter()
+    results.append( ( analyzer.get_cluster_influences_batch( p_inst = instances, p_scope = ClusterAnalyzer.C_RESULT_SCOPE_ALL ),
+                      analyzer.get_cluster_influences_batch( p_inst = instances, p_scope = ClusterAnalyzer.C_RESULT_SCOPE_MAX ) ) )
+    analyzer.log(Log.C_LOG_TYPE_S, 'Spatial index', spatial_index, ': duration', '%.4f' % (perf_counter() - tstamp), 's')
+
+
+# 4 Validation of the results
+for results_all, results_max in results[1:]:
+    for inst_ref, inst_res in zip(results[0][0], results_all):
+        ref = { item[0] : item[1] for item in inst_ref }
+        res = { item[0] : item[1] for item in inst_res }
+
+        if ( ref.keys() != res.keys() ) or not np.allclose( [ ref[key] for key in ref ], [ res[key] for key in ref ] ):
+            raise Exception('Cluster influences determined by spatial index differ')
+
+    for inst_ref, inst_res in zip(results[0][1], results_max):
+        if inst_ref[0][0] != inst_res[0][0]:
+            raise Exception('Nearest cluster determined by spatial index differs')
@@ -0,0 +1,129 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - The integrative middleware framework for standardized machine learning
+## -- Package : mlpro.oa.examples
+## -- Module  : howto_oa_streams_pp_009_bd_batch_margin.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-17  1.0.0     DA       Creation/release
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+This module demonstrates the batch processing of the boundary detector with a safety margin. The
+boundaries determined on a batch of instances are compared with those of a boundary detector
+without margin that processes the same instances one by one.
+
+You will learn:
+
+1) How to set up a boundary detector with a safety margin.
+
+2) How to process batches of instances with the boundary detector.
+
+3) How the safety margin prevents adaptations caused by small exceedances of the boundaries.
+
+"""
+
+
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.math import ESpace, Dimension, Element
+from mlpro.bf.streams import Instance, InstTypeNew, InstanceBatch
+from mlpro.oa.streams.tasks.boundarydetector import BoundaryDetector
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    batch_size = 1000
+    logging    = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    batch_size = 100
+    logging    = Log.C_LOG_NOTHING
+
+num_dim = 3
+margin  = 0.1
+rng     = np.random.default_rng(1)
+
+
+# 2 Helper to create the instances of a batch in a feature space
+def create_instances(p_feature_space : ESpace, p_data : np.ndarray, p_id_start : int = 0):
+    inst_dict = {}
+    for i, values in enumerate(p_data):
+        feature_data = Element(p_feature_space)
+        feature_data.set_values(values)
+        inst    = Instance( p_feature_data = feature_data, p_tstamp = p_id_start + i )
+        inst.id = p_id_start + i
+        inst_dict[inst.id] = ( InstTypeNew, inst )
+
+    return inst_dict
+
+
+# 3 Separate feature spaces, since the boundaries are stored in the dimensions
+fs_batch = ESpace()
+fs_ref   = ESpace()
+for i in range(num_dim):
+    fs_batch.add_dim( Dimension( p_name_short='x' + str(i) ) )
+    fs_ref.add_dim( Dimension( p_name_short='x' + str(i) ) )
+
+bd_batch = BoundaryDetector( p_name='BD with margin (batch)', 
+                             p_range_max=BoundaryDetector.C_RANGE_NONE, 
+                             p_logging=logging, 
+                             p_margin=margin )
+
+bd_ref   = BoundaryDetector( p_name='BD without margin (per instance)', 
+                             p_range_max=BoundaryDetector.C_RANGE_NONE, 
+                             p_logging=logging )
+
+
+# 4 Helper to process a batch with both detectors and to compare the boundaries
+data_all = np.empty((0, num_dim))
+
+def process(p_data : np.ndarray, p_id_start : int, p_expected = None) -> np.ndarray:
+    global data_all
+    data_all = np.concatenate([data_all, p_data])
+
+    bd_batch._run_batch( InstanceBatch.from_inst_dict( create_instances(fs_batch, p_data, p_id_start) ) )
+    bd_ref._run( p_inst = create_instances(fs_ref, p_data, p_id_start) )
+
+    bd_b = np.array([ dim.get_boundaries() for dim in fs_batch.get_dims() ], dtype=float)
+    bd_r = np.array([ dim.get_boundaries() for dim in fs_ref.get_dims() ], dtype=float)
+
+    if not np.allclose(bd_r, np.stack([ data_all.min(axis=0), data_all.max(axis=0) ], axis=1)):
+        raise Exception('Boundaries of per-instance processing differ from the extreme values')
+
+    expected = bd_r if p_expected is None else p_expected(bd_r)
+    if not np.allclose(bd_b, expected):
+        raise Exception('Boundaries of batch and per-instance processing differ: ' + str(bd_b) + ' != ' + str(expected))
+
+    bd_batch.log(Log.C_LOG_TYPE_S, 'Boundaries (batch with margin):', bd_b.tolist())
+    bd_ref.log(Log.C_LOG_TYPE_S, 'Boundaries (per instance)     :', bd_r.tolist())
+    return bd_b
+
+
+# 5 First batch: undefined boundaries are set to the extreme values without margin
+process( p_data = rng.normal(size=(batch_size, num_dim)), p_id_start = 0 )
+
+
+# 6 Second batch exceeds both boundaries: the batch boundaries are extended by the margin
+def extend_by_margin(p_bd : np.ndarray) -> np.ndarray:
+    width = p_bd[:,1] - p_bd[:,0]
+    return np.stack([ p_bd[:,0] - margin * width, p_bd[:,1] + margin * width ], axis=1)
+
+bd_2 = process( p_data = rng.normal(size=(batch_size, num_dim)) * 3, 
+                p_id_start = batch_size, 
+                p_expected = extend_by_margin )
+
+
+# 7 Third batch jitters within the margin: no adaptation of the batch boundaries
+data_3 = np.stack([ bd_2[:,0] + 0.5 * ( data_all.min(axis=0) - bd_2[:,0] ),
+                    bd_2[:,1] - 0.5 * ( bd_2[:,1] - data_all.max(axis=0) ) ])
+bd_batch._run_batch( InstanceBatch.from_inst_dict( create_instances(fs_batch, data_3, 2 * batch_size) ) )
+bd_3 = np.array([ dim.get_boundaries() for dim in fs_batch.get_dims() ], dtype=float)
+
+if not np.array_equal(bd_2, bd_3):
+    raise Exception('Boundaries adapted by values within the margin')
@@ -0,0 +1,202 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro.rl.examples
+## -- Module  : howto_rl_env_003_vectorized_environment.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -- 2026-10-17  1.1.0     DA       Fallback for copies with own action processing
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module demonstrates the vectorized environment VecEnvironment that steps several copies of an
+environment at once. A simple environment implements a batched state transition that is compared
+with the transitions of its copies one by one.
+
+You will learn:
+
+1. How to implement a batched state transition in an own environment.
+
+2. How to step several copies of an environment with a matrix of actions.
+
+3. How terminated copies are reset automatically.
+
+4. That copies with an own action processing are stepped one by one.
+
+"""
+
+
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.math import ESpace, Dimension
+from mlpro.rl import *
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyPointMass (Environment):
+    """
+    Point mass on a line that shall be moved to the origin by a force.
+    """
+
+    C_NAME          = 'Point Mass'
+    C_CYCLE_LIMIT   = 50
+    C_BATCH_NATIVE  = True
+    C_T_STEP        = 0.1
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_seed : int = None, p_logging = Log.C_LOG_ALL):
+        super().__init__(p_logging=p_logging)
+        self._state_space, self._action_space = self.setup_spaces()
+        self._rng = np.random.default_rng(p_seed)
+        self.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def setup_spaces():
+        state_space = ESpace()
+        state_space.add_dim( Dimension( p_name_short='x', p_boundaries=[-10, 10] ) )
+        state_space.add_dim( Dimension( p_name_short='v', p_boundaries=[-10, 10] ) )
+
+        action_space = ESpace()
+        action_space.add_dim( Dimension( p_name_short='f', p_boundaries=[-1, 1] ) )
+
+        return state_space, action_space
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self, p_seed=None):
+        self._state = State(self._state_space)
+        self._state.set_values( np.array([ self._rng.uniform(-5, 5), 0.0 ]) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _simulate_reaction(self, p_state : State, p_action : Action) -> State:
+        state_new = State(self._state_space)
+        state_new.set_values( self._simulate_reaction_batch( np.array([p_state.get_values()]),
+                                                             np.array([p_action.get_sorted_values()]) )[0] )
+        return state_new
+
+
+## -------------------------------------------------------------------------------------------------
+    def _simulate_reaction_batch(self, p_states, p_actions, p_t_step = None):
+        states_new = p_states.copy()
+        states_new[:, 1] += p_actions[:, 0] * self.C_T_STEP
+        states_new[:, 0] += states_new[:, 1] * self.C_T_STEP
+        return states_new
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compute_success(self, p_state : State) -> bool:
+        return abs(p_state.get_values()[0]) < 0.1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compute_broken(self, p_state : State) -> bool:
+        return abs(p_state.get_values()[0]) > 10
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compute_reward(self, p_state_old : State, p_state_new : State) -> Reward:
+        reward = Reward(self.C_REWARD_TYPE)
+        reward.set_overall_reward( -abs(p_state_new.get_values()[0]) )
+        return reward
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyPointMassLoop (MyPointMass):
+    """
+    Same environment without batched state transition.
+    """
+
+    C_BATCH_NATIVE  = False
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyPointMassCounter (MyPointMass):
+    """
+    Same environment with an own action processing that counts the processed actions.
+    """
+
+    num_actions     = 0
+
+## -------------------------------------------------------------------------------------------------
+    def _process_action(self, p_action : Action) -> bool:
+        self.num_actions += 1
+        return super()._process_action(p_action)
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    num_envs  = 100
+    num_steps = 500
+    logging   = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    num_envs  = 10
+    num_steps = 100
+    logging   = Log.C_LOG_NOTHING
+
+
+# 2 Vectorized environments with batched and non-batched state transition
+vec_env      = VecEnvironment( p_envs=[ MyPointMass(p_seed=i, p_logging=Log.C_LOG_NOTHING) for i in range(num_envs) ],
+                               p_logging=logging )
+vec_env_loop = VecEnvironment( p_envs=[ MyPointMassLoop(p_seed=i, p_logging=Log.C_LOG_NOTHING) for i in range(num_envs) ],
+                               p_logging=logging )
+
+states      = vec_env.reset()
+vec_env_loop.reset()
+rng         = np.random.default_rng(1)
+num_episodes = 0
+
+
+# 3 Simple P-controller plus noise for all copies at once
+for step in range(num_steps):
+    actions = np.clip( -0.5 * states[:, 0:1] - states[:, 1:2] + rng.normal(scale=0.1, size=(num_envs, 1)), -1, 1 )
+
+    states_new, rewards, success, broken, timeout = vec_env.process_actions(actions)
+    states_new_loop, rewards_loop, success_loop, broken_loop, timeout_loop = vec_env_loop.process_actions(actions)
+
+    if not np.allclose(states_new, states_new_loop) or not np.allclose(rewards, rewards_loop):
+        raise Exception('Batched and non-batched state transitions differ')
+
+    if not ( np.array_equal(success, success_loop) and np.array_equal(broken, broken_loop) and np.array_equal(timeout, timeout_loop) ):
+        raise Exception('Batched and non-batched state labels differ')
+
+    num_episodes += np.count_nonzero(success | broken | timeout)
+    states = vec_env.get_states()
+
+
+vec_env.log(Log.C_LOG_TYPE_S, 'Steps:', num_steps, ', copies:', num_envs, ', finished episodes:', num_episodes)
+
+
+# 4 Copies with an own action processing or in real operation mode are not stepped in batch mode
+envs_counter = [ MyPointMassCounter(p_seed=i, p_logging=Log.C_LOG_NOTHING) for i in range(num_envs) ]
+vec_env_counter = VecEnvironment( p_envs=envs_counter, p_logging=logging )
+vec_env_counter.reset()
+vec_env_counter.process_actions( np.zeros((num_envs, 1)) )
+
+if any( env.num_actions != 1 for env in envs_counter ):
+    raise Exception('Own action processing of the copies skipped')
+
+env_real = vec_env.get_envs()[0]
+env_real.set_mode(Mode.C_MODE_REAL)
+if vec_env._is_native(env_real):
+    raise Exception('Batch mode used in real operation mode')
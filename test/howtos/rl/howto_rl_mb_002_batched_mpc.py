@@ -0,0 +1,297 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro.rl.examples
+## -- Module  : howto_rl_mb_002_batched_mpc.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-16  1.0.0     DA       Creation/release
+## -- 2026-10-17  1.1.0     DA       Batched rewards and comparison with the non-batched mode on an
+## --                                environment model of class EnvModel
+## -- 2026-10-17  1.2.0     DA       Reproducible planning with a seed
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.2.0 (2026-10-17)
+
+This module demonstrates the batched planning mode of the action planner MPC. All candidate paths
+are sampled at once and rolled out in lockstep by the batched state transition and reward computation
+of the environment model. The sampling distribution is refined by the cross-entropy method (CEM).
+Finally, the batched mode is compared with the non-batched mode on an environment model of class
+EnvModel that computes the transitions and rewards one by one.
+
+You will learn:
+
+1. How to set up MPC in batched mode with CEM refinement.
+
+2. How to plan actions with a model of a simple environment.
+
+3. How to check a planned action path against the model.
+
+4. How to use the batched mode with an adaptive environment model.
+
+5. How to make the batched planning reproducible with a seed.
+
+"""
+
+
+import numpy as np
+from mlpro.bf.various import Log
+from mlpro.bf.math import ESpace, Dimension
+from mlpro.rl import *
+from mlpro.sl import SLAdaptiveFunction
+from mlpro.rl.pool.actionplanner.mpc import MPC
+from mlpro.rl.pool.policies.randomgenerator import RandomGenerator
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyPointMass (Environment):
+    """
+    Point mass on a line that shall be moved to the origin by a force.
+    """
+
+    C_NAME          = 'Point Mass'
+    C_CYCLE_LIMIT   = 50
+    C_BATCH_NATIVE  = True
+    C_T_STEP        = 0.1
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_logging = Log.C_LOG_ALL):
+        super().__init__(p_logging=p_logging)
+        self._state_space, self._action_space = self.setup_spaces()
+        self.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def setup_spaces():
+        state_space = ESpace()
+        state_space.add_dim( Dimension( p_name_short='x', p_boundaries=[-10, 10] ) )
+        state_space.add_dim( Dimension( p_name_short='v', p_boundaries=[-10, 10] ) )
+
+        action_space = ESpace()
+        action_space.add_dim( Dimension( p_name_short='f', p_base_set=Dimension.C_BASE_SET_R, p_boundaries=[-1, 1] ) )
+
+        return state_space, action_space
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self, p_seed=None):
+        self._state = State(self._state_space)
+        self._state.set_values( np.array([ 5.0, 0.0 ]) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _simulate_reaction(self, p_state : State, p_action : Action) -> State:
+        state_new = State(self._state_space)
+        state_new.set_values( self._simulate_reaction_batch( np.array([p_state.get_values()]),
+                                                             np.array([p_action.get_sorted_values()]) )[0] )
+        return state_new
+
+
+## -------------------------------------------------------------------------------------------------
+    def _simulate_reaction_batch(self, p_states, p_actions, p_t_step = None):
+        states_new = p_states.copy()
+        states_new[:, 1] += p_actions[:, 0] * self.C_T_STEP
+        states_new[:, 0] += states_new[:, 1] * self.C_T_STEP
+        return states_new
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compute_success(self, p_state : State) -> bool:
+        return abs(p_state.get_values()[0]) < 0.1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compute_broken(self, p_state : State) -> bool:
+        return abs(p_state.get_values()[0]) > 10
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compute_reward(self, p_state_old : State, p_state_new : State) -> Reward:
+        reward = Reward(self.C_REWARD_TYPE)
+        reward.set_overall_reward( -abs(p_state_new.get_values()[0]) - 0.1 * abs(p_state_new.get_values()[1]) )
+        return reward
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compute_reward_batch(self, p_states_old, p_states_new):
+        return -np.abs(p_states_new[:, 0]) - 0.1 * np.abs(p_states_new[:, 1])
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MyPointMassFunction (SLAdaptiveFunction):
+    """
+    Non-learning adaptive function with the exact state transition of the point mass.
+    """
+
+    C_NAME          = 'Point Mass Function'
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_model(self):
+        return None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _map(self, p_input : Element, p_output : Element):
+        x, v, f = p_input.get_values()
+        v_new   = v + f * MyPointMass.C_T_STEP
+        p_output.set_values( np.array([ x + v_new * MyPointMass.C_T_STEP, v_new ]) )
+
+
+
+
+# 1 Preparation of demo/unit test mode
+if __name__ == "__main__":
+    # 1.1 Parameters for demo mode
+    num_steps = 100
+    width     = 500
+    logging   = Log.C_LOG_ALL
+else:
+    # 1.2 Parameters for internal unit test
+    num_steps = 30
+    width     = 100
+    logging   = Log.C_LOG_NOTHING
+
+horizon = 10
+
+
+# 2 Environment, its perfect model and a batched MPC with CEM refinement
+env      = MyPointMass(p_logging=Log.C_LOG_NOTHING)
+envmodel = MyPointMass(p_logging=Log.C_LOG_NOTHING)
+policy   = RandomGenerator( p_observation_space=env.get_state_space(),
+                            p_action_space=env.get_action_space(),
+                            p_buffer_size=1,
+                            p_ada=False,
+                            p_logging=Log.C_LOG_NOTHING )
+
+mpc = MPC( p_batched=True,
+           p_refinement=MPC.C_REFINE_CEM,
+           p_num_iterations=3,
+           p_elite_ratio=0.1,
+           p_logging=logging,
+           p_seed=1 )
+
+mpc.setup( p_policy=policy,
+           p_envmodel=envmodel,
+           p_prediction_horizon=horizon,
+           p_control_horizon=1,
+           p_width_limit=width )
+
+
+# 3 Control of the point mass with the planned actions
+x_start = env.get_state().get_values()[0]
+
+for step in range(num_steps):
+    state  = env.get_state()
+    action = mpc.compute_action(p_obs=state)
+
+    # 3.1 The planned action path has to match the model
+    path = mpc._action_path.get_all()
+    for pred in range(horizon):
+        state_pred = envmodel.simulate_reaction(path['state'][pred], path['action'][pred])
+        if not np.allclose(state_pred.get_values(), path['state_new'][pred].get_values()):
+            raise Exception('Planned action path does not match the environment model')
+
+    env.process_action(action)
+    if env.get_success(): break
+
+
+x_end = env.get_state().get_values()[0]
+if abs(x_end) >= abs(x_start):
+    raise Exception('Point mass has not been moved towards the origin')
+
+mpc.log(Log.C_LOG_TYPE_S, 'Steps:', step + 1, ', position at start:', x_start, ', at end:', round(x_end, 3))
+
+
+
+# 4 Batched and non-batched mode on an environment model of class EnvModel
+afct_strans = AFctSTrans( p_afct_cls=MyPointMassFunction,
+                          p_state_space=env.get_state_space(),
+                          p_action_space=env.get_action_space(),
+                          p_ada=False,
+                          p_logging=Log.C_LOG_NOTHING )
+
+envmodel_ada = EnvModel( p_observation_space=env.get_state_space(),
+                         p_action_space=env.get_action_space(),
+                         p_latency=env.get_latency(),
+                         p_afct_strans=afct_strans,
+                         p_afct_reward=env,
+                         p_afct_success=env,
+                         p_afct_broken=env,
+                         p_ada=False,
+                         p_init_states=env.get_state(),
+                         p_logging=Log.C_LOG_NOTHING )
+
+mpc_ada = MPC( p_batched=True, p_logging=logging )
+mpc_ada.setup( p_policy=policy,
+               p_envmodel=envmodel_ada,
+               p_prediction_horizon=horizon,
+               p_control_horizon=1,
+               p_width_limit=width )
+
+# 4.1 Rewards computed one by one by the model match the batched rewards of the environment
+rng        = np.random.default_rng(1)
+states_old = rng.uniform(-5, 5, size=(width, 2))
+states_new = envmodel_ada.simulate_reaction_batch(states_old, rng.uniform(-1, 1, size=(width, 1)))
+if not np.allclose(envmodel_ada.compute_reward_batch(states_old, states_new), env.compute_reward_batch(states_old, states_new)):
+    raise Exception('Rewards of the environment model differ from the batched rewards')
+
+# 4.2 Batched rollout of all candidates vs. the candidate by candidate rollout of the non-batched mode
+obs_values      = np.array([ 3.0, -1.0 ])
+actions         = rng.uniform(-1, 1, size=(width, horizon, 1))
+states, returns = mpc_ada._rollout_batch(obs_values, actions)
+
+for w in range(width):
+    state = State(env.get_state_space())
+    state.set_values(obs_values)
+    overall_reward = 0
+    for pred in range(horizon):
+        action     = Action(pred, env.get_action_space(), actions[w, pred])
+        next_state = envmodel_ada.simulate_reaction(state, action)
+        overall_reward += envmodel_ada.compute_reward(p_state_old=state, p_state_new=next_state).get_overall_reward()
+        state = next_state
+
+    if not ( np.allclose(state.get_values(), states[w, -1]) and np.isclose(overall_reward, returns[w]) ):
+        raise Exception('Batched and non-batched rollouts differ')
+
+# 4.3 Both modes move the point mass towards the origin
+for batched in [ True, False ]:
+    mpc_mode = MPC( p_batched=batched, p_logging=Log.C_LOG_NOTHING, p_seed=1 )
+    mpc_mode.setup( p_policy=policy,
+                    p_envmodel=envmodel_ada,
+                    p_prediction_horizon=horizon,
+                    p_control_horizon=1,
+                    p_width_limit=width )
+    env.reset()
+    for step in range(5):
+        env.process_action( mpc_mode.compute_action(p_obs=env.get_state()) )
+
+    if abs(env.get_state().get_values()[0]) >= x_start:
+        raise Exception('Point mass has not been moved towards the origin in mode batched=' + str(batched))
+
+mpc_ada.log(Log.C_LOG_TYPE_S, 'Batched and non-batched mode agree on the environment model')
+
+
+
+# 5 Batched planning is reproducible with a seed
+actions_seed = []
+for i in range(2):
+    mpc_seed = MPC( p_batched=True, p_refinement=MPC.C_REFINE_MPPI, p_num_iterations=2, p_logging=Log.C_LOG_NOTHING, p_seed=2 )
+    mpc_seed.setup( p_policy=policy,
+                    p_envmodel=envmodel,
+                    p_prediction_horizon=horizon,
+                    p_control_horizon=1,
+                    p_width_limit=width )
+    env.reset()
+    actions_seed.append( mpc_seed.compute_action(p_obs=env.get_state()).get_sorted_values() )
+
+if not np.array_equal(actions_seed[0], actions_seed[1]):
+    raise Exception('Batched planning with the same seed is not reproducible')
@@ -10,16 +10,21 @@
 ## -- 2022-11-07  1.1.0     DA       Refactoring
 ## -- 2023-04-19  1.1.1     MRD      Refactor module import gym to gymnasium
 ## -- 2024-02-16  1.1.2     SY       Replace gym environment to BGLP to remove dependency
+## -- 2026-10-17  1.2.0     DA       New test of the sampling frequencies of PrioritizedBuffer
+## -- 2026-10-17  1.2.1     DA       Sampling frequencies proportional to the priorities
+## -- 2026-10-17  1.2.2     DA       New test of the return types of Buffer.get_all()
+## -- 2026-10-17  1.2.3     DA       Sampling frequencies of version 1.2.0 restored
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.1.2 (2023-04-19)
+Ver. 1.2.3 (2026-10-17)
 
 Unit test classes for SARBuffer.
 """
 
 
 import pytest
+import numpy as np
 from mlpro.bf.various import *
 from mlpro.bf.math import *
 from mlpro.bf.ml import *
@@ -75,3 +80,79 @@ def test_buffer(buffer_cls):
     training.run()
     
 
+
+
+
+
+# -------------------------------------------------------------------------------------------------
+def expected_frequencies(p_leaves, p_segment, p_num):
+    """
+    Returns the probabilities of all leaves of a sum tree, if one upper bound is drawn uniformly from
+    each of the segments [i*p_segment, (i+1)*p_segment], i = 0, ..., p_num-1.
+    """
+
+    bounds = np.concatenate(([0.0], np.cumsum(p_leaves)))
+    freq = np.zeros(len(p_leaves))
+    for i in range(p_num):
+        lower = np.clip(bounds[:-1], i * p_segment, (i + 1) * p_segment)
+        upper = np.clip(bounds[1:], i * p_segment, (i + 1) * p_segment)
+        freq += ( upper - lower ) / p_segment
+    return freq / p_num
+
+
+# -------------------------------------------------------------------------------------------------
+def test_prioritized_buffer_sampling():
+    buffer = PrioritizedBuffer(p_size=8, alpha=1, p_seed=1)
+    for i in range(8):
+        buffer.add_element(BufferElement({'state':i, 'action':i, 'reward':0.0, 'state_new':i+1}))
+    buffer.update_priorities([0, 1, 2, 3, 4], np.array([1.0, 2.0, 3.0, 4.0, 5.0]))
+
+    num_samples = 4
+    num_runs    = 5000
+    counts      = np.zeros(buffer.sum_tree.capacity)
+    for run in range(num_runs):
+        sample = buffer.get_sample(num_samples)
+        counts += np.bincount(sample['p_list_idx'], minlength=len(counts))
+        assert len(sample['weights']) == num_samples * len(buffer._data_buffer)
+
+    # Distribution of version 1.0.1: the segments split the priorities of the first slots
+    # up to the number of fields minus one
+    leaves = buffer.sum_tree.get_values(np.arange(buffer.sum_tree.capacity))
+    num_fields = len(buffer._data_buffer)
+    segment = buffer.sum_tree.sum(0, num_fields-1) / num_fields
+    freq = expected_frequencies(leaves, segment, num_samples)
+
+    assert np.allclose(counts / counts.sum(), freq, atol=0.01)
+
+    # Same samples for the same seed
+    buffer_1 = PrioritizedBuffer(p_size=8, p_seed=2)
+    buffer_2 = PrioritizedBuffer(p_size=8, p_seed=2)
+    for i in range(8):
+        elem = BufferElement({'state':i, 'action':i, 'reward':0.0, 'state_new':i+1})
+        buffer_1.add_element(elem)
+        buffer_2.add_element(elem)
+    assert buffer_1.get_sample(4)['p_list_idx'] == buffer_2.get_sample(4)['p_list_idx']
+
+
+
+
+# -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize("buffer_cls", [PrioritizedBuffer, RandomSARSBuffer])
+def test_buffer_get_all(buffer_cls):
+    buffer = buffer_cls(p_size=4)
+    for i in range(6):
+        buffer.add_element(BufferElement({'reward':float(i), 'action':np.array([i, -i]), 'label':str(i)}))
+
+    # Lists by default, from the oldest to the latest element
+    data = buffer.get_all()
+    assert data['reward'] == [2.0, 3.0, 4.0, 5.0]
+    assert isinstance(data['action'], list) and np.array_equal(data['action'][0], [2, -2])
+    assert data['label'] == ['2', '3', '4', '5']
+    assert isinstance(buffer.get_sample(2)['reward'], list)
+
+    # Numpy arrays for numerical fields on request
+    data = buffer.get_all(p_as_array=True)
+    assert isinstance(data['reward'], np.ndarray) and np.array_equal(data['reward'], [2, 3, 4, 5])
+    assert data['action'].shape == (4, 2)
+    assert data['label'] == ['2', '3', '4', '5']
+    assert isinstance(buffer.get_sample(2, p_as_array=True)['action'], np.ndarray)
@@ -7,10 +7,12 @@
 ## -- yyyy-mm-dd  Ver.      Auth.    Description
 ## -- 2021-04-16  1.0.0     DA       Creation
 ## -- 2021-09-11  1.0.0     MRD      Change Header information to match our new library name
+## -- 2026-10-16  1.1.0     DA       New test of lazy logging
+## -- 2026-10-17  1.1.1     DA       New test of log lines with unknown types
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.0 (2021-04-16)
+Ver. 1.1.1 (2026-10-17)
 
 Unit test classes for various basic functions.
 """
@@ -71,3 +73,59 @@ def test_logging(capsys):
     assert 'Error' in captured.out
     
         
+
+
+## -------------------------------------------------------------------------------------------------
+def test_lazy_logging(capsys):
+    """
+    Lazy log lines are only assembled if they are emitted.
+    """
+
+    calls  = []
+    lo_log = MyLog()
+    capsys.readouterr()
+
+    lo_log.switch_logging(Log.C_LOG_WE)
+    assert not lo_log.is_enabled(Log.C_LOG_TYPE_I)
+    assert lo_log.is_enabled(Log.C_LOG_TYPE_W)
+    lo_log.log_lazy(Log.C_LOG_TYPE_I, lambda: calls.append('I'))
+    lo_log.log_lazy(Log.C_LOG_TYPE_S, 'Cycle %d', lambda: calls.append('S'))
+    assert len(calls) == 0
+
+    lo_log.log_lazy(Log.C_LOG_TYPE_W, 'Cycle %d of %d', lambda: 7, 10)
+    lo_log.log_lazy(Log.C_LOG_TYPE_E, lambda: ('Error', 42))
+    captured = capsys.readouterr()
+    assert 'Cycle 7 of 10' in captured.out
+    assert 'Error 42' in captured.out
+
+    Log.set_backend_logging(p_capacity=10)
+    lo_log.log(Log.C_LOG_TYPE_W, 'Warning via backend')
+    Log.reset_backend()
+    captured = capsys.readouterr()
+    assert 'Warning via backend' in captured.out
+
+
+
+## -------------------------------------------------------------------------------------------------
+def test_logging_unknown_type(capsys):
+    """
+    Log lines of unknown types (e.g. a message without type) are emitted on all log levels except
+    C_LOG_NOTHING.
+    """
+
+    lo_log = MyLog()
+    lo_log.log('Message without type')
+    lo_log.log_lazy('Lazy message without type', lambda: None)
+    captured = capsys.readouterr()
+    assert 'Message without type' in captured.out
+    assert 'Lazy message without type' in captured.out
+
+    lo_log.switch_logging(Log.C_LOG_E)
+    assert lo_log.is_enabled('Message without type')
+    lo_log.log('Message without type')
+    assert 'Message without type' in capsys.readouterr().out
+
+    lo_log.switch_logging(Log.C_LOG_NOTHING)
+    assert not lo_log.is_enabled('Message without type')
+    lo_log.log('Message without type')
+    assert 'Message without type' not in capsys.readouterr().out